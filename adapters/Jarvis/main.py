@@ -66,6 +66,13 @@ async def startup_event():
     log_info("[Startup] MCP Hub ready!")
 
 
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Close pooled LLM/embedding HTTP clients"""
+    from core.http_client_pool import aclose_http_clients
+    await aclose_http_clients()
+
+
 
 @app.get("/health")
 async def health():
@@ -2,6 +2,8 @@
 import httpx
 from fastapi import APIRouter, HTTPException
 
+from mcp.hub import invalidate_after_write
+
 router = APIRouter(prefix="/api/maintenance", tags=["maintenance"])
 
 MEMORY_SERVICE_URL = "http://mcp-sql-memory:8081"
@@ -43,6 +45,8 @@ async def start_maintenance():
                 },
                 timeout=60.0
             )
+            # maintenance_run läuft am Hub vorbei → memory-Cache invalidieren
+            invalidate_after_write("maintenance_run")
             
             if response.status_code == 200:
                 return {
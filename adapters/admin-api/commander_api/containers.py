@@ -1620,6 +1620,17 @@ async def api_container_stats(container_id: str):
         return exception_response(e)
 
 
+@router.get("/stats")
+async def api_all_container_stats():
+    """Latest streamed stats for all running containers (no Docker round-trips)."""
+    try:
+        from container_commander.engine import get_all_container_stats
+
+        return get_all_container_stats()
+    except Exception as e:
+        return exception_response(e)
+
+
 @router.get("/quota")
 async def api_get_quota():
     """Get current session quota usage."""
@@ -1632,6 +1643,17 @@ async def api_get_quota():
         return exception_response(e)
 
 
+@router.get("/state-cache")
+async def api_state_cache_stats():
+    """Docker-events container snapshot: size, events, reconciles, API calls avoided."""
+    try:
+        from container_commander.engine import get_state_cache_stats
+
+        return get_state_cache_stats()
+    except Exception as e:
+        return exception_response(e)
+
+
 @router.post("/cleanup")
 async def api_cleanup_all():
     """Emergency: stop and remove ALL TRION containers."""
@@ -1107,8 +1107,13 @@ async def workspace_events_list(
     conversation_id: str = None,
     event_type: str = None,
     limit: int = 50,
+    since_id: int = None,
 ):
-    """List internal workspace events (read-only telemetry from workspace_events table)."""
+    """
+    List internal workspace events (read-only telemetry from workspace_events table).
+
+    With conversation_id + since_id: change feed (events after that id, oldest first).
+    """
 
     def _extract_events_payload(result_obj):
         # Fast-Lane ToolResult path
@@ -1164,6 +1169,8 @@ async def workspace_events_list(
             args["conversation_id"] = conversation_id
         if event_type:
             args["event_type"] = event_type
+        if since_id is not None:
+            args["since_id"] = since_id
         result = await _hub_call_tool("workspace_event_list", args)
         events = _extract_events_payload(result)
         if not isinstance(events, list):
@@ -1789,6 +1796,18 @@ async def tools():
         )
 
 
+@app.get("/api/tools/cache-stats")
+async def get_tool_cache_stats():
+    """MCPHub result cache: hits/misses/coalesced/latency per tool."""
+    from mcp.hub import get_hub
+
+    try:
+        return JSONResponse(get_hub().get_result_cache_stats())
+    except Exception as e:
+        log_error(f"[Admin-API-Tools] Error fetching tool cache stats: {e}")
+        return JSONResponse({"error": str(e)}, status_code=500)
+
+
 @app.get("/")
 async def root():
     """Root endpoint"""
@@ -2100,6 +2119,24 @@ async def autonomy_cron_queue():
     return JSONResponse(await scheduler.get_queue_snapshot())
 
 
+@app.get("/api/autonomy/cron/runs")
+async def autonomy_cron_runs(
+    cron_job_id: str = "",
+    status: str = "",
+    limit: int = 50,
+    before: int | None = None,
+):
+    scheduler = _get_autonomy_cron_scheduler()
+    if not scheduler:
+        return JSONResponse(
+            {"error_code": "autonomy_cron_unavailable", "error": "Autonomy cron scheduler is not initialized"},
+            status_code=503,
+        )
+    return JSONResponse(
+        await scheduler.list_runs(cron_job_id=cron_job_id, status=status, limit=limit, before=before)
+    )
+
+
 # ============================================================
 # STARTUP & SHUTDOWN
 # ============================================================
@@ -2264,6 +2301,19 @@ async def startup_event():
             logger.info(f"[Startup] Container recovery: {result}")
         except Exception as e:
             logger.warning(f"[Startup] Container recovery failed (non-critical): {e}")
+        # Docker-Events → Container-Snapshot (list/inspect/quota ohne Polling)
+        try:
+            from container_commander.engine import start_state_cache
+            if start_state_cache():
+                logger.info("[Startup] Container state cache subscriber started")
+        except Exception as e:
+            logger.warning(f"[Startup] Container state cache start failed (non-critical): {e}")
+        try:
+            from container_commander.engine import start_stats_collector
+            if start_stats_collector():
+                logger.info("[Startup] Container stats collector started")
+        except Exception as e:
+            logger.warning(f"[Startup] Container stats collector start failed (non-critical): {e}")
 
     asyncio.create_task(_recover_containers())
 
@@ -2340,4 +2390,19 @@ async def shutdown_event():
             logger.warning(f"[Shutdown] Autonomy cron scheduler stop failed: {e}")
         _autonomy_cron_scheduler = None
     clear_autonomy_cron_runtime_scheduler()
+    try:
+        from container_commander.engine import stop_state_cache
+        await asyncio.to_thread(stop_state_cache)
+    except Exception as e:
+        logger.warning(f"[Shutdown] Container state cache stop failed: {e}")
+    try:
+        from container_commander.engine import stop_stats_collector
+        await asyncio.to_thread(stop_stats_collector)
+    except Exception as e:
+        logger.warning(f"[Shutdown] Container stats collector stop failed: {e}")
+    try:
+        from core.http_client_pool import aclose_http_clients
+        await aclose_http_clients()
+    except Exception as e:
+        logger.warning(f"[Shutdown] HTTP client pool close failed: {e}")
     logger.info("Jarvis Admin API Shutting down...")
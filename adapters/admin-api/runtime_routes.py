@@ -16,6 +16,9 @@ Endpoints:
     GET /api/runtime/digest-state
         Returns digest pipeline runtime state (last run, status, locking, JIT telemetry).
         Always returns a stable JSON structure even if the pipeline has never run.
+
+    GET /api/runtime/embedding-cache
+        Shared embedding cache counters (turn/LRU hits, misses, saved latency).
 
 API versions:
     v2 (default, DIGEST_RUNTIME_API_V2=true):
@@ -389,6 +392,16 @@ async def get_runtime_session():
     )
 
 
+@router.get("/api/runtime/embedding-cache")
+async def get_embedding_cache():
+    """Hit/miss counters of the shared per-turn + LRU embedding cache."""
+    try:
+        from core.embedding_client import get_embedding_cache_stats
+        return JSONResponse(get_embedding_cache_stats())
+    except Exception as exc:
+        return JSONResponse({"error": str(exc)}, status_code=500)
+
+
 @router.get("/api/runtime/autonomy-status")
 async def get_autonomy_status():
     """
@@ -27,6 +27,8 @@ from fastapi import APIRouter, Request
 from fastapi.responses import JSONResponse
 from datetime import datetime, timezone
 
+from mcp.hub import invalidate_after_write
+
 router = APIRouter()
 log = logging.getLogger(__name__)
 
@@ -106,6 +108,8 @@ async def _mcp_call(tool_name: str, args: dict | None = None, timeout: int = 15)
                     "mcp-session-id": f"admin-api-{tool_name}",
                 },
             )
+            # Direkter Broker-Call am Hub vorbei → betroffene Cache-Domains verwerfen
+            invalidate_after_write(tool_name)
             if r.status_code not in (200, 202):
                 log.warning(f"[StorageBroker] {tool_name} → HTTP {r.status_code}")
                 return {"error": f"broker returned HTTP {r.status_code}"}
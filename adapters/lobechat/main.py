@@ -56,6 +56,13 @@ app.include_router(maintenance_router, prefix="/api/maintenance")
 # NOTE: Persona Management moved to jarvis-admin-api (port 8200)
 
 
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Close pooled LLM/embedding HTTP clients"""
+    from core.http_client_pool import aclose_http_clients
+    await aclose_http_clients()
+
+
 @app.get("/health")
 async def health():
     """Health-Check Endpoint."""
@@ -5,6 +5,8 @@ import asyncio
 from fastapi import APIRouter, HTTPException, Request
 from fastapi.responses import StreamingResponse
 
+from mcp.hub import invalidate_after_write
+
 router = APIRouter(prefix="/api/maintenance", tags=["maintenance"])
 
 MEMORY_SERVICE_URL = "http://mcp-sql-memory:8081"
@@ -105,6 +107,7 @@ async def maintenance_stream(model: str, validator_model: str = None):
                     }
                 }
             )
+            invalidate_after_write("maintenance_run")
             
             yield 'data: ' + json.dumps({"type": "task_progress", "message": "AI verarbeitet Memories...", "progress": 50}) + '\n\n'
             
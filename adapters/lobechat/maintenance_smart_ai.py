@@ -5,6 +5,8 @@ import asyncio
 from fastapi import APIRouter, Request
 from fastapi.responses import StreamingResponse
 
+from mcp.hub import invalidate_after_write
+
 router = APIRouter(prefix="/api/maintenance", tags=["maintenance-smart"])
 
 MEMORY_SERVICE_URL = "http://mcp-sql-memory:8081"
@@ -92,6 +94,7 @@ async def smart_ai_stream(
                         }
                     }
                 )
+                invalidate_after_write("maintenance_run")
                 
                 if response.status_code == 200:
                     data = parse_sse(response.text)
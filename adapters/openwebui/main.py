@@ -39,6 +39,13 @@ app.add_middleware(
 )
 
 
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Close pooled LLM/embedding HTTP clients"""
+    from core.http_client_pool import aclose_http_clients
+    await aclose_http_clients()
+
+
 @app.get("/health")
 async def health():
     return {"status": "ok", "adapter": "openwebui"}
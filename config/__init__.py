@@ -48,6 +48,7 @@ from config.models.llm import (  # noqa: F401
     get_control_model,
     get_control_model_deep,
     get_output_model,
+    get_llm_keep_alive,
     THINKING_MODEL,
     CONTROL_MODEL,
     OUTPUT_MODEL,
@@ -134,6 +135,10 @@ from config.pipeline.loop_engine import (  # noqa: F401
     get_loop_engine_output_char_cap,
     get_loop_engine_max_predict,
 )
+from config.pipeline.signal_stage import (  # noqa: F401
+    get_signal_stage_parallel_enable,
+    get_signal_stage_timeout_s,
+)
 
 # ── Output ───────────────────────────────────────────────────────────────────
 from config.output.char_limits import (  # noqa: F401
@@ -16,6 +16,7 @@ from config.models.llm import (
     get_control_model,
     get_control_model_deep,
     get_output_model,
+    get_llm_keep_alive,
     THINKING_MODEL,
     CONTROL_MODEL,
     OUTPUT_MODEL,
@@ -52,6 +53,7 @@ from config.models.tool_selector import (
 __all__ = [
     # llm
     "get_thinking_model", "get_control_model", "get_control_model_deep", "get_output_model",
+    "get_llm_keep_alive",
     "THINKING_MODEL", "CONTROL_MODEL", "OUTPUT_MODEL",
     # providers
     "get_output_provider", "get_thinking_provider", "get_control_provider", "_normalize_provider",
@@ -35,6 +35,16 @@ def get_output_model() -> str:
     return settings.get("OUTPUT_MODEL", os.getenv("OUTPUT_MODEL", "ministral-3:3b"))
 
 
+def get_llm_keep_alive() -> str:
+    """
+    keep_alive für alle Ollama-Requests (Thinking / Control / Output / Hilfs-Calls).
+    Ein einheitlicher Wert verhindert, dass ein Request mit kürzerem keep_alive
+    das Modell samt KV-Cache früher entlädt als die übrigen Layer erwarten.
+    """
+    val = str(settings.get("LLM_KEEP_ALIVE", os.getenv("LLM_KEEP_ALIVE", "5m"))).strip()
+    return val or "5m"
+
+
 # Backward-compat — beim Import eingefroren, Getter bevorzugen
 THINKING_MODEL = get_thinking_model()
 CONTROL_MODEL = get_control_model()
@@ -9,6 +9,7 @@ Module:
   grounding      → Grounding-Recovery, Memory-Retrieval, Followup-Reuse
   control_layer  → Control-Timeouts, Prompt-Sizing, Layer-Toggles, Validation
   loop_engine    → Loop-Engine Trigger, Min-Tools, Char-Cap, Token-Budget
+  signal_stage   → Parallele Signal-Stage (Tone/Budget/Domain/Tools), Timeouts
 
 Re-Exports für bequemen Zugriff via `from config.pipeline import ...`:
 """
@@ -72,6 +73,11 @@ from config.pipeline.loop_engine import (
     get_loop_engine_max_predict,
 )
 
+from config.pipeline.signal_stage import (
+    get_signal_stage_parallel_enable,
+    get_signal_stage_timeout_s,
+)
+
 __all__ = [
     # query_budget
     "get_default_response_mode", "get_response_mode_sequential_threshold",
@@ -101,4 +107,6 @@ __all__ = [
     # loop_engine
     "get_loop_engine_trigger_complexity", "get_loop_engine_min_tools",
     "get_loop_engine_output_char_cap", "get_loop_engine_max_predict",
+    # signal_stage
+    "get_signal_stage_parallel_enable", "get_signal_stage_timeout_s",
 ]
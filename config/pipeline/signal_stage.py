@@ -0,0 +1,48 @@
+"""
+config.pipeline.signal_stage
+=============================
+Signal-Stage vor dem ThinkingLayer.
+
+Tone, Query-Budget, Domain-Router und Tool-Selector laufen parallel.
+Jedes Signal hat ein eigenes Timeout; läuft es ab, wird mit dem
+Fallback-Signal weitergearbeitet statt den Turn zu blockieren.
+Tone hat wie bisher kein Timeout, solange SIGNAL_STAGE_TIMEOUT_TONE_S
+nicht gesetzt ist.
+"""
+import os
+from typing import Optional
+
+from config.infra.adapter import settings
+
+_SIGNAL_TIMEOUT_DEFAULTS = {
+    "tone": None,
+    "query_budget": 3.0,
+    "domain": 3.0,
+    "tool_selection": 6.0,
+}
+
+
+def get_signal_stage_parallel_enable() -> bool:
+    """Signale parallel statt nacheinander klassifizieren (Rollback: false)."""
+    return str(settings.get(
+        "SIGNAL_STAGE_PARALLEL_ENABLE",
+        os.getenv("SIGNAL_STAGE_PARALLEL_ENABLE", "true"),
+    )).lower() == "true"
+
+
+def get_signal_stage_timeout_s(signal: str) -> Optional[float]:
+    """
+    Timeout je Signal (Sekunden): tone, query_budget, domain, tool_selection.
+    Override via SIGNAL_STAGE_TIMEOUT_<SIGNAL>_S, z.B. SIGNAL_STAGE_TIMEOUT_TONE_S.
+    None = kein Timeout (Default für tone, wie vor der Signal-Stage).
+    """
+    default = _SIGNAL_TIMEOUT_DEFAULTS.get(signal, 3.0)
+    key = f"SIGNAL_STAGE_TIMEOUT_{signal.upper()}_S"
+    raw = settings.get(key, os.getenv(key, ""))
+    if raw in (None, ""):
+        return default
+    try:
+        val = float(raw)
+    except Exception:
+        return default
+    return max(0.1, min(60.0, val))
@@ -329,6 +329,15 @@ def _blueprint_to_params(bp: Blueprint) -> dict:
     }
 
 
+def _invalidate_cached_blueprints() -> None:
+    """Drop cached blueprint_list/blueprint_get results after a direct store write."""
+    try:
+        from mcp.hub import invalidate_cached_results
+        invalidate_cached_results(("blueprints",), by_tool="blueprint_store")
+    except Exception:
+        pass
+
+
 # ── CRUD Operations ───────────────────────────────────────
 
 def create_blueprint(bp: Blueprint) -> Blueprint:
@@ -352,9 +361,10 @@ def create_blueprint(bp: Blueprint) -> Blueprint:
         conn.commit()
         bp.created_at = params["created_at"]
         bp.updated_at = params["updated_at"]
-        return bp
     finally:
         conn.close()
+    _invalidate_cached_blueprints()
+    return bp
 
 
 def get_blueprint(blueprint_id: str) -> Optional[Blueprint]:
@@ -454,9 +464,10 @@ def update_blueprint(blueprint_id: str, updates: dict) -> Optional[Blueprint]:
             WHERE id=:id
         """, params)
         conn.commit()
-        return existing
     finally:
         conn.close()
+    _invalidate_cached_blueprints()
+    return existing
 
 
 def delete_blueprint(blueprint_id: str) -> bool:
@@ -473,9 +484,12 @@ def delete_blueprint(blueprint_id: str) -> bool:
             (datetime.utcnow().isoformat(), blueprint_id)
         )
         conn.commit()
-        return cursor.rowcount > 0
+        deleted = cursor.rowcount > 0
     finally:
         conn.close()
+    if deleted:
+        _invalidate_cached_blueprints()
+    return deleted
 
 
 # ── Blueprint Inheritance ──────────────────────────────────
@@ -745,6 +759,8 @@ def backfill_exec_policies():
             _log.getLogger(__name__).info(f"[BlueprintStore] Backfilled exec policies for {updated} blueprints")
     finally:
         conn.close()
+    if updated:
+        _invalidate_cached_blueprints()
 
 
 # Official built-in blueprints that are always trusted.
@@ -104,15 +104,16 @@ def _get_resource_summary() -> Dict:
 
 def _get_container_summary() -> Dict:
     try:
-        from .engine import list_containers, get_container_stats
+        from .engine import list_containers, get_container_stats, get_all_container_stats
         cts = list_containers()
         running = [c for c in cts if c.status.value == "running"]
         stopped = [c for c in cts if c.status.value == "stopped"]
+        streamed = get_all_container_stats()["containers"]
 
         container_details = []
         for c in running:
             try:
-                stats = get_container_stats(c.container_id)
+                stats = streamed.get(c.container_id) or get_container_stats(c.container_id)
                 container_details.append({
                     "id": c.container_id[:12],
                     "name": c.name,
@@ -179,7 +180,7 @@ def _get_alerts() -> List[Dict]:
     alerts = []
 
     try:
-        from .engine import get_quota, list_containers, get_container_stats
+        from .engine import get_quota, list_containers, get_container_stats, get_all_container_stats
 
         q = get_quota()
 
@@ -211,11 +212,12 @@ def _get_alerts() -> List[Dict]:
 
         # Idle container alerts
         cts = list_containers()
+        streamed = get_all_container_stats()["containers"]
         for c in cts:
             if c.status.value != "running":
                 continue
             try:
-                stats = get_container_stats(c.container_id)
+                stats = streamed.get(c.container_id) or get_container_stats(c.container_id)
                 eff = stats.get("efficiency", {})
                 if eff.get("level") == "red":
                     alerts.append({
@@ -58,6 +58,8 @@ from .engine_runtime_state import (
     sync_runtime_state_from_docker as _sync_runtime_state_from_docker_impl,
     update_quota_used_unlocked as _update_quota_used_unlocked_impl,
 )
+from .engine_state_cache import ContainerStateCache
+from .engine_stats_collector import ContainerStatsCollector, StatsSample, parse_stats_sample
 from .engine_connection import (
     build_connection_info as _build_connection_info_impl,
     extract_port_details as _extract_port_details_impl,
@@ -250,6 +252,65 @@ def _sync_runtime_state_refs(state: RuntimeStateRefs) -> None:
     _last_runtime_sync_monotonic = state.last_runtime_sync_monotonic
 
 
+# ── Container State Cache (Docker events) ─────────────────
+
+_state_cache = ContainerStateCache(
+    get_client=lambda: get_client(),
+    trion_label=TRION_LABEL,
+    logger=logger,
+)
+
+
+def start_state_cache() -> bool:
+    """Start the Docker-events subscriber that feeds list/inspect/quota reads."""
+    return _state_cache.start()
+
+
+def stop_state_cache() -> None:
+    _state_cache.stop()
+
+
+def get_state_cache_stats() -> Dict[str, Any]:
+    """Snapshot size, events applied, reconciles and Docker API calls avoided."""
+    return _state_cache.stats()
+
+
+# ── Container Stats Collector (streaming stats) ───────────
+
+def _list_running_for_stats() -> List[Any]:
+    running = _state_cache.list(running_only=True)
+    if running is None:
+        running = get_client().containers.list(
+            filters={"label": TRION_LABEL, "status": "running"}, sparse=True
+        )
+    return running
+
+
+_stats_collector = ContainerStatsCollector(
+    get_client=lambda: get_client(),
+    list_running=_list_running_for_stats,
+    logger=logger,
+)
+
+
+def _forget_cached_container(container_ref: str, container: Any = None) -> None:
+    """Evict a container from the state cache and the stats collector by its full id."""
+    if container is None:
+        container = _state_cache.get(container_ref)
+    container_id = str(getattr(container, "id", "") or container_ref)
+    _state_cache.forget(container_id)
+    _stats_collector.forget(container_id)
+
+
+def start_stats_collector() -> bool:
+    """Start streaming stats subscriptions for running containers."""
+    return _stats_collector.start()
+
+
+def stop_stats_collector() -> None:
+    _stats_collector.stop()
+
+
 # ── Image Management ──────────────────────────────────────
 
 def _blueprint_image_tag(blueprint: Blueprint) -> str:
@@ -601,6 +662,8 @@ def start_container(
 
         _commit_quota_reservation(instance, reserved_mem_mb, reserved_cpu)
         reservation_active = False
+        _state_cache.refresh(container.id)
+        _stats_collector.track(container.id)
 
         # 7. TTL timer
         if resources.timeout_seconds > 0:
@@ -710,6 +773,10 @@ def stop_container(container_id: str, remove: Optional[bool] = None) -> bool:
         container.stop(timeout=10)
         if should_remove:
             container.remove(force=True)
+            _forget_cached_container(container_id, container)
+        else:
+            _state_cache.refresh(container.id)
+            _stats_collector.forget(container.id)
 
         # Cancel TTL timer + in-memory registry updates
         with _state_lock:
@@ -737,6 +804,7 @@ def stop_container(container_id: str, remove: Optional[bool] = None) -> bool:
         return True
 
     except NotFound:
+        _forget_cached_container(container_id)
         with _state_lock:
             _active.pop(container_id, None)
             _ttl_timers.pop(container_id, None)
@@ -769,6 +837,7 @@ def remove_stopped_container(container_id: str) -> Dict:
 
         blueprint_id = labels.get("trion.blueprint", "unknown")
         container.remove(force=True)
+        _forget_cached_container(container_id, container)
 
         with _state_lock:
             timer = _ttl_timers.pop(container_id, None)
@@ -789,6 +858,7 @@ def remove_stopped_container(container_id: str) -> Dict:
         return {"removed": True, "container_id": container_id, "blueprint_id": blueprint_id}
 
     except NotFound:
+        _forget_cached_container(container_id)
         with _state_lock:
             _active.pop(container_id, None)
             _ttl_timers.pop(container_id, None)
@@ -812,6 +882,8 @@ def start_stopped_container(container_id: str) -> bool:
 
         container.start()
         container.reload()
+        _state_cache.put(container)
+        _stats_collector.track(container.id)
 
         with _state_lock:
             timer = _ttl_timers.pop(container_id, None)
@@ -1053,12 +1125,17 @@ def get_container_logs(container_id: str, tail: int = 100) -> str:
 
 
 def get_container_stats(container_id: str) -> Dict:
-    """Get live resource stats from a container."""
-    client = get_client()
+    """Get live resource stats (streamed sample when available, else one blocking poll)."""
+    container = _state_cache.get(container_id)
+    client = get_client() if container is None else None
     try:
-        container = client.containers.get(container_id)
+        if container is None:
+            container = client.containers.get(container_id)
         attrs = container.attrs or {}
-        stats = container.stats(stream=False)
+        sample = _stats_collector.latest(container.id)
+        if sample is None:
+            sample = parse_stats_sample(container.stats(stream=False))
+            _stats_collector.track(container.id)
         network_settings = attrs.get("NetworkSettings", {})
         networks = network_settings.get("Networks", {})
         ip_address = next(
@@ -1070,49 +1147,62 @@ def get_container_stats(container_id: str) -> Dict:
         ports = _extract_port_details(attrs)
         ports, connection = _merge_host_companion_access_info(blueprint_id, ip_address, ports)
 
-        # Parse CPU
-        cpu_delta = stats["cpu_stats"]["cpu_usage"]["total_usage"] - \
-                    stats["precpu_stats"]["cpu_usage"]["total_usage"]
-        system_delta = stats["cpu_stats"]["system_cpu_usage"] - \
-                       stats["precpu_stats"]["system_cpu_usage"]
-        num_cpus = stats["cpu_stats"].get("online_cpus", 1)
-        cpu_percent = (cpu_delta / system_delta) * num_cpus * 100.0 if system_delta > 0 else 0.0
+        result = _stats_payload(container.id, sample)
+        result["container_id"] = container_id
+        result["ports"] = ports
+        result["connection"] = connection
+        return result
 
-        # Parse Memory
-        mem_usage = stats["memory_stats"].get("usage", 0)
-        mem_limit = stats["memory_stats"].get("limit", 1)
-        mem_mb = mem_usage / (1024 * 1024)
+    except NotFound:
+        return {"error": "Container not found"}
+    except Exception as e:
+        return {"error": str(e)}
 
-        # Parse Network
-        net_rx = sum(v.get("rx_bytes", 0) for v in stats.get("networks", {}).values())
-        net_tx = sum(v.get("tx_bytes", 0) for v in stats.get("networks", {}).values())
 
-        # Update active instance
-        with _state_lock:
-            instance = _active.get(container_id)
-            if instance:
-                instance.cpu_percent = round(cpu_percent, 1)
-                instance.memory_mb = round(mem_mb, 1)
-                instance.network_rx_bytes = net_rx
-                instance.network_tx_bytes = net_tx
+def get_all_container_stats() -> Dict:
+    """
+    Stats for all tracked containers from the collector's ring buffers.
+    No Docker calls; containers without a fresh streamed sample are omitted.
+    """
+    containers = {
+        container_id: _stats_payload(container_id, sample)
+        for container_id, sample in _stats_collector.snapshot_all().items()
+    }
+    return {"containers": containers, "collector": _stats_collector.stats()}
 
-                started = instance.started_at
-                if started:
-                    runtime = (datetime.utcnow() - datetime.fromisoformat(started)).total_seconds()
-                    instance.runtime_seconds = int(runtime)
 
-                # Efficiency score
-                instance.efficiency_score, instance.efficiency_level = _calc_efficiency(instance)
+def _stats_payload(container_id: str, sample: StatsSample) -> Dict:
+    """Update the _active instance from a sample and build the stats response."""
+    window = _stats_collector.window(container_id)
+    with _state_lock:
+        instance = _active.get(container_id)
+        if instance:
+            instance.cpu_percent = round(sample.cpu_percent, 1)
+            instance.memory_mb = round(sample.memory_mb, 1)
+            instance.network_rx_bytes = sample.network_rx_bytes
+            instance.network_tx_bytes = sample.network_tx_bytes
+
+            started = instance.started_at
+            if started:
+                runtime = (datetime.utcnow() - datetime.fromisoformat(started)).total_seconds()
+                instance.runtime_seconds = int(runtime)
+
+            # Efficiency score over the sample window (a single idle tick is not "idle")
+            instance.efficiency_score, instance.efficiency_level = _calc_efficiency(
+                instance,
+                cpu_percent=window.get("cpu_percent_avg"),
+                memory_mb=window.get("memory_mb_avg"),
+            )
 
         return {
             "container_id": container_id,
-            "cpu_percent": round(cpu_percent, 1),
-            "memory_mb": round(mem_mb, 1),
-            "memory_limit_mb": round(mem_limit / (1024 * 1024), 1),
-            "network_rx_bytes": net_rx,
-            "network_tx_bytes": net_tx,
-            "ports": ports,
-            "connection": connection,
+            "cpu_percent": round(sample.cpu_percent, 1),
+            "memory_mb": round(sample.memory_mb, 1),
+            "memory_limit_mb": round(sample.memory_limit_mb, 1),
+            "network_rx_bytes": sample.network_rx_bytes,
+            "network_tx_bytes": sample.network_tx_bytes,
+            "sample_age_s": round(max(0.0, time.time() - sample.ts), 1),
+            "window": {k: round(v, 1) for k, v in window.items()},
             "efficiency": {
                 "score": instance.efficiency_score if instance else 0,
                 "level": instance.efficiency_level if instance else "green",
@@ -1120,26 +1210,23 @@ def get_container_stats(container_id: str) -> Dict:
             "deploy_warnings": list(instance.deploy_warnings or []) if instance else [],
         }
 
-    except NotFound:
-        return {"error": "Container not found"}
-    except Exception as e:
-        return {"error": str(e)}
-
 
 # ── List Containers ───────────────────────────────────────
 
 def list_containers() -> List[ContainerInstance]:
-    """List all TRION-managed containers."""
-    client = get_client()
+    """List all TRION-managed containers (event-fed snapshot, Docker poll as fallback)."""
+    containers = _state_cache.list()
+    client = get_client() if containers is None else None
     result = []
 
     try:
         with _state_lock:
             active_snapshot = dict(_active)
-        containers = client.containers.list(
-            all=True,
-            filters={"label": TRION_LABEL}
-        )
+        if containers is None:
+            containers = client.containers.list(
+                all=True,
+                filters={"label": TRION_LABEL}
+            )
 
         for c in containers:
             bp_id = c.labels.get("trion.blueprint", "unknown")
@@ -1170,12 +1257,14 @@ def list_containers() -> List[ContainerInstance]:
 def inspect_container(container_id: str) -> Dict:
     """
     Return detailed information about a specific TRION container.
-    Pulls from Docker SDK attrs + in-memory _active registry.
-    Returns a clean dict (not raw Docker API response).
+    Pulls from Docker SDK attrs (state cache snapshot when live) + in-memory
+    _active registry. Returns a clean dict (not raw Docker API response).
     """
-    client = get_client()
+    c = _state_cache.get(container_id)
+    client = get_client() if c is None else None
     try:
-        c = client.containers.get(container_id)
+        if c is None:
+            c = client.containers.get(container_id)
         attrs = c.attrs
 
         state = attrs.get("State", {})
@@ -1306,6 +1395,7 @@ def _sync_runtime_state_from_docker(force: bool = False) -> None:
         get_client=get_client,
         trion_label=TRION_LABEL,
         logger=logger,
+        list_running_containers=lambda: _state_cache.list(running_only=True),
     )
     _sync_runtime_state_refs(state)
 
@@ -1376,14 +1466,22 @@ def cleanup_all():
 
 # ── Efficiency Score ──────────────────────────────────────
 
-def _calc_efficiency(instance: ContainerInstance) -> Tuple[float, str]:
+def _calc_efficiency(
+    instance: ContainerInstance,
+    cpu_percent: Optional[float] = None,
+    memory_mb: Optional[float] = None,
+) -> Tuple[float, str]:
     """
     Calculate efficiency score based on resource usage and runtime.
     Score: 0.0 (bad) to 1.0 (good)
+
+    cpu_percent / memory_mb override the instance's last sample
+    (windowed averages from the stats collector).
     """
     runtime = instance.runtime_seconds
-    cpu = instance.cpu_percent
-    mem_pct = (instance.memory_mb / instance.memory_limit_mb * 100) if instance.memory_limit_mb > 0 else 0
+    cpu = instance.cpu_percent if cpu_percent is None else cpu_percent
+    mem = instance.memory_mb if memory_mb is None else memory_mb
+    mem_pct = (mem / instance.memory_limit_mb * 100) if instance.memory_limit_mb > 0 else 0
 
     score = 1.0
 
@@ -8,7 +8,7 @@ import threading
 import time
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Any, Callable, Dict, Tuple
+from typing import Any, Callable, Dict, Optional, Tuple
 
 from .models import ContainerInstance, ContainerStatus, ResourceLimits, SessionQuota
 
@@ -124,18 +124,22 @@ def sync_runtime_state_from_docker(
     get_client: Callable[[], Any],
     trion_label: str,
     logger: Any,
+    list_running_containers: Optional[Callable[[], Optional[list]]] = None,
 ) -> None:
     now_mono = time.monotonic()
     with state.state_lock:
         if not force and (now_mono - float(state.last_runtime_sync_monotonic or 0.0)) < 2.0:
             return
 
-    try:
-        client = get_client()
-        containers = client.containers.list(filters={"label": trion_label, "status": "running"})
-    except Exception as exc:
-        logger.debug(f"[Engine] Runtime sync skipped (docker unavailable): {exc}")
-        return
+    # Event-fed snapshot first; None means the cache is not live → poll Docker.
+    containers = list_running_containers() if list_running_containers else None
+    if containers is None:
+        try:
+            client = get_client()
+            containers = client.containers.list(filters={"label": trion_label, "status": "running"})
+        except Exception as exc:
+            logger.debug(f"[Engine] Runtime sync skipped (docker unavailable): {exc}")
+            return
 
     reconciled: Dict[str, ContainerInstance] = {}
     for container in containers:
@@ -0,0 +1,277 @@
+"""
+Event-driven snapshot of TRION-managed containers.
+
+A background thread subscribes to the Docker events stream (type=container,
+label=trion.managed) and keeps an in-memory, lock-protected map
+container_id -> docker Container (full inspect attrs). Read paths
+(list_containers, inspect_container, quota sync, context building) use the
+snapshot instead of polling `containers.list(all=True)` per call.
+
+Missed events are recovered by a periodic reconciliation sweep: the event
+subscription is opened in windows of `reconcile_interval_s` (`since`/`until`),
+and after each window the snapshot is rebuilt from one full list call. The
+next window starts at the previous `until`, so no event falls between two
+subscriptions.
+
+While the cache is not live (not started, Docker unavailable, stream broken)
+callers fall back to direct Docker API calls.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+STATE_CACHE_ENABLE = os.environ.get("COMMANDER_STATE_CACHE_ENABLE", "true").strip().lower() not in (
+    "0", "false", "no", "off",
+)
+STATE_CACHE_RECONCILE_S = max(5.0, float(os.environ.get("COMMANDER_STATE_RECONCILE_S", "60")))
+
+# Docker event actions that change what list/inspect would return.
+# exec_*, attach, resize, top, archive-path, ... are ignored on purpose:
+# exec_in_container alone would otherwise trigger a refresh per command.
+_REFRESH_ACTIONS = frozenset({
+    "create", "start", "restart", "die", "stop", "kill", "pause", "unpause",
+    "rename", "update", "oom",
+})
+_DROP_ACTIONS = frozenset({"destroy"})
+
+
+class ContainerStateCache:
+    """In-memory container snapshot fed by Docker events (thread-safe)."""
+
+    def __init__(
+        self,
+        *,
+        get_client: Callable[[], Any],
+        trion_label: str,
+        logger: Any,
+        reconcile_interval_s: float = STATE_CACHE_RECONCILE_S,
+    ):
+        self._get_client = get_client
+        self._trion_label = trion_label
+        self._logger = logger
+        self.reconcile_interval_s = float(reconcile_interval_s)
+        self._lock = threading.RLock()
+        self._containers: Dict[str, Any] = {}
+        self._live = False
+        self._thread: Optional[threading.Thread] = None
+        self._events: Any = None
+        self._stop = threading.Event()
+        self._stats = {
+            "api_calls_avoided": 0,
+            "reads_served": 0,
+            "events_applied": 0,
+            "events_ignored": 0,
+            "reconciles": 0,
+            "stream_errors": 0,
+        }
+
+    # ── lifecycle ─────────────────────────────────────────
+
+    def start(self) -> bool:
+        """Start the subscriber thread (idempotent). Returns False if disabled."""
+        if not STATE_CACHE_ENABLE:
+            return False
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return True
+            self._stop.clear()
+            self._thread = threading.Thread(
+                target=self._run, name="trion-container-state-cache", daemon=True
+            )
+            self._thread.start()
+        return True
+
+    def stop(self, timeout: float = 2.0) -> None:
+        self._stop.set()
+        _close_stream(self._events)
+        thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout)
+        with self._lock:
+            self._live = False
+            self._thread = None
+
+    def is_live(self) -> bool:
+        with self._lock:
+            return self._live
+
+    # ── reads ─────────────────────────────────────────────
+
+    def list(self, running_only: bool = False) -> Optional[List[Any]]:
+        """Snapshot containers, or None if the cache is not live (caller polls Docker)."""
+        with self._lock:
+            if not self._live:
+                return None
+            containers = [
+                c for c in self._containers.values()
+                if not running_only or _status(c) == "running"
+            ]
+            # docker-py list() without sparse = 1 list call + 1 inspect per container
+            self._stats["api_calls_avoided"] += 1 + len(self._containers)
+            self._stats["reads_served"] += 1
+        return containers
+
+    def get(self, container_ref: str) -> Optional[Any]:
+        """Lookup by full id, unique id prefix or name (like containers.get)."""
+        ref = str(container_ref or "").strip()
+        if not ref:
+            return None
+        with self._lock:
+            if not self._live:
+                return None
+            found = self._containers.get(ref)
+            if found is None:
+                name = ref.lstrip("/")
+                matches = [
+                    c for cid, c in self._containers.items()
+                    if cid.startswith(ref) or str(getattr(c, "name", "") or "").lstrip("/") == name
+                ]
+                found = matches[0] if len(matches) == 1 else None
+            if found is not None:
+                self._stats["api_calls_avoided"] += 1
+                self._stats["reads_served"] += 1
+        return found
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            out = dict(self._stats)
+            out["live"] = self._live
+            out["containers"] = len(self._containers)
+            out["reconcile_interval_s"] = self.reconcile_interval_s
+        return out
+
+    # ── write-through (engine lifecycle paths) ────────────
+
+    def put(self, container: Any) -> None:
+        """Store an already reloaded container object."""
+        if not self.is_live():
+            return
+        labels = getattr(container, "labels", None) or {}
+        with self._lock:
+            if self._trion_label in labels:
+                self._containers[container.id] = container
+
+    def forget(self, container_id: str) -> None:
+        with self._lock:
+            self._containers.pop(str(container_id or ""), None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._containers.clear()
+
+    def refresh(self, container_id: str) -> None:
+        """Re-inspect one container (1 API call); drops it if it is gone."""
+        if not self.is_live():
+            return
+        self._refresh(container_id)
+
+    def _refresh(self, container_id: str) -> None:
+        try:
+            container = self._get_client().containers.get(container_id)
+        except Exception as exc:
+            # NotFound or daemon error: the next reconcile restores the truth
+            self._logger.debug(f"[StateCache] refresh {str(container_id)[:12]} dropped: {exc}")
+            self.forget(container_id)
+            return
+        labels = getattr(container, "labels", None) or {}
+        with self._lock:
+            if self._trion_label in labels:
+                self._containers[container.id] = container
+            else:
+                self._containers.pop(container.id, None)
+
+    # ── events + reconciliation ───────────────────────────
+
+    def reconcile(self) -> int:
+        """Rebuild the snapshot from one full list call. Returns the container count."""
+        client = self._get_client()
+        containers = client.containers.list(all=True, filters={"label": self._trion_label})
+        with self._lock:
+            self._containers = {c.id: c for c in containers}
+            self._stats["reconciles"] += 1
+        return len(containers)
+
+    def apply_event(self, event: Dict[str, Any]) -> None:
+        """Apply one decoded Docker event to the snapshot."""
+        if not isinstance(event, dict) or event.get("Type", "container") != "container":
+            self._count("events_ignored")
+            return
+        action = str(event.get("Action") or event.get("status") or "")
+        container_id = str(event.get("id") or (event.get("Actor") or {}).get("ID") or "")
+        if not container_id:
+            self._count("events_ignored")
+            return
+        if action in _DROP_ACTIONS:
+            self.forget(container_id)
+        elif action in _REFRESH_ACTIONS or action.startswith("health_status"):
+            self._refresh(container_id)
+        else:
+            self._count("events_ignored")
+            return
+        self._count("events_applied")
+
+    def _count(self, key: str) -> None:
+        with self._lock:
+            self._stats[key] += 1
+
+    def _run(self) -> None:
+        backoff = 1.0
+        since = int(time.time())
+        while not self._stop.is_set():
+            until = since + int(self.reconcile_interval_s)
+            try:
+                client = self._get_client()
+                events = client.events(
+                    decode=True,
+                    since=since,
+                    until=until,
+                    filters={"type": "container", "label": self._trion_label},
+                )
+                self._events = events
+                # Subscribe first, then list: events racing the list are replayed
+                # from `since` and applied on top of the fresh snapshot.
+                self.reconcile()
+                with self._lock:
+                    self._live = True
+                for event in events:
+                    if self._stop.is_set():
+                        break
+                    self.apply_event(event)
+                backoff = 1.0
+            except Exception as exc:
+                with self._lock:
+                    self._live = False
+                if self._stop.is_set():
+                    break  # stop() closed the stream
+                self._count("stream_errors")
+                self._logger.warning(f"[StateCache] Docker event stream failed: {exc}")
+                if self._stop.wait(backoff):
+                    break
+                backoff = min(30.0, backoff * 2)
+                since = int(time.time())
+                continue
+            # Stream ended before `until` (daemon restart, stub client): do not spin
+            self._stop.wait(max(0.0, until - time.time()))
+            since = until
+        _close_stream(self._events)
+        self._events = None
+
+
+def _status(container: Any) -> str:
+    try:
+        return str(container.status or "")
+    except Exception:
+        return ""
+
+
+def _close_stream(events: Any) -> None:
+    close = getattr(events, "close", None)
+    if callable(close):
+        try:
+            close()
+        except Exception:
+            pass
@@ -0,0 +1,253 @@
+"""
+Background container stats collector.
+
+`container.stats(stream=False)` blocks for about one sample interval per
+container, so per-request stats calls serialize for seconds when many
+containers run. The collector keeps one streaming stats subscription
+(`stats(stream=True, decode=True)`, ~1 sample/s) per running TRION
+container in a daemon thread and stores parsed samples in a small ring
+buffer. Reads (`latest`, `window`, `snapshot_all`) never touch Docker.
+
+A supervisor thread reconciles the tracked set against the running
+containers every `refresh_s` seconds (event-fed state cache when live),
+starting streams for new containers and retiring streams of gone ones.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+from collections import deque
+from dataclasses import asdict, dataclass
+from typing import Any, Callable, Deque, Dict, Iterable, List, Optional
+
+STATS_COLLECTOR_ENABLE = os.environ.get("COMMANDER_STATS_COLLECTOR_ENABLE", "true").strip().lower() not in (
+    "0", "false", "no", "off",
+)
+STATS_WINDOW_SAMPLES = max(2, int(os.environ.get("COMMANDER_STATS_WINDOW_SAMPLES", "60")))
+STATS_REFRESH_S = max(1.0, float(os.environ.get("COMMANDER_STATS_REFRESH_S", "5")))
+# Samples older than this are not served as "live" (stream stalled/ended)
+STATS_MAX_AGE_S = max(2.0, float(os.environ.get("COMMANDER_STATS_MAX_AGE_S", "10")))
+
+
+@dataclass(frozen=True)
+class StatsSample:
+    ts: float
+    cpu_percent: float
+    memory_mb: float
+    memory_limit_mb: float
+    network_rx_bytes: int
+    network_tx_bytes: int
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+def parse_stats_sample(raw: Dict[str, Any], ts: Optional[float] = None) -> StatsSample:
+    """Docker stats JSON → StatsSample (same formulas as the old blocking path)."""
+    cpu_stats = raw.get("cpu_stats") or {}
+    precpu_stats = raw.get("precpu_stats") or {}
+    cpu_delta = (cpu_stats.get("cpu_usage") or {}).get("total_usage", 0) - \
+                (precpu_stats.get("cpu_usage") or {}).get("total_usage", 0)
+    system_delta = cpu_stats.get("system_cpu_usage", 0) - precpu_stats.get("system_cpu_usage", 0)
+    num_cpus = cpu_stats.get("online_cpus", 1) or 1
+    # First streamed sample has no precpu_stats → no delta yet
+    if precpu_stats.get("system_cpu_usage") and system_delta > 0:
+        cpu_percent = (cpu_delta / system_delta) * num_cpus * 100.0
+    else:
+        cpu_percent = 0.0
+
+    memory_stats = raw.get("memory_stats") or {}
+    mem_usage = memory_stats.get("usage", 0) or 0
+    mem_limit = memory_stats.get("limit", 1) or 1
+
+    networks = raw.get("networks") or {}
+    return StatsSample(
+        ts=time.time() if ts is None else ts,
+        cpu_percent=max(0.0, float(cpu_percent)),
+        memory_mb=mem_usage / (1024 * 1024),
+        memory_limit_mb=mem_limit / (1024 * 1024),
+        network_rx_bytes=sum(v.get("rx_bytes", 0) for v in networks.values()),
+        network_tx_bytes=sum(v.get("tx_bytes", 0) for v in networks.values()),
+    )
+
+
+class _Stream:
+    __slots__ = ("container_id", "samples", "stop", "thread", "started_at")
+
+    def __init__(self, container_id: str, maxlen: int):
+        self.container_id = container_id
+        self.samples: Deque[StatsSample] = deque(maxlen=maxlen)
+        self.stop = threading.Event()
+        self.thread: Optional[threading.Thread] = None
+        self.started_at = time.time()
+
+
+class ContainerStatsCollector:
+    """One streaming stats subscription per running container (thread-safe)."""
+
+    def __init__(
+        self,
+        *,
+        get_client: Callable[[], Any],
+        list_running: Callable[[], Iterable[Any]],
+        logger: Any,
+        window_samples: int = STATS_WINDOW_SAMPLES,
+        refresh_s: float = STATS_REFRESH_S,
+        max_age_s: float = STATS_MAX_AGE_S,
+    ):
+        self._get_client = get_client
+        self._list_running = list_running
+        self._logger = logger
+        self.window_samples = int(window_samples)
+        self.refresh_s = float(refresh_s)
+        self.max_age_s = float(max_age_s)
+        self._lock = threading.RLock()
+        self._streams: Dict[str, _Stream] = {}
+        self._supervisor: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        self._stats = {"streams_started": 0, "streams_ended": 0, "samples": 0, "stream_errors": 0}
+
+    # ── lifecycle ─────────────────────────────────────────
+
+    def start(self) -> bool:
+        if not STATS_COLLECTOR_ENABLE:
+            return False
+        with self._lock:
+            if self._supervisor is not None and self._supervisor.is_alive():
+                return True
+            self._stop.clear()
+            self._supervisor = threading.Thread(
+                target=self._supervise, name="trion-stats-supervisor", daemon=True
+            )
+            self._supervisor.start()
+        return True
+
+    def stop(self) -> None:
+        self._stop.set()
+        with self._lock:
+            streams = list(self._streams.values())
+            self._streams.clear()
+            self._supervisor = None
+        for stream in streams:
+            stream.stop.set()
+
+    def is_running(self) -> bool:
+        with self._lock:
+            return self._supervisor is not None and self._supervisor.is_alive()
+
+    # ── tracking ──────────────────────────────────────────
+
+    def sync(self, running_ids: Iterable[str]) -> None:
+        """Start streams for new running containers, retire the rest."""
+        wanted = {str(cid) for cid in running_ids if cid}
+        with self._lock:
+            for cid in [cid for cid in self._streams if cid not in wanted]:
+                self._streams.pop(cid).stop.set()
+            for cid in wanted:
+                stream = self._streams.get(cid)
+                if stream is None or stream.thread is None or not stream.thread.is_alive():
+                    self._start_stream(cid, previous=stream)
+
+    def track(self, container_id: str) -> None:
+        """Start streaming one container now (e.g. right after deploy)."""
+        if not self.is_running():
+            return
+        with self._lock:
+            stream = self._streams.get(container_id)
+            if stream is None or stream.thread is None or not stream.thread.is_alive():
+                self._start_stream(container_id, previous=stream)
+
+    def forget(self, container_id: str) -> None:
+        with self._lock:
+            stream = self._streams.pop(container_id, None)
+        if stream is not None:
+            stream.stop.set()
+
+    def _start_stream(self, container_id: str, previous: Optional[_Stream] = None) -> None:
+        stream = _Stream(container_id, self.window_samples)
+        if previous is not None:
+            stream.samples.extend(previous.samples)  # keep history across reconnects
+        stream.thread = threading.Thread(
+            target=self._consume, args=(stream,), name=f"trion-stats-{container_id[:12]}", daemon=True
+        )
+        self._streams[container_id] = stream
+        self._stats["streams_started"] += 1
+        stream.thread.start()
+
+    def _consume(self, stream: _Stream) -> None:
+        try:
+            container = self._get_client().containers.get(stream.container_id)
+            for raw in container.stats(stream=True, decode=True):
+                if stream.stop.is_set() or self._stop.is_set():
+                    break
+                sample = parse_stats_sample(raw)
+                with self._lock:
+                    stream.samples.append(sample)
+                    self._stats["samples"] += 1
+        except Exception as exc:
+            with self._lock:
+                self._stats["stream_errors"] += 1
+            self._logger.debug(f"[StatsCollector] stream {stream.container_id[:12]} ended: {exc}")
+        finally:
+            with self._lock:
+                self._stats["streams_ended"] += 1
+
+    def _supervise(self) -> None:
+        while not self._stop.is_set():
+            try:
+                self.sync(getattr(c, "id", c) for c in self._list_running())
+            except Exception as exc:
+                self._logger.debug(f"[StatsCollector] running-set refresh failed: {exc}")
+            self._stop.wait(self.refresh_s)
+
+    # ── reads (no Docker I/O) ─────────────────────────────
+
+    def latest(self, container_id: str) -> Optional[StatsSample]:
+        """Newest sample if it is fresh, else None (caller may poll Docker)."""
+        with self._lock:
+            stream = self._streams.get(container_id)
+            if stream is None or not stream.samples:
+                return None
+            sample = stream.samples[-1]
+        if time.time() - sample.ts > self.max_age_s:
+            return None
+        return sample
+
+    def window(self, container_id: str, seconds: Optional[float] = None) -> Dict[str, float]:
+        """Averages over the ring buffer (optionally only the last `seconds`)."""
+        with self._lock:
+            stream = self._streams.get(container_id)
+            samples: List[StatsSample] = list(stream.samples) if stream is not None else []
+        if seconds is not None and samples:
+            cutoff = samples[-1].ts - float(seconds)
+            samples = [s for s in samples if s.ts >= cutoff]
+        if not samples:
+            return {}
+        n = len(samples)
+        return {
+            "samples": n,
+            "seconds": round(samples[-1].ts - samples[0].ts, 1),
+            "cpu_percent_avg": sum(s.cpu_percent for s in samples) / n,
+            "cpu_percent_max": max(s.cpu_percent for s in samples),
+            "memory_mb_avg": sum(s.memory_mb for s in samples) / n,
+            "memory_mb_max": max(s.memory_mb for s in samples),
+        }
+
+    def snapshot_all(self) -> Dict[str, StatsSample]:
+        """Latest fresh sample per tracked container."""
+        now = time.time()
+        with self._lock:
+            latest = {cid: s.samples[-1] for cid, s in self._streams.items() if s.samples}
+        return {cid: s for cid, s in latest.items() if now - s.ts <= self.max_age_s}
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            out = dict(self._stats)
+            out["running"] = self._supervisor is not None and self._supervisor.is_alive()
+            out["streams"] = sum(
+                1 for s in self._streams.values() if s.thread is not None and s.thread.is_alive()
+            )
+            out["window_samples"] = self.window_samples
+        return out
@@ -27,7 +27,7 @@ import re
 import hashlib
 import httpx
 from typing import AsyncGenerator, Tuple, Dict, Any, List, Optional
-from config import OLLAMA_BASE, OUTPUT_MODEL, get_output_provider
+from config import OLLAMA_BASE, OUTPUT_MODEL, get_llm_keep_alive, get_output_provider
 from core.llm_provider_client import complete_chat, stream_chat, resolve_role_provider
 from utils.role_endpoint_resolver import resolve_role_endpoint
 from utils.logger import log_info, log_error, log_debug, log_warn
@@ -309,7 +309,7 @@ class LoopEngine:
             "model": self.model,
             "messages": messages,
             "stream": bool(stream),
-            "keep_alive": "5m",
+            "keep_alive": get_llm_keep_alive(),
         }
         if tools:
             payload["tools"] = tools
@@ -3,22 +3,35 @@ Autonomy Cron Scheduler
 
 Simple in-process cron runner that dispatches autonomous objectives into
 the existing /api/autonomous/jobs queue.
+
+Scheduling: every enabled job has one entry (next_fire_utc, seq, job_id) in
+a min-heap. A tick only pops the entries that are due instead of matching
+every job against the current minute; the next fire time is computed
+field-wise (``next_fire_utc``) and re-pushed.
 """
 
 from __future__ import annotations
 
 import asyncio
+import heapq
 import json
 import os
 import re
 import uuid
+from bisect import bisect_left
 from dataclasses import dataclass
-from datetime import datetime, timedelta, timezone
-from typing import Any, Awaitable, Callable, Dict, FrozenSet, List, Optional, Set, Tuple
+from datetime import date, datetime, timedelta, timezone
+from typing import Any, Awaitable, Callable, Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
 from zoneinfo import ZoneInfo
 
+from core.autonomy.cron_state_store import CronStateStore, store_path_for
 from utils.logger import log_info, log_warning, log_error
 
+# Fire times are searched this far ahead; jobs without a hit are rechecked
+# after _FIRE_RECHECK_DAYS (e.g. "0 0 31 2 *").
+_FIRE_HORIZON_DAYS = 366 * 8
+_FIRE_RECHECK_DAYS = 30
+
 
 def _utcnow() -> datetime:
     return datetime.now(timezone.utc)
@@ -211,6 +224,13 @@ class _CronField:
     values: Set[int]
     any: bool
 
+    @property
+    def sorted_values(self) -> List[int]:
+        cached = self.__dict__.get("_sorted")
+        if cached is None:
+            cached = self.__dict__["_sorted"] = sorted(self.values)
+        return cached
+
 
 def _parse_int(token: str, lo: int, hi: int, label: str) -> int:
     try:
@@ -313,6 +333,99 @@ def cron_matches(parsed: Dict[str, Any], local_dt: datetime) -> bool:
     return dom_match or dow_match
 
 
+def _day_matches(parsed: Dict[str, Any], day: date) -> bool:
+    if day.month not in parsed["month"].values:
+        return False
+    dom = parsed["day_of_month"]
+    dow = parsed["day_of_week"]
+    dom_match = day.day in dom.values
+    dow_match = ((day.weekday() + 1) % 7) in dow.values  # 0=sunday
+    if dom.any and dow.any:
+        return True
+    if dom.any:
+        return dow_match
+    if dow.any:
+        return dom_match
+    return dom_match or dow_match
+
+
+def _first_time_of_day(parsed: Dict[str, Any], hour: int, minute: int) -> Optional[Tuple[int, int]]:
+    """Earliest matching (hour, minute) >= (hour, minute) on a matching day."""
+    hours = parsed["hour"].sorted_values
+    minutes = parsed["minute"].sorted_values
+    i = bisect_left(hours, hour)
+    if i < len(hours) and hours[i] == hour:
+        j = bisect_left(minutes, minute)
+        if j < len(minutes):
+            return hour, minutes[j]
+        i += 1
+    if i < len(hours):
+        return hours[i], minutes[0]
+    return None
+
+
+def _utc_instant(tz: ZoneInfo, day: date, hour: int = 0, minute: int = 0, fold: int = 0) -> datetime:
+    local = datetime(day.year, day.month, day.day, hour, minute, tzinfo=tz, fold=fold)
+    return local.astimezone(timezone.utc)
+
+
+def _has_offset_change(tz: ZoneInfo, day: date) -> bool:
+    """True if the UTC offset is not constant over the local day (DST switch)."""
+    offsets = {
+        datetime(day.year, day.month, day.day, h, m, tzinfo=tz, fold=fold).utcoffset()
+        for h, m in ((0, 0), (23, 59))
+        for fold in (0, 1)
+    }
+    return len(offsets) > 1
+
+
+def next_fire_utc(
+    parsed: Dict[str, Any],
+    tz: ZoneInfo,
+    after_utc: datetime,
+    max_days: int = 35,
+) -> Optional[datetime]:
+    """
+    First whole UTC minute strictly after after_utc whose local wall time in
+    tz matches the cron expression (the minutes the tick would fire in).
+
+    Field-wise: months and days that do not match are skipped, and the
+    first matching hour/minute of a day is found by bisection. Days with a
+    DST switch are walked minute by minute over their real instants, so
+    skipped local times never fire and repeated ones are seen twice.
+    """
+    start = after_utc.astimezone(timezone.utc).replace(second=0, microsecond=0) + timedelta(minutes=1)
+    local_start = start.astimezone(tz)
+    day = local_start.date()
+    last_day = day + timedelta(days=max_days)
+    first = True
+    while day <= last_day:
+        if day.month not in parsed["month"].values:
+            day = date(day.year + (day.month == 12), day.month % 12 + 1, 1)
+            first = False
+            continue
+        if not _day_matches(parsed, day):
+            day += timedelta(days=1)
+            first = False
+            continue
+        if _has_offset_change(tz, day):
+            next_day = day + timedelta(days=1)
+            cursor = max(start, min(_utc_instant(tz, day, fold=f) for f in (0, 1)))
+            end = max(_utc_instant(tz, next_day, fold=f) for f in (0, 1))
+            while cursor < end:
+                if cron_matches(parsed, cursor.astimezone(tz)):
+                    return cursor
+                cursor += timedelta(minutes=1)
+        else:
+            hour, minute = (local_start.hour, local_start.minute) if first else (0, 0)
+            hit = _first_time_of_day(parsed, hour, minute)
+            if hit is not None:
+                return _utc_instant(tz, day, *hit)
+        day += timedelta(days=1)
+        first = False
+    return None
+
+
 def next_matching_utc(
     parsed: Dict[str, Any],
     timezone_name: str,
@@ -320,15 +433,8 @@ def next_matching_utc(
     max_days: int = 35,
 ) -> str:
     now_utc = from_utc or _utcnow()
-    tz = ZoneInfo(timezone_name)
-    local = now_utc.astimezone(tz).replace(second=0, microsecond=0)
-    max_minutes = max_days * 24 * 60
-
-    for i in range(1, max_minutes + 1):
-        candidate = local + timedelta(minutes=i)
-        if cron_matches(parsed, candidate):
-            return _iso(candidate.astimezone(timezone.utc))
-    return ""
+    nxt = next_fire_utc(parsed, ZoneInfo(timezone_name), now_utc, max_days=max_days)
+    return _iso(nxt) if nxt is not None else ""
 
 
 def validate_cron_expression(expr: str) -> Dict[str, Any]:
@@ -343,19 +449,18 @@ def estimate_min_interval_seconds(
     max_hits: int = 40,
 ) -> int:
     """
-    Best-effort lower bound of schedule interval by minute-scan.
+    Best-effort lower bound of schedule interval over the first hits.
     Returns a large value when no second hit is found in scan window.
     """
     base = datetime(2026, 1, 1, 0, 0, tzinfo=timezone.utc)
-    max_minutes = max_days * 24 * 60
+    end = base + timedelta(days=max_days)
+    tz = ZoneInfo("UTC")
     prev: Optional[datetime] = None
     min_delta: Optional[int] = None
     hits = 0
 
-    for i in range(max_minutes + 1):
-        candidate = base + timedelta(minutes=i)
-        if not cron_matches(parsed, candidate):
-            continue
+    candidate = next_fire_utc(parsed, tz, base - timedelta(minutes=1), max_days=max_days + 1)
+    while candidate is not None and candidate <= end:
         hits += 1
         if prev is not None:
             delta = max(60, int((candidate - prev).total_seconds()))
@@ -365,6 +470,7 @@ def estimate_min_interval_seconds(
         prev = candidate
         if hits >= max_hits and min_delta is not None:
             break
+        candidate = next_fire_utc(parsed, tz, candidate, max_days=max_days + 1)
 
     return min_delta if min_delta is not None else (366 * 24 * 60 * 60)
 
@@ -448,6 +554,11 @@ class AutonomyCronScheduler:
         hardware_probe_cb: Optional[Callable[[], Dict[str, Any]]] = None,
     ):
         self._state_path = str(state_path or "").strip()
+        self._store: Optional[CronStateStore] = (
+            CronStateStore(store_path_for(self._state_path), legacy_json_path=self._state_path)
+            if self._state_path
+            else None
+        )
         self._tick_s = max(5, int(tick_s))
         self._max_concurrency = max(1, int(max_concurrency))
         self._submit_cb = submit_cb
@@ -473,6 +584,12 @@ class AutonomyCronScheduler:
         self._history: List[Dict[str, Any]] = []
         self._jobs: Dict[str, Dict[str, Any]] = {}
         self._expr_cache: Dict[str, Dict[str, Any]] = {}
+        # min-heap of (next_fire_utc, seq, job_id); an entry is live only while
+        # _fire_seq[job_id] == seq (lazy invalidation on update/delete)
+        self._fire_heap: List[Tuple[datetime, int, str]] = []
+        self._fire_seq: Dict[str, int] = {}
+        self._next_fire: Dict[str, datetime] = {}
+        self._seq = 0
 
         self._tick_task: Optional[asyncio.Task] = None
         self._workers: List[asyncio.Task] = []
@@ -511,49 +628,117 @@ class AutonomyCronScheduler:
                 pass
             except Exception:
                 pass
+        if self._store is not None:
+            await asyncio.wrap_future(self._store.flush())
         log_info("[AutonomyCron] stopped")
 
-    def _ensure_parent_dir(self) -> None:
-        parent = os.path.dirname(self._state_path) or "."
-        os.makedirs(parent, exist_ok=True)
-
-    def _save_state_locked(self) -> None:
-        if not self._state_path:
+    def _save_state_locked(
+        self,
+        job_ids: Iterable[str] = (),
+        runs: Iterable[Dict[str, Any]] = (),
+    ) -> None:
+        """
+        Persist only the given jobs (upsert, or delete if gone) and new run
+        records. Serialization happens here for a consistent snapshot; the
+        SQLite write itself runs on the store's writer thread.
+        """
+        if self._store is None:
             return
-        self._ensure_parent_dir()
-        data = {
-            "version": 1,
-            "updated_at": _iso(),
-            "jobs": list(self._jobs.values()),
-            "history": self._history[-200:],
-        }
-        tmp = f"{self._state_path}.tmp"
-        with open(tmp, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2)
-        os.replace(tmp, self._state_path)
+        upserts: Dict[str, str] = {}
+        deletes: List[str] = []
+        for job_id in job_ids:
+            job = self._jobs.get(job_id)
+            if job is None:
+                deletes.append(job_id)
+            else:
+                upserts[job_id] = json.dumps(job)
+        run_rows = [json.dumps(run) for run in runs]
+        if upserts or deletes or run_rows:
+            self._store.write(upserts=upserts, deletes=deletes, runs=run_rows)
 
     def _load_state_locked(self) -> None:
         self._jobs = {}
         self._history = []
         self._pending = []
         self._running = {}
-        if not self._state_path or not os.path.exists(self._state_path):
+        if self._store is not None:
+            try:
+                jobs, history = self._store.load()
+                for job in jobs:
+                    if not isinstance(job, dict):
+                        continue
+                    job_id = str(job.get("id") or "").strip()
+                    if not job_id:
+                        continue
+                    self._jobs[job_id] = job
+                self._history = [x for x in history if isinstance(x, dict)][-200:]
+            except Exception as exc:
+                log_warning(f"[AutonomyCron] failed to load state: {exc}")
+        self._rebuild_fire_heap_locked()
+
+    def _rebuild_fire_heap_locked(self) -> None:
+        self._fire_heap = []
+        self._fire_seq = {}
+        self._next_fire = {}
+        now_utc = _utcnow()
+        for job_id in self._jobs:
+            self._schedule_job_locked(job_id, now_utc=now_utc)
+
+    def _push_fire_locked(self, job_id: str, fire_utc: datetime) -> None:
+        self._seq += 1
+        self._fire_seq[job_id] = self._seq
+        self._next_fire[job_id] = fire_utc
+        heapq.heappush(self._fire_heap, (fire_utc, self._seq, job_id))
+
+    def _unschedule_job_locked(self, job_id: str) -> None:
+        self._fire_seq.pop(job_id, None)
+        self._next_fire.pop(job_id, None)
+
+    def _schedule_job_locked(
+        self,
+        job_id: str,
+        *,
+        now_utc: Optional[datetime] = None,
+        after_utc: Optional[datetime] = None,
+    ) -> None:
+        """
+        (Re)place the job's heap entry. Without after_utc the current minute
+        still counts. Jobs whose run_at/cron cannot be evaluated are queued
+        as due now so the tick records the error.
+        """
+        self._unschedule_job_locked(job_id)
+        job = self._jobs.get(job_id)
+        if not job or not bool(job.get("enabled", True)):
             return
+        now_utc = now_utc or _utcnow()
+        if self._is_one_shot_mode(job):
+            if self._is_one_shot_consumed(job):
+                return
+            run_at = _parse_iso_datetime(str(job.get("run_at", "")))
+            self._push_fire_locked(job_id, run_at if run_at is not None else now_utc)
+            return
+        if after_utc is None:
+            after_utc = now_utc.replace(second=0, microsecond=0) - timedelta(minutes=1)
         try:
-            with open(self._state_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
-            for job in (data.get("jobs") or []):
-                if not isinstance(job, dict):
-                    continue
-                job_id = str(job.get("id") or "").strip()
-                if not job_id:
-                    continue
-                self._jobs[job_id] = job
-            hist = data.get("history") or []
-            if isinstance(hist, list):
-                self._history = [x for x in hist if isinstance(x, dict)][-200:]
-        except Exception as exc:
-            log_warning(f"[AutonomyCron] failed to load state: {exc}")
+            parsed = self._parsed_expr(str(job.get("cron", "")))
+            tz = ZoneInfo(str(job.get("timezone", "UTC")))
+        except Exception:
+            self._push_fire_locked(job_id, now_utc)
+            return
+        fire = next_fire_utc(parsed, tz, after_utc, max_days=_FIRE_HORIZON_DAYS)
+        if fire is None:
+            fire = now_utc + timedelta(days=_FIRE_RECHECK_DAYS)
+        self._push_fire_locked(job_id, fire)
+
+    def _pop_due_locked(self, now_utc: datetime) -> List[Tuple[datetime, str]]:
+        due: List[Tuple[datetime, str]] = []
+        while self._fire_heap and self._fire_heap[0][0] <= now_utc:
+            fire_utc, seq, job_id = heapq.heappop(self._fire_heap)
+            if self._fire_seq.get(job_id) != seq:
+                continue  # stale entry
+            self._unschedule_job_locked(job_id)
+            due.append((fire_utc, job_id))
+        return due
 
     def _parsed_expr(self, expr: str) -> Dict[str, Any]:
         key = str(expr or "").strip()
@@ -582,6 +767,10 @@ class AutonomyCronScheduler:
                 if self._is_one_shot_consumed(job):
                     return ""
                 return _iso(run_at)
+            cached = self._next_fire.get(str(job.get("id", "")))
+            if cached is not None and cached > _utcnow().replace(second=0, microsecond=0):
+                # heap entry is the first hit at or after the current minute
+                return _iso(cached)
             parsed = self._parsed_expr(str(job.get("cron", "")))
             return next_matching_utc(parsed, str(job.get("timezone", "UTC")))
         except Exception:
@@ -590,10 +779,14 @@ class AutonomyCronScheduler:
     async def list_jobs(self) -> List[Dict[str, Any]]:
         async with self._lock:
             out = []
+            running = {x.get("cron_job_id") for x in self._running.values()}
+            queued = {x.get("cron_job_id") for x in self._pending}
             for job in self._jobs.values():
                 entry = dict(job)
                 entry["next_run_at"] = self._next_run_iso(job) if bool(job.get("enabled", True)) else ""
-                entry["runtime_state"] = self._runtime_state_for_job_locked(str(job.get("id", "")))
+                entry["runtime_state"] = self._runtime_state_for_job_locked(
+                    str(job.get("id", "")), running=running, queued=queued
+                )
                 out.append(entry)
             out.sort(key=lambda x: x.get("created_at", ""), reverse=True)
             return out
@@ -611,10 +804,22 @@ class AutonomyCronScheduler:
             out["runtime_state"] = self._runtime_state_for_job_locked(job_id)
             return out
 
-    def _runtime_state_for_job_locked(self, cron_job_id: str) -> str:
-        if any(x.get("cron_job_id") == cron_job_id for x in self._running.values()):
+    def _runtime_state_for_job_locked(
+        self,
+        cron_job_id: str,
+        *,
+        running: Optional[Set[Any]] = None,
+        queued: Optional[Set[Any]] = None,
+    ) -> str:
+        if running is not None:
+            if cron_job_id in running:
+                return "running"
+        elif any(x.get("cron_job_id") == cron_job_id for x in self._running.values()):
             return "running"
-        if any(x.get("cron_job_id") == cron_job_id for x in self._pending):
+        if queued is not None:
+            if cron_job_id in queued:
+                return "queued"
+        elif any(x.get("cron_job_id") == cron_job_id for x in self._pending):
             return "queued"
         job = self._jobs.get(cron_job_id) or {}
         if self._is_one_shot_mode(job) and self._is_one_shot_consumed(job):
@@ -1085,7 +1290,8 @@ class AutonomyCronScheduler:
                 "last_manual_trigger_at": "",
             }
             self._jobs[job_id] = job
-            self._save_state_locked()
+            self._schedule_job_locked(job_id)
+            self._save_state_locked([job_id])
             out = dict(job)
             out["next_run_at"] = self._next_run_iso(job) if bool(job.get("enabled", True)) else ""
             out["runtime_state"] = self._runtime_state_for_job_locked(job_id)
@@ -1103,7 +1309,8 @@ class AutonomyCronScheduler:
             self._enforce_job_policy_locked(normalized, existing=current, job_id=job_id)
             normalized["updated_at"] = _iso()
             self._jobs[job_id] = {**current, **normalized}
-            self._save_state_locked()
+            self._schedule_job_locked(job_id)
+            self._save_state_locked([job_id])
             out = dict(self._jobs[job_id])
             out["next_run_at"] = self._next_run_iso(out) if bool(out.get("enabled", True)) else ""
             out["runtime_state"] = self._runtime_state_for_job_locked(job_id)
@@ -1116,9 +1323,10 @@ class AutonomyCronScheduler:
         async with self._lock:
             existed = job_id in self._jobs
             self._jobs.pop(job_id, None)
+            self._unschedule_job_locked(job_id)
             self._pending = [x for x in self._pending if x.get("cron_job_id") != job_id]
             if existed:
-                self._save_state_locked()
+                self._save_state_locked([job_id])
             return existed
 
     async def pause_job(self, cron_job_id: str) -> Optional[Dict[str, Any]]:
@@ -1156,11 +1364,12 @@ class AutonomyCronScheduler:
             if self._is_one_shot_mode(job):
                 self._jobs[job_id]["last_trigger_key"] = f"one_shot:manual:{item['queued_at']}"
                 self._jobs[job_id]["enabled"] = False
+                self._unschedule_job_locked(job_id)
             else:
                 self._jobs[job_id]["last_trigger_key"] = ""
             if str(item.get("reason", "")) in {"manual", "tool"}:
                 self._jobs[job_id]["last_manual_trigger_at"] = item["queued_at"]
-            self._save_state_locked()
+            self._save_state_locked([job_id])
             out = dict(job)
             out["runtime_state"] = self._runtime_state_for_job_locked(job_id)
             out["next_run_at"] = self._next_run_iso(job) if bool(job.get("enabled", True)) else ""
@@ -1179,6 +1388,7 @@ class AutonomyCronScheduler:
                     "tick_s": self._tick_s,
                     "max_concurrency": self._max_concurrency,
                     "state_path": self._state_path,
+                    "state_store": self._store.path if self._store is not None else "",
                 },
                 "policy": self._policy_snapshot_locked(),
                 "counts": {
@@ -1199,6 +1409,36 @@ class AutonomyCronScheduler:
                 "recent": list(self._history[-50:]),
             }
 
+    async def list_runs(
+        self,
+        *,
+        cron_job_id: str = "",
+        status: str = "",
+        limit: int = 50,
+        before: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """
+        Run history newest-first. ``before`` is the ``next_before`` cursor of
+        the previous page. Without a state store only the in-memory window
+        (last 200 runs) is available.
+        """
+        limit = max(1, min(200, int(limit or 50)))
+        if self._store is not None:
+            return await asyncio.wrap_future(
+                self._store.list_runs(cron_job_id=cron_job_id, status=status, limit=limit, before=before)
+            )
+        async with self._lock:
+            indexed = [
+                (idx, run)
+                for idx, run in enumerate(self._history, start=1)
+                if (not cron_job_id or run.get("cron_job_id") == cron_job_id)
+                and (not status or run.get("status") == status)
+                and (before is None or idx < int(before))
+            ]
+        page = indexed[::-1][: limit + 1]
+        runs = [{**run, "seq": idx} for idx, run in page[:limit]]
+        return {"runs": runs, "next_before": runs[-1]["seq"] if len(page) > limit else None}
+
     async def _tick_loop(self) -> None:
         while not self._stopping:
             try:
@@ -1211,11 +1451,14 @@ class AutonomyCronScheduler:
 
     async def _tick_once(self) -> None:
         now_utc = _utcnow()
-        changed = False
+        minute_start = now_utc.replace(second=0, microsecond=0)
+        changed: Set[str] = set()
         queued = 0
         async with self._lock:
-            for job_id, job in self._jobs.items():
-                if not bool(job.get("enabled", True)):
+            retry: List[Tuple[str, datetime]] = []
+            for fire_utc, job_id in self._pop_due_locked(now_utc):
+                job = self._jobs.get(job_id)
+                if not job or not bool(job.get("enabled", True)):
                     continue
                 if self._is_one_shot_mode(job):
                     if self._is_one_shot_consumed(job):
@@ -1224,9 +1467,10 @@ class AutonomyCronScheduler:
                     if run_at is None:
                         job["last_status"] = "error"
                         job["last_error"] = "one_shot_run_at_invalid"
-                        changed = True
+                        changed.add(job_id)
                         continue
                     if now_utc < run_at:
+                        self._push_fire_locked(job_id, run_at)
                         continue
                     allowed, policy_error = self._check_enqueue_policy_locked(
                         cron_job_id=job_id,
@@ -1238,7 +1482,8 @@ class AutonomyCronScheduler:
                             job["last_status"] = "throttled"
                             job["last_error"] = policy_error.error_code
                             job["updated_at"] = _iso()
-                            changed = True
+                            changed.add(job_id)
+                        retry.append((job_id, run_at))
                         continue
 
                     run_id = uuid.uuid4().hex[:12]
@@ -1253,25 +1498,33 @@ class AutonomyCronScheduler:
                     job["last_triggered_at"] = item["queued_at"]
                     job["last_trigger_key"] = f"one_shot:{str(job.get('run_at', ''))}"
                     job["enabled"] = False
-                    changed = True
+                    changed.add(job_id)
                     queued += 1
                     continue
                 cron_expr = str(job.get("cron", ""))
                 tz_name = str(job.get("timezone", "UTC"))
                 try:
                     parsed = self._parsed_expr(cron_expr)
-                    local = now_utc.astimezone(ZoneInfo(tz_name))
+                    tz = ZoneInfo(tz_name)
+                    local = now_utc.astimezone(tz)
                     local = local.replace(second=0, microsecond=0)
                 except Exception as exc:
                     job["last_status"] = "error"
                     job["last_error"] = f"cron_parse_error:{exc}"
-                    changed = True
+                    changed.add(job_id)
                     continue
 
+                if fire_utc < minute_start:
+                    # missed minute(s) (tick lag, recheck entry): no catch-up,
+                    # only the current minute may still fire
+                    self._schedule_job_locked(job_id, now_utc=now_utc)
+                    if self._next_fire.get(job_id) != minute_start:
+                        continue
+                    self._unschedule_job_locked(job_id)
+
                 minute_key = local.strftime("%Y-%m-%dT%H:%M")
-                if not cron_matches(parsed, local):
-                    continue
                 if str(job.get("last_trigger_key", "")) == minute_key:
+                    self._schedule_job_locked(job_id, now_utc=now_utc, after_utc=minute_start)
                     continue
                 allowed, policy_error = self._check_enqueue_policy_locked(
                     cron_job_id=job_id,
@@ -1283,7 +1536,8 @@ class AutonomyCronScheduler:
                         job["last_status"] = "throttled"
                         job["last_error"] = policy_error.error_code
                         job["updated_at"] = _iso()
-                        changed = True
+                        changed.add(job_id)
+                    retry.append((job_id, minute_start))
                     continue
 
                 run_id = uuid.uuid4().hex[:12]
@@ -1297,11 +1551,16 @@ class AutonomyCronScheduler:
                 await self._queue.put(item)
                 job["last_triggered_at"] = item["queued_at"]
                 job["last_trigger_key"] = minute_key
-                changed = True
+                changed.add(job_id)
                 queued += 1
+                self._schedule_job_locked(job_id, now_utc=now_utc, after_utc=minute_start)
+
+            # throttled jobs stay due and are retried on the next tick
+            for job_id, fire_utc in retry:
+                self._push_fire_locked(job_id, fire_utc)
 
             if changed:
-                self._save_state_locked()
+                self._save_state_locked(changed)
 
         if queued:
             log_info(f"[AutonomyCron] queued scheduled runs: {queued}")
@@ -1322,7 +1581,7 @@ class AutonomyCronScheduler:
                 if job:
                     job["last_run_at"] = running_entry["started_at"]
                     job["last_status"] = "dispatching"
-                self._save_state_locked()
+                    self._save_state_locked([str(item.get("cron_job_id", ""))])
 
             try:
                 job_id = str(item.get("cron_job_id", ""))
@@ -1347,23 +1606,22 @@ class AutonomyCronScheduler:
                             job_ref["last_status"] = "deferred_hardware"
                             job_ref["last_error"] = guard_reason[:300]
                             job_ref["updated_at"] = finish
-                        self._history.append(
-                            {
-                                "run_id": run_id,
-                                "cron_job_id": job_id,
-                                "status": "deferred_hardware",
-                                "queued_at": item.get("queued_at"),
-                                "started_at": running_entry.get("started_at"),
-                                "finished_at": finish,
-                                "reason": item.get("reason", "schedule"),
-                                "hardware_guard": {
-                                    "reason": guard_reason,
-                                    "snapshot": guard_snapshot,
-                                },
-                            }
-                        )
+                        hist = {
+                            "run_id": run_id,
+                            "cron_job_id": job_id,
+                            "status": "deferred_hardware",
+                            "queued_at": item.get("queued_at"),
+                            "started_at": running_entry.get("started_at"),
+                            "finished_at": finish,
+                            "reason": item.get("reason", "schedule"),
+                            "hardware_guard": {
+                                "reason": guard_reason,
+                                "snapshot": guard_snapshot,
+                            },
+                        }
+                        self._history.append(hist)
                         self._history = self._history[-200:]
-                        self._save_state_locked()
+                        self._save_state_locked([job_id], [hist])
                     continue
 
                 conversation_id = str(job.get("conversation_id", "")).strip()
@@ -1408,7 +1666,7 @@ class AutonomyCronScheduler:
                             job_ref["enabled"] = False
                     self._history.append(hist)
                     self._history = self._history[-200:]
-                    self._save_state_locked()
+                    self._save_state_locked([job_id], [hist])
             except asyncio.CancelledError:
                 raise
             except Exception as exc:
@@ -1425,19 +1683,18 @@ class AutonomyCronScheduler:
                         job_ref["updated_at"] = finish
                         if self._is_one_shot_mode(job_ref):
                             job_ref["enabled"] = False
-                    self._history.append(
-                        {
-                            "run_id": run_id,
-                            "cron_job_id": job_id,
-                            "status": "failed",
-                            "queued_at": item.get("queued_at"),
-                            "started_at": item.get("started_at"),
-                            "finished_at": finish,
-                            "error": err[:500],
-                            "reason": item.get("reason", "schedule"),
-                        }
-                    )
+                    hist = {
+                        "run_id": run_id,
+                        "cron_job_id": job_id,
+                        "status": "failed",
+                        "queued_at": item.get("queued_at"),
+                        "started_at": item.get("started_at"),
+                        "finished_at": finish,
+                        "error": err[:500],
+                        "reason": item.get("reason", "schedule"),
+                    }
+                    self._history.append(hist)
                     self._history = self._history[-200:]
-                    self._save_state_locked()
+                    self._save_state_locked([job_id], [hist])
             finally:
                 self._queue.task_done()
@@ -0,0 +1,240 @@
+"""
+Journaled state store for the Autonomy Cron Scheduler.
+
+SQLite (WAL) instead of rewriting one JSON file per change: every write only
+upserts/deletes the changed job rows and appends new run records. All
+statements run on a single writer thread, so callers never block the event
+loop and writes stay in submission order. Run history is kept beyond the
+in-memory window and can be paged newest-first via ``list_runs``.
+
+An existing legacy JSON state file (same path with ``.json``) is imported
+once when the database is created.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from utils.logger import log_info, log_warning
+
+_HISTORY_KEEP = max(200, int(os.getenv("AUTONOMY_CRON_HISTORY_KEEP", "5000")))
+_RECENT_RUNS = 200
+
+
+def store_path_for(state_path: str) -> str:
+    """``memory_speicher/autonomy_cron_state.json`` -> ``...state.sqlite``."""
+    root, ext = os.path.splitext(state_path)
+    if ext.lower() in {".sqlite", ".db"}:
+        return state_path
+    return f"{root if ext.lower() == '.json' else state_path}.sqlite"
+
+
+class CronStateStore:
+    def __init__(
+        self,
+        db_path: str,
+        *,
+        legacy_json_path: str = "",
+        history_keep: int = _HISTORY_KEEP,
+    ):
+        self.path = str(db_path)
+        self._legacy_json_path = str(legacy_json_path or "")
+        self._history_keep = max(1, int(history_keep))
+        self._conn: Optional[sqlite3.Connection] = None
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="autonomy-cron-store")
+        self.stats: Dict[str, int] = {"writes": 0, "jobs_written": 0, "runs_written": 0, "errors": 0}
+
+    # ---- writer thread ----------------------------------------------------
+
+    def _db(self) -> sqlite3.Connection:
+        if self._conn is not None:
+            return self._conn
+        parent = os.path.dirname(self.path) or "."
+        os.makedirs(parent, exist_ok=True)
+        conn = sqlite3.connect(self.path, timeout=5.0, isolation_level=None, check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS cron_jobs (
+                id TEXT PRIMARY KEY,
+                data TEXT NOT NULL
+            )
+            """
+        )
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS cron_runs (
+                seq INTEGER PRIMARY KEY AUTOINCREMENT,
+                run_id TEXT NOT NULL,
+                cron_job_id TEXT NOT NULL,
+                status TEXT NOT NULL,
+                finished_at TEXT NOT NULL,
+                data TEXT NOT NULL
+            )
+            """
+        )
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_cron_runs_job ON cron_runs(cron_job_id, seq)")
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_cron_runs_status ON cron_runs(status, seq)")
+        conn.execute("CREATE TABLE IF NOT EXISTS cron_meta (key TEXT PRIMARY KEY, value TEXT NOT NULL)")
+        self._conn = conn
+        self._import_legacy_json(conn)
+        return conn
+
+    def _import_legacy_json(self, conn: sqlite3.Connection) -> None:
+        if conn.execute("SELECT 1 FROM cron_meta WHERE key='legacy_json_checked'").fetchone():
+            return
+        jobs: List[Dict[str, Any]] = []
+        history: List[Dict[str, Any]] = []
+        path = self._legacy_json_path
+        if path and path != self.path and os.path.exists(path):
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    data = json.load(f)
+                jobs = [j for j in (data.get("jobs") or []) if isinstance(j, dict) and str(j.get("id") or "").strip()]
+                history = [h for h in (data.get("history") or []) if isinstance(h, dict)]
+            except Exception as exc:
+                log_warning(f"[AutonomyCron] legacy state import failed: {exc}")
+        conn.execute("BEGIN")
+        try:
+            self._apply(
+                conn,
+                {str(j["id"]).strip(): json.dumps(j) for j in jobs},
+                [],
+                [json.dumps(h) for h in history],
+            )
+            conn.execute("INSERT OR REPLACE INTO cron_meta(key, value) VALUES('legacy_json_checked', '1')")
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        if jobs or history:
+            log_info(f"[AutonomyCron] imported legacy state jobs={len(jobs)} runs={len(history)} from {path}")
+
+    def _apply(
+        self,
+        conn: sqlite3.Connection,
+        upserts: Dict[str, str],
+        deletes: List[str],
+        runs: List[str],
+    ) -> None:
+        if upserts:
+            conn.executemany(
+                "INSERT INTO cron_jobs(id, data) VALUES(?, ?) ON CONFLICT(id) DO UPDATE SET data=excluded.data",
+                list(upserts.items()),
+            )
+        if deletes:
+            conn.executemany("DELETE FROM cron_jobs WHERE id=?", [(job_id,) for job_id in deletes])
+        if runs:
+            rows = []
+            for raw in runs:
+                run = json.loads(raw)
+                rows.append((
+                    str(run.get("run_id", "")),
+                    str(run.get("cron_job_id", "")),
+                    str(run.get("status", "")),
+                    str(run.get("finished_at", "") or ""),
+                    raw,
+                ))
+            conn.executemany(
+                "INSERT INTO cron_runs(run_id, cron_job_id, status, finished_at, data) VALUES(?, ?, ?, ?, ?)",
+                rows,
+            )
+            conn.execute(
+                "DELETE FROM cron_runs WHERE seq <= (SELECT MAX(seq) FROM cron_runs) - ?",
+                (self._history_keep,),
+            )
+
+    def _write(self, upserts: Dict[str, str], deletes: List[str], runs: List[str]) -> None:
+        try:
+            conn = self._db()
+            conn.execute("BEGIN")
+            try:
+                self._apply(conn, upserts, deletes, runs)
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+            self.stats["writes"] += 1
+            self.stats["jobs_written"] += len(upserts) + len(deletes)
+            self.stats["runs_written"] += len(runs)
+        except Exception as exc:
+            self.stats["errors"] += 1
+            log_warning(f"[AutonomyCron] state write failed: {exc}")
+
+    def _load(self) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        conn = self._db()
+        jobs = [json.loads(row["data"]) for row in conn.execute("SELECT data FROM cron_jobs ORDER BY rowid")]
+        recent = [
+            json.loads(row["data"])
+            for row in conn.execute("SELECT data FROM cron_runs ORDER BY seq DESC LIMIT ?", (_RECENT_RUNS,))
+        ]
+        recent.reverse()
+        return jobs, recent
+
+    def _list_runs(self, cron_job_id: str, status: str, limit: int, before: Optional[int]) -> Dict[str, Any]:
+        conn = self._db()
+        where, params = [], []
+        if cron_job_id:
+            where.append("cron_job_id=?")
+            params.append(cron_job_id)
+        if status:
+            where.append("status=?")
+            params.append(status)
+        if before is not None:
+            where.append("seq<?")
+            params.append(int(before))
+        sql = "SELECT seq, data FROM cron_runs"
+        if where:
+            sql += " WHERE " + " AND ".join(where)
+        sql += " ORDER BY seq DESC LIMIT ?"
+        rows = conn.execute(sql, (*params, limit + 1)).fetchall()
+        runs = [{**json.loads(row["data"]), "seq": row["seq"]} for row in rows[:limit]]
+        return {
+            "runs": runs,
+            "next_before": runs[-1]["seq"] if len(rows) > limit else None,
+        }
+
+    # ---- public API (thread-safe, ordered) ---------------------------------
+
+    def load(self) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """Blocking: all jobs plus the most recent runs (oldest first)."""
+        return self._executor.submit(self._load).result()
+
+    def write(
+        self,
+        *,
+        upserts: Optional[Dict[str, str]] = None,
+        deletes: Iterable[str] = (),
+        runs: Iterable[str] = (),
+    ) -> Future:
+        """Queue one transaction; payloads are pre-serialized JSON strings."""
+        return self._executor.submit(self._write, dict(upserts or {}), list(deletes), list(runs))
+
+    def list_runs(
+        self,
+        *,
+        cron_job_id: str = "",
+        status: str = "",
+        limit: int = 50,
+        before: Optional[int] = None,
+    ) -> Future:
+        """Newest-first page; pass ``next_before`` of the result to continue."""
+        return self._executor.submit(self._list_runs, str(cron_job_id or ""), str(status or ""), int(limit), before)
+
+    def flush(self) -> Future:
+        """Resolves once every previously queued write has been applied."""
+        return self._executor.submit(lambda: None)
+
+    def close(self) -> None:
+        def _close() -> None:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+        self._executor.submit(_close).result()
@@ -18,6 +18,7 @@ from __future__ import annotations
 import hashlib
 import json
 import os
+import threading
 from dataclasses import dataclass
 from dataclasses import field as _dc_field
 from datetime import datetime
@@ -300,13 +301,48 @@ _DEFAULT_RULES = [
 ]
 
 
+_RULES_PATH = os.path.join(os.path.dirname(__file__), "mapping_rules.yaml")
+_rules_cache: Dict[str, object] = {"sig": None, "data": None}
+_rules_lock = threading.Lock()
+
+
+def _rules_signature() -> Optional[tuple]:
+    """(mtime_ns, size) of mapping_rules.yaml, None if missing."""
+    try:
+        st = os.stat(_RULES_PATH)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+def _load_mapping_rules() -> Optional[dict]:
+    """
+    Parsed mapping_rules.yaml, cached by mtime/size.
+
+    Returns None when PyYAML or the file is missing. Parse errors propagate to
+    the caller (every loader below logs and falls back on its own). The parsed
+    document is shared — callers must treat it as read-only.
+    """
+    if not _YAML_AVAILABLE:
+        return None
+    sig = _rules_signature()
+    if sig is None:
+        return None
+    with _rules_lock:
+        if _rules_cache["sig"] == sig:
+            return _rules_cache["data"]  # type: ignore[return-value]
+        with open(_RULES_PATH, "r", encoding="utf-8") as f:
+            data = yaml.safe_load(f) or {}
+        _rules_cache["sig"] = sig
+        _rules_cache["data"] = data
+        return data
+
+
 def _load_limits() -> dict:
     """Load limits from mapping_rules.yaml (if available), else use defaults."""
-    rules_path = os.path.join(os.path.dirname(__file__), "mapping_rules.yaml")
-    if _YAML_AVAILABLE and os.path.exists(rules_path):
+    if _YAML_AVAILABLE and os.path.exists(_RULES_PATH):
         try:
-            with open(rules_path, "r", encoding="utf-8") as f:
-                data = yaml.safe_load(f)
+            data = _load_mapping_rules() or {}
             return {**_DEFAULT_LIMITS, **(data.get("limits", {}))}
         except Exception as e:
             log_warn(f"[ContextCleanup] Could not load mapping_rules.yaml: {e}")
@@ -328,11 +364,9 @@ def _load_confidence_config() -> dict:
 
     Falls back to empty dict (callers use _SOURCE_RELIABILITY_DEFAULTS).
     """
-    rules_path = os.path.join(os.path.dirname(__file__), "mapping_rules.yaml")
-    if _YAML_AVAILABLE and os.path.exists(rules_path):
+    if _YAML_AVAILABLE and os.path.exists(_RULES_PATH):
         try:
-            with open(rules_path, "r", encoding="utf-8") as f:
-                data = yaml.safe_load(f)
+            data = _load_mapping_rules() or {}
             return {
                 "source_reliability": data.get("source_reliability", {}),
                 "entity_match":       data.get("confidence", {}).get("entity_match", {}),
@@ -1003,6 +1037,7 @@ def _apply_events_to_state(
     future use by richer rendering/rendering decisions.
     """
     _MAX_SOURCE_IDS = 100
+    known_ids = set(state.source_event_ids)  # O(1) dedupe instead of a list scan
     for ev in events:
         try:
             _apply_event(state, ev, conf_cfg=conf_cfg)
@@ -1011,7 +1046,8 @@ def _apply_events_to_state(
 
         # Track source_event_ids for ALL event types (bounded, dedupe)
         ev_id = ev.get("id", "")
-        if ev_id and ev_id not in state.source_event_ids:
+        if ev_id and ev_id not in known_ids:
+            known_ids.add(ev_id)
             state.source_event_ids.append(ev_id)
 
     if len(state.source_event_ids) > _MAX_SOURCE_IDS:
@@ -1046,12 +1082,10 @@ def _load_output_config() -> dict:
 
     Falls back to empty dict; callers use module-level defaults.
     """
-    rules_path = os.path.join(os.path.dirname(__file__), "mapping_rules.yaml")
-    if _YAML_AVAILABLE and os.path.exists(rules_path):
+    if _YAML_AVAILABLE and os.path.exists(_RULES_PATH):
         try:
-            with open(rules_path, "r", encoding="utf-8") as f:
-                data = yaml.safe_load(f)
-            return data.get("output", {}).get("compact_context", {})
+            data = _load_mapping_rules() or {}
+            return dict(data.get("output", {}).get("compact_context", {}))
         except Exception as exc:
             log_warn(f"[ContextCleanup] Could not load output config: {exc}")
     return {}
@@ -1747,11 +1781,9 @@ _RENDERER_CHAR_CAP_DEFAULT = 2200
 
 def _get_renderer_char_cap() -> int:
     """Load renderer char_cap from mapping_rules.yaml limits.char_cap, else default 2200."""
-    rules_path = os.path.join(os.path.dirname(__file__), "mapping_rules.yaml")
-    if _YAML_AVAILABLE and os.path.exists(rules_path):
+    if _YAML_AVAILABLE and os.path.exists(_RULES_PATH):
         try:
-            with open(rules_path, "r", encoding="utf-8") as f:
-                data = yaml.safe_load(f)
+            data = _load_mapping_rules() or {}
             val = data.get("limits", {}).get("char_cap")
             if val is not None:
                 return int(val)
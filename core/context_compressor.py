@@ -22,6 +22,7 @@ import httpx
 from pathlib import Path
 from datetime import datetime
 from typing import Optional, List, Tuple, Dict, Any
+from config import get_llm_keep_alive
 from utils.logger import log_info, log_warn, log_error, log_debug
 from utils.service_endpoint_resolver import default_service_endpoint
 
@@ -31,7 +32,6 @@ from utils.service_endpoint_resolver import default_service_endpoint
 PROTOCOL_DIR     = Path(os.getenv("PROTOCOL_DIR", "/app/memory"))
 OLLAMA_BASE      = os.getenv("OLLAMA_BASE", default_service_endpoint("ollama", 11434))
 COMPRESS_MODEL   = os.getenv("COMPRESS_MODEL", "ministral-3:3b")
-MEMORY_URL       = os.getenv("MCP_BASE", "http://mcp-sql-memory:8081")
 
 PHASE1_THRESHOLD   = int(os.getenv("COMPRESSION_THRESHOLD",       "20000"))
 PHASE2_THRESHOLD   = int(os.getenv("COMPRESSION_PHASE2_THRESHOLD","40000"))
@@ -138,7 +138,7 @@ async def _llm_call(prompt: str, max_tokens: int = 1200) -> str:
                     "model": COMPRESS_MODEL,
                     "prompt": prompt,
                     "stream": False,
-                    "keep_alive": "2m",
+                    "keep_alive": get_llm_keep_alive(),
                     "options": {"temperature": 0.1, "num_predict": max_tokens},
                 },
             )
@@ -440,38 +440,39 @@ FAKTEN (JSON-Array):"""
 
 
 async def _push_facts_to_graph(facts: List[str]):
-    """Schreibt extrahierte Fakten per graph_add_node ins Langzeitgedächtnis."""
+    """Schreibt extrahierte Fakten per graph_add_node ins Langzeitgedächtnis.
+
+    Läuft über MCPHub, damit der Result-Cache die memory-Domain invalidiert
+    (sonst liefern gecachte memory_graph_search-Treffer die neuen Fakten nicht).
+    """
     if not facts:
         return
 
+    from mcp.hub import get_hub
+
+    hub = get_hub()
     date_str = datetime.now().strftime("%Y-%m-%d")
     pushed = 0
 
     for fact in facts:
         try:
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                r = await client.post(
-                    f"{MEMORY_URL}/mcp",
-                    json={
-                        "method": "tools/call",
-                        "params": {
-                            "name": "graph_add_node",
-                            "arguments": {
-                                "conversation_id": "_summaries",
-                                "content": fact,
-                                "source_type": "summary",
-                                "importance": 0.7,
-                                "metadata": json.dumps({
-                                    "compressed_from": date_str,
-                                    "type": "extracted_fact"
-                                }),
-                            }
-                        }
-                    },
-                    headers={"Accept": "application/json, text/event-stream"},
-                )
-                if r.status_code == 200:
-                    pushed += 1
+            result = await hub.call_tool_async(
+                "graph_add_node",
+                {
+                    "conversation_id": "_summaries",
+                    "content": fact,
+                    "source_type": "summary",
+                    "importance": 0.7,
+                    "metadata": json.dumps({
+                        "compressed_from": date_str,
+                        "type": "extracted_fact"
+                    }),
+                },
+            )
+            if isinstance(result, dict) and result.get("error"):
+                log_warn(f"[ContextCompressor] graph_add_node failed: {result['error']}")
+            else:
+                pushed += 1
         except Exception as e:
             log_warn(f"[ContextCompressor] graph_add_node failed: {e}")
 
@@ -15,6 +15,8 @@ import os
 import json
 import time
 import re
+import threading
+from collections import OrderedDict
 from concurrent.futures import ALL_COMPLETED, ThreadPoolExecutor, wait
 from pathlib import Path
 from datetime import datetime, timedelta
@@ -40,6 +42,48 @@ from core.work_context.writers.workspace_events import build_workspace_event_fro
 # Constants
 SYSTEM_CONV_ID = "system"
 
+# Small-model context: newest workspace events per build (last 48h)
+_SMALL_CTX_EVENT_LIMIT = 100
+_SMALL_CTX_EVENT_HOURS = 48
+_SMALL_CTX_WINDOWS_MAX = max(1, int(os.getenv("CONTEXT_EVENT_WINDOWS_MAX", "64")))
+
+
+def _int_event_ids(events: List[dict]) -> Optional[List[int]]:
+    ids: List[int] = []
+    for ev in events:
+        ev_id = ev.get("id") if isinstance(ev, dict) else None
+        if not isinstance(ev_id, int) or isinstance(ev_id, bool):
+            return None
+        ids.append(ev_id)
+    return ids
+
+
+class _WorkspaceEventWindows:
+    """LRU: conversation_id -> (high-water event id, event window oldest-first)."""
+
+    def __init__(self, max_entries: int = _SMALL_CTX_WINDOWS_MAX):
+        self._max = max(1, int(max_entries))
+        self._entries: "OrderedDict[str, Tuple[int, List[dict]]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def checkout(self, conversation_id: str) -> Optional[Tuple[int, List[dict]]]:
+        with self._lock:
+            return self._entries.pop(conversation_id, None)
+
+    def checkin(self, conversation_id: str, high_water: int, window: List[dict]) -> None:
+        with self._lock:
+            self._entries[conversation_id] = (high_water, window)
+            self._entries.move_to_end(conversation_id)
+            while len(self._entries) > self._max:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+_EVENT_WINDOWS = _WorkspaceEventWindows()
+
 
 class ContextResult:
     """Result of context retrieval operations"""
@@ -260,6 +304,48 @@ class ContextManager:
     # MAIN PUBLIC INTERFACE
     # ═══════════════════════════════════════════════════════════
     
+    def memory_lookup_keys(self, thinking_plan: Optional[Dict]) -> List[str]:
+        """
+        Memory keys get_context looks up for this plan (normalized and capped).
+
+        Empty for temporal plans and plans without needs_memory/is_fact_query.
+        The needs_memory fallback keys are not included; get_context adds them
+        only after its recall check.
+        """
+        if not thinking_plan or thinking_plan.get("time_reference"):
+            return []
+        if not (thinking_plan.get("needs_memory") or thinking_plan.get("is_fact_query")):
+            return []
+        return self._normalize_memory_keys(thinking_plan.get("memory_keys", []))
+
+    def search_memory_keys(
+        self,
+        keys: List[str],
+        conversation_id: str,
+        *,
+        include_system: bool = True,
+        deadline: Optional[float] = None,
+        call_timeout_s: Optional[float] = None,
+        request_cache: Optional[Dict[str, Any]] = None,
+        cancel_event: Optional[Any] = None,
+    ) -> Dict[str, Tuple[str, bool]]:
+        """
+        Look up memory keys concurrently: key -> (content, found).
+
+        Backend results land in request_cache under "<ctx>|<backend>|<key>"
+        (ctx = conversation_id or "system"). Once cancel_event is set, no
+        further keys are submitted and running lookups are not awaited.
+        """
+        return self._search_memory_keys_parallel(
+            keys=keys,
+            conversation_id=conversation_id,
+            include_system=include_system,
+            deadline=deadline,
+            call_timeout_s=call_timeout_s,
+            request_cache=request_cache,
+            cancel_event=cancel_event,
+        )
+
     def get_context(
         self,
         query: str,
@@ -329,7 +415,7 @@ class ContextManager:
             if not _smm_time_ref and thinking_plan and (
                 thinking_plan.get("needs_memory") or thinking_plan.get("is_fact_query")
             ):
-                memory_keys = self._normalize_memory_keys(thinking_plan.get("memory_keys", []))
+                memory_keys = self.memory_lookup_keys(thinking_plan)
                 # Fallback: ThinkingLayer liefert needs_memory=True aber keine keys
                 if not memory_keys and thinking_plan.get("needs_memory"):
                     if self._should_apply_memory_fallback_keys(
@@ -342,7 +428,7 @@ class ContextManager:
                     else:
                         log_info("[ContextManager] fallback keys skipped (non-recall/runtime turn)")
                 if memory_keys and _budget_ok("small_mode_memory_keys"):
-                    key_results = self._search_memory_keys_parallel(
+                    key_results = self.search_memory_keys(
                         keys=memory_keys,
                         conversation_id=conversation_id,
                         include_system=False,
@@ -467,7 +553,7 @@ class ContextManager:
         if time_ref:
             log_info(f"[ContextManager] Skipping memory search — time_reference={time_ref}, protocol is source")
         elif thinking_plan.get("needs_memory") or thinking_plan.get("is_fact_query"):
-            memory_keys = self._normalize_memory_keys(thinking_plan.get("memory_keys", []))
+            memory_keys = self.memory_lookup_keys(thinking_plan)
             # Fallback: ThinkingLayer liefert needs_memory=True aber keine keys
             if not memory_keys and thinking_plan.get("needs_memory"):
                 if self._should_apply_memory_fallback_keys(
@@ -480,7 +566,7 @@ class ContextManager:
                 else:
                     log_info("[ContextManager] fallback keys skipped (non-recall/runtime turn)")
             if memory_keys and _budget_ok("memory_keys_loop"):
-                key_results = self._search_memory_keys_parallel(
+                key_results = self.search_memory_keys(
                     keys=memory_keys,
                     conversation_id=conversation_id,
                     include_system=True,
@@ -553,12 +639,17 @@ class ContextManager:
         deadline: Optional[float] = None,
         call_timeout_s: Optional[float] = None,
         request_cache: Optional[Dict[str, Any]] = None,
+        cancel_event: Optional[Any] = None,
     ) -> Dict[str, Tuple[str, bool]]:
         """
         Request phase retrieval:
         1) collect keys
         2) execute key lookups concurrently
         3) merge in original key order
+
+        cancel_event (threading.Event, optional): once set, no further keys
+        are submitted and the call returns without waiting for running
+        lookups (used by the plan speculation when its plan is dropped).
         """
         normalized_keys = self._normalize_memory_keys(keys)
         if not normalized_keys:
@@ -582,8 +673,15 @@ class ContextManager:
         results: Dict[str, Tuple[str, bool]] = {}
         future_map = {}
 
-        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="ctx-keys") as key_executor:
+        def _cancelled() -> bool:
+            return cancel_event is not None and cancel_event.is_set()
+
+        key_executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="ctx-keys")
+        try:
             for key in normalized_keys:
+                if _cancelled():
+                    results[key] = ("", False)
+                    continue
                 if _remaining_timeout() <= 0:
                     log_warn(f"[ContextManager-Memory] Key phase budget exhausted before key='{key}'")
                     results[key] = ("", False)
@@ -607,11 +705,22 @@ class ContextManager:
                     num_keys=len(normalized_keys),
                     max_workers=max_workers,
                 )
-                done, not_done = wait(
-                    set(future_map.keys()),
-                    timeout=phase_wait_timeout,
-                    return_when=ALL_COMPLETED,
-                )
+                if cancel_event is None:
+                    done, not_done = wait(
+                        set(future_map.keys()),
+                        timeout=phase_wait_timeout,
+                        return_when=ALL_COMPLETED,
+                    )
+                else:
+                    # Wait in short slices so a cancel takes effect promptly.
+                    wait_until = time.monotonic() + phase_wait_timeout
+                    not_done = set(future_map.keys())
+                    while not_done and not _cancelled():
+                        slice_s = min(0.05, wait_until - time.monotonic())
+                        if slice_s <= 0:
+                            break
+                        _, not_done = wait(not_done, timeout=slice_s, return_when=ALL_COMPLETED)
+                    done = set(future_map.keys()) - not_done
                 for fut in done:
                     key = future_map[fut]
                     try:
@@ -622,8 +731,12 @@ class ContextManager:
                 for fut in not_done:
                     key = future_map[fut]
                     fut.cancel()
-                    log_warn(f"[ContextManager-Memory] Key lookup timed out key='{key}'")
+                    if not _cancelled():
+                        log_warn(f"[ContextManager-Memory] Key lookup timed out key='{key}'")
                     results[key] = ("", False)
+        finally:
+            # Cancelled: don't wait for running lookups (backend calls can't be interrupted).
+            key_executor.shutdown(wait=not _cancelled(), cancel_futures=_cancelled())
 
         return results
 
@@ -1361,6 +1474,55 @@ class ContextManager:
             return sc.get("entries", [])
         return []
 
+    def _fetch_small_model_events(self, hub, conversation_id: Optional[str]) -> list:
+        """
+        Newest workspace events (limit 100, last 48h), newest first.
+
+        Per conversation the previous window and its high-water mark (highest
+        event id seen) are kept, so later turns only ask the change feed
+        (workspace_event_list with since_id) for newer events and slide the
+        window locally. A full page, an unexpected feed answer or non-int ids
+        fall back to the plain newest-100 read.
+        """
+        args: dict = {"limit": _SMALL_CTX_EVENT_LIMIT}
+        if not conversation_id:
+            return self._extract_workspace_events(hub.call_tool("workspace_event_list", args))
+        args["conversation_id"] = conversation_id
+
+        cached = _EVENT_WINDOWS.checkout(conversation_id)
+        window: Optional[List[dict]] = None
+        high_water = 0
+        if cached is not None:
+            high_water, window = cached
+            feed = self._extract_workspace_events(
+                hub.call_tool("workspace_event_list", {**args, "since_id": high_water})
+            )
+            feed_ids = _int_event_ids(feed)
+            if (
+                feed_ids is None
+                or len(feed) >= _SMALL_CTX_EVENT_LIMIT
+                or any(i <= high_water for i in feed_ids)
+            ):
+                window = None
+            else:
+                window = window + sorted(feed, key=lambda ev: ev["id"])
+                high_water = max(feed_ids, default=high_water)
+        if window is None:
+            events = self._extract_workspace_events(hub.call_tool("workspace_event_list", args))
+            ids = _int_event_ids(events)
+            if ids is None:
+                return events
+            window = sorted(events, key=lambda ev: ev["id"])
+            high_water = max(ids, default=0)
+
+        cutoff = (datetime.utcnow() - timedelta(hours=_SMALL_CTX_EVENT_HOURS)).isoformat()
+        window = [
+            ev for ev in window
+            if not isinstance(ev.get("created_at"), str) or ev["created_at"] >= cutoff
+        ][-_SMALL_CTX_EVENT_LIMIT:]
+        _EVENT_WINDOWS.checkin(conversation_id, high_water, window)
+        return list(reversed(window))
+
     def _build_work_context_extra_events(
         self,
         *,
@@ -1435,11 +1597,7 @@ class ContextManager:
             hub.initialize()
 
             # Load events from Fast-Lane event store
-            args: dict = {"limit": 100}
-            if conversation_id:
-                args["conversation_id"] = conversation_id
-            ev_result = hub.call_tool("workspace_event_list", args)
-            events = self._extract_workspace_events(ev_result)
+            events = self._fetch_small_model_events(hub, conversation_id)
             # SINGLE_TRUTH_GUARD: filter event types already claimed by another channel.
             # Prevents tool_result events (in tool_ctx) from also appearing in compact context.
             if exclude_event_types:
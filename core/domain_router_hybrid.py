@@ -9,22 +9,17 @@ Design goals:
 
 from __future__ import annotations
 
-import math
 import re
 import time
 from datetime import datetime, timedelta, timezone
 from typing import Any, Dict, List, Optional, Tuple
 
-import httpx
-
 from config import (
-    OLLAMA_BASE,
     get_domain_router_embedding_enable,
     get_domain_router_lock_min_confidence,
-    get_embedding_model,
 )
-from utils.logger import log_debug
-from utils.role_endpoint_resolver import resolve_role_endpoint
+from core.embedding_client import embed_text
+from utils.embedding.similarity import PrototypeMatrix, cosine_similarity
 
 
 class DomainRouterHybridClassifier:
@@ -61,6 +56,25 @@ class DomainRouterHybridClassifier:
         "funktion erstellen",
         "code schreiben",
     )
+    _SKILL_SELECTOR_TOOLS = frozenset({"create_skill", "run_skill", "autonomous_skill_task"})
+    _CONTAINER_SELECTOR_TOOLS = frozenset({
+        "request_container",
+        "stop_container",
+        "exec_in_container",
+        "container_logs",
+        "container_stats",
+        "container_list",
+        "container_inspect",
+        "blueprint_list",
+        "blueprint_get",
+        "blueprint_create",
+        "storage_scope_list",
+        "storage_scope_upsert",
+        "list_used_ports",
+        "find_free_port",
+        "check_port",
+        "list_blueprint_ports",
+    })
     _CONTAINER_MARKERS = (
         "container",
         "container manager",
@@ -150,7 +164,7 @@ class DomainRouterHybridClassifier:
 
     def __init__(self) -> None:
         self._embed_timeout_s = 1.5
-        self._proto_cache: Dict[str, List[float]] = {}
+        self._proto_cache: PrototypeMatrix = PrototypeMatrix()
         self._proto_ts = 0.0
         self._proto_ttl_s = 6 * 60 * 60
 
@@ -237,36 +251,11 @@ class DomainRouterHybridClassifier:
 
     @staticmethod
     def _cos(a: List[float], b: List[float]) -> float:
-        if not a or not b or len(a) != len(b):
-            return 0.0
-        dot = 0.0
-        na = 0.0
-        nb = 0.0
-        for x, y in zip(a, b):
-            dot += x * y
-            na += x * x
-            nb += y * y
-        if na <= 0.0 or nb <= 0.0:
-            return 0.0
-        return dot / (math.sqrt(na) * math.sqrt(nb))
+        return cosine_similarity(a, b)
 
     async def _embed(self, text: str) -> Optional[List[float]]:
-        route = resolve_role_endpoint("embedding", default_endpoint=OLLAMA_BASE)
-        if route.get("hard_error"):
-            return None
-        endpoint = route.get("endpoint") or OLLAMA_BASE
-        payload = {"model": get_embedding_model(), "prompt": text}
-        try:
-            async with httpx.AsyncClient(timeout=self._embed_timeout_s) as client:
-                resp = await client.post(f"{endpoint}/api/embeddings", json=payload)
-                resp.raise_for_status()
-                data = resp.json()
-            vec = data.get("embedding")
-            if isinstance(vec, list) and vec:
-                return [float(v) for v in vec]
-        except Exception as exc:
-            log_debug(f"[DomainRouter] embedding unavailable: {type(exc).__name__}: {exc}")
-        return None
+        # Shared per-turn + LRU cache: one Ollama round-trip per text and turn.
+        return await embed_text(text, timeout_s=self._embed_timeout_s)
 
     async def _ensure_prototypes(self) -> bool:
         now = time.time()
@@ -279,7 +268,7 @@ class DomainRouterHybridClassifier:
                 cache[label] = vec
         if not cache:
             return False
-        self._proto_cache = cache
+        self._proto_cache = PrototypeMatrix(cache)
         self._proto_ts = now
         return True
 
@@ -542,6 +531,32 @@ class DomainRouterHybridClassifier:
             return "exec"
         return "unknown"
 
+    @staticmethod
+    def _selector_tool_names(selected_tools: Optional[List[Any]]) -> List[str]:
+        names: List[str] = []
+        for item in selected_tools or []:
+            if isinstance(item, dict):
+                name = str(item.get("tool") or item.get("name") or "").strip().lower()
+            else:
+                name = str(item or "").strip().lower()
+            if name:
+                names.append(name)
+        return names
+
+    @staticmethod
+    def _is_cron_selector_tool(name: str) -> bool:
+        return name.startswith("autonomy_cron_") or name == "cron_reference_links_list"
+
+    @classmethod
+    def depends_on_selected_tools(cls, selected_tools: Optional[List[Any]]) -> bool:
+        """True if any selected tool contributes to the rule scores."""
+        return any(
+            cls._is_cron_selector_tool(name)
+            or name in cls._SKILL_SELECTOR_TOOLS
+            or name in cls._CONTAINER_SELECTOR_TOOLS
+            for name in cls._selector_tool_names(selected_tools)
+        )
+
     @classmethod
     def _rule_scores(
         cls,
@@ -607,37 +622,14 @@ class DomainRouterHybridClassifier:
             container_score += 1.0
             reasons.append("container:runtime_context")
 
-        for item in selected_tools or []:
-            if isinstance(item, dict):
-                name = str(item.get("tool") or item.get("name") or "").strip().lower()
-            else:
-                name = str(item or "").strip().lower()
-            if not name:
-                continue
-            if name.startswith("autonomy_cron_") or name == "cron_reference_links_list":
+        for name in cls._selector_tool_names(selected_tools):
+            if cls._is_cron_selector_tool(name):
                 cron_score += 1.5
                 reasons.append(f"cron:selector:{name}")
-            if name in {"create_skill", "run_skill", "autonomous_skill_task"}:
+            if name in cls._SKILL_SELECTOR_TOOLS:
                 skill_score += 1.5
                 reasons.append(f"skill:selector:{name}")
-            if name in {
-                "request_container",
-                "stop_container",
-                "exec_in_container",
-                "container_logs",
-                "container_stats",
-                "container_list",
-                "container_inspect",
-                "blueprint_list",
-                "blueprint_get",
-                "blueprint_create",
-                "storage_scope_list",
-                "storage_scope_upsert",
-                "list_used_ports",
-                "find_free_port",
-                "check_port",
-                "list_blueprint_ports",
-            }:
+            if name in cls._CONTAINER_SELECTOR_TOOLS:
                 container_score += 1.5
                 reasons.append(f"container:selector:{name}")
 
@@ -761,9 +753,7 @@ class DomainRouterHybridClassifier:
             elif get_domain_router_embedding_enable() and await self._ensure_prototypes():
                 text_vec = await self._embed(user_text)
                 if text_vec:
-                    sims: Dict[str, float] = {}
-                    for label, vec in self._proto_cache.items():
-                        sims[label] = self._cos(text_vec, vec)
+                    sims = PrototypeMatrix.coerce(self._proto_cache).scores(text_vec)
                     ranked = sorted(sims.items(), key=lambda kv: kv[1], reverse=True)
                     if ranked:
                         best_label, best_sim = ranked[0]
@@ -1,34 +1,159 @@
 """
 Shared embedding helper for lightweight runtime checks.
+
+All pre-thinking embedding callers (tone / query-budget / domain classifiers,
+tool selector) go through ``embed_text`` and share one cache:
+
+- turn scope: ``begin_embedding_turn()`` installs a per-request dict in a
+  ContextVar; everything awaited inside that request task shares it.
+- cross-request LRU keyed by (model, embedding_version, sha256(text)).
+- single-flight: concurrent identical requests join one in-flight call.
+
+``get_embedding_cache_stats()`` exposes hit/miss counters and the latency
+saved by hits (sum of the original miss latency for every hit).
 """
 
 from __future__ import annotations
 
-import math
-from typing import List, Optional
+import asyncio
+import hashlib
+import os
+import threading
+import time
+from collections import OrderedDict
+from contextvars import ContextVar
+from typing import Any, Dict, List, Optional, Tuple
 
-import httpx
-
-from config import OLLAMA_BASE, get_embedding_model
+from config import OLLAMA_BASE, get_embedding_model, get_embedding_runtime_policy
+from core.http_client_pool import pooled_client
+from utils.embedding.similarity import cosine_similarity  # noqa: F401  (re-export)
 from utils.logger import log_debug
 from utils.role_endpoint_resolver import resolve_role_endpoint
 
+_LRU_MAX_ENTRIES = max(0, int(os.getenv("EMBEDDING_CACHE_MAX_ENTRIES", "512")))
+_LRU_TTL_S = max(0.0, float(os.getenv("EMBEDDING_CACHE_TTL_S", "900")))
 
-async def embed_text(
-    text: str,
-    *,
-    timeout_s: float = 2.8,
-) -> Optional[List[float]]:
+CacheKey = Tuple[str, str, str]
+
+_TURN_CACHE: ContextVar[Optional[Dict[CacheKey, Tuple[List[float], float]]]] = ContextVar(
+    "embedding_turn_cache", default=None
+)
+
+
+def compute_embedding_version_id(model: str, runtime_policy: str) -> str:
+    """Same version id as sql-memory/embedding.py (model + runtime policy)."""
+    model_norm = (model or "").strip()
+    policy_norm = (runtime_policy or "auto").strip().lower()
+    digest = hashlib.sha256(f"{model_norm}|{policy_norm}".encode("utf-8")).hexdigest()[:16]
+    return f"embv1_{digest}"
+
+
+def get_active_embedding_version() -> str:
+    return compute_embedding_version_id(get_embedding_model(), get_embedding_runtime_policy())
+
+
+class _EmbeddingCache:
+    """Cross-request LRU + single-flight table (thread-safe counters)."""
+
+    def __init__(self, max_entries: int, ttl_s: float):
+        self.max_entries = max_entries
+        self.ttl_s = ttl_s
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[CacheKey, Tuple[List[float], float, float]]" = OrderedDict()
+        self._inflight: Dict[CacheKey, asyncio.Future] = {}
+        self._stats = self._empty_stats()
+
+    @staticmethod
+    def _empty_stats() -> Dict[str, float]:
+        return {
+            "turn_hits": 0,
+            "lru_hits": 0,
+            "inflight_joins": 0,
+            "misses": 0,
+            "errors": 0,
+            "miss_latency_ms_total": 0.0,
+            "saved_latency_ms_total": 0.0,
+        }
+
+    def get(self, key: CacheKey) -> Optional[Tuple[List[float], float]]:
+        with self._lock:
+            hit = self._entries.get(key)
+            if hit is None:
+                return None
+            vec, latency_ms, ts = hit
+            if self.ttl_s and (time.time() - ts) > self.ttl_s:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return vec, latency_ms
+
+    def put(self, key: CacheKey, vec: List[float], latency_ms: float) -> None:
+        if self.max_entries <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (vec, latency_ms, time.time())
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def record(self, counter: str, latency_ms: float = 0.0, saved_ms: float = 0.0) -> None:
+        with self._lock:
+            self._stats[counter] += 1
+            self._stats["miss_latency_ms_total"] += latency_ms
+            self._stats["saved_latency_ms_total"] += saved_ms
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            out = dict(self._stats)
+            out["entries"] = len(self._entries)
+        hits = out["turn_hits"] + out["lru_hits"] + out["inflight_joins"]
+        lookups = hits + out["misses"]
+        out["hits"] = hits
+        out["hit_ratio"] = round(hits / lookups, 4) if lookups else 0.0
+        out["miss_latency_ms_total"] = round(out["miss_latency_ms_total"], 1)
+        out["saved_latency_ms_total"] = round(out["saved_latency_ms_total"], 1)
+        return out
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._inflight.clear()
+            self._stats = self._empty_stats()
+
+
+_CACHE = _EmbeddingCache(_LRU_MAX_ENTRIES, _LRU_TTL_S)
+
+
+def begin_embedding_turn() -> None:
+    """Start a fresh per-turn embedding scope for the current request task."""
+    _TURN_CACHE.set({})
+
+
+def get_embedding_cache_stats() -> Dict[str, Any]:
+    return _CACHE.stats()
+
+
+def reset_embedding_cache() -> None:
+    _CACHE.clear()
+
+
+def _cache_key(text: str) -> CacheKey:
+    model = get_embedding_model()
+    version = compute_embedding_version_id(model, get_embedding_runtime_policy())
+    return (model, version, hashlib.sha256(text.encode("utf-8")).hexdigest())
+
+
+async def _fetch_embedding(text: str, timeout_s: float) -> Optional[List[float]]:
     payload = {
         "model": get_embedding_model(),
-        "prompt": str(text or ""),
+        "prompt": text,
     }
     route = resolve_role_endpoint("embedding", default_endpoint=OLLAMA_BASE)
     if route.get("hard_error"):
         return None
     endpoint = route.get("endpoint") or OLLAMA_BASE
     try:
-        async with httpx.AsyncClient(timeout=timeout_s) as client:
+        async with pooled_client(endpoint, timeout_s=timeout_s) as client:
             resp = await client.post(f"{endpoint}/api/embeddings", json=payload)
             resp.raise_for_status()
             data = resp.json()
@@ -40,17 +165,61 @@ async def embed_text(
     return None
 
 
-def cosine_similarity(a: List[float], b: List[float]) -> float:
-    if not a or not b or len(a) != len(b):
-        return 0.0
-    dot = 0.0
-    norm_a = 0.0
-    norm_b = 0.0
-    for x, y in zip(a, b):
-        dot += x * y
-        norm_a += x * x
-        norm_b += y * y
-    if norm_a <= 0.0 or norm_b <= 0.0:
-        return 0.0
-    return dot / (math.sqrt(norm_a) * math.sqrt(norm_b))
+async def embed_text(
+    text: str,
+    *,
+    timeout_s: float = 2.8,
+) -> Optional[List[float]]:
+    text = str(text or "")
+    key = _cache_key(text)
+    turn = _TURN_CACHE.get()
+
+    if turn is not None and key in turn:
+        vec, latency_ms = turn[key]
+        _CACHE.record("turn_hits", saved_ms=latency_ms)
+        return vec
+
+    hit = _CACHE.get(key)
+    if hit is not None:
+        vec, latency_ms = hit
+        _CACHE.record("lru_hits", saved_ms=latency_ms)
+        if turn is not None:
+            turn[key] = (vec, latency_ms)
+        return vec
 
+    loop = asyncio.get_running_loop()
+    pending = _CACHE._inflight.get(key)
+    if pending is not None and pending.get_loop() is loop and not pending.done():
+        try:
+            joined = await asyncio.wait_for(asyncio.shield(pending), timeout=timeout_s)
+        except asyncio.TimeoutError:
+            return None
+        if joined is None:
+            return None
+        vec, latency_ms = joined
+        _CACHE.record("inflight_joins", saved_ms=latency_ms)
+        if turn is not None:
+            turn[key] = joined
+        return vec
+
+    future: asyncio.Future = loop.create_future()
+    _CACHE._inflight[key] = future
+    started = time.perf_counter()
+    result: Optional[Tuple[List[float], float]] = None
+    try:
+        vec = await _fetch_embedding(text, timeout_s)
+        latency_ms = (time.perf_counter() - started) * 1000
+        if vec is None:
+            _CACHE.record("errors", latency_ms=latency_ms)
+            return None
+        result = (vec, latency_ms)
+        _CACHE.record("misses", latency_ms=latency_ms)
+        _CACHE.put(key, vec, latency_ms)
+        if turn is not None:
+            turn[key] = result
+        return vec
+    finally:
+        if not future.done():
+            future.set_result(result)
+        if _CACHE._inflight.get(key) is future:
+            del _CACHE._inflight[key]
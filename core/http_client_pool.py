@@ -0,0 +1,205 @@
+"""
+Shared, long-lived httpx clients for LLM provider and embedding calls.
+
+Every thinking/control/output call used to open a fresh ``httpx.AsyncClient``
+and paid TCP (and TLS for cloud providers) setup again. Callers now borrow a
+pooled client instead:
+
+    async with pooled_client(endpoint, timeout_s=timeout_s) as client:
+        r = await client.post(f"{endpoint}/api/chat", json=payload)
+
+- one client per (event loop, scheme://host:port, timeout) — connections are
+  kept alive between calls and never shared across event loops.
+- per-endpoint connection limits (HTTP_POOL_MAX_CONNECTIONS,
+  HTTP_POOL_MAX_KEEPALIVE, HTTP_POOL_KEEPALIVE_EXPIRY_S).
+- HTTP/2 for https endpoints via ``h2`` from requirements.txt
+  (HTTP_POOL_HTTP2=false disables it; without ``h2`` clients stay on HTTP/1.1).
+- a client is never closed under other borrowers: only a ``ConnectError``
+  retires it from the table, and it is closed once its last borrower is done.
+  Timeouts/read errors leave it alone — httpx drops the broken connection.
+- ``aclose_http_clients()`` is called from the app shutdown hooks.
+
+``get_http_pool_stats()`` exposes client creations vs. reuses.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import threading
+import weakref
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, Tuple
+from urllib.parse import urlsplit
+
+import httpx
+
+from utils.logger import log_debug, log_warning
+
+try:  # h2 ships with requirements.txt; missing only in bare dev installs
+    import h2  # noqa: F401
+    _H2_AVAILABLE = True
+except ImportError:  # pragma: no cover - depends on the environment
+    _H2_AVAILABLE = False
+
+_MAX_CONNECTIONS = max(1, int(os.getenv("HTTP_POOL_MAX_CONNECTIONS", "20")))
+_MAX_KEEPALIVE = max(0, int(os.getenv("HTTP_POOL_MAX_KEEPALIVE", "10")))
+_KEEPALIVE_EXPIRY_S = max(0.0, float(os.getenv("HTTP_POOL_KEEPALIVE_EXPIRY_S", "60")))
+_HTTP2_ENABLE = str(os.getenv("HTTP_POOL_HTTP2", "true")).lower() == "true"
+
+PoolKey = Tuple[str, float]
+
+
+def _origin(url: str) -> str:
+    parts = urlsplit(str(url or ""))
+    if not parts.scheme or not parts.netloc:
+        return str(url or "")
+    return f"{parts.scheme}://{parts.netloc}".lower()
+
+
+def _use_http2(origin: str) -> bool:
+    return _HTTP2_ENABLE and _H2_AVAILABLE and origin.startswith("https://")
+
+
+class _ClientPool:
+    """Per-event-loop client table (thread-safe counters)."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[PoolKey, Any]]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._borrowers: Dict[Any, int] = {}
+        self._retired: set = set()
+        self._stats = {"created": 0, "reused": 0, "closed": 0}
+
+    def get(self, url: str, timeout_s: float) -> Any:
+        loop = asyncio.get_running_loop()
+        origin = _origin(url)
+        key = (origin, float(timeout_s))
+        with self._lock:
+            per_loop = self._clients.setdefault(loop, {})
+            client = per_loop.get(key)
+            if client is not None and not getattr(client, "is_closed", False):
+                self._stats["reused"] += 1
+                return client
+            client = httpx.AsyncClient(
+                timeout=timeout_s,
+                limits=httpx.Limits(
+                    max_connections=_MAX_CONNECTIONS,
+                    max_keepalive_connections=_MAX_KEEPALIVE,
+                    keepalive_expiry=_KEEPALIVE_EXPIRY_S,
+                ),
+                http2=_use_http2(origin),
+            )
+            per_loop[key] = client
+            self._stats["created"] += 1
+        log_debug(f"[HttpPool] new client origin={origin} timeout={timeout_s}s http2={_use_http2(origin)}")
+        return client
+
+    def acquire(self, url: str, timeout_s: float) -> Any:
+        client = self.get(url, timeout_s)
+        with self._lock:
+            self._borrowers[client] = self._borrowers.get(client, 0) + 1
+        return client
+
+    def release(self, client: Any) -> bool:
+        """Returns True when a retired client lost its last borrower (-> close)."""
+        with self._lock:
+            left = self._borrowers.get(client, 1) - 1
+            if left > 0:
+                self._borrowers[client] = left
+                return False
+            self._borrowers.pop(client, None)
+            if client in self._retired:
+                self._retired.discard(client)
+                return True
+            return False
+
+    def retire(self, client: Any) -> None:
+        """Remove from the table; closing is left to the last borrower."""
+        with self._lock:
+            for per_loop in self._clients.values():
+                for key, value in list(per_loop.items()):
+                    if value is client:
+                        del per_loop[key]
+            self._retired.add(client)
+
+    def pop_current_loop(self) -> Dict[PoolKey, Any]:
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return {}
+        with self._lock:
+            return self._clients.pop(loop, None) or {}
+
+    def record_closed(self, count: int) -> None:
+        with self._lock:
+            self._stats["closed"] += count
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            out = dict(self._stats)
+            out["open"] = sum(len(v) for v in self._clients.values())
+        out["http2_available"] = _H2_AVAILABLE
+        return out
+
+    def clear(self) -> None:
+        with self._lock:
+            self._clients = weakref.WeakKeyDictionary()
+            self._borrowers = {}
+            self._retired = set()
+            self._stats = {"created": 0, "reused": 0, "closed": 0}
+
+
+_POOL = _ClientPool()
+
+
+def get_http_client(url: str, *, timeout_s: float = 90.0) -> Any:
+    """Shared keep-alive client for the origin of `url` on the running loop."""
+    return _POOL.get(url, timeout_s)
+
+
+@asynccontextmanager
+async def pooled_client(url: str, *, timeout_s: float = 90.0) -> AsyncIterator[Any]:
+    """
+    Drop-in for ``async with httpx.AsyncClient(timeout=...) as client`` that
+    borrows the pooled client instead of closing it on exit.
+
+    A ``ConnectError`` retires the client so the next call starts with a
+    fresh one; it is closed only after every concurrent borrower released
+    it. Other transport errors (e.g. a per-request ``ReadTimeout``) only
+    affect their own connection and leave the shared client in place.
+    """
+    client = _POOL.acquire(url, timeout_s)
+    try:
+        yield client
+    except httpx.ConnectError:
+        _POOL.retire(client)
+        raise
+    finally:
+        if _POOL.release(client):
+            try:
+                await client.aclose()
+            except Exception:
+                pass
+            _POOL.record_closed(1)
+
+
+async def aclose_http_clients() -> None:
+    """Close all pooled clients of the running loop (app shutdown)."""
+    clients = list(_POOL.pop_current_loop().values())
+    for client in clients:
+        try:
+            await client.aclose()
+        except Exception as exc:
+            log_warning(f"[HttpPool] close failed: {type(exc).__name__}: {exc}")
+    _POOL.record_closed(len(clients))
+
+
+def get_http_pool_stats() -> Dict[str, Any]:
+    return _POOL.stats()
+
+
+def reset_http_pool() -> None:
+    _POOL.clear()
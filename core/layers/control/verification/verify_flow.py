@@ -8,6 +8,8 @@ from typing import Any
 
 import httpx
 
+from core.prompt_assembly import STABILITY_REQUEST, STABILITY_STATIC, PromptSegment, assemble_prompt
+
 
 async def verify_flow(
     user_text: str,
@@ -118,12 +120,18 @@ async def verify_flow(
     verify_timeout_s = resolve_verify_timeout_s_fn(response_mode_norm)
     control_model = resolve_model_fn(response_mode_norm)
     payload = build_control_prompt_payload_fn(user_text, thinking_plan, retrieved_memory)
-    prompt = f"""{control_prompt}
-
-CONTROL_INPUT:
-{json.dumps(payload, ensure_ascii=False)}
-
-Deine Bewertung (nur JSON):"""
+    prompt = assemble_prompt(
+        [
+            PromptSegment("system", control_prompt, STABILITY_STATIC),
+            PromptSegment(
+                "control_input",
+                f"CONTROL_INPUT:\n{json.dumps(payload, ensure_ascii=False)}\n\nDeine Bewertung (nur JSON):",
+                STABILITY_REQUEST,
+            ),
+        ],
+        role="control",
+        model=control_model,
+    )
     log_info_fn(
         "[ControlLayer] verify_prompt "
         f"chars={len(prompt)} "
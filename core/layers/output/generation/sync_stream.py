@@ -17,6 +17,7 @@ from core.llm_provider_client import resolve_role_provider
 from core.plan_runtime_bridge import get_runtime_grounding_value
 from core.control_contract import ControlDecision
 from config import (
+    get_llm_keep_alive,
     get_output_model,
     get_output_provider,
     get_output_timeout_interactive_s,
@@ -128,7 +129,7 @@ def generate_stream_sync(
         "model": model,
         "prompt": full_prompt,
         "stream": True,
-        "keep_alive": "5m",
+        "keep_alive": get_llm_keep_alive(),
     }
 
     try:
@@ -13,6 +13,7 @@ import httpx
 from typing import Dict, Any, Optional, AsyncGenerator, List
 from config import (
     OLLAMA_BASE,
+    get_llm_keep_alive,
     get_output_model,
     get_output_provider,
     get_output_tool_injection_mode,
@@ -2034,7 +2035,7 @@ class OutputLayer:
             "model": model,
             "prompt": full_prompt,
             "stream": True,
-            "keep_alive": "5m",
+            "keep_alive": get_llm_keep_alive(),
         }
         
         try:
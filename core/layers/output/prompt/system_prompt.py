@@ -10,7 +10,14 @@ Orchestriert alle Prompt-Sektionen:
 """
 from typing import Any, Dict, List, Optional
 
+from config import get_output_model
 from core.persona import get_persona
+from core.prompt_assembly import (
+    STABILITY_STATIC,
+    STABILITY_TURN,
+    PromptSegment,
+    assemble_prompt,
+)
 from core.plan_runtime_bridge import get_policy_final_instruction, get_policy_warnings, get_runtime_tool_results
 from core.plan_runtime_bridge import get_runtime_grounding_value
 from core.grounding_policy import load_grounding_policy
@@ -38,7 +45,7 @@ def build_system_prompt(
     Baut den vollständigen System-Prompt für den Output-LLM-Call.
 
     Sektionen (in Reihenfolge):
-      1. Persona-Basis + dynamische Tools
+      1. Persona-Basis + dynamische Tools (ohne Tools stabiler Prefix, s. core.prompt_assembly)
       2. Anti-Halluzination (wenn Memory gesucht aber nicht gefunden)
       3. Chat-History-Hinweis
       4. Control-Layer-Anweisung
@@ -56,10 +63,15 @@ def build_system_prompt(
     persona = get_persona()
     prompt_parts = []
 
-    # 1. Persona
+    # 1. Persona — die Live-Tools stehen wie bisher vor den Persona-Regeln und
+    #    wechseln pro Turn; nur eine Persona ohne Tools ist stabiler Prefix
     available_tools = resolve_tools_for_prompt(verified_plan)
     dynamic_context = {"tools": available_tools} if available_tools else None
-    prompt_parts.append(persona.build_system_prompt(dynamic_context=dynamic_context))
+    persona_segment = PromptSegment(
+        "persona",
+        persona.build_system_prompt(dynamic_context=dynamic_context),
+        STABILITY_TURN if available_tools else STABILITY_STATIC,
+    )
 
     # 2. Anti-Halluzination
     if memory_required_but_missing:
@@ -199,7 +211,12 @@ def build_system_prompt(
         elif length_hint == "long":
             prompt_parts.append(load_prompt("contracts", "output_length_long"))
 
-    return "\n".join(prompt_parts)
+    return assemble_prompt(
+        [persona_segment, PromptSegment("turn", "\n".join(prompt_parts), STABILITY_TURN)],
+        role="output",
+        model=get_output_model(),
+        separator="\n",
+    )
 
 
 def build_messages(
@@ -11,8 +11,19 @@ from typing import Dict, Any, AsyncGenerator, Tuple, Optional
 from config import OLLAMA_BASE, get_thinking_model, get_thinking_provider
 from utils.logger import log_info, log_error, log_debug
 from utils.json_parser import safe_parse_json
+from utils.text.json_stream import StreamingJSONParser
 from utils.role_endpoint_resolver import resolve_role_endpoint
 from core.llm_provider_client import resolve_role_provider, stream_prompt
+from core.prompt_assembly import (
+    STABILITY_CATALOG,
+    STABILITY_REQUEST,
+    STABILITY_STATIC,
+    STABILITY_TURN,
+    PromptSegment,
+    assemble_prompt,
+    canonical_json,
+    canonical_tool_snapshot,
+)
 from intelligence_modules.prompt_manager import load_prompt
 
 
@@ -38,43 +49,49 @@ class ThinkingLayer:
         """
         Analysiert die User-Anfrage MIT STREAMING.
         Yields: (thinking_chunk, is_done, plan_if_done)
+
+        Solange is_done=False enthält das dritte Element {"plan_fields": {...}},
+        sobald Top-Level-Felder des Plans vollständig gestreamt sind (vorläufig,
+        maßgeblich bleibt der finale Plan).
         """
-        prompt = f"{THINKING_PROMPT}\n\n"
-        
+        model_name = self._resolve_model()
+        # Sektionsfolge wie bisher; stabiler Prefix für den KV-Cache ist der
+        # System-Prompt, Tools/Tone sind kanonisch kodiert (gleiche Menge = gleiche Bytes)
+        segments = [PromptSegment("system", THINKING_PROMPT, STABILITY_STATIC)]
+
         if memory_context:
-            prompt += load_prompt(
+            segments.append(PromptSegment("memory_context", load_prompt(
                 "layers",
                 "thinking_memory_context",
                 memory_context=memory_context,
-            ) + "\n\n"
-        
+            ), STABILITY_TURN))
+
         if available_tools:
-            import json
-            tools_json = json.dumps(available_tools, indent=1)
-            prompt += load_prompt(
+            segments.append(PromptSegment("available_tools", load_prompt(
                 "layers",
                 "thinking_available_tools",
-                tools_json=tools_json,
-            ) + "\n\n"
+                tools_json=canonical_tool_snapshot(available_tools),
+            ), STABILITY_TURN))
 
         if tone_signal:
-            import json
-            tone_json = json.dumps(tone_signal, ensure_ascii=False, indent=1)
-            prompt += load_prompt(
+            segments.append(PromptSegment("tone_signal", load_prompt(
                 "layers",
                 "thinking_tone_signal",
-                tone_json=tone_json,
-            ) + "\n\n"
-        
+                tone_json=canonical_json(tone_signal),
+            ), STABILITY_TURN))
+
         if tool_hints:
-            prompt += f"{tool_hints}\n\n"
+            segments.append(PromptSegment("detection_hints", tool_hints, STABILITY_CATALOG))
             log_debug(f"[ThinkingLayer] Injected detection hints ({len(tool_hints)} chars)")
 
-        prompt += load_prompt("layers", "thinking_user_request", user_text=user_text)
+        segments.append(PromptSegment("user_request", load_prompt(
+            "layers", "thinking_user_request", user_text=user_text,
+        ), STABILITY_REQUEST))
+        prompt = assemble_prompt(segments, role="thinking", model=model_name)
 
-        model_name = self._resolve_model()
         provider = resolve_role_provider("thinking", default=get_thinking_provider())
         full_response = ""
+        field_parser = StreamingJSONParser()
         
         try:
             endpoint = self.ollama_base
@@ -112,7 +129,8 @@ class ThinkingLayer:
             ):
                 if chunk:
                     full_response += chunk
-                    yield (chunk, False, {})
+                    fields = field_parser.feed(chunk)
+                    yield (chunk, False, {"plan_fields": dict(fields)} if fields else {})
             
             plan = self._extract_plan(full_response)
             log_info(f"[ThinkingLayer] Plan: intent={plan.get('intent')}, needs_memory={plan.get('needs_memory')}")
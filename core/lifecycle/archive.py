@@ -18,10 +18,11 @@ Created: Phase 2 - Week 2 (Task Lifecycle)
 import json
 import os
 import sqlite3
+import sys
 import requests
 import logging
-import math
 import hashlib
+from array import array
 from datetime import datetime
 from typing import Dict, Any, Optional, List
 
@@ -33,6 +34,7 @@ from config import (
     get_embedding_endpoint_mode,
 )
 from utils.embedding_resolver import resolve_embedding_target
+from utils.embedding.similarity import cosine_similarity
 from utils.embedding_metrics import increment_fallback, increment_error, record_latency
 from utils.role_endpoint_resolver import resolve_role_endpoint
 from utils.service_endpoint_resolver import default_service_endpoint
@@ -276,19 +278,33 @@ def _get_embedding(text: str) -> Optional[List[float]]:
     return embedding
 
 
-def _cosine_similarity(vec1: List[float], vec2: List[float]) -> float:
-    """Cosine similarity between two vectors."""
-    if not vec1 or not vec2 or len(vec1) != len(vec2):
-        return 0.0
+def _encode_embedding(embedding: List[float]) -> bytes:
+    """Pack embedding as little-endian float32 BLOB (sql-memory VectorStore format)."""
+    packed = array("f", embedding)
+    if sys.byteorder != "little":
+        packed.byteswap()
+    return packed.tobytes()
+
 
-    dot_product = sum(a * b for a, b in zip(vec1, vec2))
-    norm1 = math.sqrt(sum(a * a for a in vec1))
-    norm2 = math.sqrt(sum(b * b for b in vec2))
+def _decode_embedding(value: Any) -> Optional[List[float]]:
+    """Decode float32 BLOB or legacy JSON text embedding."""
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        raw = bytes(value)
+        if not raw or len(raw) % 4:
+            return None
+        unpacked = array("f")
+        unpacked.frombytes(raw)
+        if sys.byteorder != "little":
+            unpacked.byteswap()
+        return unpacked.tolist()
+    if isinstance(value, str) and value:
+        return json.loads(value)
+    return None
 
-    if norm1 == 0 or norm2 == 0:
-        return 0.0
 
-    return dot_product / (norm1 * norm2)
+def _cosine_similarity(vec1: List[float], vec2: List[float]) -> float:
+    """Cosine similarity between two vectors."""
+    return cosine_similarity(vec1, vec2)
 
 
 # ═══════════════════════════════════════════════════════════
@@ -517,7 +533,7 @@ class TaskArchiveManager:
                         continue
 
                     try:
-                        stored_embedding = json.loads(row["embedding"])
+                        stored_embedding = _decode_embedding(row["embedding"])
                         similarity = _cosine_similarity(query_embedding, stored_embedding)
 
                         if similarity >= min_similarity:
@@ -693,7 +709,7 @@ class TaskArchiveManager:
                             conversation_id,
                             content,
                             metadata_json,
-                            json.dumps(embedding),
+                            _encode_embedding(embedding),
                             embedding_context["embedding_model"],
                             len(embedding),
                             embedding_context["embedding_version"],
@@ -714,7 +730,7 @@ class TaskArchiveManager:
                     conversation_id,
                     content,
                     metadata_json,
-                    json.dumps(embedding),
+                    _encode_embedding(embedding),
                     embedding_context["embedding_model"],
                     len(embedding),
                     embedding_context["embedding_version"],
@@ -21,12 +21,14 @@ import httpx
 
 from config import (
     get_control_provider,
+    get_llm_keep_alive,
     get_output_model,
     get_output_provider,
     get_secret_resolve_miss_ttl_s,
     get_secret_resolve_not_found_ttl_s,
     get_thinking_provider,
 )
+from core.http_client_pool import pooled_client
 from core.secret_resolve_runtime import (
     clear_provider_miss,
     mark_provider_miss,
@@ -323,7 +325,7 @@ async def _resolve_cloud_api_key(provider: str) -> str:
     attempted_remote = False
     saw_not_found = False
     try:
-        async with httpx.AsyncClient(timeout=5.0) as client:
+        async with pooled_client(base, timeout_s=5.0) as client:
             for name in ordered_candidates:
                 if secret_not_found_active(
                     provider_norm,
@@ -393,11 +395,11 @@ async def complete_prompt(
                     "model": candidate_model,
                     "messages": [{"role": "user", "content": prompt}],
                     "stream": True,
-                    "keep_alive": "2m",
+                    "keep_alive": get_llm_keep_alive(),
                 }
                 parts: List[str] = []
                 try:
-                    async with httpx.AsyncClient(timeout=timeout_s) as client:
+                    async with pooled_client(endpoint, timeout_s=timeout_s) as client:
                         async with client.stream(
                             "POST",
                             f"{endpoint}/api/chat",
@@ -434,11 +436,11 @@ async def complete_prompt(
             "model": model_name,
             "prompt": prompt,
             "stream": False,
-            "keep_alive": "2m",
+            "keep_alive": get_llm_keep_alive(),
         }
         if json_mode:
             payload["format"] = "json"
-        async with httpx.AsyncClient(timeout=timeout_s) as client:
+        async with pooled_client(endpoint, timeout_s=timeout_s) as client:
             r = await client.post(f"{endpoint}/api/generate", json=payload, headers=headers or None)
             _capture_rate_limit_headers(provider_norm, r.headers, r.status_code)
             r.raise_for_status()
@@ -459,7 +461,7 @@ async def complete_prompt(
         if json_mode:
             body["response_format"] = {"type": "json_object"}
         headers = {"Authorization": f"Bearer {api_key}", "Content-Type": "application/json"}
-        async with httpx.AsyncClient(timeout=timeout_s) as client:
+        async with pooled_client(_openai_base(), timeout_s=timeout_s) as client:
             r = await client.post(f"{_openai_base()}/chat/completions", json=body, headers=headers)
             _capture_rate_limit_headers(provider_norm, r.headers, r.status_code)
             r.raise_for_status()
@@ -478,7 +480,7 @@ async def complete_prompt(
         "anthropic-version": "2023-06-01",
         "content-type": "application/json",
     }
-    async with httpx.AsyncClient(timeout=timeout_s) as client:
+    async with pooled_client(_anthropic_base(), timeout_s=timeout_s) as client:
         r = await client.post(f"{_anthropic_base()}/messages", json=body, headers=headers)
         _capture_rate_limit_headers(provider_norm, r.headers, r.status_code)
         r.raise_for_status()
@@ -520,13 +522,13 @@ async def stream_prompt(
             payload = {
                 "messages": [{"role": "user", "content": prompt}],
                 "stream": True,
-                "keep_alive": "2m",
+                "keep_alive": get_llm_keep_alive(),
             }
             last_exc: Exception | None = None
             for candidate_model in _ollama_cloud_model_candidates(model_name):
                 payload["model"] = candidate_model
                 try:
-                    async with httpx.AsyncClient(timeout=timeout_s) as client:
+                    async with pooled_client(endpoint, timeout_s=timeout_s) as client:
                         async with client.stream(
                             "POST",
                             f"{endpoint}/api/chat",
@@ -564,9 +566,9 @@ async def stream_prompt(
             "model": model_name,
             "prompt": prompt,
             "stream": True,
-            "keep_alive": "2m",
+            "keep_alive": get_llm_keep_alive(),
         }
-        async with httpx.AsyncClient(timeout=timeout_s) as client:
+        async with pooled_client(endpoint, timeout_s=timeout_s) as client:
             async with client.stream(
                 "POST",
                 f"{endpoint}/api/generate",
@@ -601,7 +603,7 @@ async def stream_prompt(
             "temperature": 0,
             "stream": True,
         }
-        async with httpx.AsyncClient(timeout=timeout_s) as client:
+        async with pooled_client(_openai_base(), timeout_s=timeout_s) as client:
             async with client.stream(
                 "POST",
                 f"{_openai_base()}/chat/completions",
@@ -638,7 +640,7 @@ async def stream_prompt(
         "messages": [{"role": "user", "content": prompt}],
         "stream": True,
     }
-    async with httpx.AsyncClient(timeout=timeout_s) as client:
+    async with pooled_client(_anthropic_base(), timeout_s=timeout_s) as client:
         async with client.stream(
             "POST",
             f"{_anthropic_base()}/messages",
@@ -701,12 +703,12 @@ async def complete_chat(
                 "model": candidate_model,
                 "messages": list(messages or []),
                 "stream": False,
-                "keep_alive": "5m",
+                "keep_alive": get_llm_keep_alive(),
             }
             if tools:
                 payload["tools"] = tools
             try:
-                async with httpx.AsyncClient(timeout=timeout_s) as client:
+                async with pooled_client(endpoint, timeout_s=timeout_s) as client:
                     response = await client.post(
                         f"{endpoint}/api/chat",
                         json=payload,
@@ -744,7 +746,7 @@ async def complete_chat(
             "temperature": 0,
             "stream": False,
         }
-        async with httpx.AsyncClient(timeout=timeout_s) as client:
+        async with pooled_client(_openai_base(), timeout_s=timeout_s) as client:
             response = await client.post(
                 f"{_openai_base()}/chat/completions",
                 json=body,
@@ -771,7 +773,7 @@ async def complete_chat(
         "anthropic-version": "2023-06-01",
         "content-type": "application/json",
     }
-    async with httpx.AsyncClient(timeout=timeout_s) as client:
+    async with pooled_client(_anthropic_base(), timeout_s=timeout_s) as client:
         response = await client.post(f"{_anthropic_base()}/messages", json=body, headers=headers)
         _capture_rate_limit_headers(provider_norm, response.headers, response.status_code)
         response.raise_for_status()
@@ -820,10 +822,10 @@ async def stream_chat_events(
                 "model": candidate_model,
                 "messages": list(messages or []),
                 "stream": True,
-                "keep_alive": "5m",
+                "keep_alive": get_llm_keep_alive(),
             }
             try:
-                async with httpx.AsyncClient(timeout=timeout_s) as client:
+                async with pooled_client(endpoint, timeout_s=timeout_s) as client:
                     async with client.stream(
                         "POST",
                         f"{endpoint}/api/chat",
@@ -871,7 +873,7 @@ async def stream_chat_events(
             "temperature": 0,
             "stream": True,
         }
-        async with httpx.AsyncClient(timeout=timeout_s) as client:
+        async with pooled_client(_openai_base(), timeout_s=timeout_s) as client:
             async with client.stream(
                 "POST",
                 f"{_openai_base()}/chat/completions",
@@ -911,7 +913,7 @@ async def stream_chat_events(
         "anthropic-version": "2023-06-01",
         "content-type": "application/json",
     }
-    async with httpx.AsyncClient(timeout=timeout_s) as client:
+    async with pooled_client(_anthropic_base(), timeout_s=timeout_s) as client:
         async with client.stream(
             "POST",
             f"{_anthropic_base()}/messages",
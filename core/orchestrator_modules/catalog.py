@@ -487,6 +487,39 @@ CONTAINER_ID_REQUIRED_TOOLS = frozenset(
         "stop_container",
     }
 )
+# Tools ohne Seiteneffekte: dürfen im Tool-Loop vorab parallel laufen
+# (core/orchestrator_tool_prefetch_utils.py). Alles andere bleibt serialisiert.
+PARALLEL_SAFE_READ_TOOLS = frozenset(
+    {
+        "memory_search",
+        "memory_graph_search",
+        "memory_fact_load",
+        "memory_search_layered",
+        "home_read",
+        "home_list",
+        "container_list",
+        "container_inspect",
+        "container_stats",
+        "container_logs",
+        "blueprint_list",
+        "blueprint_get",
+        "storage_scope_list",
+        "storage_list_disks",
+        "storage_get_disk",
+        "storage_list_mounts",
+        "storage_get_summary",
+        "storage_get_policy",
+        "storage_list_blocked_paths",
+        "storage_list_managed_paths",
+        "list_used_ports",
+        "check_port",
+        "list_blueprint_ports",
+        "autonomy_cron_status",
+        "autonomy_cron_list_jobs",
+        "autonomy_cron_queue",
+        "cron_reference_links_list",
+    }
+).union(READ_ONLY_SKILL_TOOLS)
 DOMAIN_CRON_OP_TO_TOOL = {
     "create": "autonomy_cron_create_job",
     "update": "autonomy_cron_update_job",
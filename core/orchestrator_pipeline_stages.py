@@ -7,11 +7,16 @@ Both orchestrator_sync_flow_utils and orchestrator_stream_flow_utils call these.
 Stages:
   run_pre_control_gates()    — Skill-Dedup, Container-Candidate, Hardware-Gate
   run_plan_finalization()    — Post-thinking coercion, response mode, temporal context
-  run_tool_selection_stage() — Tool selection, short-input bypass, budget/domain signals
+  start_tone_signal()        — Kicks off tone classification at request start
+  run_tool_selection_stage() — Signal stage: tone, tool selection, budget/domain signals
+                               concurrently, short-input bypass, context follow-up
   prepare_output_invocation() — Model resolution, memory guard flag, time budget (pre-output)
 """
 
-from typing import Any, Dict, List, Optional, Tuple
+import asyncio
+import inspect
+import time
+from typing import Any, Awaitable, Dict, List, Optional, Tuple
 
 
 def run_pre_control_gates(
@@ -219,6 +224,98 @@ def run_plan_finalization(
     return thinking_plan, response_mode
 
 
+async def _timed_signal(
+    name: str,
+    awaitable: Awaitable[Any],
+    timeout_s: Optional[float],
+    fallback: Any,
+    trace: Dict[str, Any],
+) -> Any:
+    """Await one signal with its own timeout; degrade to `fallback` on timeout/error."""
+    started = time.perf_counter()
+    status = "ok"
+    try:
+        if timeout_s is None:
+            result = await awaitable
+        else:
+            result = await asyncio.wait_for(awaitable, timeout=timeout_s)
+    except asyncio.TimeoutError:
+        status = "timeout"
+        result = fallback
+    except Exception as exc:
+        status = f"error:{type(exc).__name__}"
+        result = fallback
+    trace[name] = {"ms": round((time.perf_counter() - started) * 1000, 1), "status": status}
+    return result
+
+
+class PendingSignal:
+    """A signal classification started ahead of the stage that consumes it."""
+
+    def __init__(
+        self, name: str, awaitable: Awaitable[Any], timeout_s: Optional[float], fallback: Any
+    ):
+        self.name = name
+        self.trace: Dict[str, Any] = {}
+        self._task = asyncio.ensure_future(
+            _timed_signal(name, awaitable, timeout_s, fallback, self.trace)
+        )
+
+    async def result(self) -> Any:
+        return await self._task
+
+    def cancel(self) -> None:
+        if not self._task.done():
+            self._task.cancel()
+
+
+def start_tone_signal(orch: Any, user_text: str, request: Any) -> PendingSignal:
+    """
+    Start tone classification right away so it overlaps with everything
+    before the signal stage (intent check, compression, chunking).
+    No timeout unless SIGNAL_STAGE_TIMEOUT_TONE_S is set. Callers must
+    cancel() the returned signal on every exit that never consumes it.
+    """
+    from config import get_signal_stage_timeout_s
+
+    return PendingSignal(
+        "tone",
+        orch._classify_tone_signal(user_text, getattr(request, "messages", None)),
+        get_signal_stage_timeout_s("tone"),
+        orch._sanitize_tone_signal(None),
+    )
+
+
+async def _resolve_signal(value: Any) -> Any:
+    if isinstance(value, PendingSignal):
+        return await value.result()
+    if inspect.isawaitable(value):
+        return await value
+    return value
+
+
+def _needs_query_budget_followup(orch: Any, selected_tools: List[str], tone_signal: Any) -> bool:
+    check = getattr(getattr(orch, "query_budget", None), "depends_on_context", None)
+    if not callable(check):
+        return bool(selected_tools) or bool(tone_signal)
+    try:
+        return bool(check(selected_tools, tone_signal if isinstance(tone_signal, dict) else None))
+    except Exception:
+        return True
+
+
+def _needs_domain_followup(orch: Any, selected_tools: List[str]) -> bool:
+    if not selected_tools:
+        return False
+    check = getattr(getattr(orch, "domain_router", None), "depends_on_selected_tools", None)
+    if not callable(check):
+        return True
+    try:
+        return bool(check(selected_tools))
+    except Exception:
+        return True
+
+
 async def run_tool_selection_stage(
     orch: Any,
     user_text: str,
@@ -226,9 +323,22 @@ async def run_tool_selection_stage(
     forced_response_mode: Optional[str],
     tone_signal: Any,
     log_info_fn: Any,
+    *,
+    trace_out: Optional[Dict[str, Any]] = None,
 ) -> Tuple[List[str], Dict, Dict, str]:
     """
-    Layer 0: Tool selection, short-input bypass, budget and domain signals.
+    Layer 0 signal stage: tool selection, short-input bypass, budget and domain signals.
+
+    Tone (already running if `tone_signal` is a PendingSignal from
+    start_tone_signal), tool selection, query budget and domain routing run
+    concurrently, each under its own timeout (config.get_signal_stage_timeout_s).
+    Query budget / domain are classified without selected_tools/tone first; the
+    context-aware re-classification runs as a cheap follow-up only when the
+    selected tools or the tone act actually change their scores (embeddings
+    are shared via the per-turn embedding cache).
+
+    Set SIGNAL_STAGE_PARALLEL_ENABLE=false for the old sequential order.
+    `trace_out` (optional) receives the per-signal timing breakdown.
 
     Returns:
         selected_tools        — list of tool names
@@ -236,6 +346,8 @@ async def run_tool_selection_stage(
         domain_route_signal   — dict
         last_assistant_msg    — str (used downstream for context enrichment)
     """
+    from config import get_signal_stage_parallel_enable, get_signal_stage_timeout_s
+
     # Extract last assistant message for context-aware selection
     last_assistant_msg = ""
     for _msg in reversed(list(getattr(request, "messages", None) or [])):
@@ -243,9 +355,49 @@ async def run_tool_selection_stage(
             last_assistant_msg = str(_msg.get("content", ""))
             break
 
-    selected_tools = await orch.tool_selector.select_tools(
-        user_text, context_summary=last_assistant_msg
-    )
+    trace: Dict[str, Any] = {}
+    stage_started = time.perf_counter()
+    pending_tone = tone_signal if isinstance(tone_signal, PendingSignal) else None
+
+    def _select() -> Awaitable[Any]:
+        return _timed_signal(
+            "tool_selection",
+            orch.tool_selector.select_tools(user_text, context_summary=last_assistant_msg),
+            get_signal_stage_timeout_s("tool_selection"),
+            None,
+            trace,
+        )
+
+    def _budget(name: str, tools: Optional[List[str]], tone: Any) -> Awaitable[Any]:
+        return _timed_signal(
+            name,
+            orch._classify_query_budget_signal(user_text, selected_tools=tools, tone_signal=tone),
+            get_signal_stage_timeout_s("query_budget"),
+            {},
+            trace,
+        )
+
+    def _domain(name: str, tools: Optional[List[str]]) -> Awaitable[Any]:
+        return _timed_signal(
+            name,
+            orch._classify_domain_signal(user_text, selected_tools=tools),
+            get_signal_stage_timeout_s("domain"),
+            {},
+            trace,
+        )
+
+    parallel = get_signal_stage_parallel_enable()
+    if parallel:
+        tone_signal, selected_tools, query_budget_signal, domain_route_signal = await asyncio.gather(
+            _resolve_signal(tone_signal),
+            _select(),
+            _budget("query_budget", None, None),
+            _domain("domain", None),
+        )
+    else:
+        tone_signal = await _resolve_signal(tone_signal)
+        selected_tools = await _select()
+
     selected_tools = orch._filter_tool_selector_candidates(
         selected_tools, user_text, forced_mode=forced_response_mode
     )
@@ -258,17 +410,46 @@ async def run_tool_selection_stage(
             selected_tools = ["request_container", "run_skill", "home_write"]
         log_info_fn("[Pipeline] Short-Input Bypass: core follow-up tools injected")
 
-    query_budget_signal = await orch._classify_query_budget_signal(
-        user_text,
-        selected_tools=selected_tools,
-        tone_signal=tone_signal,
-    )
-    domain_route_signal = await orch._classify_domain_signal(
-        user_text,
-        selected_tools=selected_tools,
+    if not parallel:
+        query_budget_signal = await _budget("query_budget", selected_tools, tone_signal)
+        domain_route_signal = await _domain("domain", selected_tools)
+    else:
+        # Context-aware follow-up only where selected_tools / tone move the scores.
+        followups: List[Awaitable[Any]] = []
+        budget_followup = _needs_query_budget_followup(orch, selected_tools, tone_signal)
+        domain_followup = _needs_domain_followup(orch, selected_tools)
+        if budget_followup:
+            followups.append(_budget("query_budget_followup", selected_tools, tone_signal))
+        if domain_followup:
+            followups.append(_domain("domain_followup", selected_tools))
+        if followups:
+            results = list(await asyncio.gather(*followups))
+            if budget_followup:
+                query_budget_signal = results.pop(0) or query_budget_signal
+            if domain_followup:
+                domain_route_signal = results.pop(0) or domain_route_signal
+
+    if pending_tone is not None:
+        trace.update(pending_tone.trace)
+
+    wall_ms = round((time.perf_counter() - stage_started) * 1000, 1)
+    serial_ms = round(sum(float(v.get("ms", 0.0)) for v in trace.values()), 1)
+    breakdown = {
+        "mode": "parallel" if parallel else "sequential",
+        "wall_ms": wall_ms,
+        "serial_ms": serial_ms,
+        "saved_ms": round(max(0.0, serial_ms - wall_ms), 1) if parallel else 0.0,
+        "signals": trace,
+    }
+    if trace_out is not None:
+        trace_out.update(breakdown)
+    log_info_fn(
+        f"[Pipeline] signal_stage mode={breakdown['mode']} wall={wall_ms}ms "
+        f"serial={serial_ms}ms saved={breakdown['saved_ms']}ms "
+        + " ".join(f"{k}={v['ms']}ms/{v['status']}" for k, v in trace.items())
     )
 
-    return selected_tools, query_budget_signal, domain_route_signal, last_assistant_msg
+    return selected_tools, query_budget_signal or {}, domain_route_signal or {}, last_assistant_msg
 
 
 def prepare_output_invocation(
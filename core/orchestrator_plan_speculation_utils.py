@@ -0,0 +1,190 @@
+"""
+Speculative memory retrieval while the ThinkingLayer plan is still streaming.
+
+``ThinkingLayer.analyze_stream`` reports top-level plan fields as soon as they
+are complete (``{"plan_fields": {...}}`` on non-final chunks). The memory
+fields (needs_memory, memory_keys, is_fact_query, time_reference) come early
+in the plan, long before the free-text ``reasoning``. Once all of them are
+known, ``PlanSpeculation`` starts the memory-key lookups of
+``ContextManager.get_context`` in a background worker. Key selection and
+lookups go through the same public helpers get_context uses
+(``ContextManager.memory_lookup_keys`` / ``search_memory_keys``):
+
+- results go into a private cache, never directly into the request cache
+- ``settle()`` runs after plan finalization, right before
+  ``build_effective_context``. If the final plan still looks up at least one
+  of the speculated keys, it waits (bounded by the retrieval budget) for the
+  worker and copies the non-empty backend results of the shared keys into the
+  request cache. Otherwise the speculation is cancelled and its results are
+  dropped.
+- ``get_context`` itself is unchanged and reads the request cache as before;
+  keys or backends the speculation did not cover are looked up normally.
+- ``cancel()`` also reaches lookups that are already running: the key phase
+  stops submitting keys and returns without waiting for in-flight calls. The
+  stream flow calls it when the request fails or the client disconnects
+  before ``settle()``.
+
+A disagreeing final plan therefore never changes the retrieved context, it
+only loses the head start. Tool-argument preparation is not speculated: it
+depends on control-layer corrections that only exist after the full plan.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional
+
+_SPECULATION_ENABLE = str(os.getenv("THINKING_SPECULATION_ENABLE", "true")).lower() == "true"
+_MAX_WORKERS = max(1, int(os.getenv("THINKING_SPECULATION_MAX_WORKERS", "2")))
+
+# Plan fields get_context needs to decide on memory-key lookups.
+SPECULATION_TRIGGER_FIELDS = ("needs_memory", "is_fact_query", "memory_keys", "time_reference")
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=_MAX_WORKERS, thread_name_prefix="plan-speculation")
+        return _executor
+
+
+def shutdown_plan_speculation_pool() -> None:
+    global _executor
+    with _executor_lock:
+        executor, _executor = _executor, None
+    if executor is not None:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+class PlanSpeculation:
+    """Background memory lookups for one streamed plan (not thread-shared)."""
+
+    def __init__(
+        self,
+        context_manager: Any,
+        conversation_id: str,
+        *,
+        small_model_mode: bool = False,
+        enabled: Optional[bool] = None,
+        log_fn: Optional[Callable[[str], None]] = None,
+    ):
+        self._context = context_manager
+        self._conversation_id = conversation_id
+        self._include_system = not small_model_mode
+        self.enabled = _SPECULATION_ENABLE if enabled is None else bool(enabled)
+        self._log_fn = log_fn
+        self.fields: Dict[str, Any] = {}
+        self.keys: List[str] = []
+        # idle | running | skipped | confirmed | cancelled | failed
+        self.status = "idle"
+        self._cache: Dict[str, Any] = {}
+        self._future: Optional[Future] = None
+        self._cancelled = threading.Event()
+        self._budget_s = 0.0
+        self._started_at = 0.0
+
+    def _log(self, msg: str) -> None:
+        if self._log_fn is not None:
+            try:
+                self._log_fn(msg)
+            except Exception:
+                pass
+
+    def observe(self, plan_fields: Any) -> bool:
+        """Merge early plan fields; returns True when this call started the lookups."""
+        if not self.enabled or self.status != "idle" or not isinstance(plan_fields, dict):
+            return False
+        self.fields.update(plan_fields)
+        if any(field not in self.fields for field in SPECULATION_TRIGGER_FIELDS):
+            return False
+        try:
+            self.keys = list(self._context.memory_lookup_keys(self.fields))
+        except Exception:
+            self.keys = []
+        if not self.keys:
+            self.status = "skipped"
+            return False
+        try:
+            from config import get_context_retrieval_budget_s, get_memory_lookup_timeout_s
+
+            self._budget_s = max(0.0, float(get_context_retrieval_budget_s()))
+            call_timeout_s = float(get_memory_lookup_timeout_s())
+            self._started_at = time.monotonic()
+            self._future = _get_executor().submit(
+                self._run, self._started_at + self._budget_s, call_timeout_s
+            )
+        except Exception as e:
+            self.status = "failed"
+            self._log(f"[PlanSpeculation] start failed: {e}")
+            return False
+        self.status = "running"
+        self._log(f"[PlanSpeculation] memory lookups started early keys={self.keys}")
+        return True
+
+    def _run(self, deadline: float, call_timeout_s: float) -> None:
+        if self._cancelled.is_set():
+            return
+        self._context.search_memory_keys(
+            keys=self.keys,
+            conversation_id=self._conversation_id,
+            include_system=self._include_system,
+            deadline=deadline,
+            call_timeout_s=call_timeout_s,
+            request_cache=self._cache,
+            cancel_event=self._cancelled,
+        )
+
+    def cancel(self) -> None:
+        self._cancelled.set()
+        if self._future is not None:
+            self._future.cancel()
+        if self.status == "running":
+            self.status = "cancelled"
+
+    async def settle(self, final_plan: Dict[str, Any], request_cache: Dict[str, Any]) -> str:
+        """
+        Reconcile with the finalized plan before build_effective_context.
+
+        Returns the final status. Only "confirmed" touches ``request_cache``.
+        """
+        if self.status != "running" or self._future is None:
+            return self.status
+        try:
+            final_keys = set(self._context.memory_lookup_keys(final_plan))
+        except Exception:
+            final_keys = set()
+        shared = [k for k in self.keys if k in final_keys]
+        if not shared or not isinstance(request_cache, dict):
+            self.cancel()
+            self._log(f"[PlanSpeculation] final plan disagrees — dropped keys={self.keys}")
+            return self.status
+
+        remaining = max(0.0, self._started_at + self._budget_s - time.monotonic())
+        try:
+            await asyncio.wait_for(asyncio.shield(asyncio.wrap_future(self._future)), timeout=remaining)
+        except asyncio.TimeoutError:
+            self._log("[PlanSpeculation] lookups still running at settle — using partial results")
+        except Exception as e:
+            self._log(f"[PlanSpeculation] lookups failed: {e}")
+
+        merged = 0
+        # Timeouts/failures leave default values in the private cache; only
+        # real results are handed over so get_context retries the rest.
+        for cache_key, value in dict(self._cache).items():
+            parts = cache_key.split("|", 2)
+            if len(parts) != 3 or parts[2] not in shared or not value:
+                continue
+            if cache_key not in request_cache:
+                request_cache[cache_key] = value
+                merged += 1
+        self.status = "confirmed"
+        self._log(f"[PlanSpeculation] confirmed keys={shared} cached_backends={merged}")
+        return self.status
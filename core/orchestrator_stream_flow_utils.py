@@ -1,4 +1,5 @@
 import asyncio
+import copy
 import json
 import re
 from datetime import datetime
@@ -33,6 +34,7 @@ from core.control_contract import (
     tool_allowed_by_control_decision,
 )
 from core.layers.control.policy.decision import normalize_control_verification
+from core.embedding_client import begin_embedding_turn
 from core.task_loop.context_writeback import build_background_loop_state, persist_context_only_turn
 from core.plan_runtime_bridge import (
     append_runtime_tool_results,
@@ -62,6 +64,14 @@ from core.host_runtime_policy import (
     extract_blueprint_id_from_create_result,
 )
 from core.tool_hub_runtime import get_initialized_hub_safe
+from core.orchestrator_tool_prefetch_utils import (
+    PrefetchCall,
+    ToolPrefetcher,
+    is_parallel_safe_tool,
+    plan_read_only_segment,
+    spec_tool_name,
+)
+from core.orchestrator_plan_speculation_utils import PlanSpeculation
 
 
 def _build_thinking_ui_payload(plan: Optional[Dict[str, Any]], **overrides: Any) -> Dict[str, Any]:
@@ -214,95 +224,104 @@ async def process_stream_with_events(
     conversation_id = request.conversation_id
     forced_response_mode = orch._requested_response_mode(request)
     request_retrieval_cache: Dict[str, Any] = {}
-    tone_signal = await orch._classify_tone_signal(user_text, request.messages)
+    plan_speculation: Optional[PlanSpeculation] = None
+    begin_embedding_turn()
+    from core.orchestrator_pipeline_stages import run_tool_selection_stage, start_tone_signal
+    tone_pending = start_tone_signal(orch, user_text, request)
     _emit_loop_trace = is_internal_loop_analysis_prompt(user_text)
     _loop_trace_started_emitted = False
     
-    # ═══════════════════════════════════════════════════
-    # STEP 0: INTENT CONFIRMATION
-    # ═══════════════════════════════════════════════════
-    if intent_system_available:
-        try:
-            result = await orch._check_pending_confirmation(user_text, conversation_id)
-            if result:
-                yield (result.content, False, {"type": "content"})
-                ws_done = orch._save_workspace_entry(
-                    conversation_id,
-                    orch._build_done_workspace_summary("confirmation_executed"),
-                    "chat_done",
-                    "orchestrator",
-                )
-                if ws_done:
-                    yield ("", False, ws_done)
-                yield ("", True, {"done_reason": "confirmation_executed"})
-                return
-        except Exception as e:
-            log_info_fn(f"[Orchestrator] Intent check skipped: {e}")
+    try:
+        # ═══════════════════════════════════════════════════
+        # STEP 0: INTENT CONFIRMATION
+        # ═══════════════════════════════════════════════════
+        if intent_system_available:
+            try:
+                result = await orch._check_pending_confirmation(user_text, conversation_id)
+                if result:
+                    tone_pending.cancel()
+                    yield (result.content, False, {"type": "content"})
+                    ws_done = orch._save_workspace_entry(
+                        conversation_id,
+                        orch._build_done_workspace_summary("confirmation_executed"),
+                        "chat_done",
+                        "orchestrator",
+                    )
+                    if ws_done:
+                        yield ("", False, ws_done)
+                    yield ("", True, {"done_reason": "confirmation_executed"})
+                    return
+            except Exception as e:
+                log_info_fn(f"[Orchestrator] Intent check skipped: {e}")
 
-    from core.orchestrator_modules.task_loop import (
-        clear_active_task_loop,
-        get_active_task_loop_snapshot,
-        inject_active_task_loop_context,
-        stream_task_loop_events,
-    )
-    from core.orchestrator_modules.task_loop_routing import decide_task_loop_routing
-    active_task_loop_snapshot = get_active_task_loop_snapshot(conversation_id)
+        from core.orchestrator_modules.task_loop import (
+            clear_active_task_loop,
+            get_active_task_loop_snapshot,
+            inject_active_task_loop_context,
+            stream_task_loop_events,
+        )
+        from core.orchestrator_modules.task_loop_routing import decide_task_loop_routing
+        active_task_loop_snapshot = get_active_task_loop_snapshot(conversation_id)
     
-    # ═══════════════════════════════════════════════════
-    # STEP 0.5: CHUNKING (large inputs)
-    # ═══════════════════════════════════════════════════
-    chunking_context = None
+        # ═══════════════════════════════════════════════════
+        # STEP 0.5: CHUNKING (large inputs)
+        # ═══════════════════════════════════════════════════
+        chunking_context = None
     
-    try:
-        from utils.chunker import needs_chunking, count_tokens
-        if enable_chunking and needs_chunking(user_text, chunking_threshold):
-            log_info_fn(f"[Orchestrator] Chunking: {count_tokens(user_text)} tokens")
-            async for event in orch._process_chunked_stream(user_text, conversation_id, request):
-                chunk_text, is_done, metadata = event
-                yield event
-                if metadata.get("type") == "chunking_done":
-                    chunking_context = {
-                        "aggregated_summary": metadata.get("aggregated_summary", ""),
-                        "thinking_result": metadata.get("thinking_result", {}),
-                    }
-    except Exception as e:
-        log_info_fn(f"[Orchestrator] Chunking skipped: {e}")
+        try:
+            from utils.chunker import needs_chunking, count_tokens
+            if enable_chunking and needs_chunking(user_text, chunking_threshold):
+                log_info_fn(f"[Orchestrator] Chunking: {count_tokens(user_text)} tokens")
+                async for event in orch._process_chunked_stream(user_text, conversation_id, request):
+                    chunk_text, is_done, metadata = event
+                    yield event
+                    if metadata.get("type") == "chunking_done":
+                        chunking_context = {
+                            "aggregated_summary": metadata.get("aggregated_summary", ""),
+                            "thinking_result": metadata.get("thinking_result", {}),
+                        }
+        except Exception as e:
+            log_info_fn(f"[Orchestrator] Chunking skipped: {e}")
     
-    # ═══════════════════════════════════════════════════
-    # STEP 0.8: CONTEXT COMPRESSION (Rolling Summary)
-    # ═══════════════════════════════════════════════════
-    try:
-        from core.context_compressor import get_compressor, estimate_protocol_tokens
-        from utils.settings import settings as _settings
-        _compression_enabled = _settings.get("CONTEXT_COMPRESSION_ENABLED", True)
-        if _compression_enabled:
-            _token_est = estimate_protocol_tokens()
-            _compression_threshold = _settings.get("COMPRESSION_THRESHOLD", 100000)
-            if _token_est >= _compression_threshold:
-                _compression_mode = _settings.get("CONTEXT_COMPRESSION_MODE", "sync")
-                log_info_fn(f"[Orchestrator] Context compression triggered ({_token_est} tokens, mode={_compression_mode})")
-                yield ("", False, {
-                    "type": "compression_start",
-                    "token_count": _token_est,
-                    "mode": _compression_mode,
-                })
-                if _compression_mode == "sync":
-                    _did_compress, _phase = await get_compressor().check_and_compress()
-                    yield ("", False, {
-                        "type": "compression_done",
-                        "phase": _phase,
-                        "async": False,
-                    })
-                else:
-                    # Async: Hintergrund-Task, Pipeline läuft sofort weiter
-                    asyncio.create_task(get_compressor().check_and_compress())
+        # ═══════════════════════════════════════════════════
+        # STEP 0.8: CONTEXT COMPRESSION (Rolling Summary)
+        # ═══════════════════════════════════════════════════
+        try:
+            from core.context_compressor import get_compressor, estimate_protocol_tokens
+            from utils.settings import settings as _settings
+            _compression_enabled = _settings.get("CONTEXT_COMPRESSION_ENABLED", True)
+            if _compression_enabled:
+                _token_est = estimate_protocol_tokens()
+                _compression_threshold = _settings.get("COMPRESSION_THRESHOLD", 100000)
+                if _token_est >= _compression_threshold:
+                    _compression_mode = _settings.get("CONTEXT_COMPRESSION_MODE", "sync")
+                    log_info_fn(f"[Orchestrator] Context compression triggered ({_token_est} tokens, mode={_compression_mode})")
                     yield ("", False, {
-                        "type": "compression_done",
-                        "phase": "async_started",
-                        "async": True,
+                        "type": "compression_start",
+                        "token_count": _token_est,
+                        "mode": _compression_mode,
                     })
-    except Exception as _ce:
-        log_warn_fn(f"[Orchestrator] Context compression skipped: {_ce}")
+                    if _compression_mode == "sync":
+                        _did_compress, _phase = await get_compressor().check_and_compress()
+                        yield ("", False, {
+                            "type": "compression_done",
+                            "phase": _phase,
+                            "async": False,
+                        })
+                    else:
+                        # Async: Hintergrund-Task, Pipeline läuft sofort weiter
+                        asyncio.create_task(get_compressor().check_and_compress())
+                        yield ("", False, {
+                            "type": "compression_done",
+                            "phase": "async_started",
+                            "async": True,
+                        })
+        except Exception as _ce:
+            log_warn_fn(f"[Orchestrator] Context compression skipped: {_ce}")
+    except BaseException:
+        # Disconnect/Fehler vor der Signal-Stage → Tone-Task nicht weiterlaufen lassen
+        tone_pending.cancel()
+        raise
 
     # ═══════════════════════════════════════════════════
     # STEP 1: THINKING LAYER (STREAMING)
@@ -318,6 +337,7 @@ async def process_stream_with_events(
     if chunking_context and chunking_context.get("thinking_result"):
         log_info_fn("[Orchestrator] Layer 1 SKIPPED (using chunking result)")
         thinking_plan = chunking_context["thinking_result"]
+        tone_signal = await tone_pending.result()
         thinking_plan = orch._ensure_dialogue_controls(
             thinking_plan,
             tone_signal,
@@ -332,13 +352,13 @@ async def process_stream_with_events(
     else:
         log_info_fn("[Orchestrator] === LAYER 1: THINKING (STREAMING) ===")
         
-        # Layer 0: Tool Selection
-        from core.orchestrator_pipeline_stages import run_tool_selection_stage
+        # Layer 0: Signal stage (tone, tool selection, budget, domain)
         selected_tools, query_budget_signal, domain_route_signal, _last_assistant_msg = (
             await run_tool_selection_stage(
-                orch, user_text, request, forced_response_mode, tone_signal, log_info_fn
+                orch, user_text, request, forced_response_mode, tone_pending, log_info_fn
             )
         )
+        tone_signal = await tone_pending.result()
         if selected_tools:
             yield ("", False, {"type": "tool_selection", "tools": selected_tools})
 
@@ -451,84 +471,108 @@ async def process_stream_with_events(
                 )
                 tool_hints = build_detection_hints(hub=_hub_ref)
 
-                async for chunk, is_done, plan in orch.thinking.analyze_stream(
-                    _thinking_user_text,
-                    memory_context=_thinking_skill_ctx,
-                    available_tools=available_tools_snapshot,
-                    tone_signal=tone_signal,
-                    tool_hints=tool_hints,
-                ):
-                    if not is_done:
-                        yield ("", False, {
-                            "type": "thinking_stream",
-                            "chunk": chunk,
-                            "thinking_chunk": chunk,
-                        })
-                    else:
-                        thinking_plan = plan
-                        thinking_plan = orch._ensure_dialogue_controls(
+                # Memory-Lookups starten, sobald die Memory-Felder des Plans gestreamt sind
+                from config import get_small_model_mode as _get_smm_speculation
+                plan_speculation = PlanSpeculation(
+                    orch.context,
+                    conversation_id,
+                    small_model_mode=_get_smm_speculation(),
+                    log_fn=log_info_fn,
+                )
+
+                try:
+                    async for chunk, is_done, plan in orch.thinking.analyze_stream(
+                        _thinking_user_text,
+                        memory_context=_thinking_skill_ctx,
+                        available_tools=available_tools_snapshot,
+                        tone_signal=tone_signal,
+                        tool_hints=tool_hints,
+                    ):
+                        if not is_done:
+                            if isinstance(plan, dict) and plan.get("plan_fields"):
+                                plan_speculation.observe(plan["plan_fields"])
+                            yield ("", False, {
+                                "type": "thinking_stream",
+                                "chunk": chunk,
+                                "thinking_chunk": chunk,
+                            })
+                        else:
+                            thinking_plan = plan
+                            thinking_plan = orch._ensure_dialogue_controls(
+                                thinking_plan,
+                                tone_signal,
+                                user_text=user_text,
+                                selected_tools=selected_tools,
+                            )
+                            thinking_plan["_trace_skills_prefetch"] = bool(_thinking_skill_ctx)
+                            thinking_plan["_trace_skills_prefetch_mode"] = _stream_prefetch_mode
+                            # Im Cache speichern für spätere Aufrufe
+                            thinking_plan_cache.set(user_text, thinking_plan)
+                            log_info_fn(f"[Orchestrator] ThinkingLayer plan cached prefetch={_stream_prefetch_mode}")
+                    yield ("", False, {
+                        "type": "thinking_done",
+                        "thinking": _build_thinking_ui_payload(
                             thinking_plan,
-                            tone_signal,
-                            user_text=user_text,
-                            selected_tools=selected_tools,
-                        )
-                        thinking_plan["_trace_skills_prefetch"] = bool(_thinking_skill_ctx)
-                        thinking_plan["_trace_skills_prefetch_mode"] = _stream_prefetch_mode
-                        # Im Cache speichern für spätere Aufrufe
-                        thinking_plan_cache.set(user_text, thinking_plan)
-                        log_info_fn(f"[Orchestrator] ThinkingLayer plan cached prefetch={_stream_prefetch_mode}")
-                yield ("", False, {
-                    "type": "thinking_done",
-                    "thinking": _build_thinking_ui_payload(
-                        thinking_plan,
-                        source="live",
-                    ),
-                })
-    if _emit_loop_trace:
-        yield ("", False, build_loop_trace_started_event(user_text, thinking_plan))
-        _loop_trace_started_emitted = True
-    # ═══════════════════════════════════════════════════
-    # PLAN FINALIZATION + RESPONSE MODE
-    # ═══════════════════════════════════════════════════
-    from core.orchestrator_pipeline_stages import run_plan_finalization
-    thinking_plan, response_mode_stream = run_plan_finalization(
-        orch, user_text, request, thinking_plan, selected_tools,
-        query_budget_signal, domain_route_signal, forced_response_mode,
-        conversation_id, log_info_fn,
-    )
-    thinking_plan = inject_active_task_loop_context(
-        thinking_plan,
-        active_task_loop_snapshot,
-        user_text=user_text,
-        raw_request=getattr(request, "raw_request", None),
-    )
-    log_info_fn(f"[Orchestrator] response_mode={response_mode_stream} (stream)")
-    _loop_trace_normalized = build_loop_trace_plan_normalized_event(thinking_plan)
-    if _loop_trace_normalized:
-        _emit_loop_trace = True
-        if not _loop_trace_started_emitted:
+                            source="live",
+                        ),
+                    })
+                except BaseException:
+                    # Abbruch/Disconnect vor settle() → Lookups nicht weiterlaufen lassen
+                    plan_speculation.cancel()
+                    raise
+    try:
+        if _emit_loop_trace:
             yield ("", False, build_loop_trace_started_event(user_text, thinking_plan))
             _loop_trace_started_emitted = True
-    if _loop_trace_normalized:
-        yield ("", False, _loop_trace_normalized)
-    yield ("", False, {"type": "response_mode", "mode": response_mode_stream})
-    
-    # ═══════════════════════════════════════════════════
-    # WORKSPACE: Save thinking observations
-    # ═══════════════════════════════════════════════════
-    obs_text = orch._extract_workspace_observations(thinking_plan)
-    if obs_text:
-        ws_event = orch._save_workspace_entry(
-            conversation_id, obs_text, "observation", "thinking"
+        # ═══════════════════════════════════════════════════
+        # PLAN FINALIZATION + RESPONSE MODE
+        # ═══════════════════════════════════════════════════
+        from core.orchestrator_pipeline_stages import run_plan_finalization
+        thinking_plan, response_mode_stream = run_plan_finalization(
+            orch, user_text, request, thinking_plan, selected_tools,
+            query_budget_signal, domain_route_signal, forced_response_mode,
+            conversation_id, log_info_fn,
         )
-        if ws_event:
-            yield ("", False, ws_event)
+        thinking_plan = inject_active_task_loop_context(
+            thinking_plan,
+            active_task_loop_snapshot,
+            user_text=user_text,
+            raw_request=getattr(request, "raw_request", None),
+        )
+        log_info_fn(f"[Orchestrator] response_mode={response_mode_stream} (stream)")
+        _loop_trace_normalized = build_loop_trace_plan_normalized_event(thinking_plan)
+        if _loop_trace_normalized:
+            _emit_loop_trace = True
+            if not _loop_trace_started_emitted:
+                yield ("", False, build_loop_trace_started_event(user_text, thinking_plan))
+                _loop_trace_started_emitted = True
+        if _loop_trace_normalized:
+            yield ("", False, _loop_trace_normalized)
+        yield ("", False, {"type": "response_mode", "mode": response_mode_stream})
+        
+        # ═══════════════════════════════════════════════════
+        # WORKSPACE: Save thinking observations
+        # ═══════════════════════════════════════════════════
+        obs_text = orch._extract_workspace_observations(thinking_plan)
+        if obs_text:
+            ws_event = orch._save_workspace_entry(
+                conversation_id, obs_text, "observation", "thinking"
+            )
+            if ws_event:
+                yield ("", False, ws_event)
 
-    # ═══════════════════════════════════════════════════
-    # STEP 1.5: CONTEXT RETRIEVAL (unified helper)
-    # ═══════════════════════════════════════════════════
-    from config import get_small_model_mode as _get_smm_stream
-    _smm_stream = _get_smm_stream()
+        # ═══════════════════════════════════════════════════
+        # STEP 1.5: CONTEXT RETRIEVAL (unified helper)
+        # ═══════════════════════════════════════════════════
+        from config import get_small_model_mode as _get_smm_stream
+        _smm_stream = _get_smm_stream()
+        if plan_speculation is not None:
+            await plan_speculation.settle(thinking_plan, request_retrieval_cache)
+    except BaseException:
+        # siehe oben: auch Fehler/Disconnect zwischen Thinking und settle()
+        if plan_speculation is not None:
+            plan_speculation.cancel()
+        raise
     full_context, ctx_trace_stream, mem_res = orch.build_effective_context(
         user_text=user_text,
         conv_id=conversation_id,
@@ -1169,11 +1213,61 @@ async def process_stream_with_events(
         from core.tool_intelligence import ReflectionLoop
         _reflection = ReflectionLoop()
         _round1_args: Dict[str, Dict] = {}
+        # Args pro Queue-Position: Prefetch-Planung und Ausführung bauen sie nur einmal.
+        _built_args: Dict[int, Any] = {}
+
+        def _stream_tool_args_at(_index: int, _name: Any) -> Any:
+            if _index not in _built_args:
+                _built_args[_index] = _control_tool_decisions.get(_name) or orch._build_tool_args(
+                    _name, user_text, verified_plan=verified_plan
+                )
+            return _built_args[_index]
+
+        def _stream_prefetch_call_for(_index: int, _spec: Any) -> Optional[PrefetchCall]:
+            # Gleiche Guards wie im Loop; alles Unklare läuft dort normal seriell.
+            if isinstance(_spec, dict) and "tool" in _spec:
+                _name, _args = _spec["tool"], _spec.get("args", {})
+            else:
+                _name = _spec
+                _args = _stream_tool_args_at(_index, _name)
+            if not isinstance(_args, dict) or _args.get("container_id") == "PENDING":
+                return None
+            if not tool_allowed_by_control_decision(control_decision, _name):
+                return None
+            if _name == "memory_graph_search" and thinking_plan.get("time_reference"):
+                return None
+            _ok, _args, _ = orch._validate_tool_args(tool_hub, _name, copy.deepcopy(_args), user_text)
+            if not _ok:
+                return None
+            orch._bind_cron_conversation_id(_name, _args, conversation_id)
+            if _name in _STREAM_FAST_LANE_TOOLS and _stream_fast_lane:
+                return "fast_lane", _name, _args
+            if getattr(tool_hub, "supports_concurrent_calls", lambda _n: False)(_name) is not True:
+                return None
+            return "mcp", _name, _args
+
+        _stream_prefetcher = ToolPrefetcher(
+            lambda lane, name, args: (
+                _stream_fast_lane.execute(name, args) if lane == "fast_lane" else tool_hub.call_tool(name, args)
+            ),
+            log_fn=log_info_fn,
+        )
+        _prefetch_armed = True
         _tool_queue = list(suggested_tools or [])
         _tool_idx = 0
         while _tool_idx < len(_tool_queue):
             tool_spec = _tool_queue[_tool_idx]
             _tool_idx += 1
+            # Read-only Segment vorab parallel starten; Seiteneffekt-Tools sind Barrieren
+            if not is_parallel_safe_tool(spec_tool_name(tool_spec)):
+                _stream_prefetcher.barrier()
+                _built_args.clear()  # Einfügungen in die Queue beginnen immer mit einer Barriere
+                _prefetch_armed = True
+            elif _prefetch_armed:
+                _prefetch_armed = False
+                _stream_prefetcher.schedule(
+                    plan_read_only_segment(_tool_queue, _tool_idx - 1, _stream_prefetch_call_for)
+                )
             # Handle normalisierte Specs: {"tool": "run_skill", "args": {...}}
             if isinstance(tool_spec, dict) and "tool" in tool_spec:
                 tool_name = tool_spec["tool"]
@@ -1182,7 +1276,8 @@ async def process_stream_with_events(
                 tool_name = tool_spec
                 # ControlLayer entscheidet Args (Function Calling) — Fallback: heuristic
                 # IMPORTANT: {} is falsy → same logic as sync path (_cd.get() or _build_tool_args)
-                tool_args = _control_tool_decisions.get(tool_name) or orch._build_tool_args(tool_name, user_text, verified_plan=verified_plan)
+                tool_args = _stream_tool_args_at(_tool_idx - 1, tool_name)
+                _built_args.pop(_tool_idx - 1, None)
                 if tool_name in _control_tool_decisions and _control_tool_decisions[tool_name]:
                     log_debug_fn(f"[Orchestrator] Using ControlLayer args for {tool_name}")
                 # autonomous_skill_task: Intent aus ThinkingLayer injizieren
@@ -1520,7 +1615,11 @@ async def process_stream_with_events(
                 if tool_name in _STREAM_FAST_LANE_TOOLS and _stream_fast_lane:
                     try:
                         log_info_fn(f"[Orchestrator-Stream] Fast Lane ⚡ {tool_name}")
-                        fl_result = _stream_fast_lane.execute(tool_name, tool_args)
+                        _prefetched = _stream_prefetcher.take("fast_lane", tool_name, tool_args)
+                        if _prefetched is not None:
+                            fl_result = await asyncio.wrap_future(_prefetched)
+                        else:
+                            fl_result = _stream_fast_lane.execute(tool_name, tool_args)
                         formatted, success, meta = orch._format_tool_result(fl_result, tool_name)
                         # ── Commit 2 stream parity: Card + Full Payload ──
                         _fl_status = "ok" if success else "error"
@@ -1633,7 +1732,10 @@ async def process_stream_with_events(
                             continue
 
                 log_info_fn(f"[Orchestrator] Calling tool: {tool_name}({tool_args})")
-                if hasattr(tool_hub, "call_tool_async"):
+                _prefetched = _stream_prefetcher.take("mcp", tool_name, tool_args)
+                if _prefetched is not None:
+                    result = await asyncio.wrap_future(_prefetched)
+                elif hasattr(tool_hub, "call_tool_async"):
                     result = await tool_hub.call_tool_async(tool_name, tool_args)
                 else:
                     result = await asyncio.to_thread(tool_hub.call_tool, tool_name, tool_args)
@@ -1960,6 +2062,7 @@ async def process_stream_with_events(
                     status="error",
                     reason=str(e),
                 )
+        _stream_prefetcher.barrier()
 
     # ═══════════════════════════════════════════════════
     # STEP 2.5: REFLECTION LOOP (Round 2, max 1x)
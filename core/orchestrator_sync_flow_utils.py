@@ -39,6 +39,7 @@ from core.control_contract import (
     control_decision_from_plan,
     persist_control_decision,
 )
+from core.embedding_client import begin_embedding_turn
 from core.task_loop.context_writeback import persist_context_only_turn
 from core.plan_runtime_bridge import (
     append_runtime_tool_results,
@@ -85,62 +86,70 @@ async def process_request(
     conversation_id = request.conversation_id
     forced_response_mode = orch._requested_response_mode(request)
     request_retrieval_cache: Dict[str, Any] = {}
-    tone_signal = await orch._classify_tone_signal(user_text, request.messages)
+    begin_embedding_turn()
+    from core.orchestrator_pipeline_stages import run_tool_selection_stage, start_tone_signal
+    tone_pending = start_tone_signal(orch, user_text, request)
     
-    # ===============================================================
-    # STEP 1: Intent Confirmation Check
-    # ===============================================================
-    if intent_system_available:
-        confirmation_result = await orch._check_pending_confirmation(
-            user_text, conversation_id
-        )
-        if confirmation_result:
-            log_info_fn("[Orchestrator] Returning confirmation result")
-            return confirmation_result
-
-    from core.orchestrator_modules.task_loop import (
-        clear_active_task_loop,
-        get_active_task_loop_snapshot,
-        inject_active_task_loop_context,
-        maybe_handle_task_loop_sync,
-    )
-    from core.orchestrator_modules.task_loop_routing import decide_task_loop_routing
-    active_task_loop_snapshot = get_active_task_loop_snapshot(conversation_id)
-
-    # ===============================================================
-    # STEP 1.1: CONTEXT COMPRESSION (non-stream, deep-aware)
-    # ===============================================================
     try:
-        _deep_hint = forced_response_mode == "deep" or orch._is_explicit_deep_request(user_text)
-        if _deep_hint:
-            from core.context_compressor import get_compressor, estimate_protocol_tokens
-            from utils.settings import settings as _settings
-            _compression_enabled = _settings.get("CONTEXT_COMPRESSION_ENABLED", True)
-            if _compression_enabled:
-                _token_est = estimate_protocol_tokens()
-                _compression_threshold = _settings.get("COMPRESSION_THRESHOLD", 100000)
-                if _token_est >= _compression_threshold:
-                    _compression_mode = _settings.get("CONTEXT_COMPRESSION_MODE", "sync")
-                    log_info_fn(
-                        "[Orchestrator] Context compression triggered (sync path) "
-                        f"tokens={_token_est} mode={_compression_mode}"
-                    )
-                    if _compression_mode == "sync":
-                        await get_compressor().check_and_compress()
-                    else:
-                        asyncio.create_task(get_compressor().check_and_compress())
-    except Exception as _ce_sync:
-        log_warn_fn(f"[Orchestrator] Context compression skipped (sync path): {_ce_sync}")
+        # ===============================================================
+        # STEP 1: Intent Confirmation Check
+        # ===============================================================
+        if intent_system_available:
+            confirmation_result = await orch._check_pending_confirmation(
+                user_text, conversation_id
+            )
+            if confirmation_result:
+                log_info_fn("[Orchestrator] Returning confirmation result")
+                tone_pending.cancel()
+                return confirmation_result
+
+        from core.orchestrator_modules.task_loop import (
+            clear_active_task_loop,
+            get_active_task_loop_snapshot,
+            inject_active_task_loop_context,
+            maybe_handle_task_loop_sync,
+        )
+        from core.orchestrator_modules.task_loop_routing import decide_task_loop_routing
+        active_task_loop_snapshot = get_active_task_loop_snapshot(conversation_id)
+
+        # ===============================================================
+        # STEP 1.1: CONTEXT COMPRESSION (non-stream, deep-aware)
+        # ===============================================================
+        try:
+            _deep_hint = forced_response_mode == "deep" or orch._is_explicit_deep_request(user_text)
+            if _deep_hint:
+                from core.context_compressor import get_compressor, estimate_protocol_tokens
+                from utils.settings import settings as _settings
+                _compression_enabled = _settings.get("CONTEXT_COMPRESSION_ENABLED", True)
+                if _compression_enabled:
+                    _token_est = estimate_protocol_tokens()
+                    _compression_threshold = _settings.get("COMPRESSION_THRESHOLD", 100000)
+                    if _token_est >= _compression_threshold:
+                        _compression_mode = _settings.get("CONTEXT_COMPRESSION_MODE", "sync")
+                        log_info_fn(
+                            "[Orchestrator] Context compression triggered (sync path) "
+                            f"tokens={_token_est} mode={_compression_mode}"
+                        )
+                        if _compression_mode == "sync":
+                            await get_compressor().check_and_compress()
+                        else:
+                            asyncio.create_task(get_compressor().check_and_compress())
+        except Exception as _ce_sync:
+            log_warn_fn(f"[Orchestrator] Context compression skipped (sync path): {_ce_sync}")
+    except BaseException:
+        # Fehler/Abbruch vor der Signal-Stage → Tone-Task nicht weiterlaufen lassen
+        tone_pending.cancel()
+        raise
     
     # ===============================================================
     # STEP 1.5: Tool Selector (Layer 0)
     # ===============================================================
-    from core.orchestrator_pipeline_stages import run_tool_selection_stage
     selected_tools, query_budget_signal, domain_route_signal, _last_assistant_msg = (
         await run_tool_selection_stage(
-            orch, user_text, request, forced_response_mode, tone_signal, log_info_fn
+            orch, user_text, request, forced_response_mode, tone_pending, log_info_fn
         )
     )
+    tone_signal = await tone_pending.result()
     
     # ===============================================================
     # STEP 2: Thinking Layer
@@ -1,3 +1,4 @@
+import copy
 import json
 from datetime import datetime
 from typing import Any, Callable, Dict, List, Optional, Tuple
@@ -16,6 +17,13 @@ from core.plan_runtime_bridge import (
     set_runtime_grounding_evidence,
     set_runtime_successful_tool_runs,
 )
+from core.orchestrator_tool_prefetch_utils import (
+    PrefetchCall,
+    ToolPrefetcher,
+    is_parallel_safe_tool,
+    plan_read_only_segment,
+    spec_tool_name,
+)
 from core.host_runtime_policy import (
     build_direct_host_runtime_response,
     build_host_runtime_blueprint_create_args,
@@ -99,31 +107,65 @@ def execute_tools_sync(
 
     fast_lane_tools = {"home_read", "home_write", "home_list"}
 
+    def _tool_name_and_args(tool_spec: Any) -> Tuple[Any, Any]:
+        if isinstance(tool_spec, dict) and "tool" in tool_spec:
+            return tool_spec["tool"], tool_spec.get("args", {})
+        tool_name = tool_spec.get("name") if isinstance(tool_spec, dict) else tool_spec
+        control_decisions = control_tool_decisions or {}
+        tool_args = control_decisions.get(tool_name) or build_tool_args_fn(
+            tool_name,
+            user_text,
+            verified_plan=verified,
+        )
+        return tool_name, tool_args
+
+    # Args pro Queue-Position: Prefetch-Planung und Ausführung bauen sie nur einmal.
+    built_args: Dict[int, Tuple[Any, Any]] = {}
+
+    def _tool_name_and_args_at(index: int, tool_spec: Any) -> Tuple[Any, Any]:
+        if index not in built_args:
+            built_args[index] = _tool_name_and_args(tool_spec)
+        return built_args[index]
+
+    def _prefetch_call_for(index: int, tool_spec: Any) -> Optional[PrefetchCall]:
+        # Gleiche Guards wie im Loop; alles Unklare läuft dort normal seriell.
+        tool_name, tool_args = _tool_name_and_args_at(index, tool_spec)
+        if not isinstance(tool_args, dict) or tool_args.get("container_id") == "PENDING":
+            return None
+        if not tool_allowed_by_control_decision(control_decision, tool_name):
+            return None
+        if tool_name == "memory_graph_search" and time_reference:
+            return None
+        valid, tool_args, _reason = validate_tool_args_fn(tool_hub, tool_name, copy.deepcopy(tool_args), user_text)
+        if not valid:
+            return None
+        bind_cron_conversation_id_fn(tool_name, tool_args, session_id)
+        if tool_name in fast_lane_tools and fast_lane:
+            return "fast_lane", tool_name, tool_args
+        if getattr(tool_hub, "supports_concurrent_calls", lambda _name: False)(tool_name) is not True:
+            return None
+        return "mcp", tool_name, tool_args
+
+    prefetcher = ToolPrefetcher(
+        lambda lane, name, args: fast_lane.execute(name, args) if lane == "fast_lane" else tool_hub.call_tool(name, args),
+        log_fn=log_info_fn,
+    )
+    prefetch_armed = True
+
     tool_queue = list(suggested_tools or [])
     tool_index = 0
     while tool_index < len(tool_queue):
         tool_spec = tool_queue[tool_index]
         tool_index += 1
+        if not is_parallel_safe_tool(spec_tool_name(tool_spec)):
+            prefetcher.barrier()
+            built_args.clear()  # Einfügungen in die Queue beginnen immer mit einer Barriere
+            prefetch_armed = True
+        elif prefetch_armed:
+            prefetch_armed = False
+            prefetcher.schedule(plan_read_only_segment(tool_queue, tool_index - 1, _prefetch_call_for))
         try:
-            if isinstance(tool_spec, dict) and "tool" in tool_spec:
-                tool_name = tool_spec["tool"]
-                tool_args = tool_spec.get("args", {})
-            elif isinstance(tool_spec, dict):
-                tool_name = tool_spec.get("name")
-                control_decisions = control_tool_decisions or {}
-                tool_args = control_decisions.get(tool_name) or build_tool_args_fn(
-                    tool_name,
-                    user_text,
-                    verified_plan=verified,
-                )
-            else:
-                tool_name = tool_spec
-                control_decisions = control_tool_decisions or {}
-                tool_args = control_decisions.get(tool_name) or build_tool_args_fn(
-                    tool_name,
-                    user_text,
-                    verified_plan=verified,
-                )
+            tool_name, tool_args = built_args.pop(tool_index - 1, None) or _tool_name_and_args(tool_spec)
 
             if tool_name == "request_container" and bool(verified.get("_trion_home_start_fast_path")):
                 tool_name = "home_start"
@@ -448,7 +490,8 @@ def execute_tools_sync(
             if is_fast_lane and fast_lane:
                 try:
                     log_info_fn(f"[Orchestrator] Executing {tool_name} via Fast Lane")
-                    result = fast_lane.execute(tool_name, tool_args)
+                    prefetched = prefetcher.take("fast_lane", tool_name, tool_args)
+                    result = prefetched.result() if prefetched is not None else fast_lane.execute(tool_name, tool_args)
                     formatted, success, _metadata = format_tool_result_fn(result, tool_name)
                     fl_status = "ok" if success else "error"
                     fl_raw = formatted.strip()
@@ -527,7 +570,8 @@ def execute_tools_sync(
                             continue
 
                 log_info_fn(f"[Orchestrator] Calling tool: {tool_name}({tool_args})")
-                result = tool_hub.call_tool(tool_name, tool_args)
+                prefetched = prefetcher.take("mcp", tool_name, tool_args)
+                result = prefetched.result() if prefetched is not None else tool_hub.call_tool(tool_name, tool_args)
 
                 if tool_name == "request_container" and isinstance(result, dict):
                     last_container_id = result.get("container_id", "") or result.get("container", {}).get(
@@ -734,6 +778,7 @@ def execute_tools_sync(
                 status="error",
                 reason=str(tool_error),
             )
+    prefetcher.barrier()
 
     if isinstance(verified, dict):
         if host_runtime_lookup and not direct_host_runtime_response:
@@ -0,0 +1,166 @@
+"""
+Read-only tool prefetch for the sequential tool loops (sync + stream).
+
+The tool loops in ``orchestrator_tool_execution_sync_utils`` and
+``orchestrator_stream_flow_utils`` stay strictly sequential: guards, result
+cards, grounding evidence, workspace events and container state are produced
+in queue order, exactly as before. Only the blocking I/O of independent
+read-only tools is moved forward:
+
+- The tool queue is cut into segments at every side-effecting tool
+  (request_container, exec_in_container, home_write, cron writes, ...).
+  A side-effecting tool is a barrier: nothing behind it is started before it
+  ran, because later tools may depend on its result (e.g. container_id from
+  request_container, PENDING args).
+- When the loop reaches a segment of ``PARALLEL_SAFE_READ_TOOLS``, every call
+  in that segment whose final args are already known is submitted to a shared,
+  bounded worker pool (TOOL_PARALLEL_MAX_WORKERS).
+- At its turn the loop takes the prefetched future if tool name *and* final
+  args match, otherwise it calls the tool itself. A mismatch therefore never
+  changes results, it only loses the head start.
+
+Multi-tool turns with several read-only lookups now take about as long as
+the slowest of them instead of their sum.
+"""
+
+from __future__ import annotations
+
+import copy
+import json
+import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from core.orchestrator_modules.catalog import PARALLEL_SAFE_READ_TOOLS
+
+_PREFETCH_ENABLE = str(os.getenv("TOOL_PARALLEL_ENABLE", "true")).lower() == "true"
+_MAX_WORKERS = max(1, int(os.getenv("TOOL_PARALLEL_MAX_WORKERS", "4")))
+
+# (lane, tool_name, args) — lane: "mcp" | "fast_lane"
+PrefetchCall = Tuple[str, str, Dict[str, Any]]
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=_MAX_WORKERS, thread_name_prefix="tool-prefetch")
+        return _executor
+
+
+def shutdown_tool_prefetch_pool() -> None:
+    global _executor
+    with _executor_lock:
+        executor, _executor = _executor, None
+    if executor is not None:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def spec_tool_name(tool_spec: Any) -> str:
+    """Tool-Name aus einem Queue-Eintrag ("name", {"tool": ...} oder {"name": ...})."""
+    if isinstance(tool_spec, dict):
+        return str(tool_spec.get("tool") or tool_spec.get("name") or "")
+    return str(tool_spec or "")
+
+
+def is_parallel_safe_tool(tool_name: str) -> bool:
+    return str(tool_name or "") in PARALLEL_SAFE_READ_TOOLS
+
+
+def args_key(lane: str, tool_name: str, tool_args: Any) -> str:
+    try:
+        payload = json.dumps(tool_args, sort_keys=True, ensure_ascii=False, default=str)
+    except Exception:
+        payload = repr(tool_args)
+    return f"{lane}\x00{tool_name}\x00{payload}"
+
+
+def plan_read_only_segment(
+    tool_queue: List[Any],
+    start: int,
+    resolve_fn: Callable[[int, Any], Optional[PrefetchCall]],
+) -> List[PrefetchCall]:
+    """
+    Prefetch-fähige Calls ab Queue-Index start bis zur nächsten Barriere.
+
+    resolve_fn(index, spec) liefert (lane, name, args) mit den finalen Args
+    oder None, wenn der Call nicht vorab bestimmbar ist (Guard, PENDING
+    container_id, invalid). Solche Read-Tools werden im Loop normal ausgeführt,
+    sind aber keine Barriere. Der Index erlaubt dem Loop, einmal gebaute Args
+    pro Queue-Position wiederzuverwenden.
+    """
+    calls: List[PrefetchCall] = []
+    for index in range(max(0, start), len(tool_queue)):
+        spec = tool_queue[index]
+        if not is_parallel_safe_tool(spec_tool_name(spec)):
+            break
+        try:
+            resolved = resolve_fn(index, spec)
+        except Exception:
+            resolved = None
+        if resolved is not None:
+            calls.append(resolved)
+    return calls
+
+
+class ToolPrefetcher:
+    """Futures für vorab gestartete Read-only Calls eines Tool-Loops (nicht thread-shared)."""
+
+    def __init__(
+        self,
+        call_fn: Callable[[str, str, Dict[str, Any]], Any],
+        *,
+        enabled: Optional[bool] = None,
+        log_fn: Optional[Callable[[str], None]] = None,
+    ):
+        self._call_fn = call_fn
+        self.enabled = _PREFETCH_ENABLE if enabled is None else bool(enabled)
+        self._log_fn = log_fn
+        self._pending: Dict[str, List[Future]] = {}
+        self.stats = {"scheduled": 0, "hits": 0, "discarded": 0}
+
+    def schedule(self, calls: List[PrefetchCall]) -> int:
+        """Startet die Calls eines Segments. Ein einzelner Call lohnt sich nicht."""
+        if not self.enabled or len(calls) < 2:
+            return 0
+        executor = _get_executor()
+        for lane, tool_name, tool_args in calls:
+            frozen_args = copy.deepcopy(tool_args)
+            future = executor.submit(self._call_fn, lane, tool_name, frozen_args)
+            self._pending.setdefault(args_key(lane, tool_name, frozen_args), []).append(future)
+        self.stats["scheduled"] += len(calls)
+        if self._log_fn:
+            self._log_fn(
+                f"[ToolPrefetch] {len(calls)} read-only tools parallel gestartet: "
+                + ", ".join(name for _, name, _ in calls)
+            )
+        return len(calls)
+
+    def take(self, lane: str, tool_name: str, tool_args: Any) -> Optional[Future]:
+        """Future für genau diesen Call (Name + finale Args) oder None."""
+        if not self._pending:
+            return None
+        key = args_key(lane, tool_name, tool_args)
+        futures = self._pending.get(key)
+        if not futures:
+            return None
+        future = futures.pop(0)
+        if not futures:
+            del self._pending[key]
+        self.stats["hits"] += 1
+        return future
+
+    def barrier(self) -> None:
+        """Nicht abgeholte Prefetches verwerfen (laufende Read-Calls enden folgenlos)."""
+        for futures in self._pending.values():
+            for future in futures:
+                future.cancel()
+                self.stats["discarded"] += 1
+        self._pending.clear()
+
+    def has_pending(self) -> bool:
+        return bool(self._pending)
@@ -0,0 +1,144 @@
+# core/prompt_assembly.py
+"""
+Prefix-stabile Prompt-Montage für die Layer-Prompts.
+
+Ollama verwirft den KV-Cache ab dem ersten Token, das sich gegenüber dem
+vorherigen Request an dasselbe Modell unterscheidet. Die Layer-Prompts
+wurden bisher als statischer System-Prompt + Turn-Material in wechselnder
+Reihenfolge zusammengesetzt (Memory vor Tools, Tools als
+json.dumps(indent=1) in Selektor-Reihenfolge) — schon ein anderer
+Skill-Kontext verschob alles dahinter.
+
+- PromptSegment trägt eine Stabilitätsstufe: STATIC (System-Prompt),
+  CATALOG (Detection-Rules), TURN (Memory, Tone, Tool-Auswahl), REQUEST
+  (User-Text). assemble_prompt() behält die Reihenfolge des Aufrufers bei —
+  die Sektionsfolge, die das Modell sieht, ändert sich nicht; cachebar ist
+  nur der führende Block aus STATIC/CATALOG-Segmenten
+- canonical_json()/canonical_tool_snapshot(): sortierte, kompakte,
+  deterministische Kodierung — gleiche Tool-Menge ergibt gleiche Bytes
+- PromptPrefixTracker: Hash des stabilen Prefix pro Rolle/Modell; zählt, wie oft der Prefix dem vorherigen Aufruf entspricht
+  (= Cache-Wiederverwendung möglich)
+"""
+
+import hashlib
+import json
+import threading
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+STABILITY_STATIC = 0    # System-Prompt, Persona — ändert sich nur mit Config/Deploy
+STABILITY_CATALOG = 1   # Detection-Rules — ändert sich mit dem Tool-Katalog
+STABILITY_TURN = 2      # Memory-/Skill-Kontext, Tone-Signal, Tool-Auswahl, Plan-Flags
+STABILITY_REQUEST = 3   # User-Anfrage + Antwort-Marker — immer zuletzt
+
+
+@dataclass(frozen=True)
+class PromptSegment:
+    name: str
+    text: str
+    stability: int = STABILITY_TURN
+
+
+def canonical_json(value: Any) -> str:
+    """Deterministisches, kompaktes JSON (sortierte Keys, keine Leerzeichen)."""
+    return json.dumps(value, sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str)
+
+
+def canonical_tool_snapshot(tools: Optional[Iterable[Any]]) -> str:
+    """
+    Tool-Snapshot als JSON-Array, eine Zeile pro Tool, nach Name sortiert.
+
+    Duplikate (gleicher Name) werden auf den ersten Eintrag reduziert, damit
+    die Selektor-Reihenfolge keinen Einfluss auf die Bytes hat.
+    """
+    by_name: Dict[str, str] = {}
+    for tool in tools or []:
+        if isinstance(tool, dict):
+            name = str(tool.get("name") or tool.get("tool") or "")
+            encoded = canonical_json(tool)
+        else:
+            name = str(tool or "")
+            encoded = canonical_json(name)
+        by_name.setdefault(name, encoded)
+    if not by_name:
+        return "[]"
+    return "[\n" + ",\n".join(by_name[name] for name in sorted(by_name)) + "\n]"
+
+
+def prefix_hash(text: str) -> str:
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()[:16]
+
+
+class PromptPrefixTracker:
+    """Merkt sich pro (Rolle, Modell) den Hash des stabilen Prompt-Teils."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._last: Dict[Tuple[str, str], str] = {}
+        self._stats: Dict[Tuple[str, str], Dict[str, int]] = {}
+
+    def observe(self, role: str, model: str, stable_text: str) -> bool:
+        """True, wenn der stabile Teil identisch zum letzten Aufruf ist."""
+        key = (str(role or ""), str(model or ""))
+        digest = prefix_hash(stable_text)
+        with self._lock:
+            stats = self._stats.setdefault(key, {"calls": 0, "hits": 0, "stable_chars": 0})
+            hit = self._last.get(key) == digest
+            self._last[key] = digest
+            stats["calls"] += 1
+            stats["hits"] += int(hit)
+            stats["stable_chars"] = len(stable_text)
+        return hit
+
+    def last_hash(self, role: str, model: str) -> Optional[str]:
+        with self._lock:
+            return self._last.get((str(role or ""), str(model or "")))
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        with self._lock:
+            out: Dict[str, Dict[str, Any]] = {}
+            for (role, model), stats in self._stats.items():
+                calls = stats["calls"]
+                out[f"{role}|{model}"] = {
+                    **stats,
+                    "prefix_hash": self._last.get((role, model)),
+                    "hit_ratio": round(stats["hits"] / calls, 3) if calls else 0.0,
+                }
+            return out
+
+    def clear(self) -> None:
+        with self._lock:
+            self._last.clear()
+            self._stats.clear()
+
+
+_TRACKER = PromptPrefixTracker()
+
+
+def get_prompt_prefix_stats() -> Dict[str, Dict[str, Any]]:
+    return _TRACKER.snapshot()
+
+
+def assemble_prompt(
+    segments: Iterable[PromptSegment],
+    *,
+    role: str,
+    model: str = "",
+    separator: str = "\n\n",
+    tracker: Optional[PromptPrefixTracker] = None,
+) -> str:
+    """
+    Segmente in der übergebenen Reihenfolge zusammenfügen.
+
+    Leere Segmente fallen weg. Der Hash über die führenden STATIC/CATALOG-
+    Segmente (bis zum ersten TURN/REQUEST-Segment) wird pro Rolle/Modell im
+    Tracker festgehalten.
+    """
+    ordered: List[PromptSegment] = [seg for seg in segments if seg.text]
+    prefix: List[str] = []
+    for seg in ordered:
+        if seg.stability >= STABILITY_TURN:
+            break
+        prefix.append(seg.text)
+    (tracker or _TRACKER).observe(role, model, separator.join(prefix))
+    return separator.join(seg.text for seg in ordered)
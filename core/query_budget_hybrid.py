@@ -10,20 +10,13 @@ Purpose:
 from __future__ import annotations
 
 import asyncio
-import math
 import re
 import time
 from typing import Any, Dict, List, Optional
 
-import httpx
-
-from config import (
-    OLLAMA_BASE,
-    get_embedding_model,
-    get_query_budget_embedding_enable,
-)
-from utils.logger import log_debug
-from utils.role_endpoint_resolver import resolve_role_endpoint
+from config import get_query_budget_embedding_enable
+from core.embedding_client import embed_text
+from utils.embedding.similarity import PrototypeMatrix, cosine_similarity
 
 
 class QueryBudgetHybridClassifier:
@@ -99,6 +92,11 @@ class QueryBudgetHybridClassifier:
         "skill",
         "tool",
     }
+    # Selector tools / tone acts that shift the lexical scores.
+    _RECALL_SELECTOR_TOOLS = frozenset({"memory_graph_search", "memory_search"})
+    _ANALYTICAL_SELECTOR_TOOLS = frozenset({"analyze", "think"})
+    _ACTION_SELECTOR_TOOLS = frozenset({"run_skill", "request_container", "exec_in_container"})
+    _SCORED_TONE_ACTS = frozenset({"smalltalk", "analysis", "ack", "feedback"})
     _EXPLICIT_DEEP_MARKERS = (
         "/deep",
         "deep analysis",
@@ -118,7 +116,7 @@ class QueryBudgetHybridClassifier:
     )
 
     def __init__(self):
-        self._prototype_cache: Dict[str, List[float]] = {}
+        self._prototype_cache: PrototypeMatrix = PrototypeMatrix()
         self._prototype_cache_ts = 0.0
         self._prototype_lock = asyncio.Lock()
         self._prototype_cache_ttl_s = 6 * 60 * 60
@@ -405,39 +403,11 @@ class QueryBudgetHybridClassifier:
 
     @staticmethod
     def _cosine_similarity(a: List[float], b: List[float]) -> float:
-        if not a or not b or len(a) != len(b):
-            return 0.0
-        dot = 0.0
-        norm_a = 0.0
-        norm_b = 0.0
-        for x, y in zip(a, b):
-            dot += x * y
-            norm_a += x * x
-            norm_b += y * y
-        if norm_a <= 0.0 or norm_b <= 0.0:
-            return 0.0
-        return dot / (math.sqrt(norm_a) * math.sqrt(norm_b))
+        return cosine_similarity(a, b)
 
     async def _embed_text(self, text: str) -> Optional[List[float]]:
-        route = resolve_role_endpoint("embedding", default_endpoint=OLLAMA_BASE)
-        if route.get("hard_error"):
-            return None
-        endpoint = route.get("endpoint") or OLLAMA_BASE
-        payload = {
-            "model": get_embedding_model(),
-            "prompt": text,
-        }
-        try:
-            async with httpx.AsyncClient(timeout=self._embed_timeout_s) as client:
-                resp = await client.post(f"{endpoint}/api/embeddings", json=payload)
-                resp.raise_for_status()
-                data = resp.json()
-            vec = data.get("embedding")
-            if isinstance(vec, list) and vec:
-                return [float(v) for v in vec]
-        except Exception as e:
-            log_debug(f"[QueryBudget] Embedding unavailable: {type(e).__name__}: {e}")
-        return None
+        # Shared per-turn + LRU cache: one Ollama round-trip per text and turn.
+        return await embed_text(text, timeout_s=self._embed_timeout_s)
 
     async def _ensure_prototype_vectors(self) -> bool:
         now = time.time()
@@ -454,10 +424,38 @@ class QueryBudgetHybridClassifier:
                     cache[key] = vec
             if not cache:
                 return False
-            self._prototype_cache = cache
+            self._prototype_cache = PrototypeMatrix(cache)
             self._prototype_cache_ts = now
             return True
 
+    @staticmethod
+    def _selector_tool_names(selected_tools: Optional[List[Any]]) -> List[str]:
+        tool_names: List[str] = []
+        for item in selected_tools or []:
+            if isinstance(item, dict):
+                name = str(item.get("tool") or item.get("name") or "").strip().lower()
+            else:
+                name = str(item or "").strip().lower()
+            if name:
+                tool_names.append(name)
+        return tool_names
+
+    @classmethod
+    def depends_on_context(
+        cls,
+        selected_tools: Optional[List[Any]] = None,
+        tone_signal: Optional[Dict[str, Any]] = None,
+    ) -> bool:
+        """
+        True if selected_tools / tone_signal would change the lexical scores.
+        The signal stage classifies without them first and re-runs only then.
+        """
+        tone_act = str((tone_signal or {}).get("dialogue_act") or "").strip().lower()
+        if tone_act in cls._SCORED_TONE_ACTS:
+            return True
+        scored = cls._RECALL_SELECTOR_TOOLS | cls._ANALYTICAL_SELECTOR_TOOLS | cls._ACTION_SELECTOR_TOOLS
+        return any(name in scored for name in cls._selector_tool_names(selected_tools))
+
     def _lexical_classify(
         self,
         user_text: str,
@@ -469,14 +467,7 @@ class QueryBudgetHybridClassifier:
         tokens = self._tokenize(text)
         token_set = set(tokens)
 
-        tool_names: List[str] = []
-        for item in selected_tools or []:
-            if isinstance(item, dict):
-                name = str(item.get("tool") or item.get("name") or "").strip().lower()
-            else:
-                name = str(item or "").strip().lower()
-            if name:
-                tool_names.append(name)
+        tool_names = self._selector_tool_names(selected_tools)
 
         def _hits(vocab: set) -> int:
             total = len(token_set.intersection(vocab))
@@ -505,11 +496,11 @@ class QueryBudgetHybridClassifier:
             )
         )
 
-        if any(name in {"memory_graph_search", "memory_search"} for name in tool_names):
+        if any(name in self._RECALL_SELECTOR_TOOLS for name in tool_names):
             factual_hits += 2 if recall_like else 0.35
-        if any(name in {"analyze", "think"} for name in tool_names):
+        if any(name in self._ANALYTICAL_SELECTOR_TOOLS for name in tool_names):
             analytical_hits += 2
-        if any(name in {"run_skill", "request_container", "exec_in_container"} for name in tool_names):
+        if any(name in self._ACTION_SELECTOR_TOOLS for name in tool_names):
             action_hits += 2
 
         tone_act = str((tone_signal or {}).get("dialogue_act") or "").strip().lower()
@@ -621,12 +612,10 @@ class QueryBudgetHybridClassifier:
         if not text_vec:
             return None
 
-        sims: Dict[str, float] = {}
-        for key in self._QUERY_TYPES:
-            proto = self._prototype_cache.get(key)
-            if not proto:
-                continue
-            sims[key] = self._cosine_similarity(text_vec, proto)
+        all_sims = PrototypeMatrix.coerce(self._prototype_cache).scores(text_vec)
+        sims: Dict[str, float] = {
+            key: all_sims[key] for key in self._QUERY_TYPES if key in all_sims
+        }
         if not sims:
             return None
         best = sorted(sims.items(), key=lambda kv: kv[1], reverse=True)[0]
@@ -10,16 +10,13 @@ Design:
 from __future__ import annotations
 
 import asyncio
-import math
 import re
 import time
 from typing import Any, Dict, List, Optional, Tuple
 
-import httpx
-
-from config import OLLAMA_BASE, get_embedding_model
+from core.embedding_client import embed_text
+from utils.embedding.similarity import PrototypeMatrix, cosine_similarity
 from utils.logger import log_debug, log_warning
-from utils.role_endpoint_resolver import resolve_role_endpoint
 
 
 class ToneHybridClassifier:
@@ -115,7 +112,7 @@ class ToneHybridClassifier:
     }
 
     def __init__(self):
-        self._prototype_cache: Dict[str, List[float]] = {}
+        self._prototype_cache: PrototypeMatrix = PrototypeMatrix()
         self._prototype_cache_ts = 0.0
         self._prototype_lock = asyncio.Lock()
         self._prototype_cache_ttl_s = 6 * 60 * 60
@@ -148,39 +145,11 @@ class ToneHybridClassifier:
 
     @staticmethod
     def _cosine_similarity(a: List[float], b: List[float]) -> float:
-        if not a or not b or len(a) != len(b):
-            return 0.0
-        dot = 0.0
-        norm_a = 0.0
-        norm_b = 0.0
-        for x, y in zip(a, b):
-            dot += x * y
-            norm_a += x * x
-            norm_b += y * y
-        if norm_a <= 0.0 or norm_b <= 0.0:
-            return 0.0
-        return dot / (math.sqrt(norm_a) * math.sqrt(norm_b))
+        return cosine_similarity(a, b)
 
     async def _embed_text(self, text: str) -> Optional[List[float]]:
-        route = resolve_role_endpoint("embedding", default_endpoint=OLLAMA_BASE)
-        if route.get("hard_error"):
-            return None
-        endpoint = route.get("endpoint") or OLLAMA_BASE
-        payload = {
-            "model": get_embedding_model(),
-            "prompt": text,
-        }
-        try:
-            async with httpx.AsyncClient(timeout=self._embed_timeout_s) as client:
-                resp = await client.post(f"{endpoint}/api/embeddings", json=payload)
-                resp.raise_for_status()
-                data = resp.json()
-            vec = data.get("embedding")
-            if isinstance(vec, list) and vec:
-                return [float(v) for v in vec]
-        except Exception as e:
-            log_debug(f"[ToneHybrid] Embedding unavailable: {type(e).__name__}: {e}")
-        return None
+        # Shared per-turn + LRU cache: one Ollama round-trip per text and turn.
+        return await embed_text(text, timeout_s=self._embed_timeout_s)
 
     async def _ensure_prototype_vectors(self) -> bool:
         now = time.time()
@@ -202,7 +171,7 @@ class ToneHybridClassifier:
                     cache[key] = vec
             if not cache:
                 return False
-            self._prototype_cache = cache
+            self._prototype_cache = PrototypeMatrix(cache)
             self._prototype_cache_ts = now
             return True
 
@@ -272,19 +241,18 @@ class ToneHybridClassifier:
         if not query_vec:
             return None
 
-        tone_scores: Dict[str, float] = {}
-        for label in self._TONE_LABELS:
-            vec = self._prototype_cache.get(f"tone::{label}")
-            if not vec:
-                continue
-            tone_scores[label] = (self._cosine_similarity(query_vec, vec) + 1.0) / 2.0
-
-        act_scores: Dict[str, float] = {}
-        for label in self._ACT_LABELS:
-            vec = self._prototype_cache.get(f"act::{label}")
-            if not vec:
-                continue
-            act_scores[label] = (self._cosine_similarity(query_vec, vec) + 1.0) / 2.0
+        # One matrix-vs-vector call scores all tone + act prototypes.
+        sims = PrototypeMatrix.coerce(self._prototype_cache).scores(query_vec)
+        tone_scores: Dict[str, float] = {
+            label: (sims[f"tone::{label}"] + 1.0) / 2.0
+            for label in self._TONE_LABELS
+            if f"tone::{label}" in sims
+        }
+        act_scores: Dict[str, float] = {
+            label: (sims[f"act::{label}"] + 1.0) / 2.0
+            for label in self._ACT_LABELS
+            if f"act::{label}" in sims
+        }
 
         return {
             "tone_scores": self._normalize_scores(tone_scores),
@@ -14,6 +14,7 @@ from config import (
     get_tool_selector_candidate_limit,
     get_tool_selector_min_similarity,
 )
+from core.embedding_client import embed_text, get_active_embedding_version
 from mcp.hub import get_hub
 
 logger = logging.getLogger(__name__)
@@ -72,18 +73,21 @@ class ToolSelector:
         try:
             limit = get_tool_selector_candidate_limit()
             min_similarity = get_tool_selector_min_similarity()
+            args: Dict[str, Any] = {
+                "query": query,
+                "limit": limit,
+                "min_similarity": min_similarity,
+            }
+            # Reuse the turn-shared query vector so sql-memory does not embed the
+            # same text again (it ignores the vector on embedding_version mismatch).
+            query_vec = await embed_text(query)
+            if query_vec:
+                args["query_embedding"] = query_vec
+                args["query_embedding_version"] = get_active_embedding_version()
             if hasattr(self.hub, "call_tool_async"):
-                result = await self.hub.call_tool_async("memory_semantic_search", {
-                    "query": query,
-                    "limit": limit,
-                    "min_similarity": min_similarity,
-                })
+                result = await self.hub.call_tool_async("memory_semantic_search", args)
             else:
-                result = await asyncio.to_thread(self.hub.call_tool, "memory_semantic_search", {
-                    "query": query,
-                    "limit": limit,
-                    "min_similarity": min_similarity,
-                })
+                result = await asyncio.to_thread(self.hub.call_tool, "memory_semantic_search", args)
             if isinstance(result, dict) and result.get("error"):
                 logger.warning(f"[ToolSelector] Semantic search error: {result.get('error')}")
                 return []
@@ -11,8 +11,10 @@ from datetime import datetime
 # Import security validator
 try:
     from core.tools.fast_lane.security import SecurePathValidator
+    from core.tools.fast_lane.workspace_event_store import get_workspace_event_store
 except ImportError:
     from .security import SecurePathValidator
+    from .workspace_event_store import get_workspace_event_store
 
 
 class BaseNativeTool(BaseModel):
@@ -319,36 +321,11 @@ class WorkspaceEventSaveTool(BaseNativeTool):
 
     def execute(self) -> str:
         try:
-            with get_db_connection() as conn:
-                cursor = conn.cursor()
-
-                cursor.execute(
-                    """
-                    CREATE TABLE IF NOT EXISTS workspace_events (
-                        id INTEGER PRIMARY KEY AUTOINCREMENT,
-                        conversation_id TEXT NOT NULL,
-                        event_type TEXT NOT NULL,
-                        event_data TEXT NOT NULL,
-                        created_at TEXT NOT NULL
-                    )
-                    """
-                )
-
-                cursor.execute(
-                    """
-                    INSERT INTO workspace_events (conversation_id, event_type, event_data, created_at)
-                    VALUES (?, ?, ?, ?)
-                    """,
-                    (
-                        self.conversation_id,
-                        self.event_type,
-                        json.dumps(self.event_data or {}),
-                        datetime.utcnow().isoformat(),
-                    ),
-                )
-                conn.commit()
-                event_id = cursor.lastrowid
-
+            event_id = get_workspace_event_store().save(
+                self.conversation_id,
+                self.event_type,
+                self.event_data,
+            )
             return json.dumps({"id": event_id, "status": "saved"})
 
         except Exception as e:
@@ -356,48 +333,32 @@ class WorkspaceEventSaveTool(BaseNativeTool):
 
 
 class WorkspaceEventListTool(BaseNativeTool):
-    """Lists workspace events from workspace_events (last 48 hours, read-only telemetry)."""
+    """
+    Lists workspace events from workspace_events (last 48 hours, read-only telemetry).
+
+    With conversation_id + since_id it returns the change feed instead:
+    all events after that id, oldest first, without the 48h window.
+    """
     conversation_id: Optional[str] = Field(None, description="Filter by conversation")
     event_type: Optional[str] = Field(None, description="Filter by event type")
     limit: int = Field(10, description="Max events")
+    since_id: Optional[int] = Field(None, description="Only events with id > since_id (requires conversation_id)")
 
     def execute(self) -> List[dict]:
         try:
-            with get_db_connection() as conn:
-                conn.row_factory = sqlite3.Row
-                cursor = conn.cursor()
-
-                query = """
-                    SELECT id, conversation_id, event_type, event_data, created_at
-                    FROM workspace_events
-                    WHERE created_at >= datetime('now', '-2 days')
-                """
-                params: list = []
-
-                if self.conversation_id:
-                    query += " AND conversation_id = ?"
-                    params.append(self.conversation_id)
-
-                if self.event_type:
-                    query += " AND event_type = ?"
-                    params.append(self.event_type)
-
-                query += " ORDER BY created_at DESC LIMIT ?"
-                params.append(self.limit)
-
-                cursor.execute(query, params)
-                results = cursor.fetchall()
-
-            return [
-                {
-                    "id": row["id"],
-                    "conversation_id": row["conversation_id"],
-                    "event_type": row["event_type"],
-                    "event_data": json.loads(row["event_data"]),
-                    "created_at": row["created_at"],
-                }
-                for row in results
-            ]
+            store = get_workspace_event_store()
+            if self.since_id is not None and self.conversation_id:
+                return store.list_since(
+                    self.conversation_id,
+                    self.since_id,
+                    event_type=self.event_type,
+                    limit=self.limit,
+                )
+            return store.list_recent(
+                conversation_id=self.conversation_id,
+                event_type=self.event_type,
+                limit=self.limit,
+            )
 
         except Exception as e:
             raise RuntimeError(f"Failed to list workspace events: {str(e)}")
@@ -553,6 +514,7 @@ def get_fast_lane_tools_summary() -> List[Dict[str, Any]]:
                     "conversation_id": {"type": "string", "description": "Filter by conversation ID."},
                     "event_type": {"type": "string", "description": "Filter by event type."},
                     "limit": {"type": "integer", "description": "Max results.", "default": 20},
+                    "since_id": {"type": "integer", "description": "Change feed: only events with id > since_id (oldest first, needs conversation_id)."},
                 },
                 "required": [],
             },
@@ -0,0 +1,333 @@
+"""
+Workspace event store for the Fast-Lane workspace_event_* tools.
+
+- schema + indexes are created once per process, not on every save
+- saves are group-committed: callers enqueue and wait, a background writer
+  inserts everything that queued up meanwhile in one transaction (optionally
+  lingering WORKSPACE_EVENTS_BATCH_WAIT_MS for more)
+- retention is opt-in (WORKSPACE_EVENTS_RETENTION_DAYS, default 0 = keep
+  everything) and works on whole UTC days (created_at is ISO, so a day prefix
+  is a range boundary on the index). Once per day the writer deletes expired
+  days in small chunks, one chunk only while no save is queued, so saves never
+  wait behind more than one chunk; a WAL checkpoint follows the last chunk
+- per-conversation high-water mark (max committed id, one index seek) so
+  readers can ask for "events since id N" instead of re-reading the last
+  48 hours; it is read from the table, so writers in other processes sharing
+  memory.db are seen as well
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import queue
+import sqlite3
+import threading
+from concurrent.futures import Future
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Tuple
+
+from utils.logger import log_info, log_warning
+
+_DB_PATH = os.getenv("WORKSPACE_EVENTS_DB_PATH", "/app/memory_data/memory.db")
+_RETENTION_DAYS = max(0, int(os.getenv("WORKSPACE_EVENTS_RETENTION_DAYS", "0")))
+_BATCH_MAX = max(1, int(os.getenv("WORKSPACE_EVENTS_BATCH_MAX", "256")))
+_BATCH_WAIT_MS = max(0, int(os.getenv("WORKSPACE_EVENTS_BATCH_WAIT_MS", "0")))
+_SAVE_TIMEOUT_S = 5.0
+_PRUNE_CHUNK = 500
+
+
+def _row_to_event(row: sqlite3.Row) -> Dict[str, Any]:
+    return {
+        "id": row["id"],
+        "conversation_id": row["conversation_id"],
+        "event_type": row["event_type"],
+        "event_data": json.loads(row["event_data"]),
+        "created_at": row["created_at"],
+    }
+
+
+class WorkspaceEventStore:
+    def __init__(
+        self,
+        db_path: str = _DB_PATH,
+        *,
+        retention_days: int = _RETENTION_DAYS,
+        batch_max: int = _BATCH_MAX,
+        batch_wait_ms: int = _BATCH_WAIT_MS,
+    ):
+        self.db_path = str(db_path)
+        self._retention_days = max(0, int(retention_days))
+        self._batch_max = max(1, int(batch_max))
+        self._batch_wait_s = max(0, int(batch_wait_ms)) / 1000.0
+        self._queue: "queue.Queue[Tuple[Tuple[str, str, str, str], Future]]" = queue.Queue()
+        self._schema_lock = threading.Lock()
+        self._schema_ready = False
+        self._writer_lock = threading.Lock()
+        self._writer: Optional[threading.Thread] = None
+        self._pruned_day = ""
+        self._prune_cutoff = ""  # pending background prune (writer thread only)
+        self._prune_deleted = 0
+        self.stats: Dict[str, int] = {"saved": 0, "batches": 0, "pruned": 0}
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_path, timeout=5.0, check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    def _fetch(self, query: str, params: list) -> List[sqlite3.Row]:
+        self._ensure_schema()
+        conn = self._connect()
+        try:
+            return conn.execute(query, params).fetchall()
+        finally:
+            conn.close()
+
+    def _ensure_schema(self) -> None:
+        if self._schema_ready:
+            return
+        with self._schema_lock:
+            if self._schema_ready:
+                return
+            parent = os.path.dirname(self.db_path)
+            if parent:
+                os.makedirs(parent, exist_ok=True)
+            with self._connect() as conn:
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.execute(
+                    """
+                    CREATE TABLE IF NOT EXISTS workspace_events (
+                        id INTEGER PRIMARY KEY AUTOINCREMENT,
+                        conversation_id TEXT NOT NULL,
+                        event_type TEXT NOT NULL,
+                        event_data TEXT NOT NULL,
+                        created_at TEXT NOT NULL
+                    )
+                    """
+                )
+                conn.execute(
+                    "CREATE INDEX IF NOT EXISTS idx_workspace_events_conv_created "
+                    "ON workspace_events(conversation_id, created_at)"
+                )
+                # change feed: rowid order within one conversation
+                conn.execute(
+                    "CREATE INDEX IF NOT EXISTS idx_workspace_events_conv_id "
+                    "ON workspace_events(conversation_id, id)"
+                )
+                conn.execute(
+                    "CREATE INDEX IF NOT EXISTS idx_workspace_events_created "
+                    "ON workspace_events(created_at)"
+                )
+                conn.commit()
+            self._schema_ready = True
+
+    # ---- writes ------------------------------------------------------------
+
+    def _ensure_writer(self) -> None:
+        if self._writer is not None and self._writer.is_alive():
+            return
+        with self._writer_lock:
+            if self._writer is not None and self._writer.is_alive():
+                return
+            self._writer = threading.Thread(
+                target=self._writer_loop, name="workspace-event-writer", daemon=True
+            )
+            self._writer.start()
+
+    def save(self, conversation_id: str, event_type: str, event_data: Optional[dict] = None) -> int:
+        """Queue one event and block until its batch is committed; returns the row id."""
+        self._ensure_schema()
+        self._ensure_writer()
+        row = (
+            str(conversation_id),
+            str(event_type),
+            json.dumps(event_data or {}),
+            datetime.utcnow().isoformat(),
+        )
+        fut: Future = Future()
+        self._queue.put((row, fut))
+        return int(fut.result(timeout=_SAVE_TIMEOUT_S))
+
+    def _next_batch(self) -> List[Tuple[Tuple[str, str, str, str], Future]]:
+        batch = [self._queue.get()]
+        while len(batch) < self._batch_max:
+            try:
+                if self._batch_wait_s:
+                    batch.append(self._queue.get(timeout=self._batch_wait_s))
+                else:
+                    batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        return batch
+
+    def _writer_loop(self) -> None:
+        conn = self._connect()
+        while True:
+            if self._prune_cutoff and self._queue.empty():
+                try:
+                    self._prune_step(conn)
+                except Exception as exc:
+                    self._prune_cutoff = ""
+                    log_warning(f"[WorkspaceEvents] retention failed: {exc}")
+                continue
+            batch = self._next_batch()
+            try:
+                ids = self._commit_batch(conn, [row for row, _ in batch])
+            except Exception as exc:
+                log_warning(f"[WorkspaceEvents] batch write failed ({len(batch)} events): {exc}")
+                for _, fut in batch:
+                    fut.set_exception(exc)
+                continue
+            for (_, fut), event_id in zip(batch, ids):
+                fut.set_result(event_id)
+            self._maybe_schedule_prune()
+
+    def _commit_batch(self, conn: sqlite3.Connection, rows: List[Tuple[str, str, str, str]]) -> List[int]:
+        ids: List[int] = []
+        with conn:
+            for row in rows:
+                cur = conn.execute(
+                    """
+                    INSERT INTO workspace_events (conversation_id, event_type, event_data, created_at)
+                    VALUES (?, ?, ?, ?)
+                    """,
+                    row,
+                )
+                ids.append(int(cur.lastrowid))
+        self.stats["saved"] += len(rows)
+        self.stats["batches"] += 1
+        return ids
+
+    # ---- retention ---------------------------------------------------------
+
+    def _cutoff_day(self, now: Optional[datetime] = None) -> str:
+        return ((now or datetime.utcnow()) - timedelta(days=self._retention_days)).date().isoformat()
+
+    def _maybe_schedule_prune(self) -> None:
+        """Arm the writer's chunked prune once per UTC day."""
+        if not self._retention_days:
+            return
+        today = datetime.utcnow().date().isoformat()
+        if self._pruned_day == today:
+            return
+        self._pruned_day = today
+        self._prune_cutoff = self._cutoff_day()
+        self._prune_deleted = 0
+
+    @staticmethod
+    def _delete_chunk(conn: sqlite3.Connection, cutoff_day: str) -> int:
+        with conn:
+            cur = conn.execute(
+                """
+                DELETE FROM workspace_events WHERE id IN (
+                    SELECT id FROM workspace_events WHERE created_at < ? LIMIT ?
+                )
+                """,
+                (cutoff_day, _PRUNE_CHUNK),
+            )
+        return cur.rowcount
+
+    def _finish_prune(self, conn: sqlite3.Connection, cutoff_day: str, deleted: int) -> None:
+        if deleted:
+            conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+            log_info(f"[WorkspaceEvents] retention removed {deleted} events before {cutoff_day}")
+        self.stats["pruned"] += deleted
+
+    def _prune_step(self, conn: sqlite3.Connection) -> None:
+        """One chunk of the pending prune; the writer calls it only while idle."""
+        cutoff_day = self._prune_cutoff
+        deleted = self._delete_chunk(conn, cutoff_day)
+        self._prune_deleted += deleted
+        if deleted < _PRUNE_CHUNK:
+            self._prune_cutoff = ""
+            self._finish_prune(conn, cutoff_day, self._prune_deleted)
+
+    def prune(self, *, now: Optional[datetime] = None) -> int:
+        """Drop every UTC day older than the retention window now; returns deleted rows."""
+        if not self._retention_days:
+            return 0
+        self._ensure_schema()
+        cutoff_day = self._cutoff_day(now)
+        conn = self._connect()
+        deleted = 0
+        try:
+            while True:
+                chunk = self._delete_chunk(conn, cutoff_day)
+                deleted += chunk
+                if chunk < _PRUNE_CHUNK:
+                    break
+            self._finish_prune(conn, cutoff_day, deleted)
+        finally:
+            conn.close()
+        return deleted
+
+    # ---- reads -------------------------------------------------------------
+
+    def high_water(self, conversation_id: str) -> int:
+        """Highest committed event id of a conversation (0 if none)."""
+        rows = self._fetch(
+            "SELECT MAX(id) FROM workspace_events WHERE conversation_id = ?",
+            [str(conversation_id)],
+        )
+        return int(rows[0][0] or 0)
+
+    def list_recent(
+        self,
+        *,
+        conversation_id: Optional[str] = None,
+        event_type: Optional[str] = None,
+        limit: int = 10,
+        hours: int = 48,
+    ) -> List[Dict[str, Any]]:
+        """Newest-first events of the last ``hours`` hours."""
+        cutoff = (datetime.utcnow() - timedelta(hours=hours)).isoformat()
+        query = """
+            SELECT id, conversation_id, event_type, event_data, created_at
+            FROM workspace_events
+            WHERE created_at >= ?
+        """
+        params: list = [cutoff]
+        if conversation_id:
+            query += " AND conversation_id = ?"
+            params.append(conversation_id)
+        if event_type:
+            query += " AND event_type = ?"
+            params.append(event_type)
+        query += " ORDER BY created_at DESC LIMIT ?"
+        params.append(int(limit))
+        return [_row_to_event(row) for row in self._fetch(query, params)]
+
+    def list_since(
+        self,
+        conversation_id: str,
+        since_id: int,
+        *,
+        event_type: Optional[str] = None,
+        limit: int = 100,
+    ) -> List[Dict[str, Any]]:
+        """Change feed: events with id > since_id, oldest first."""
+        query = """
+            SELECT id, conversation_id, event_type, event_data, created_at
+            FROM workspace_events
+            WHERE conversation_id = ? AND id > ?
+        """
+        params: list = [str(conversation_id), int(since_id)]
+        if event_type:
+            query += " AND event_type = ?"
+            params.append(event_type)
+        query += " ORDER BY id ASC LIMIT ?"
+        params.append(int(limit))
+        return [_row_to_event(row) for row in self._fetch(query, params)]
+
+
+_STORE: Optional[WorkspaceEventStore] = None
+_STORE_LOCK = threading.Lock()
+
+
+def get_workspace_event_store() -> WorkspaceEventStore:
+    global _STORE
+    if _STORE is None:
+        with _STORE_LOCK:
+            if _STORE is None:
+                _STORE = WorkspaceEventStore()
+    return _STORE
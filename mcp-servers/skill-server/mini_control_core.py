@@ -32,6 +32,7 @@ from pathlib import Path
 from datetime import datetime
 
 from skill_cim_light import SkillCIMLight, ValidationResult, get_skill_cim
+from skill_catalog import SkillCatalog, extract_keywords
 
 try:
     from cim_rag import cim_kb  # type: ignore
@@ -227,6 +228,14 @@ class SkillMiniControl:
         self.auto_create_escalate_to_deep = AUTO_CREATE_ESCALATE_TO_DEEP
         self.auto_repair_on_validation_fail = AUTO_REPAIR_ON_VALIDATION_FAIL
         self.auto_repair_max_attempts = max(0, AUTO_REPAIR_MAX_ATTEMPTS)
+        self._skill_catalog = SkillCatalog(self.skills_dir)
+
+    def _get_skill_catalog(self) -> SkillCatalog:
+        """In-memory skill catalog (refreshed incrementally on every access)."""
+        catalog = getattr(self, "_skill_catalog", None)
+        if catalog is None or catalog.skills_dir != Path(self.skills_dir):
+            catalog = self._skill_catalog = SkillCatalog(Path(self.skills_dir))
+        return catalog
 
     @staticmethod
     def _is_run_result_success(run_result: Dict[str, Any]) -> bool:
@@ -661,7 +670,10 @@ class SkillMiniControl:
         """
         Find an existing skill that matches the user's intent.
         
-        Uses keyword matching and description similarity.
+        Uses the skill catalog's inverted index to skip skills without any
+        keyword hit, then the keyword match score. Ties keep registry order
+        (installed, then drafts); only with SKILL_MATCH_EMBED_MODEL set do
+        ties follow the embedding rerank.
         
         Args:
             intent: Extracted intent from ThinkingLayer
@@ -696,16 +708,21 @@ class SkillMiniControl:
         search_terms = self._extract_keywords(intent) + self._extract_keywords(user_text)
         search_terms = list(set([t.lower() for t in search_terms]))
         
-        best_match = None
-        best_score = 0
+        # BM25 top-k (SKILL_MATCH_TOP_K), optionally reranked by embeddings.
+        # The first candidate in that order that clears the keyword threshold wins.
+        candidates = await self._get_skill_catalog().rank(
+            search_terms,
+            skills=all_skills,
+            query_text=f"{intent} {user_text}",
+        )
         
-        for name, info in all_skills.items():
+        for name in candidates:
+            info = all_skills[name]
             score = self._calculate_match_score(name, info, search_terms)
-            if score > best_score and score >= 0.3:  # Minimum threshold
-                best_score = score
-                best_match = {"name": name, **info, "match_score": score}
+            if score >= 0.3:  # Minimum threshold
+                return {"name": name, **info, "match_score": score}
         
-        return best_match
+        return None
 
     @staticmethod
     def _is_explicit_create_request(intent: str, user_text: str) -> bool:
@@ -852,80 +869,15 @@ class SkillMiniControl:
         Handles both legacy flat dict and V2 envelope transparently.
         Returns flat {skill_name: {...}} — backward compat for all call sites.
         """
-        registry_file = self.skills_dir / "_registry" / "installed.json"
-        if registry_file.exists():
-            try:
-                with open(registry_file, "r", encoding="utf-8") as f:
-                    raw = json.load(f)
-                if isinstance(raw, dict) and raw.get("schema_version") == 2:
-                    return raw.get("skills", {}) if isinstance(raw.get("skills"), dict) else {}
-                if isinstance(raw, dict):
-                    return raw
-            except:
-                pass
-        return {}
+        return self._get_skill_catalog().installed()
 
     def _load_draft_skills(self) -> Dict[str, Dict]:
         """Load draft skills (for matching). Supports manifest.yaml and legacy manifest.json."""
-        drafts_dir = self.skills_dir / "_drafts"
-        drafts = {}
-        
-        if drafts_dir.exists():
-            for skill_dir in drafts_dir.iterdir():
-                if skill_dir.is_dir():
-                    data: Dict[str, Any] = {}
-                    manifest_yaml = skill_dir / "manifest.yaml"
-                    manifest_json = skill_dir / "manifest.json"
-                    if manifest_yaml.exists():
-                        try:
-                            import yaml
-                            with open(manifest_yaml, "r", encoding="utf-8") as f:
-                                data = yaml.safe_load(f) or {}
-                        except Exception:
-                            data = {}
-                    elif manifest_json.exists():
-                        try:
-                            with open(manifest_json, "r", encoding="utf-8") as f:
-                                data = json.load(f) or {}
-                        except Exception:
-                            data = {}
-                    if data:
-                        drafts[skill_dir.name] = {
-                            "description": data.get("description", ""),
-                            "triggers": data.get("triggers", []),
-                            "is_draft": True
-                        }
-        return drafts
+        return self._get_skill_catalog().drafts()
     
     def _extract_keywords(self, text: str) -> List[str]:
         """Extract meaningful keywords from text."""
-        # Remove common words
-        stopwords = {
-            'ich', 'du', 'er', 'sie', 'es', 'wir', 'ihr', 'sie',
-            'ein', 'eine', 'einen', 'der', 'die', 'das', 'den', 'dem',
-            'und', 'oder', 'aber', 'wenn', 'dann', 'dass', 'wie',
-            'ist', 'sind', 'war', 'waren', 'wird', 'werden',
-            'kann', 'können', 'möchte', 'möchten', 'soll', 'sollen',
-            'bitte', 'mal', 'mir', 'mich', 'dir', 'dich',
-            'the', 'a', 'an', 'is', 'are', 'was', 'were', 'be', 'been',
-            'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would',
-            'can', 'could', 'should', 'may', 'might', 'must',
-            'i', 'you', 'he', 'she', 'it', 'we', 'they',
-            'this', 'that', 'these', 'those', 'my', 'your', 'his', 'her',
-            'for', 'to', 'of', 'in', 'on', 'at', 'with', 'from', 'by',
-            # Skill-Creation Meta-Wörter — kein Domain-Keyword
-            'skill', 'erstelle', 'erstellen', 'create', 'neuen', 'neuer',
-            'baue', 'bau', 'mach', 'mache', 'schreibe', 'schreib',
-            'new', 'make', 'build', 'write', 'generate',
-        }
-        
-        # Extract words
-        words = re.findall(r'\b\w+\b', text.lower())
-        
-        # Filter
-        keywords = [w for w in words if w not in stopwords and len(w) > 2]
-        
-        return keywords
+        return extract_keywords(text)
     
     def _calculate_match_score(
         self, 
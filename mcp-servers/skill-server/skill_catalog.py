@@ -0,0 +1,444 @@
+"""
+In-memory skill catalog for SkillMiniControl matching.
+
+Keeps installed skills (``_registry/installed.json``) and draft manifests
+(``_drafts/<name>/manifest.yaml|json``) in memory and refreshes them
+incrementally: every ``refresh()`` only stats the registry file and the draft
+manifests and re-parses just the files whose (mtime, size, inode) changed.
+The index follows the skill map it is queried with and re-indexes only
+entries that were added, removed or changed.
+
+Matching:
+- Token inverted index over the keywords of skill names, descriptions and
+  triggers (same ``extract_keywords()`` filter as the query: lower-cased,
+  no stopwords, no words of <= 2 chars).
+- ``search()`` scores BM25 over the weighted fields and returns the top-k
+  skill names. A query term also hits every indexed token that contains it
+  (``rechner`` → ``taschenrechner``), mirroring the substring semantics of
+  the legacy scoring; the expansion is cached per vocabulary version.
+- ``rank()`` optionally reranks those candidates by cosine similarity with
+  cached skill embeddings (SKILL_MATCH_EMBED_MODEL, Ollama /api/embed). The
+  query and every skill text not cached yet go out in one batch request.
+
+This file is the single copy; ``tool_executor/skill_catalog.py`` is a symlink
+to it (the tool-executor image copies it from the skill-server build context).
+"""
+
+import asyncio
+import hashlib
+import json
+import math
+import os
+import re
+import threading
+import weakref
+from collections import Counter
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional, Tuple
+
+import httpx
+
+SKILL_MATCH_TOP_K = max(1, int(os.getenv("SKILL_MATCH_TOP_K", "20")))
+SKILL_MATCH_EMBED_MODEL = os.getenv("SKILL_MATCH_EMBED_MODEL", "").strip()
+SKILL_MATCH_EMBED_WEIGHT = float(os.getenv("SKILL_MATCH_EMBED_WEIGHT", "0.5"))
+OLLAMA_BASE_URL = os.getenv("OLLAMA_URL", "http://ollama:11434")
+
+SKILL_STOPWORDS = frozenset({
+    'ich', 'du', 'er', 'sie', 'es', 'wir', 'ihr', 'sie',
+    'ein', 'eine', 'einen', 'der', 'die', 'das', 'den', 'dem',
+    'und', 'oder', 'aber', 'wenn', 'dann', 'dass', 'wie',
+    'ist', 'sind', 'war', 'waren', 'wird', 'werden',
+    'kann', 'können', 'möchte', 'möchten', 'soll', 'sollen',
+    'bitte', 'mal', 'mir', 'mich', 'dir', 'dich',
+    'the', 'a', 'an', 'is', 'are', 'was', 'were', 'be', 'been',
+    'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would',
+    'can', 'could', 'should', 'may', 'might', 'must',
+    'i', 'you', 'he', 'she', 'it', 'we', 'they',
+    'this', 'that', 'these', 'those', 'my', 'your', 'his', 'her',
+    'for', 'to', 'of', 'in', 'on', 'at', 'with', 'from', 'by',
+    # Skill-Creation Meta-Wörter — kein Domain-Keyword
+    'skill', 'erstelle', 'erstellen', 'create', 'neuen', 'neuer',
+    'baue', 'bau', 'mach', 'mache', 'schreibe', 'schreib',
+    'new', 'make', 'build', 'write', 'generate',
+})
+
+# BM25F-style field weights (name > triggers > description, as in the legacy score)
+_FIELD_WEIGHTS = {"name": 3.0, "triggers": 2.0, "description": 1.0}
+_BM25_K1 = 1.2
+_BM25_B = 0.75
+
+_WORD_RE = re.compile(r'\b\w+\b')
+
+# batch embedder: one vector (or None) per input text, in input order
+EmbedFn = Callable[[List[str]], Awaitable[List[Optional[List[float]]]]]
+_StatKey = Optional[Tuple[int, int, int]]
+
+
+def extract_keywords(text: str) -> List[str]:
+    """Lower-cased words of text without stopwords and words of <= 2 chars."""
+    words = _WORD_RE.findall(text.lower())
+    return [w for w in words if w not in SKILL_STOPWORDS and len(w) > 2]
+
+
+def load_installed_registry(registry_file: Path) -> Dict[str, Dict]:
+    """
+    Load installed skills from registry.
+    Handles both legacy flat dict and V2 envelope transparently.
+    """
+    if registry_file.exists():
+        try:
+            with open(registry_file, "r", encoding="utf-8") as f:
+                raw = json.load(f)
+            if isinstance(raw, dict) and raw.get("schema_version") == 2:
+                return raw.get("skills", {}) if isinstance(raw.get("skills"), dict) else {}
+            if isinstance(raw, dict):
+                return raw
+        except:
+            pass
+    return {}
+
+
+def _draft_manifest(skill_dir: Path) -> Optional[Path]:
+    for filename in ("manifest.yaml", "manifest.json"):
+        manifest = skill_dir / filename
+        if manifest.exists():
+            return manifest
+    return None
+
+
+def load_draft_manifest(skill_dir: Path) -> Optional[Dict]:
+    """Matching info of one draft (manifest.yaml, legacy manifest.json); None if empty/missing."""
+    data: Dict[str, Any] = {}
+    manifest = _draft_manifest(skill_dir)
+    if manifest is not None and manifest.suffix == ".yaml":
+        try:
+            import yaml
+            with open(manifest, "r", encoding="utf-8") as f:
+                data = yaml.safe_load(f) or {}
+        except Exception:
+            data = {}
+    elif manifest is not None:
+        try:
+            with open(manifest, "r", encoding="utf-8") as f:
+                data = json.load(f) or {}
+        except Exception:
+            data = {}
+    if not data:
+        return None
+    return {
+        "description": data.get("description", ""),
+        "triggers": data.get("triggers", []),
+        "is_draft": True
+    }
+
+
+def _stat_key(path: Optional[Path]) -> _StatKey:
+    if path is None:
+        return None
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    # inode: the registry store replaces the file atomically (os.replace)
+    return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+
+@dataclass
+class _SkillDoc:
+    tf: Counter  # token -> field-weighted term frequency
+    length: float
+    text: str  # embedding input
+
+
+def _skill_text(name: str, info: Dict) -> Tuple[str, str, List[str]]:
+    description = str(info.get("description") or "")
+    triggers = info.get("triggers", [])
+    triggers = [str(t) for t in triggers] if isinstance(triggers, list) else []
+    return name.lower().replace('_', ' '), description, triggers
+
+
+def _build_doc(name: str, info: Dict) -> _SkillDoc:
+    name_text, description, triggers = _skill_text(name, info)
+    tf: Counter = Counter()
+    for field_name, text in (
+        ("name", name_text),
+        ("description", description),
+        ("triggers", " ".join(triggers)),
+    ):
+        weight = _FIELD_WEIGHTS[field_name]
+        for token in extract_keywords(text):
+            tf[token] += weight
+    text = f"{name_text}: {description} ({', '.join(triggers)})" if triggers else f"{name_text}: {description}"
+    return _SkillDoc(tf=tf, length=sum(tf.values()), text=text)
+
+
+class SkillCatalog:
+    """Incrementally refreshed skill map with a BM25 inverted index."""
+
+    def __init__(self, skills_dir: Path, embed_fn: Optional[EmbedFn] = None):
+        self.skills_dir = Path(skills_dir)
+        self.embed_fn = embed_fn if embed_fn is not None else (
+            _ollama_embed if SKILL_MATCH_EMBED_MODEL else None
+        )
+        self._lock = threading.RLock()
+        self._registry_key: _StatKey = None
+        self._registry_seen = False
+        self._installed: Dict[str, Dict] = {}
+        self._draft_keys: Dict[str, _StatKey] = {}
+        self._drafts: Dict[str, Dict] = {}
+        self._skills: Dict[str, Dict] = {}
+        self._docs: Dict[str, _SkillDoc] = {}
+        self._postings: Dict[str, Dict[str, float]] = {}
+        self._total_length = 0.0
+        self._expansions: Dict[str, List[str]] = {}
+        self._embeddings: Dict[str, Tuple[str, List[float]]] = {}  # name -> (text hash, vector)
+        self.stats = {"refreshes": 0, "reparsed": 0, "reindexed": 0}
+
+    # ------------------------------------------------------------------
+    # Change detection
+    # ------------------------------------------------------------------
+
+    def refresh(self) -> bool:
+        """Re-read only changed sources; returns True if installed/drafts changed."""
+        with self._lock:
+            self.stats["refreshes"] += 1
+            changed = self._refresh_installed()
+            return self._refresh_drafts() or changed
+
+    def _refresh_installed(self) -> bool:
+        registry_file = self.skills_dir / "_registry" / "installed.json"
+        key = _stat_key(registry_file)
+        if self._registry_seen and key == self._registry_key:
+            return False
+        self._registry_seen = True
+        self._registry_key = key
+        self._installed = load_installed_registry(registry_file) if key is not None else {}
+        self.stats["reparsed"] += 1
+        return True
+
+    def _refresh_drafts(self) -> bool:
+        drafts_dir = self.skills_dir / "_drafts"
+        seen: Dict[str, _StatKey] = {}
+        changed = False
+        try:
+            entries = [e for e in os.scandir(drafts_dir) if e.is_dir()]
+        except OSError:
+            entries = []
+        for entry in entries:
+            skill_dir = Path(entry.path)
+            key = _stat_key(_draft_manifest(skill_dir))
+            seen[entry.name] = key
+            if entry.name in self._draft_keys and self._draft_keys[entry.name] == key:
+                continue
+            changed = True
+            info = load_draft_manifest(skill_dir) if key is not None else None
+            self.stats["reparsed"] += 1
+            if info:
+                self._drafts[entry.name] = info
+            else:
+                self._drafts.pop(entry.name, None)
+        for name in set(self._draft_keys) - set(seen):
+            self._drafts.pop(name, None)
+            changed = True
+        # keep directory order (drafts override installed in that order)
+        if changed:
+            self._drafts = {name: self._drafts[name] for name in seen if name in self._drafts}
+        self._draft_keys = seen
+        return changed
+
+    def _reindex(self, skills: Dict[str, Dict]):
+        """Sync the index to skills; only added/removed/changed entries are rebuilt."""
+        for name in list(self._docs):
+            if name not in skills:
+                self._remove_doc(name)
+        for name, info in skills.items():
+            if self._skills.get(name) == info and name in self._docs:
+                continue
+            self._remove_doc(name)
+            doc = _build_doc(name, info)
+            self._docs[name] = doc
+            self._total_length += doc.length
+            for token, tf in doc.tf.items():
+                if token not in self._postings:
+                    self._postings[token] = {}
+                    self._expansions.clear()
+                self._postings[token][name] = tf
+            self.stats["reindexed"] += 1
+        self._skills = dict(skills)
+
+    def _remove_doc(self, name: str):
+        doc = self._docs.pop(name, None)
+        if doc is None:
+            return
+        self._total_length -= doc.length
+        for token in doc.tf:
+            postings = self._postings.get(token)
+            if postings is None:
+                continue
+            postings.pop(name, None)
+            if not postings:
+                del self._postings[token]
+                self._expansions.clear()
+
+    # ------------------------------------------------------------------
+    # Access
+    # ------------------------------------------------------------------
+
+    def installed(self) -> Dict[str, Dict]:
+        """Installed registry entries (refreshed)."""
+        self.refresh()
+        return dict(self._installed)
+
+    def drafts(self) -> Dict[str, Dict]:
+        """Draft skills with a manifest (refreshed)."""
+        self.refresh()
+        return dict(self._drafts)
+
+    def skills(self) -> Dict[str, Dict]:
+        """Installed skills merged with drafts (refreshed, drafts override)."""
+        self.refresh()
+        return {**self._installed, **self._drafts}
+
+    # ------------------------------------------------------------------
+    # Matching
+    # ------------------------------------------------------------------
+
+    def _expand(self, term: str) -> List[str]:
+        tokens = self._expansions.get(term)
+        if tokens is None:
+            tokens = [token for token in self._postings if term in token]
+            self._expansions[term] = tokens
+        return tokens
+
+    def search(
+        self,
+        terms: List[str],
+        skills: Optional[Dict[str, Dict]] = None,
+        top_k: int = SKILL_MATCH_TOP_K,
+    ) -> List[Tuple[str, float]]:
+        """
+        BM25 top-k (name, score) for the search terms; ties keep skill order.
+
+        skills: skill map to search (default: ``skills()``); the index is
+        synced to it incrementally.
+        """
+        if skills is None:
+            skills = self.skills()
+        with self._lock:
+            self._reindex(skills)
+            n_docs = len(self._docs)
+            if not n_docs or not terms:
+                return []
+            avg_length = (self._total_length / n_docs) or 1.0
+            scores: Dict[str, float] = {}
+            for term in set(terms):
+                for token in self._expand(term):
+                    postings = self._postings[token]
+                    df = len(postings)
+                    idf = math.log(1.0 + (n_docs - df + 0.5) / (df + 0.5))
+                    for name, tf in postings.items():
+                        norm = _BM25_K1 * (1 - _BM25_B + _BM25_B * self._docs[name].length / avg_length)
+                        scores[name] = scores.get(name, 0.0) + idf * tf * (_BM25_K1 + 1) / (tf + norm)
+            order = {name: i for i, name in enumerate(self._skills)}
+            ranked = sorted(scores.items(), key=lambda item: (-item[1], order.get(item[0], 0)))
+            return ranked[:max(1, int(top_k))]
+
+    async def rank(
+        self,
+        terms: List[str],
+        skills: Optional[Dict[str, Dict]] = None,
+        query_text: str = "",
+        top_k: int = SKILL_MATCH_TOP_K,
+    ) -> List[str]:
+        """
+        search() candidates in score order, reranked with cached embeddings
+        when embed_fn is set.
+        """
+        candidates = self.search(terms, skills=skills, top_k=top_k)
+        if len(candidates) < 2 or self.embed_fn is None or not query_text.strip():
+            return [name for name, _ in candidates]
+
+        # one batch: the query plus every candidate without a current embedding
+        vectors: Dict[str, Optional[List[float]]] = {}
+        missing: List[Tuple[str, str, str]] = []  # (name, digest, text)
+        for name, _ in candidates:
+            doc = self._docs.get(name)
+            if doc is None:
+                continue
+            digest = hashlib.sha256(doc.text.encode("utf-8")).hexdigest()
+            cached = self._embeddings.get(name)
+            if cached is not None and cached[0] == digest:
+                vectors[name] = cached[1]
+            else:
+                missing.append((name, digest, doc.text))
+        try:
+            batch = await self.embed_fn([query_text] + [text for _, _, text in missing])
+        except Exception:
+            batch = []
+        query_vec = batch[0] if batch else None
+        if not query_vec:
+            return [name for name, _ in candidates]
+        for (name, digest, _), vec in zip(missing, batch[1:]):
+            if vec:
+                self._embeddings[name] = (digest, vec)
+                vectors[name] = vec
+
+        top_bm25 = candidates[0][1] or 1.0
+        blended = []
+        for i, (name, bm25) in enumerate(candidates):
+            vec = vectors.get(name)
+            cosine = _cosine(query_vec, vec) if vec else 0.0
+            score = (1 - SKILL_MATCH_EMBED_WEIGHT) * bm25 / top_bm25 + SKILL_MATCH_EMBED_WEIGHT * cosine
+            blended.append((-score, i, name))
+        return [name for _, _, name in sorted(blended)]
+
+
+def _cosine(a: List[float], b: List[float]) -> float:
+    dot = sum(x * y for x, y in zip(a, b))
+    norm = math.sqrt(sum(x * x for x in a)) * math.sqrt(sum(y * y for y in b))
+    return dot / norm if norm else 0.0
+
+
+_FALLBACK_CLIENTS: "weakref.WeakKeyDictionary[Any, httpx.AsyncClient]" = weakref.WeakKeyDictionary()
+
+
+@asynccontextmanager
+async def _embed_client(url: str, timeout_s: float) -> AsyncIterator[httpx.AsyncClient]:
+    """Pooled client where core/ is importable, else one keep-alive client per event loop."""
+    try:
+        from core.http_client_pool import pooled_client
+    except ImportError:  # skill-server / tool-executor images ship without core/
+        pooled_client = None
+    if pooled_client is not None:
+        async with pooled_client(url, timeout_s=timeout_s) as client:
+            yield client
+        return
+    loop = asyncio.get_running_loop()
+    client = _FALLBACK_CLIENTS.get(loop)
+    if client is None or client.is_closed:
+        client = _FALLBACK_CLIENTS[loop] = httpx.AsyncClient(timeout=timeout_s)
+    yield client
+
+
+async def _ollama_embed(texts: List[str]) -> List[Optional[List[float]]]:
+    """Embed all texts with one Ollama /api/embed request; [] on failure."""
+    if not texts:
+        return []
+    try:
+        async with _embed_client(OLLAMA_BASE_URL, 5.0) as client:
+            resp = await client.post(
+                f"{OLLAMA_BASE_URL}/api/embed",
+                json={"model": SKILL_MATCH_EMBED_MODEL, "input": texts},
+            )
+            resp.raise_for_status()
+            vectors = resp.json().get("embeddings")
+    except Exception:
+        return []
+    if not isinstance(vectors, list) or len(vectors) != len(texts):
+        return []
+    return [
+        [float(v) for v in vec] if isinstance(vec, list) and vec else None
+        for vec in vectors
+    ]
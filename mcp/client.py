@@ -112,7 +112,14 @@ def call_tool(name: str, arguments: Dict[str, Any], timeout: float = 5.0) -> Opt
             "arguments": arguments,
         },
     }
-    return _call_mcp_raw(payload, timeout=timeout)
+    result = _call_mcp_raw(payload, timeout=timeout)
+    # Write am Hub vorbei → dessen Result-Cache trotzdem invalidieren
+    try:
+        from mcp.hub import get_hub
+        get_hub().invalidate_after_write(name)
+    except Exception as e:
+        log_debug(f"[MCP] Result-cache invalidation skipped: {e}")
+    return result
 
 
 # ------------------------------------------------------
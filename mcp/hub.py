@@ -9,18 +9,30 @@ Funktionen:
 - AUTO-REGISTRATION: Speichert Tool-Infos automatisch im Knowledge Graph
 """
 
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, Iterable, List, Optional
 from mcp_registry import MCPS, get_enabled_mcps, get_mcp_config
 from mcp.transports import HTTPTransport, SSETransport, STDIOTransport
 from mcp.tool_prompt_hints import TOOL_KEYWORDS, iter_base_detection_rules
+from mcp.result_cache import (
+    CachePolicy,
+    ToolResultCache,
+    resolve_cache_policy,
+    resolve_invalidated_domains,
+)
 
 from utils.logger import log_info, log_error, log_debug, log_warning
 import json
 import os
 import threading
+import time
 import asyncio
 from pathlib import Path
 
+# Max. Wartezeit des ersten initialize() auf die Discovery (nur ohne Snapshot);
+# langsamere MCPs werden nachträglich routbar, sobald sie antworten.
+_DISCOVERY_DEADLINE_S = max(0.0, float(os.getenv("MCP_DISCOVERY_DEADLINE_S", "5")))
+_TOOL_SNAPSHOT_PATH = Path(os.getenv("MCP_TOOL_SNAPSHOT_PATH", "/app/data/mcp_tools_snapshot.json"))
+
 class MCPHub:
     """Zentraler Hub für alle MCPs."""
 
@@ -34,13 +46,24 @@ class MCPHub:
         self._initialized = False
         self._tools_registered = False
         self._lock = threading.RLock()
-
-
-    def _register_fast_lane_tools(self):
+        self._result_cache = ToolResultCache()
+        # Discovery-State (parallel, inkrementell)
+        self._discovery_order: List[str] = []
+        self._discovery_pending: set = set()
+        self._discovery_status: Dict[str, Dict[str, Any]] = {}
+        self._discovery_idle = threading.Event()
+        self._discovery_idle.set()
+        self._registration_thread: Optional[threading.Thread] = None
+        # tool_name → (CachePolicy | None, invalidierte Domains); geleert bei refresh()
+        self._cache_rules: Dict[str, Any] = {}
+
+
+    def _register_fast_lane_tools(self, register_in_graph: bool = True):
         """
         Register Fast Lane Tools in Knowledge Graph
         
         CRITICAL: Without this, Tool Selector cannot find Fast Lane tools!
+        register_in_graph=False: nur Routing (Graph-Teil läuft im Hintergrund).
         """
         try:
             from core.tools.fast_lane.definitions import get_fast_lane_tools_summary
@@ -59,7 +82,8 @@ class MCPHub:
                 self._tools_cache[tool["name"]] = "fast-lane"
                 
                 # Register in Knowledge Graph (for Tool Selector semantic search)
-                self._register_tool_in_graph(tool)
+                if register_in_graph:
+                    self._register_tool_in_graph(tool)
                 
                 log_info(f"[MCPHub] ✓ Registered Fast Lane tool: {tool['name']}")
             
@@ -108,7 +132,15 @@ class MCPHub:
             log_warning(f"[MCPHub] Could not register tool in graph (non-critical): {e}")
     
     def initialize(self):
-        """Initialisiert alle aktiven MCPs."""
+        """
+        Initialisiert alle aktiven MCPs.
+
+        Discovery läuft parallel (ein Thread pro MCP) und blockiert den Hub-Lock
+        nicht: jedes MCP wird routbar, sobald es antwortet. Liegt ein Snapshot der
+        letzten erfolgreichen Discovery vor, ist das Routing sofort verfügbar und
+        wird im Hintergrund aktualisiert; sonst wartet der erste Aufrufer höchstens
+        MCP_DISCOVERY_DEADLINE_S. Graph-Registrierung läuft danach im Hintergrund.
+        """
         with self._lock:
             if self._initialized:
                 return
@@ -117,14 +149,15 @@ class MCPHub:
             
             enabled_mcps = get_enabled_mcps()
             log_info(f"[MCPHub] Found {len(enabled_mcps)} enabled MCPs")
+            self._discovery_order = list(enabled_mcps.keys())
             
             for mcp_name, config in enabled_mcps.items():
                 try:
                     self._init_transport(mcp_name, config)
-                    self._discover_tools(mcp_name)
                 except Exception as e:
                     log_error(f"[MCPHub] Failed to init {mcp_name}: {e}")
-            
+
+            snapshot_tools = self._load_tool_snapshot()
 
             # Register Container Commander tools (local, no HTTP)
             try:
@@ -139,17 +172,188 @@ class MCPHub:
                 register_sysinfo_tools(self)
             except Exception as e:
                 log_warning(f"[MCPHub] SysInfo not available: {e}")
+
+            # Fast Lane tools sofort routbar (workspace_event_* etc.);
+            # Graph-Registrierung folgt im Hintergrund.
+            self._register_fast_lane_tools(register_in_graph=False)
             self._initialized = True
-            log_info(f"[MCPHub] Ready with {len(self._tools_cache)} tools from {len(self._transports)} MCPs")
+            discovering = [name for name in self._discovery_order if name in self._transports]
+            self._start_discovery(discovering)
 
-            # Register Fast Lane tools as early as possible after MCP discovery.
-            # This keeps runtime-only tools (workspace_event_*) immediately callable,
-            # even if graph auto-registration is slow.
-            self._register_fast_lane_tools()
+        if discovering and not snapshot_tools:
+            # Kalter Start ohne Snapshot: kurz auf die ersten Antworten warten
+            self._discovery_idle.wait(_DISCOVERY_DEADLINE_S)
+        with self._lock:
+            pending = sorted(self._discovery_pending)
+            log_info(
+                f"[MCPHub] Ready with {len(self._tools_cache)} tools from {len(self._transports)} MCPs"
+                + (f" (snapshot: {snapshot_tools} tools)" if snapshot_tools else "")
+                + (f" — still discovering: {', '.join(pending)}" if pending else "")
+            )
+
+    # ═══════════════════════════════════════════════════════════════
+    # DISCOVERY: parallel, inkrementell, Snapshot für Kaltstarts
+    # ═══════════════════════════════════════════════════════════════
+
+    def _start_discovery(self, mcp_names: List[str]) -> None:
+        """Startet list_tools() für alle MCPs parallel (Aufrufer hält den Lock)."""
+        if not mcp_names:
+            self._discovery_idle.set()
+            self._start_background_registration()
+            return
+        self._discovery_idle.clear()
+        self._discovery_pending.update(mcp_names)
+        for mcp_name in mcp_names:
+            self._discovery_status[mcp_name] = {"state": "pending", "tools": 0, "duration_ms": None}
+            threading.Thread(
+                target=self._discover_in_background,
+                args=(mcp_name,),
+                name=f"mcp-discovery-{mcp_name}",
+                daemon=True,
+            ).start()
+
+    def _discover_in_background(self, mcp_name: str) -> None:
+        started = time.monotonic()
+        transport = self._transports.get(mcp_name)
+        tools: List[Dict[str, Any]] = []
+        error = ""
+        try:
+            tools = list(transport.list_tools() or []) if transport else []
+        except Exception as e:
+            error = str(e)
+        elapsed_s = time.monotonic() - started
+
+        with self._lock:
+            if tools:
+                self._apply_discovered_tools(mcp_name, tools)
+            self._discovery_status[mcp_name] = {
+                "state": "ok" if tools else "failed",
+                "tools": len(tools),
+                "duration_ms": round(elapsed_s * 1000.0, 1),
+                "late": elapsed_s > _DISCOVERY_DEADLINE_S,
+                **({"error": error} if error else {}),
+            }
+            self._discovery_pending.discard(mcp_name)
+            finished = not self._discovery_pending
+
+        if tools:
+            log_info(f"[MCPHub] {mcp_name}: {len(tools)} tools discovered{self._format_info(transport)} in {elapsed_s:.2f}s")
+        else:
+            log_error(f"[MCPHub] {mcp_name}: Failed to discover tools{f': {error}' if error else ''} ({elapsed_s:.2f}s)")
 
-            # Auto-Registration im Graph (best effort, may be slow under load)
+        if finished:
+            self._save_tool_snapshot()
+            self._discovery_idle.set()
+            self._start_background_registration()
+
+    def _apply_discovered_tools(self, mcp_name: str, tools: List[Dict[str, Any]]) -> None:
+        """Ersetzt die Tools eines MCPs (Aufrufer hält den Lock).
+
+        Reihenfolge wie bei sequenzieller Discovery: spätere MCPs in der Registry
+        und lokal registrierte Tools (Commander, SysInfo, Fast Lane) gewinnen.
+        """
+        rank = self._owner_rank(mcp_name)
+        fresh = {tool.get("name", ""): tool for tool in tools if tool.get("name", "")}
+        for tool_name in [t for t, owner in self._tools_cache.items() if owner == mcp_name and t not in fresh]:
+            self._tools_cache.pop(tool_name, None)
+            self._tool_definitions.pop(tool_name, None)
+        for tool_name, tool in fresh.items():
+            owner = self._tools_cache.get(tool_name)
+            if owner and owner != mcp_name and self._owner_rank(owner) > rank:
+                continue
+            self._tools_cache[tool_name] = mcp_name
+            self._tool_definitions[tool_name] = tool
+        self._cache_rules.clear()
+
+    def _owner_rank(self, mcp_name: str) -> int:
+        try:
+            return self._discovery_order.index(mcp_name)
+        except ValueError:
+            return len(self._discovery_order) + 1  # lokal registriert
+
+    @staticmethod
+    def _format_info(transport: Any) -> str:
+        # Erkanntes Format (wenn HTTPTransport)
+        if transport is not None and hasattr(transport, "get_format"):
+            return f" (format={transport.get_format()})"
+        return ""
+
+    def wait_for_discovery(self, timeout: Optional[float] = None) -> bool:
+        """Blockiert bis alle laufenden Discoveries fertig sind (True) oder Timeout."""
+        return self._discovery_idle.wait(timeout)
+
+    def get_discovery_status(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "pending": sorted(self._discovery_pending),
+                "snapshot_path": str(_TOOL_SNAPSHOT_PATH),
+                "registered_in_graph": self._tools_registered,
+                "mcps": {name: dict(status) for name, status in self._discovery_status.items()},
+            }
+
+    def _load_tool_snapshot(self) -> int:
+        """Tool-Definitionen der letzten Discovery laden (Aufrufer hält den Lock)."""
+        try:
+            data = json.loads(_TOOL_SNAPSHOT_PATH.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return 0
+        except Exception as e:
+            log_warning(f"[MCPHub] Tool snapshot unreadable ({_TOOL_SNAPSHOT_PATH}): {e}")
+            return 0
+        loaded = 0
+        for mcp_name, tools in (data.get("mcps") or {}).items():
+            if mcp_name not in self._transports or not isinstance(tools, list):
+                continue
+            valid = [t for t in tools if isinstance(t, dict) and t.get("name")]
+            self._apply_discovered_tools(mcp_name, valid)
+            self._discovery_status[mcp_name] = {"state": "snapshot", "tools": len(valid), "duration_ms": None}
+            loaded += len(valid)
+        if loaded:
+            log_info(f"[MCPHub] Routing from snapshot: {loaded} tools ({_TOOL_SNAPSHOT_PATH})")
+        return loaded
+
+    def _save_tool_snapshot(self) -> None:
+        """Persistiert die Tools aller remote MCPs (nur mit mindestens einem Tool)."""
+        with self._lock:
+            by_mcp: Dict[str, List[Dict[str, Any]]] = {}
+            for tool_name, mcp_name in self._tools_cache.items():
+                if mcp_name in self._discovery_order:
+                    by_mcp.setdefault(mcp_name, []).append(self._tool_definitions.get(tool_name, {"name": tool_name}))
+        if not by_mcp:
+            return
+        try:
+            _TOOL_SNAPSHOT_PATH.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = _TOOL_SNAPSHOT_PATH.with_suffix(".tmp")
+            tmp_path.write_text(
+                json.dumps({"saved_at": time.time(), "mcps": by_mcp}, ensure_ascii=False, default=str),
+                encoding="utf-8",
+            )
+            os.replace(tmp_path, _TOOL_SNAPSHOT_PATH)
+        except Exception as e:
+            log_warning(f"[MCPHub] Could not write tool snapshot ({_TOOL_SNAPSHOT_PATH}): {e}")
+
+    def _start_background_registration(self) -> None:
+        """Graph-Registrierung (Fast Lane + Auto-Registration) ohne den Request-Pfad zu blockieren."""
+        if self._tools_registered:
+            return
+        with self._lock:
+            if self._registration_thread is not None and self._registration_thread.is_alive():
+                return
+            self._registration_thread = threading.Thread(
+                target=self._run_background_registration, name="mcp-graph-registration", daemon=True
+            )
+            self._registration_thread.start()
+
+    def _run_background_registration(self) -> None:
+        try:
+            with self._lock:
+                direct_tools = [dict(t) for t in self._tool_definitions.values() if t.get("execution") == "direct"]
+            for tool in direct_tools:
+                self._register_tool_in_graph(tool)
             self._auto_register_tools()
-    
+        except Exception as e:
+            log_error(f"[MCPHub] Background tool registration failed: {e}")
+
     def _init_transport(self, mcp_name: str, config: Dict):
         """Erstellt Transport für ein MCP."""
         transport_type = config.get("transport", "http")
@@ -168,11 +372,15 @@ class MCPHub:
             
         elif transport_type == "stdio":
             command = config.get("command", "")
-            self._transports[mcp_name] = STDIOTransport(command)
+            self._transports[mcp_name] = STDIOTransport(
+                command,
+                timeout=int(config.get("timeout", 30)),
+                pool_size=config.get("pool_size"),
+            )
             log_debug(f"[MCPHub] {mcp_name}: STDIO transport → {command}")
     
     def _discover_tools(self, mcp_name: str):
-        """Entdeckt Tools von einem MCP."""
+        """Entdeckt Tools von einem MCP (synchron, z.B. für refresh())."""
         transport = self._transports.get(mcp_name)
         if not transport:
             return
@@ -186,13 +394,7 @@ class MCPHub:
                     self._tools_cache[tool_name] = mcp_name
                     self._tool_definitions[tool_name] = tool
             
-            # Log mit erkanntem Format (wenn HTTPTransport)
-            format_info = ""
-            if hasattr(transport, 'get_format'):
-                detected_format = transport.get_format()
-                format_info = f" (format={detected_format})"
-            
-            log_info(f"[MCPHub] {mcp_name}: {len(tools)} tools discovered{format_info}")
+            log_info(f"[MCPHub] {mcp_name}: {len(tools)} tools discovered{self._format_info(transport)}")
             
         except Exception as e:
             log_error(f"[MCPHub] {mcp_name}: Failed to discover tools: {e}")
@@ -278,7 +480,8 @@ Examples: {"; ".join(examples[:2])}
                 
                 rules.append((score, rule_text))
         
-        rules.sort(key=lambda x: x[0])
+        # Tie-Break über den Text: Reihenfolge unabhängig von der Transport-Ladefolge (stabiler Prompt-Prefix)
+        rules.sort(key=lambda x: (x[0], x[1]))
         final_rules = [r[1] for r in rules]
         
         count = len(final_rules)
@@ -593,23 +796,121 @@ Examples: {"; ".join(examples[:2])}
             log_error(f"[MCPHub] No transport for MCP: {mcp_name}{trace_suffix}")
             return {"error": f"MCP '{mcp_name}' not available"}
         
-        log_info(f"[MCPHub] Calling {tool_name} via {mcp_name}{trace_suffix}")
-        
-        try:
-            result = transport.call_tool(tool_name, arguments)
-            return result
-        except Exception as e:
-            log_error(f"[MCPHub] Tool call failed{trace_suffix}: {e}")
-            return {"error": str(e)}
+        policy, invalidates = self._get_cache_rules(tool_name, tool_def, mcp_name)
+
+        def _call_transport() -> Any:
+            log_info(f"[MCPHub] Calling {tool_name} via {mcp_name}{trace_suffix}")
+            try:
+                return transport.call_tool(tool_name, arguments)
+            except Exception as e:
+                log_error(f"[MCPHub] Tool call failed{trace_suffix}: {e}")
+                return {"error": str(e)}
+
+        if policy is not None and self._result_cache.enabled:
+            return self._result_cache.call(tool_name, arguments, policy, _call_transport)
+
+        result = _call_transport()
+        if invalidates:
+            # Nach dem Write: Einträge + laufende Fetches der Domain verwerfen
+            self._result_cache.invalidate_domains(invalidates, by_tool=tool_name)
+        return result
+
+    def _get_cache_rules(
+        self, tool_name: str, tool_def: Optional[Dict], mcp_name: str
+    ) -> "tuple[Optional[CachePolicy], tuple]":
+        """Cache-Policy + invalidierte Domains pro Tool (einmal aufgelöst).
+
+        _cache_rules wird von Discovery-Threads geleert → Zugriff unter dem Lock,
+        die Config-Auflösung selbst läuft außerhalb.
+        """
+        with self._lock:
+            rules = self._cache_rules.get(tool_name)
+        if rules is None:
+            mcp_config = dict(self._get_mcp_config(mcp_name) or {})
+            for key, value in (get_mcp_config(mcp_name) or {}).items():
+                if key in ("result_cache", "cache_invalidates"):
+                    mcp_config[key] = value
+            rules = (
+                resolve_cache_policy(tool_name, tool_def, mcp_config),
+                resolve_invalidated_domains(tool_name, tool_def, mcp_config),
+            )
+            with self._lock:
+                self._cache_rules[tool_name] = rules
+        return rules
+
+    def invalidate_after_write(self, tool_name: str) -> int:
+        """Invalidiert die Domains eines Write-Tools, das nicht über call_tool lief
+        (z.B. direkter MCP-Fallback in mcp.client)."""
+        with self._lock:
+            tool_def = self._tool_definitions.get(tool_name)
+            mcp_name = self._tools_cache.get(tool_name)
+        if mcp_name:
+            _policy, invalidates = self._get_cache_rules(tool_name, tool_def, mcp_name)
+        else:
+            invalidates = resolve_invalidated_domains(tool_name, tool_def, None)
+        if not invalidates:
+            return 0
+        return self._result_cache.invalidate_domains(invalidates, by_tool=tool_name)
+
+    def invalidate_result_domains(self, domains: Iterable[str], *, by_tool: str = "") -> int:
+        """Invalidiert Cache-Domains für Writes außerhalb der MCP-Tools (z.B. Admin-REST)."""
+        return self._result_cache.invalidate_domains(domains, by_tool=by_tool)
+
+    def get_result_cache_stats(self) -> Dict[str, Any]:
+        """Hit/Miss/Latenz pro Tool (Admin-API)."""
+        return self._result_cache.stats()
 
     async def call_tool_async(self, tool_name: str, arguments: Dict[str, Any]) -> Any:
         """
         Async-safe MCP tool call wrapper.
-        Keeps existing sync routing logic, but offloads blocking transport I/O
-        from the event loop. Useful for async request paths (/api/chat stream/deep).
+        Transports mit ``call_tool_async`` (HTTP) laufen direkt auf dem Event-Loop
+        über den gepoolten httpx-Client. Fast-Lane-, gecachte und STDIO-Tools
+        behalten die sync Routing-Logik im Worker-Thread.
         """
-        return await asyncio.to_thread(self.call_tool, tool_name, arguments)
+        if not self._initialized:
+            await asyncio.to_thread(self.initialize)
+
+        with self._lock:
+            tool_def = self._tool_definitions.get(tool_name)
+            mcp_name = self._tools_cache.get(tool_name)
+            transport = self._transports.get(mcp_name) if mcp_name else None
+
+        call_async = getattr(transport, "call_tool_async", None) if transport is not None else None
+        is_direct = bool(tool_def and tool_def.get("execution") == "direct")
+        if not asyncio.iscoroutinefunction(call_async) or is_direct:
+            return await asyncio.to_thread(self.call_tool, tool_name, arguments)
+
+        policy, invalidates = self._get_cache_rules(tool_name, tool_def, mcp_name)
+        if policy is not None and self._result_cache.enabled:
+            # Single-Flight/Read-Through ist thread-basiert → sync Pfad
+            return await asyncio.to_thread(self.call_tool, tool_name, arguments)
+
+        trace_id = ""
+        if isinstance(arguments, dict):
+            trace_id = str(arguments.get("_trace_id") or "").strip()
+        trace_suffix = f" trace={trace_id}" if trace_id else ""
+        log_info(f"[MCPHub] Calling {tool_name} via {mcp_name} (async){trace_suffix}")
+        try:
+            result = await call_async(tool_name, arguments)
+        except Exception as e:
+            log_error(f"[MCPHub] Tool call failed{trace_suffix}: {e}")
+            result = {"error": str(e)}
+        if invalidates:
+            self._result_cache.invalidate_domains(invalidates, by_tool=tool_name)
+        return result
     
+    def supports_concurrent_calls(self, tool_name: str) -> bool:
+        """True wenn der Transport des Tools parallele call_tool()-Aufrufe verträgt."""
+        with self._lock:
+            tool_def = self._tool_definitions.get(tool_name) or {}
+            mcp_name = self._tools_cache.get(tool_name)
+            transport = self._transports.get(mcp_name) if mcp_name else None
+        if tool_def.get("execution") == "direct":
+            return True
+        if transport is None:
+            return False
+        return bool(getattr(transport, "supports_concurrent_calls", True))
+
     def get_mcp_for_tool(self, tool_name: str) -> Optional[str]:
         """Gibt den MCP-Namen für ein Tool zurück."""
         self.initialize()
@@ -656,6 +957,8 @@ Examples: {"; ".join(examples[:2])}
             
             self._tools_cache.clear()
             self._tool_definitions.clear()
+            self._cache_rules.clear()
+            self._result_cache.clear()
             self._tools_registered = False  # Neu registrieren
 
             for mcp_name in list(self._transports.keys()):
@@ -668,14 +971,17 @@ Examples: {"; ".join(examples[:2])}
             self._auto_register_tools()
             
             tools_count = len(self._tools_cache)
+        self._save_tool_snapshot()
         
         log_info(f"[MCPHub] Refresh complete: {tools_count} tools")
     
     def shutdown(self):
-        """Beendet alle STDIO-Transports."""
+        """Beendet alle STDIO-Transports und schließt gepoolte HTTP-Verbindungen."""
         for mcp_name, transport in self._transports.items():
             if isinstance(transport, STDIOTransport):
                 transport.shutdown()
+            elif isinstance(transport, HTTPTransport):
+                transport.close()
         log_info("[MCPHub] Shutdown complete")
 
 
@@ -691,3 +997,25 @@ def get_hub() -> MCPHub:
     if _hub_instance is None:
         _hub_instance = MCPHub()
     return _hub_instance
+
+
+def invalidate_after_write(tool_name: str) -> int:
+    """Invalidiert die Cache-Domains eines Write-Tools, das am Hub vorbei lief.
+
+    No-op solange kein Hub existiert (dann gibt es auch keinen Cache).
+    """
+    hub = _hub_instance
+    if hub is None:
+        return 0
+    return hub.invalidate_after_write(tool_name)
+
+
+def invalidate_cached_results(domains: Iterable[str], *, by_tool: str = "") -> int:
+    """Verwirft gecachte Tool-Ergebnisse nach direkten Store-Writes.
+
+    No-op solange kein Hub existiert (dann gibt es auch keinen Cache).
+    """
+    hub = _hub_instance
+    if hub is None:
+        return 0
+    return hub.invalidate_result_domains(domains, by_tool=by_tool)
@@ -0,0 +1,284 @@
+# mcp/result_cache.py
+"""
+Read-through Result-Cache für idempotente MCP-Tools (MCPHub.call_tool).
+
+- Cachebarkeit + TTL pro Tool:
+    1. Tool-Definition:  {"name": ..., "cache": {"ttl_s": 30, "domain": "blueprints"}}
+    2. MCP-Config (mcp_registry / config.json):
+       "result_cache": {"blueprint_list": {"ttl_s": 30, "domain": "blueprints"}}
+    3. DEFAULT_CACHE_POLICIES unten
+  "cache": false / ttl_s <= 0 schaltet das Caching für ein Tool ab.
+- Key = Tool-Name + kanonisierte Args (sort_keys, Trace-Felder entfernt).
+- Invalidierung: ein Tool, das eine Domain verändert ("invalidates" in der
+  Tool-Definition, "cache_invalidates" in der MCP-Config oder
+  DEFAULT_INVALIDATIONS), leert alle Einträge dieser Domain. Läuft gerade ein
+  Fetch für die Domain, wird dessen Ergebnis nicht mehr gespeichert.
+- Single-Flight: gleichzeitige identische Calls teilen sich einen Roundtrip.
+- Fehler-Ergebnisse ({"error": ...}) werden nie gecacht.
+
+Env: MCP_RESULT_CACHE_ENABLE (default true), MCP_RESULT_CACHE_MAX_ENTRIES (default 512).
+"""
+
+from __future__ import annotations
+
+import copy
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Tuple
+
+_CACHE_ENABLE = str(os.getenv("MCP_RESULT_CACHE_ENABLE", "true")).lower() == "true"
+_MAX_ENTRIES = max(16, int(os.getenv("MCP_RESULT_CACHE_MAX_ENTRIES", "512")))
+
+# Trace-/Request-Metadaten ändern das Ergebnis nicht
+_VOLATILE_ARG_KEYS = frozenset({"_trace_id", "trace_id", "_request_id"})
+
+DEFAULT_CACHE_POLICIES: Dict[str, Dict[str, Any]] = {
+    "memory_graph_search": {"ttl_s": 30, "domain": "memory"},
+    "memory_fact_load": {"ttl_s": 30, "domain": "memory"},
+    "blueprint_list": {"ttl_s": 60, "domain": "blueprints"},
+    "blueprint_get": {"ttl_s": 60, "domain": "blueprints"},
+    "list_skills": {"ttl_s": 30, "domain": "skills"},
+    "list_draft_skills": {"ttl_s": 30, "domain": "skills"},
+    "get_skill_info": {"ttl_s": 30, "domain": "skills"},
+    "container_list": {"ttl_s": 5, "domain": "containers"},
+    "storage_scope_list": {"ttl_s": 30, "domain": "storage_scopes"},
+    "autonomy_cron_list_jobs": {"ttl_s": 10, "domain": "cron"},
+}
+
+DEFAULT_INVALIDATIONS: Dict[str, Tuple[str, ...]] = {
+    "memory_save": ("memory",),
+    "memory_fact_save": ("memory",),
+    "memory_graph_save": ("memory",),
+    "memory_semantic_save": ("memory",),
+    "memory_autosave_hook": ("memory",),
+    "memory_delete": ("memory",),
+    "memory_delete_bulk": ("memory",),
+    "memory_reset": ("memory",),
+    "tool_embedding_save": ("memory",),
+    "memory_embedding_backfill": ("memory",),
+    "maintenance_run": ("memory",),
+    "graph_add_node": ("memory",),
+    "graph_merge_nodes": ("memory",),
+    "graph_delete_orphan_nodes": ("memory",),
+    "graph_prune_weak_edges": ("memory",),
+    "graph_rebuild_semantic_edges": ("memory",),
+    "blueprint_create": ("blueprints",),
+    "create_skill": ("skills",),
+    "install_skill": ("skills",),
+    "uninstall_skill": ("skills",),
+    "promote_skill_draft": ("skills",),
+    "autonomous_skill_task": ("skills",),
+    "request_container": ("containers",),
+    "home_start": ("containers",),
+    "stop_container": ("containers",),
+    "snapshot_restore": ("containers",),
+    "optimize_container": ("containers",),
+    "storage_provision_container": ("containers", "storage_scopes"),
+    "storage_scope_upsert": ("storage_scopes",),
+    "storage_scope_delete": ("storage_scopes",),
+    "autonomy_cron_create_job": ("cron",),
+    "autonomy_cron_update_job": ("cron",),
+    "autonomy_cron_pause_job": ("cron",),
+    "autonomy_cron_resume_job": ("cron",),
+    "autonomy_cron_run_now": ("cron",),
+    "autonomy_cron_delete_job": ("cron",),
+}
+
+
+@dataclass(frozen=True)
+class CachePolicy:
+    ttl_s: float
+    domain: str
+
+
+def canonical_args_key(tool_name: str, arguments: Any) -> str:
+    """Stabiler Key: Args sortiert, Trace-Felder entfernt."""
+    args = arguments if isinstance(arguments, dict) else {}
+    cleaned = {k: v for k, v in args.items() if k not in _VOLATILE_ARG_KEYS}
+    try:
+        payload = json.dumps(cleaned, sort_keys=True, ensure_ascii=False, separators=(",", ":"), default=str)
+    except Exception:
+        payload = repr(sorted(cleaned.items(), key=lambda kv: str(kv[0])))
+    return f"{tool_name}\x00{payload}"
+
+
+def resolve_cache_policy(
+    tool_name: str,
+    tool_def: Optional[Mapping[str, Any]],
+    mcp_config: Optional[Mapping[str, Any]],
+) -> Optional[CachePolicy]:
+    raw: Any = None
+    if isinstance(tool_def, Mapping) and "cache" in tool_def:
+        raw = tool_def.get("cache")
+    elif isinstance(mcp_config, Mapping) and tool_name in (mcp_config.get("result_cache") or {}):
+        raw = (mcp_config.get("result_cache") or {}).get(tool_name)
+    else:
+        raw = DEFAULT_CACHE_POLICIES.get(tool_name)
+    if not isinstance(raw, Mapping):
+        return None
+    try:
+        ttl_s = float(raw.get("ttl_s", 0) or 0)
+    except (TypeError, ValueError):
+        return None
+    if ttl_s <= 0:
+        return None
+    return CachePolicy(ttl_s=ttl_s, domain=str(raw.get("domain") or tool_name))
+
+
+def resolve_invalidated_domains(
+    tool_name: str,
+    tool_def: Optional[Mapping[str, Any]],
+    mcp_config: Optional[Mapping[str, Any]],
+) -> Tuple[str, ...]:
+    raw: Any = None
+    if isinstance(tool_def, Mapping) and "invalidates" in tool_def:
+        raw = tool_def.get("invalidates")
+    elif isinstance(mcp_config, Mapping) and tool_name in (mcp_config.get("cache_invalidates") or {}):
+        raw = (mcp_config.get("cache_invalidates") or {}).get(tool_name)
+    else:
+        raw = DEFAULT_INVALIDATIONS.get(tool_name)
+    if isinstance(raw, str):
+        raw = [raw]
+    return tuple(str(d) for d in (raw or ()) if str(d or "").strip())
+
+
+def _is_error_result(result: Any) -> bool:
+    if isinstance(result, dict):
+        return bool(result.get("error")) or result.get("isError") is True
+    return False
+
+
+class _Flight:
+    __slots__ = ("event", "result", "error")
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class ToolResultCache:
+    """TTL-Cache mit Domain-Invalidierung und Single-Flight (thread-safe)."""
+
+    def __init__(self, *, max_entries: int = _MAX_ENTRIES, enabled: Optional[bool] = None):
+        self.enabled = _CACHE_ENABLE if enabled is None else bool(enabled)
+        self.max_entries = int(max_entries)
+        self._lock = threading.Lock()
+        # key → (expires_at, domain, result)
+        self._entries: "OrderedDict[str, Tuple[float, str, Any]]" = OrderedDict()
+        self._inflight: Dict[str, _Flight] = {}
+        self._generation: Dict[str, int] = {}
+        self._epoch = 0  # clear() verwirft auch laufende Fetches aller Domains
+        self._metrics: Dict[str, Dict[str, float]] = {}
+
+    # ── metrics ───────────────────────────────────────────
+
+    def _metric(self, tool_name: str) -> Dict[str, float]:
+        m = self._metrics.get(tool_name)
+        if m is None:
+            m = {"hits": 0, "misses": 0, "coalesced": 0, "invalidations": 0, "miss_latency_ms_total": 0.0}
+            self._metrics[tool_name] = m
+        return m
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            tools = {}
+            for name, m in sorted(self._metrics.items()):
+                lookups = m["hits"] + m["misses"] + m["coalesced"]
+                tools[name] = {
+                    "hits": int(m["hits"]),
+                    "misses": int(m["misses"]),
+                    "coalesced": int(m["coalesced"]),
+                    "invalidations": int(m["invalidations"]),
+                    "hit_rate": round((m["hits"] + m["coalesced"]) / lookups, 4) if lookups else 0.0,
+                    "avg_miss_latency_ms": round(m["miss_latency_ms_total"] / m["misses"], 2) if m["misses"] else 0.0,
+                }
+            return {
+                "enabled": self.enabled,
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "inflight": len(self._inflight),
+                "tools": tools,
+            }
+
+    # ── cache ─────────────────────────────────────────────
+
+    def call(self, tool_name: str, arguments: Any, policy: CachePolicy, fetch: Callable[[], Any]) -> Any:
+        """Read-through: Treffer aus dem Cache, sonst genau ein fetch() pro Key."""
+        key = canonical_args_key(tool_name, arguments)
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > now:
+                self._entries.move_to_end(key)
+                self._metric(tool_name)["hits"] += 1
+                return copy.deepcopy(entry[2])
+            if entry is not None:
+                del self._entries[key]
+            flight = self._inflight.get(key)
+            leader = flight is None
+            if leader:
+                flight = _Flight()
+                self._inflight[key] = flight
+                generation = (self._epoch, self._generation.get(policy.domain, 0))
+                self._metric(tool_name)["misses"] += 1
+            else:
+                self._metric(tool_name)["coalesced"] += 1
+
+        if not leader:
+            flight.event.wait()
+            if flight.error is not None:
+                raise flight.error
+            return copy.deepcopy(flight.result)
+
+        started = time.perf_counter()
+        try:
+            result = fetch()
+        except BaseException as exc:
+            flight.error = exc
+            with self._lock:
+                self._inflight.pop(key, None)
+            flight.event.set()
+            raise
+        elapsed_ms = (time.perf_counter() - started) * 1000.0
+
+        with self._lock:
+            self._metric(tool_name)["miss_latency_ms_total"] += elapsed_ms
+            # Während des Fetches invalidiert → Ergebnis nicht speichern
+            current = (self._epoch, self._generation.get(policy.domain, 0))
+            if not _is_error_result(result) and current == generation:
+                self._entries[key] = (time.monotonic() + policy.ttl_s, policy.domain, copy.deepcopy(result))
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+            self._inflight.pop(key, None)
+            flight.result = copy.deepcopy(result)
+        flight.event.set()
+        return result
+
+    def invalidate_domains(self, domains: Iterable[str], *, by_tool: str = "") -> int:
+        targets = {str(d) for d in domains if d}
+        if not targets:
+            return 0
+        with self._lock:
+            for domain in targets:
+                self._generation[domain] = self._generation.get(domain, 0) + 1
+            stale = [k for k, (_exp, domain, _res) in self._entries.items() if domain in targets]
+            for key in stale:
+                del self._entries[key]
+            if by_tool:
+                self._metric(by_tool)["invalidations"] += 1
+        return len(stale)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._epoch += 1
+            self._entries.clear()
+
+    def keys(self) -> List[str]:
+        with self._lock:
+            return list(self._entries.keys())
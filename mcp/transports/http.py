@@ -8,14 +8,26 @@ Erkennt automatisch:
 - Streamable HTTP (stateless)
 
 Handhabt Sessions automatisch wenn nötig.
+
+Verbindungen: pro Transport eine gepoolte ``requests.Session`` (Keep-Alive,
+max. MCP_HTTP_POOL_MAXSIZE Verbindungen, thread-safe geteilt). ``call_tool_async``
+nutzt den gepoolten httpx-Client aus ``core.http_client_pool`` direkt auf dem
+Event-Loop — kein Worker-Thread pro Call.
 """
 
+import asyncio
+import os
+import threading
+
 import requests
+from requests.adapters import HTTPAdapter
 import json
 import uuid
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, Iterable, List, Optional, Union
 from utils.logger import log_info, log_error, log_debug, log_warning
 
+_POOL_MAXSIZE = max(1, int(os.getenv("MCP_HTTP_POOL_MAXSIZE", "16")))
+
 
 class HTTPTransport:
     """
@@ -42,6 +54,45 @@ class HTTPTransport:
         self._format: Optional[str] = None
         self._session_id: Optional[str] = None
         self._format_detected = False
+
+        # Keep-Alive Pool (lazy) + Lock für Format-Detection/Session-Init
+        self._http: Optional[requests.Session] = None
+        self._http_lock = threading.Lock()
+        self._setup_lock = threading.Lock()
+    
+    # ═══════════════════════════════════════════════════════════════
+    # CONNECTION POOL
+    # ═══════════════════════════════════════════════════════════════
+
+    def _get_http(self) -> requests.Session:
+        """Gepoolte Session (Keep-Alive), geteilt über Calls und Threads."""
+        http = self._http
+        if http is None:
+            with self._http_lock:
+                if self._http is None:
+                    http = requests.Session()
+                    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=_POOL_MAXSIZE)
+                    http.mount("http://", adapter)
+                    http.mount("https://", adapter)
+                    self._http = http
+                http = self._http
+        return http
+
+    def _post(self, payload: Dict[str, Any], headers: Dict[str, str]) -> requests.Response:
+        return self._get_http().post(
+            self.url,
+            json=payload,
+            headers=headers,
+            timeout=self.timeout,
+            stream=True
+        )
+
+    def close(self):
+        """Schließt die gepoolten Verbindungen."""
+        with self._http_lock:
+            http, self._http = self._http, None
+        if http is not None:
+            http.close()
     
     # ═══════════════════════════════════════════════════════════════
     # HEADER BUILDERS
@@ -89,14 +140,9 @@ class HTTPTransport:
             "params": {}
         }
         
+        resp = None
         try:
-            resp = requests.post(
-                self.url,
-                json=payload,
-                headers=self._get_base_headers(),
-                timeout=self.timeout,
-                stream=True
-            )
+            resp = self._post(payload, self._get_base_headers())
             
             content_type = resp.headers.get("Content-Type", "")
             
@@ -143,6 +189,9 @@ class HTTPTransport:
             self._format = self.FORMAT_UNKNOWN
             self._format_detected = True
             return self._format
+        finally:
+            if resp is not None:
+                resp.close()
     
     # ═══════════════════════════════════════════════════════════════
     # SESSION MANAGEMENT
@@ -173,14 +222,9 @@ class HTTPTransport:
             }
         }
         
+        resp = None
         try:
-            resp = requests.post(
-                self.url,
-                json=payload,
-                headers=self._get_base_headers(),
-                timeout=self.timeout,
-                stream=True
-            )
+            resp = self._post(payload, self._get_base_headers())
             
             # Session-ID aus Response-Header
             session_id = resp.headers.get("Mcp-Session-Id")
@@ -205,6 +249,9 @@ class HTTPTransport:
         except Exception as e:
             log_error(f"[HTTP] Session initialization failed: {e}")
             return False
+        finally:
+            if resp is not None:
+                resp.close()
     
     def _ensure_session(self) -> bool:
         """Stellt sicher dass eine Session existiert (wenn nötig)."""
@@ -212,6 +259,25 @@ class HTTPTransport:
             if not self._session_id:
                 return self._initialize_session()
         return True
+
+    def _needs_setup(self) -> bool:
+        return not self._format_detected or (
+            self._format == self.FORMAT_STREAMABLE and not self._session_id
+        )
+
+    def _prepare(self) -> bool:
+        """Format-Detection + Session-Init genau einmal, auch bei parallelen ersten Calls."""
+        with self._setup_lock:
+            if not self._format_detected:
+                self._detect_format()
+            return self._ensure_session()
+
+    def _is_session_error(self, error_data: Any) -> bool:
+        if not isinstance(error_data, dict):
+            return False
+        error = error_data.get("error", {})
+        error_msg = error.get("message", "") if isinstance(error, dict) else str(error or "")
+        return "session" in error_msg.lower()
     
     # ═══════════════════════════════════════════════════════════════
     # RESPONSE PARSING
@@ -253,11 +319,15 @@ class HTTPTransport:
     
     def _parse_sse_response(self, response: requests.Response) -> Any:
         """Parst SSE-Response und extrahiert das Result."""
+        return self._parse_sse_lines(response.iter_lines())
+
+    def _parse_sse_lines(self, lines: Iterable[Union[bytes, str]]) -> Any:
+        """SSE-Zeilen (bytes von requests, str von httpx) → Result."""
         result = None
         
-        for line in response.iter_lines():
+        for line in lines:
             if line:
-                decoded = line.decode("utf-8")
+                decoded = line.decode("utf-8") if isinstance(line, bytes) else line
                 
                 # SSE Format: "data: {...}"
                 if decoded.startswith("data: "):
@@ -294,11 +364,22 @@ class HTTPTransport:
         
         # JSON Response
         try:
-            data = response.json()
-            if "error" in data:
-                return {"error": data["error"]}
-            result = data.get("result", data)
-            return self._extract_mcp_content(result)
+            return self._parse_json_data(response.json())
+        except:
+            return None
+
+    def _parse_json_data(self, data: Any) -> Any:
+        if "error" in data:
+            return {"error": data["error"]}
+        result = data.get("result", data)
+        return self._extract_mcp_content(result)
+
+    def _parse_text_body(self, content_type: str, text: str) -> Any:
+        """Wie _parse_response, aber für einen bereits gelesenen Body (httpx)."""
+        if "text/event-stream" in content_type:
+            return self._extract_mcp_content(self._parse_sse_lines(text.splitlines()))
+        try:
+            return self._parse_json_data(json.loads(text))
         except:
             return None
     
@@ -314,32 +395,20 @@ class HTTPTransport:
         - Initialisiert Session wenn nötig
         - Retry bei Session-Fehlern
         """
-        # Format erkennen
-        if not self._format_detected:
-            self._detect_format()
-        
-        # Session sicherstellen
-        if not self._ensure_session():
+        # Format erkennen + Session sicherstellen
+        if self._needs_setup() and not self._prepare():
             log_error(f"[HTTP] Could not establish session")
             return {"error": "Session initialization failed"}
         
-        # Request senden
+        # Request senden (Keep-Alive-Verbindung aus dem Pool)
+        resp = None
         try:
-            resp = requests.post(
-                self.url,
-                json=payload,
-                headers=self._get_headers_with_session(),
-                timeout=self.timeout,
-                stream=True
-            )
+            resp = self._post(payload, self._get_headers_with_session())
             
             # Session-Fehler → Retry mit neuer Session
             if resp.status_code == 400 and retry_count < 2:
                 try:
-                    error_data = resp.json()
-                    error_msg = error_data.get("error", {}).get("message", "")
-                    
-                    if "session" in error_msg.lower():
+                    if self._is_session_error(resp.json()):
                         log_warning(f"[HTTP] Session error, reinitializing...")
                         self._session_id = None
                         self._format = self.FORMAT_STREAMABLE
@@ -356,6 +425,44 @@ class HTTPTransport:
         except Exception as e:
             log_error(f"[HTTP] Request failed: {e}")
             return {"error": str(e)}
+        finally:
+            if resp is not None:
+                resp.close()
+
+    async def _smart_request_async(self, payload: Dict[str, Any], retry_count: int = 0) -> Any:
+        """Async-Variante von _smart_request über den gepoolten httpx-Client."""
+        import httpx
+        from core.http_client_pool import pooled_client
+
+        # Detection/Session-Init einmalig (selten) im Thread, danach rein async
+        if self._needs_setup() and not await asyncio.to_thread(self._prepare):
+            log_error(f"[HTTP] Could not establish session")
+            return {"error": "Session initialization failed"}
+
+        try:
+            async with pooled_client(self.url, timeout_s=float(self.timeout)) as client:
+                resp = await client.post(self.url, json=payload, headers=self._get_headers_with_session())
+
+            # Session-Fehler → Retry mit neuer Session
+            if resp.status_code == 400 and retry_count < 2:
+                try:
+                    if self._is_session_error(resp.json()):
+                        log_warning(f"[HTTP] Session error, reinitializing...")
+                        self._session_id = None
+                        self._format = self.FORMAT_STREAMABLE
+                        return await self._smart_request_async(payload, retry_count + 1)
+                except Exception:
+                    pass
+
+            resp.raise_for_status()
+            return self._parse_text_body(resp.headers.get("Content-Type", ""), resp.text)
+
+        except httpx.HTTPStatusError as e:
+            log_error(f"[HTTP] HTTP error: {e}")
+            return {"error": str(e)}
+        except Exception as e:
+            log_error(f"[HTTP] Request failed: {e}")
+            return {"error": str(e)}
     
     # ═══════════════════════════════════════════════════════════════
     # PUBLIC API
@@ -406,6 +513,27 @@ class HTTPTransport:
             log_error(f"[HTTP] Tool error: {result['error']}")
         
         return result
+
+    async def call_tool_async(self, tool_name: str, arguments: Dict[str, Any]) -> Any:
+        """Ruft ein Tool auf, ohne einen Worker-Thread zu belegen."""
+        payload = {
+            "jsonrpc": "2.0",
+            "id": 1,
+            "method": "tools/call",
+            "params": {
+                "name": tool_name,
+                "arguments": arguments
+            }
+        }
+
+        log_debug(f"[HTTP] tools/call (async) {tool_name} → {self.url}")
+
+        result = await self._smart_request_async(payload)
+
+        if isinstance(result, dict) and result.get("error") is not None:
+            log_error(f"[HTTP] Tool error: {result['error']}")
+
+        return result
     
     def health_check(self) -> bool:
         """Prüft ob MCP erreichbar ist."""
@@ -2,35 +2,74 @@
 """
 STDIO Transport für lokale MCP-Prozesse.
 Kommuniziert via stdin/stdout mit einem Subprocess.
+
+Multiplexing: jeder Request bekommt eine eigene JSON-RPC-ID, ein Reader-Thread
+pro Prozess ordnet die Responses über die ID zu. Dadurch sind beliebig viele
+Requests gleichzeitig unterwegs; ein Timeout betrifft nur den einzelnen
+Request, nicht den Prozess. Für CPU-lastige MCPs kann ein Pool aus N
+Prozessen gestartet werden (``pool_size`` bzw. MCP_STDIO_POOL_SIZE) — jeder
+Request geht an den Prozess mit den wenigsten offenen Requests.
 """
 
 import subprocess
 import json
+import os
 import threading
-import queue
+import itertools
 from typing import Dict, Any, List, Optional
-from utils.logger import log_info, log_error, log_debug
+from utils.logger import log_info, log_error, log_debug, log_warning
 
+_POOL_SIZE = max(1, int(os.getenv("MCP_STDIO_POOL_SIZE", "1")))
+_INIT_TIMEOUT_S = 60
 
-class STDIOTransport:
-    """STDIO Transport für lokale MCP-Prozesse."""
-    
-    def __init__(self, command: str, timeout: int = 30):
+
+class _PendingRequest:
+    __slots__ = ("event", "response")
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.response: Optional[Dict[str, Any]] = None
+
+
+class _STDIOProcess:
+    """Ein MCP-Kindprozess mit Reader-Thread und ID-basiertem Dispatch."""
+
+    def __init__(self, command: str, index: int = 0):
         self.command = command
-        self.timeout = timeout
+        self.index = index
         self.process: Optional[subprocess.Popen] = None
-        self._response_queue = queue.Queue()
         self._reader_thread: Optional[threading.Thread] = None
-        self._running = False
-    
-    def _start_process(self):
-        """Startet den MCP-Prozess."""
-        if self.process is not None:
+        self._ready = False
+        self._start_lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._pending_lock = threading.Lock()
+        self._pending: Dict[int, _PendingRequest] = {}
+        self._ids = itertools.count(1)
+        self.timeouts = 0
+        self.in_flight = 0  # vom Transport beim Auswählen reserviert
+
+    def is_alive(self) -> bool:
+        return self.process is not None and self.process.poll() is None
+
+    def is_ready(self) -> bool:
+        return self._ready and self.is_alive()
+
+    def start(self):
+        """Startet den Prozess (idempotent, thread-safe) inkl. MCP-Handshake."""
+        if self.is_ready():
             return
-        
+        with self._start_lock:
+            if self.is_ready():
+                return
+            if self.process is not None:
+                log_warning(f"[STDIO] Process #{self.index} exited, restarting")
+                self._stop_process()
+            self._start_process()
+
+    def _start_process(self):
         try:
             log_debug(f"[STDIO] Starting: {self.command}")
-            
+
             self.process = subprocess.Popen(
                 self.command.split(),
                 stdin=subprocess.PIPE,
@@ -39,173 +78,241 @@ class STDIOTransport:
                 text=True,
                 bufsize=1
             )
-            
-            self._running = True
-            self._reader_thread = threading.Thread(target=self._read_output, daemon=True)
+
+            self._reader_thread = threading.Thread(
+                target=self._read_output,
+                args=(self.process,),
+                name=f"mcp-stdio-reader-{self.index}",
+                daemon=True,
+            )
             self._reader_thread.start()
-            
+
             log_info(f"[STDIO] Process started: PID {self.process.pid}")
-            
+
             # MCP Handshake: Initialize
-            init_payload = {
-                "jsonrpc": "2.0",
-                "id": 0,
-                "method": "initialize",
-                "params": {
+            log_debug("[STDIO] Sending initialize...")
+            init_response = self.request(
+                "initialize",
+                {
                     "protocolVersion": "2024-11-05",
                     "capabilities": {},
                     "clientInfo": {"name": "jarvis-hub", "version": "1.0.0"}
-                }
-            }
-            log_debug("[STDIO] Sending initialize...")
-            
-            # Send init
-            request_str = json.dumps(init_payload) + "\n"
-            self.process.stdin.write(request_str)
-            self.process.stdin.flush()
-            
-            # Wait for response (manually, since thread not yet consuming queue efficiently?)
-            # Actually, the reader thread is started, so we should wait on queue
-            # But _send_request logic is similar. Let's reuse _send_request logic if possible?
-            # No, because _send_request calls _start_process which would recurse.
-            # We must adhere to the flow.
-            # Reader thread puts response in queue. We wait for it.
-            
-            try:
-                init_response = self._response_queue.get(timeout=60)
-                if "error" in init_response:
-                    log_error(f"[STDIO] Initialize failed: {init_response['error']}")
-                    raise Exception(f"Initialize failed: {init_response['error']}")
-                log_debug("[STDIO] Initialize successful")
-                
-                # Send initialized notification
-                notif_payload = {
-                    "jsonrpc": "2.0",
-                    "method": "notifications/initialized",
-                    "params": {}
-                }
-                notif_str = json.dumps(notif_payload) + "\n"
-                self.process.stdin.write(notif_str)
-                self.process.stdin.flush()
-                log_debug("[STDIO] Sent initialized notification")
-                
-            except queue.Empty:
-                log_error("[STDIO] Timeout waiting for initialize response")
-                raise Exception("Timeout waiting for initialize response")
-
-            
+                },
+                timeout=_INIT_TIMEOUT_S,
+            )
+            if "error" in init_response:
+                log_error(f"[STDIO] Initialize failed: {init_response['error']}")
+                raise Exception(f"Initialize failed: {init_response['error']}")
+            log_debug("[STDIO] Initialize successful")
+
+            # Send initialized notification
+            self._write({
+                "jsonrpc": "2.0",
+                "method": "notifications/initialized",
+                "params": {}
+            })
+            log_debug("[STDIO] Sent initialized notification")
+            self._ready = True
+
         except Exception as e:
             log_error(f"[STDIO] Failed to start: {e}")
+            self._stop_process()
             raise
-    
-    def _read_output(self):
-        """Liest stdout in separatem Thread."""
-        while self._running and self.process:
+
+    def _read_output(self, process: subprocess.Popen):
+        """Liest stdout und verteilt Responses per JSON-RPC-ID."""
+        while True:
             try:
-                line = self.process.stdout.readline()
-                if line:
-                    try:
-                        data = json.loads(line.strip())
-                        self._response_queue.put(data)
-                    except json.JSONDecodeError:
-                        pass
-                elif self.process.poll() is not None:
-                    break
+                line = process.stdout.readline()
             except Exception as e:
                 log_error(f"[STDIO] Read error: {e}")
                 break
-    
-    def _send_request(self, payload: Dict) -> Dict:
-        """Sendet Request und wartet auf Response."""
-        self._start_process()
-        
-        try:
-            # Request senden
-            request_str = json.dumps(payload) + "\n"
+            if not line:
+                break  # EOF: Prozess beendet
+            try:
+                data = json.loads(line.strip())
+            except json.JSONDecodeError:
+                continue
+            if not isinstance(data, dict) or "method" in data:
+                continue  # Notifications/Server-Requests ignorieren
+            with self._pending_lock:
+                pending = self._pending.pop(data.get("id"), None)
+            if pending is None:
+                log_debug(f"[STDIO] Dropping late/unknown response id={data.get('id')}")
+                continue
+            pending.response = data
+            pending.event.set()
+        # Nur wenn dieser Prozess noch aktuell ist (nicht nach Restart)
+        if self.process is process:
+            self._ready = False
+            self._fail_pending("MCP process exited")
+
+    def _fail_pending(self, message: str):
+        with self._pending_lock:
+            pending, self._pending = list(self._pending.values()), {}
+        for request in pending:
+            request.response = {"error": message}
+            request.event.set()
+
+    def _write(self, payload: Dict[str, Any]):
+        request_str = json.dumps(payload) + "\n"
+        with self._write_lock:
             self.process.stdin.write(request_str)
             self.process.stdin.flush()
-            
-            # Auf Response warten
-            response = self._response_queue.get(timeout=self.timeout)
-            return response
-            
-        except queue.Empty:
-            log_error(f"[STDIO] Timeout waiting for response")
+
+    def request(self, method: str, params: Dict[str, Any], timeout: float) -> Dict[str, Any]:
+        """Sendet einen Request und wartet nur auf dessen Response."""
+        request_id = next(self._ids)
+        pending = _PendingRequest()
+        with self._pending_lock:
+            self._pending[request_id] = pending
+        try:
+            self._write({"jsonrpc": "2.0", "id": request_id, "method": method, "params": params})
+        except Exception as e:
+            with self._pending_lock:
+                self._pending.pop(request_id, None)
+            raise e
+
+        if not pending.event.wait(timeout):
+            with self._pending_lock:
+                self._pending.pop(request_id, None)
+            self.timeouts += 1
+            log_error(f"[STDIO] Timeout waiting for response (id={request_id}, method={method})")
             return {"error": "Timeout"}
+        return pending.response or {"error": "Empty response"}
+
+    def _stop_process(self):
+        self._ready = False
+        process, self.process = self.process, None
+        if process is not None and process.poll() is None:
+            process.terminate()
+            try:
+                process.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                process.kill()
+        self._fail_pending("MCP process terminated")
+
+    def stop(self):
+        with self._start_lock:
+            self._stop_process()
+
+
+class STDIOTransport:
+    """STDIO Transport für lokale MCP-Prozesse."""
+
+    # Responses werden per Request-ID zugeordnet → parallele Calls erlaubt
+    supports_concurrent_calls = True
+
+    def __init__(self, command: str, timeout: int = 30, pool_size: Optional[int] = None):
+        self.command = command
+        self.timeout = timeout
+        self.pool_size = max(1, int(pool_size or _POOL_SIZE))
+        self._processes = [_STDIOProcess(command, index=i) for i in range(self.pool_size)]
+        self._pick_lock = threading.Lock()
+
+    @property
+    def process(self) -> Optional[subprocess.Popen]:
+        """Prozess des ersten Pool-Slots (Kompatibilität)."""
+        return self._processes[0].process
+
+    def _pick_process(self) -> _STDIOProcess:
+        """Laufender Prozess mit den wenigsten offenen Requests (reserviert einen Slot)."""
+        with self._pick_lock:
+            alive = [p for p in self._processes if p.is_ready()]
+            idle_slot = next((p for p in self._processes if not p.is_ready() and not p.in_flight), None)
+            worker = min(alive, key=lambda p: p.in_flight) if alive else None
+            # Pool wächst lazy: weitere Prozesse erst, wenn die laufenden busy sind
+            if worker is None or (worker.in_flight and idle_slot is not None):
+                worker = idle_slot or min(self._processes, key=lambda p: p.in_flight)
+            worker.in_flight += 1
+            return worker
+
+    def _send_request(self, method: str, params: Dict[str, Any]) -> Dict:
+        """Sendet Request und wartet auf Response."""
+        worker = self._pick_process()
+        try:
+            worker.start()
+            return worker.request(method, params, timeout=self.timeout)
         except Exception as e:
             log_error(f"[STDIO] Request failed: {e}")
             return {"error": str(e)}
-    
+        finally:
+            with self._pick_lock:
+                worker.in_flight -= 1
+
     def list_tools(self) -> List[Dict[str, Any]]:
         """Holt Tool-Liste vom MCP."""
         try:
-            payload = {
-                "jsonrpc": "2.0",
-                "id": 1,
-                "method": "tools/list",
-                "params": {}
-            }
-            
             log_debug(f"[STDIO] tools/list")
-            
-            response = self._send_request(payload)
-            
+
+            response = self._send_request("tools/list", {})
+
             if "result" in response:
                 result = response["result"]
                 if isinstance(result, dict) and "tools" in result:
                     return result["tools"]
                 elif isinstance(result, list):
                     return result
-            
+
             return []
-            
+
         except Exception as e:
             log_error(f"[STDIO] tools/list failed: {e}")
             return []
-    
+
     def call_tool(self, tool_name: str, arguments: Dict[str, Any]) -> Any:
         """Ruft ein Tool auf."""
         try:
-            payload = {
-                "jsonrpc": "2.0",
-                "id": 1,
-                "method": "tools/call",
-                "params": {
+            log_debug(f"[STDIO] tools/call {tool_name}")
+
+            response = self._send_request(
+                "tools/call",
+                {
                     "name": tool_name,
                     "arguments": arguments
-                }
-            }
-            
-            log_debug(f"[STDIO] tools/call {tool_name}")
-            
-            response = self._send_request(payload)
-            
+                },
+            )
+
             if "error" in response:
                 return {"error": response["error"]}
-            
+
             return response.get("result", {})
-            
+
         except Exception as e:
             log_error(f"[STDIO] call_tool failed: {e}")
             return {"error": str(e)}
-    
+
+    def get_stats(self) -> Dict[str, Any]:
+        """In-flight/Timeout-Zähler pro Pool-Prozess."""
+        return {
+            "pool_size": self.pool_size,
+            "processes": [
+                {
+                    "index": p.index,
+                    "alive": p.is_ready(),
+                    "pid": p.process.pid if p.process is not None else None,
+                    "in_flight": p.in_flight,
+                    "timeouts": p.timeouts,
+                }
+                for p in self._processes
+            ],
+        }
+
     def health_check(self) -> bool:
         """Prüft ob MCP läuft."""
         try:
-            if self.process is None:
-                self._start_process()
-            return self.process is not None and self.process.poll() is None
+            worker = self._processes[0]
+            worker.start()
+            return worker.is_ready()
         except:
             return False
-    
+
     def shutdown(self):
-        """Beendet den Prozess."""
-        self._running = False
-        if self.process:
-            self.process.terminate()
-            try:
-                self.process.wait(timeout=5)
-            except subprocess.TimeoutExpired:
-                self.process.kill()
-            self.process = None
+        """Beendet alle Prozesse."""
+        stopped = 0
+        for worker in self._processes:
+            if worker.process is not None:
+                worker.stop()
+                stopped += 1
+        if stopped:
             log_info("[STDIO] Process terminated")
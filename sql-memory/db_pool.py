@@ -0,0 +1,305 @@
+# sql-memory/db_pool.py
+"""
+Geteilter SQLite-Connection-Manager fuer memory.db.
+
+Statt pro Tool-Call ``sqlite3.connect(DB_PATH)`` mit Default-Journal gibt es
+pro Datenbank-Datei:
+
+  - genau eine Writer-Connection; Schreiber stehen in einer FIFO-Queue
+    (Lease), d.h. Writes sind serialisiert statt in SQLITE_BUSY zu laufen.
+  - einen Pool read-only WAL-Connections (``mode=ro``) fuer reine Leser.
+  - getunte Pragmas: journal_mode=WAL, synchronous=NORMAL, mmap_size,
+    cache_size, busy_timeout, temp_store=MEMORY.
+  - langlebige Connections mit ``cached_statements=_CACHED_STATEMENTS``
+    (MEMORY_DB_CACHED_STATEMENTS): der Statement-Cache von sqlite3 pro
+    Connection; er greift nur bei wiederholt identischem SQL-Text.
+
+Aufrufer behalten das gewohnte Muster, nur der Connect-Aufruf aendert sich:
+
+    conn = db_pool.connect(DB_PATH)                 # Writer-Lease
+    conn = db_pool.connect(DB_PATH, readonly=True)  # Leser aus dem Pool
+    ...
+    conn.close()                                    # gibt die Lease zurueck
+
+``close()`` schliesst nicht, sondern rollt offene Transaktionen zurueck und
+gibt die Connection frei. Der Writer ist pro Thread reentrant (verschachtelte
+Aufrufe bekommen dieselbe Connection, auch mit readonly=True: wer die
+Writer-Lease haelt, wartet nie auf einen Leser aus dem Pool). MEMORY_DB_POOL_ENABLE=false schaltet
+auf den alten Pfad (eine frische Connection pro Aufruf) zurueck.
+"""
+
+import logging
+import os
+import sqlite3
+import threading
+from collections import OrderedDict, deque
+from pathlib import Path
+from typing import Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+_POOL_ENABLE = os.getenv("MEMORY_DB_POOL_ENABLE", "true").lower() == "true"
+_READ_POOL_SIZE = max(1, int(os.getenv("MEMORY_DB_READ_POOL_SIZE", "4")))
+_BUSY_TIMEOUT_MS = max(0, int(os.getenv("MEMORY_DB_BUSY_TIMEOUT_MS", "5000")))
+_MMAP_SIZE = max(0, int(os.getenv("MEMORY_DB_MMAP_SIZE", str(256 * 1024 * 1024))))
+_CACHE_SIZE_KB = max(0, int(os.getenv("MEMORY_DB_CACHE_SIZE_KB", "20000")))
+_CACHED_STATEMENTS = max(0, int(os.getenv("MEMORY_DB_CACHED_STATEMENTS", "256")))
+_MAX_DATABASES = 8
+
+
+class PooledConnection(sqlite3.Connection):
+    """sqlite3.Connection, deren close() die Lease zurueckgibt statt zu schliessen."""
+
+    _pool: Optional["_DatabasePool"] = None
+    _readonly: bool = False
+
+    def close(self) -> None:
+        pool = self._pool
+        if pool is None:
+            super().close()
+        elif self._readonly:
+            pool.release_reader(self)
+        else:
+            pool.release_writer(self)
+
+    def _close_for_real(self) -> None:
+        self._pool = None
+        super().close()
+
+
+def _apply_pragmas(conn: sqlite3.Connection, *, writer: bool) -> None:
+    conn.execute(f"PRAGMA busy_timeout={_BUSY_TIMEOUT_MS}")
+    conn.execute(f"PRAGMA cache_size=-{_CACHE_SIZE_KB}")
+    conn.execute(f"PRAGMA mmap_size={_MMAP_SIZE}")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    if writer:
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+
+
+def _file_id(db_path: str) -> Optional[tuple]:
+    try:
+        st = os.stat(db_path)
+    except OSError:
+        return None
+    return (st.st_dev, st.st_ino)
+
+
+def _reset(conn: sqlite3.Connection) -> None:
+    if conn.in_transaction:
+        conn.rollback()
+    conn.row_factory = None
+
+
+class _DatabasePool:
+    """Writer-Queue + Reader-Pool fuer genau eine Datenbank-Datei."""
+
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        self.file_id = _file_id(db_path)
+        self._cond = threading.Condition()
+        self._writer: Optional[PooledConnection] = None
+        self._writer_owner: Optional[int] = None
+        self._writer_depth = 0
+        self._nested_row_factories: List = []
+        self._waiters: deque = deque()
+        self._idle_readers: List[PooledConnection] = []
+        self._open_readers = 0
+        self._closed = False
+        self._stats = {
+            "write_leases": 0,
+            "write_waits": 0,
+            "read_leases": 0,
+            "read_fallbacks": 0,
+            "reads_on_writer": 0,
+        }
+
+    # ── Writer ───────────────────────────────────────────────
+    def _open_writer(self) -> PooledConnection:
+        conn = sqlite3.connect(
+            self.db_path,
+            factory=PooledConnection,
+            check_same_thread=False,
+            cached_statements=_CACHED_STATEMENTS,
+        )
+        _apply_pragmas(conn, writer=True)
+        conn._pool = self
+        return conn
+
+    def _enter_nested(self) -> PooledConnection:
+        """Verschachtelte Lease des eigenen Writers (unter self._cond)."""
+        self._writer_depth += 1
+        self._nested_row_factories.append(self._writer.row_factory)
+        return self._writer
+
+    def acquire_writer(self) -> PooledConnection:
+        me = threading.get_ident()
+        with self._cond:
+            if self._writer_owner == me:
+                return self._enter_nested()
+            ticket = object()
+            self._waiters.append(ticket)
+            if self._writer_owner is not None:
+                self._stats["write_waits"] += 1
+            while self._writer_owner is not None or self._waiters[0] is not ticket:
+                self._cond.wait()
+            self._waiters.popleft()
+            self._writer_owner = me
+            self._writer_depth = 1
+            self._stats["write_leases"] += 1
+            try:
+                if self._writer is None:
+                    self._writer = self._open_writer()
+                    if self.file_id is None:
+                        self.file_id = _file_id(self.db_path)
+            except Exception:
+                self._writer_owner = None
+                self._writer_depth = 0
+                self._cond.notify_all()
+                raise
+            return self._writer
+
+    def release_writer(self, conn: PooledConnection) -> None:
+        with self._cond:
+            if self._writer_owner != threading.get_ident() or conn is not self._writer:
+                return
+            self._writer_depth -= 1
+            if self._writer_depth > 0:
+                # aeussere Lease behaelt ihre row_factory
+                conn.row_factory = self._nested_row_factories.pop()
+                return
+            try:
+                _reset(conn)
+            except sqlite3.Error as e:
+                logger.warning(f"[DbPool] Writer reset failed, reopening: {e}")
+                self._writer = None
+                conn._close_for_real()
+            if self._closed and self._writer is not None:
+                self._writer._close_for_real()
+                self._writer = None
+            self._writer_owner = None
+            self._cond.notify_all()
+
+    # ── Reader ───────────────────────────────────────────────
+    def _open_reader(self) -> PooledConnection:
+        uri = Path(self.db_path).absolute().as_uri() + "?mode=ro"
+        conn = sqlite3.connect(
+            uri,
+            uri=True,
+            factory=PooledConnection,
+            check_same_thread=False,
+            cached_statements=_CACHED_STATEMENTS,
+        )
+        _apply_pragmas(conn, writer=False)
+        conn._pool = self
+        conn._readonly = True
+        return conn
+
+    def acquire_reader(self) -> PooledConnection:
+        with self._cond:
+            if self._writer_owner == threading.get_ident():
+                # Kein Leser unter der Writer-Lease: ein erschoepfter Pool wuerde
+                # den Write-Lock blockieren. Der Writer sieht zudem eigene Writes.
+                self._stats["reads_on_writer"] += 1
+                return self._enter_nested()
+            while not self._idle_readers and self._open_readers >= _READ_POOL_SIZE:
+                self._cond.wait()
+            self._stats["read_leases"] += 1
+            if self._idle_readers:
+                return self._idle_readers.pop()
+            self._open_readers += 1
+            warm = self._writer is None
+        try:
+            if warm:
+                # Writer zuerst: setzt journal_mode=WAL und legt -wal/-shm an
+                self.release_writer(self.acquire_writer())
+            return self._open_reader()
+        except sqlite3.Error:
+            with self._cond:
+                self._open_readers -= 1
+                self._stats["read_fallbacks"] += 1
+                self._cond.notify_all()
+            # Datei existiert noch nicht / nicht lesbar → Writer-Lease
+            return self.acquire_writer()
+
+    def release_reader(self, conn: PooledConnection) -> None:
+        try:
+            _reset(conn)
+            healthy = True
+        except sqlite3.Error:
+            healthy = False
+        with self._cond:
+            if healthy and not self._closed:
+                self._idle_readers.append(conn)
+            else:
+                self._open_readers -= 1
+                conn._close_for_real()
+            self._cond.notify_all()
+
+    # ── Lifecycle ────────────────────────────────────────────
+    def close(self) -> None:
+        with self._cond:
+            self._closed = True
+            for conn in self._idle_readers:
+                conn._close_for_real()
+            self._open_readers -= len(self._idle_readers)
+            self._idle_readers = []
+            if self._writer is not None and self._writer_owner is None:
+                self._writer._close_for_real()
+                self._writer = None
+
+    def stats(self) -> Dict[str, int]:
+        with self._cond:
+            out = dict(self._stats)
+            out["open_readers"] = self._open_readers
+            out["idle_readers"] = len(self._idle_readers)
+            out["writer_open"] = int(self._writer is not None)
+        return out
+
+
+_POOLS: "OrderedDict[str, _DatabasePool]" = OrderedDict()
+_POOLS_LOCK = threading.Lock()
+
+
+def _pool_for(db_path: str) -> _DatabasePool:
+    key = os.path.abspath(str(db_path))
+    with _POOLS_LOCK:
+        pool = _POOLS.get(key)
+        if pool is not None and pool.file_id is not None and _file_id(key) != pool.file_id:
+            # Datei wurde geloescht/ersetzt → alte Handles zeigen ins Leere
+            _POOLS.pop(key)
+            pool.close()
+            pool = None
+        if pool is None:
+            pool = _DatabasePool(key)
+            _POOLS[key] = pool
+            while len(_POOLS) > _MAX_DATABASES:
+                _, evicted = _POOLS.popitem(last=False)
+                evicted.close()
+        else:
+            _POOLS.move_to_end(key)
+        return pool
+
+
+def connect(db_path: str, *, readonly: bool = False) -> sqlite3.Connection:
+    """
+    Connection fuer `db_path` leihen. readonly=True nur fuer reine SELECT-Pfade.
+    Aufrufer muessen close() aufrufen (try/finally), sonst bleibt die Lease belegt.
+    """
+    if not _POOL_ENABLE:
+        return sqlite3.connect(db_path)
+    pool = _pool_for(db_path)
+    return pool.acquire_reader() if readonly else pool.acquire_writer()
+
+
+def get_pool_stats(db_path: str) -> Dict[str, int]:
+    return _pool_for(db_path).stats()
+
+
+def close_all() -> None:
+    """Alle Pools schliessen (Shutdown, Tests, memory_reset)."""
+    with _POOLS_LOCK:
+        pools = list(_POOLS.values())
+        _POOLS.clear()
+    for pool in pools:
+        pool.close()
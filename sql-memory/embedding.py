@@ -16,6 +16,7 @@ import os
 import hashlib
 import time
 import threading
+import numpy as np
 import requests
 from typing import List, Optional, Dict, Any
 import logging
@@ -590,20 +591,25 @@ def cosine_similarity(vec1: List[float], vec2: List[float]) -> float:
     """
     Berechnet Cosine Similarity zwischen zwei Vektoren.
 
+    Skalarer Kompat-Helper (Mirror von utils/embedding/similarity.py, inlined
+    weil sql-memory in einem eigenen Container laeuft). Fuer viele Vektoren
+    den Matrix-Pfad in vector_index.py nutzen.
+
     Returns:
         Wert zwischen -1 und 1 (1 = identisch, 0 = orthogonal)
     """
-    if not vec1 or not vec2 or len(vec1) != len(vec2):
+    if vec1 is None or vec2 is None or len(vec1) == 0 or len(vec1) != len(vec2):
         return 0.0
 
-    dot_product = sum(a * b for a, b in zip(vec1, vec2))
-    norm1 = sum(a * a for a in vec1) ** 0.5
-    norm2 = sum(b * b for b in vec2) ** 0.5
+    a = np.asarray(vec1, dtype=np.float64)
+    b = np.asarray(vec2, dtype=np.float64)
+    norm1 = float(np.linalg.norm(a))
+    norm2 = float(np.linalg.norm(b))
 
     if norm1 == 0 or norm2 == 0:
         return 0.0
 
-    return dot_product / (norm1 * norm2)
+    return float(np.dot(a, b) / (norm1 * norm2))
 
 
 # Prime runtime config once at import time so request-path deadlocks/timeouts
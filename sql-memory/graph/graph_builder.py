@@ -4,13 +4,15 @@ Graph Builder - Erstellt automatisch Kanten beim Speichern.
 """
 
 import logging
-from typing import List, Optional
+import os
+from typing import Dict, List, Optional
 from .graph_store import get_graph_store
 
 logger = logging.getLogger(__name__)
 
 # Similarity Thresholds
 SEMANTIC_THRESHOLD = 0.70
+SEMANTIC_TOP_K = int(os.getenv("GRAPH_SEMANTIC_TOP_K", "100"))
 COOCCUR_WEIGHT = 0.2
 
 
@@ -22,7 +24,8 @@ def build_node_with_edges(
     conversation_id: str = None,
     related_keys: List[str] = None,
     weight_boost: float = 0.0,
-    confidence: float = 0.5
+    confidence: float = 0.5,
+    embedding_id: int = None
 ) -> int:
     """
     Erstellt einen Node UND automatisch passende Edges.
@@ -35,6 +38,7 @@ def build_node_with_edges(
     Args:
         weight_boost: Added to edge weights (for workspace-promoted nodes)
         confidence: Node confidence score (0.5=auto, 0.9=workspace)
+        embedding_id: ID der zugehörigen embeddings-Zeile (Seed-Lookup per ID)
     """
     gs = get_graph_store()
 
@@ -48,7 +52,8 @@ def build_node_with_edges(
         source_id=source_id,
         embedding=embedding,
         conversation_id=conversation_id,
-        confidence=confidence
+        confidence=confidence,
+        embedding_id=embedding_id
     )
 
     logger.info(f"[GraphBuilder] Created node {node_id}")
@@ -80,48 +85,16 @@ def _create_semantic_edges(
     embedding: List[float],
     conversation_id: str = None
 ):
-    """Erstellt Semantic Edges zu ähnlichen Nodes."""
-    from embedding import cosine_similarity
-    import json
-    
+    """Erstellt Semantic Edges zu den ähnlichsten Nodes (k-NN über alle Nodes)."""
     gs = get_graph_store()
-    
-    # Alle Nodes mit Embeddings holen (außer der aktuelle)
-    import sqlite3
-    from memory_mcp.config import DB_PATH
-    
-    conn = sqlite3.connect(DB_PATH)
-    cursor = conn.cursor()
-    
-    cursor.execute("""
-        SELECT id, embedding FROM graph_nodes
-        WHERE embedding IS NOT NULL AND id != ?
-        ORDER BY id DESC
-        LIMIT 100
-    """, (node_id,))
-    
-    rows = cursor.fetchall()
-    conn.close()
-    
-    for row in rows:
-        other_id, other_emb_json = row
-        if not other_emb_json:
-            continue
-        
-        try:
-            other_embedding = json.loads(other_emb_json)
-            similarity = cosine_similarity(embedding, other_embedding)
-            
-            if similarity >= SEMANTIC_THRESHOLD:
-                gs.add_edge(
-                    src_node_id=node_id,
-                    dst_node_id=other_id,
-                    edge_type="semantic",
-                    weight=similarity
-                )
-                logger.info(f"[GraphBuilder] Semantic edge: {node_id} → {other_id} (sim={similarity:.3f})")
-        except:
-            continue
+    hits = gs.find_similar_nodes(
+        {node_id: embedding},
+        limit=SEMANTIC_TOP_K,
+        min_similarity=SEMANTIC_THRESHOLD,
+    ).get(node_id, [])
+    gs.upsert_edges([(node_id, other_id, "semantic", sim) for other_id, sim in hits])
+    for other_id, sim in hits:
+        logger.info(f"[GraphBuilder] Semantic edge: {node_id} → {other_id} (sim={sim:.3f})")
 
 
 def _create_cooccur_edges(
@@ -131,30 +104,55 @@ def _create_cooccur_edges(
 ):
     """Erstellt Co-Occurrence Edges zwischen verwandten Keys."""
     gs = get_graph_store()
-    
-    # Finde Nodes die zu den related_keys gehören
-    import sqlite3
-    from memory_mcp.config import DB_PATH
-    
-    conn = sqlite3.connect(DB_PATH)
-    cursor = conn.cursor()
-    
-    for key in related_keys:
-        cursor.execute("""
-            SELECT id FROM graph_nodes
-            WHERE content LIKE ? AND id != ?
-            LIMIT 5
-        """, (f"%{key}%", node_id))
-        
-        rows = cursor.fetchall()
-        for row in rows:
-            other_id = row[0]
-            gs.add_edge(
-                src_node_id=node_id,
-                dst_node_id=other_id,
-                edge_type="cooccur",
-                weight=COOCCUR_WEIGHT
-            )
-            logger.info(f"[GraphBuilder] Cooccur edge: {node_id} → {other_id}")
-    
-    conn.close()
\ No newline at end of file
+
+    # Finde Nodes die zu den related_keys gehören (Trigram-FTS statt LIKE-Scan)
+    matches = gs.find_nodes_containing(related_keys, exclude_id=node_id, limit=5)
+    edges = [
+        (node_id, other_id, "cooccur", COOCCUR_WEIGHT)
+        for key in related_keys
+        for other_id in matches.get(key, [])
+    ]
+    gs.upsert_edges(edges)
+    for _, other_id, _, _ in edges:
+        logger.info(f"[GraphBuilder] Cooccur edge: {node_id} → {other_id}")
+
+
+def rebuild_semantic_edges(
+    chunk_size: int = 256,
+    start_after_id: int = 0,
+    max_nodes: Optional[int] = None,
+    threshold: float = SEMANTIC_THRESHOLD,
+    top_k: int = SEMANTIC_TOP_K,
+) -> Dict[str, int]:
+    """
+    Offline-Neuaufbau aller Semantic Edges in Chunks.
+
+    Pro Chunk: Batch-k-NN gegen ältere Nodes (wie beim inkrementellen
+    Aufbau, Kante neu → alt), danach werden die Semantic Edges der
+    Chunk-Nodes in einer Transaktion ersetzt. Resume-fähig über
+    `start_after_id` (= `last_node_id` des vorigen Laufs).
+    """
+    gs = get_graph_store()
+    stats = {"processed": 0, "edges": 0, "last_node_id": int(start_after_id or 0)}
+    chunk_size = max(1, int(chunk_size))
+    while max_nodes is None or stats["processed"] < max_nodes:
+        take = chunk_size if max_nodes is None else min(chunk_size, max_nodes - stats["processed"])
+        chunk = gs.get_node_embeddings_after(stats["last_node_id"], take)
+        if not chunk:
+            break
+        vectors = {node_id: vec for node_id, vec in chunk if vec is not None}
+        hits = gs.find_similar_nodes(vectors, limit=top_k, min_similarity=threshold, older_only=True)
+        edges = [
+            (node_id, other_id, "semantic", sim)
+            for node_id, found in hits.items()
+            for other_id, sim in found
+        ]
+        gs.replace_edges("semantic", [node_id for node_id, _ in chunk], edges)
+        stats["processed"] += len(chunk)
+        stats["edges"] += len(edges)
+        stats["last_node_id"] = chunk[-1][0]
+        logger.info(
+            f"[GraphBuilder] Semantic rebuild: {stats['processed']} nodes, "
+            f"{stats['edges']} edges (last id {stats['last_node_id']})"
+        )
+    return stats
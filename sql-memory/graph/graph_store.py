@@ -10,83 +10,201 @@ Graph Store - Speichert Nodes und Edges in SQLite.
 import sqlite3
 import json
 import logging
+import threading
 from typing import List, Dict, Any, Optional
 from datetime import datetime
 
+import db_pool
+
+from .node_index import GraphNodeIndex
+
 logger = logging.getLogger(__name__)
 
+# graph_meta-Key: höchste graph_nodes.id, die der Embedding-Link-Backfill geprüft hat
+_EMBEDDING_LINK_WATERMARK = "embedding_link_checked_id"
+
 
 class GraphStore:
     """SQLite-basierter Graph Store."""
     
     def __init__(self, db_path: str):
         self.db_path = db_path
+        self._node_index: Optional[GraphNodeIndex] = None
+        self._fts = False
         self._init_tables()
     
     def _init_tables(self):
         """Erstellt die Graph-Tabellen falls nicht vorhanden."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        conn = db_pool.connect(self.db_path)
+        try:
+            cursor = conn.cursor()
         
-        # Nodes Tabelle
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS graph_nodes (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                source_type TEXT NOT NULL,
-                source_id INTEGER,
-                content TEXT NOT NULL,
-                embedding BLOB,
-                conversation_id TEXT,
-                confidence REAL DEFAULT 0.5,
-                created_at TEXT DEFAULT CURRENT_TIMESTAMP
-            )
-        """)
+            # Nodes Tabelle
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS graph_nodes (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    source_type TEXT NOT NULL,
+                    source_id INTEGER,
+                    content TEXT NOT NULL,
+                    embedding BLOB,
+                    conversation_id TEXT,
+                    confidence REAL DEFAULT 0.5,
+                    created_at TEXT DEFAULT CURRENT_TIMESTAMP
+                )
+            """)
 
-        # Migration: add confidence if table existed before
-        cursor.execute("PRAGMA table_info(graph_nodes)")
-        columns = [row[1] for row in cursor.fetchall()]
-        if "confidence" not in columns:
-            cursor.execute("ALTER TABLE graph_nodes ADD COLUMN confidence REAL DEFAULT 0.5")
+            # Migration: add confidence if table existed before
+            cursor.execute("PRAGMA table_info(graph_nodes)")
+            columns = [row[1] for row in cursor.fetchall()]
+            if "confidence" not in columns:
+                cursor.execute("ALTER TABLE graph_nodes ADD COLUMN confidence REAL DEFAULT 0.5")
+            # Migration: Link zur embeddings-Zeile (Seed-Auflösung per ID statt Textvergleich)
+            if "embedding_id" not in columns:
+                cursor.execute("ALTER TABLE graph_nodes ADD COLUMN embedding_id INTEGER")
+
+            # Migrations-Watermarks (z. B. Embedding-Link-Backfill)
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS graph_meta (
+                    key TEXT PRIMARY KEY,
+                    value TEXT
+                )
+            """)
         
-        # Edges Tabelle
+            # Edges Tabelle
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS graph_edges (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    src_node_id INTEGER NOT NULL,
+                    dst_node_id INTEGER NOT NULL,
+                    edge_type TEXT NOT NULL,
+                    weight REAL DEFAULT 1.0,
+                    created_at TEXT DEFAULT CURRENT_TIMESTAMP,
+                    FOREIGN KEY (src_node_id) REFERENCES graph_nodes(id),
+                    FOREIGN KEY (dst_node_id) REFERENCES graph_nodes(id)
+                )
+            """)
+        
+            # Indices
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_nodes_source 
+                ON graph_nodes(source_type, source_id)
+            """)
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_nodes_conv 
+                ON graph_nodes(conversation_id)
+            """)
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_nodes_embedding
+                ON graph_nodes(embedding_id)
+            """)
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_edges_src 
+                ON graph_edges(src_node_id)
+            """)
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_edges_dst 
+                ON graph_edges(dst_node_id)
+            """)
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_edges_type 
+                ON graph_edges(edge_type)
+            """)
+            self._ensure_edge_key(cursor)
+            self._fts = self._ensure_content_fts(cursor)
+        
+            conn.commit()
+        finally:
+            conn.close()
+        logger.info("[GraphStore] Tables initialized")
+
+    @staticmethod
+    def _ensure_edge_key(cursor) -> None:
+        """
+        Eindeutiger Key (src, dst, type) fuer Bulk-Upserts per ON CONFLICT.
+        Alt-Duplikate werden vorher in die aelteste Zeile zusammengefasst
+        (mit dem staerksten Gewicht der Gruppe) und der Rest geloescht.
+        """
+        cursor.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'index' AND name = 'idx_edges_key'"
+        )
+        if cursor.fetchone():
+            return
         cursor.execute("""
-            CREATE TABLE IF NOT EXISTS graph_edges (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                src_node_id INTEGER NOT NULL,
-                dst_node_id INTEGER NOT NULL,
-                edge_type TEXT NOT NULL,
-                weight REAL DEFAULT 1.0,
-                created_at TEXT DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY (src_node_id) REFERENCES graph_nodes(id),
-                FOREIGN KEY (dst_node_id) REFERENCES graph_nodes(id)
+            UPDATE graph_edges SET weight = (
+                SELECT MAX(dup.weight) FROM graph_edges dup
+                WHERE dup.src_node_id = graph_edges.src_node_id
+                  AND dup.dst_node_id = graph_edges.dst_node_id
+                  AND dup.edge_type = graph_edges.edge_type
+            )
+            WHERE id IN (
+                SELECT MIN(id) FROM graph_edges
+                GROUP BY src_node_id, dst_node_id, edge_type
+                HAVING COUNT(*) > 1
             )
         """)
-        
-        # Indices
         cursor.execute("""
-            CREATE INDEX IF NOT EXISTS idx_nodes_source 
-            ON graph_nodes(source_type, source_id)
+            DELETE FROM graph_edges WHERE id NOT IN (
+                SELECT MIN(id) FROM graph_edges
+                GROUP BY src_node_id, dst_node_id, edge_type
+            )
         """)
+        if cursor.rowcount > 0:
+            logger.info(
+                f"[GraphStore] Edge key migration: merged {cursor.rowcount} duplicate edges"
+            )
         cursor.execute("""
-            CREATE INDEX IF NOT EXISTS idx_nodes_conv 
-            ON graph_nodes(conversation_id)
+            CREATE UNIQUE INDEX idx_edges_key
+            ON graph_edges(src_node_id, dst_node_id, edge_type)
         """)
+
+    @staticmethod
+    def _ensure_content_fts(cursor) -> bool:
+        """
+        Trigram-FTS ueber graph_nodes.content: `content LIKE '%key%'` laeuft
+        damit ueber den Index statt als Full-Scan. False, wenn SQLite kein
+        FTS5/trigram kann (dann bleibt der LIKE-Scan auf graph_nodes).
+        """
+        cursor.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'graph_nodes_fts'"
+        )
+        if cursor.fetchone():
+            return True
+        try:
+            cursor.execute("""
+                CREATE VIRTUAL TABLE graph_nodes_fts USING fts5(
+                    content, content='graph_nodes', content_rowid='id', tokenize='trigram'
+                )
+            """)
+        except sqlite3.OperationalError as e:
+            logger.warning(f"[GraphStore] Content FTS unavailable, using LIKE scan: {e}")
+            return False
         cursor.execute("""
-            CREATE INDEX IF NOT EXISTS idx_edges_src 
-            ON graph_edges(src_node_id)
+            CREATE TRIGGER IF NOT EXISTS graph_nodes_fts_ai AFTER INSERT ON graph_nodes BEGIN
+                INSERT INTO graph_nodes_fts(rowid, content) VALUES (new.id, new.content);
+            END
         """)
         cursor.execute("""
-            CREATE INDEX IF NOT EXISTS idx_edges_dst 
-            ON graph_edges(dst_node_id)
+            CREATE TRIGGER IF NOT EXISTS graph_nodes_fts_ad AFTER DELETE ON graph_nodes BEGIN
+                INSERT INTO graph_nodes_fts(graph_nodes_fts, rowid, content)
+                VALUES ('delete', old.id, old.content);
+            END
         """)
         cursor.execute("""
-            CREATE INDEX IF NOT EXISTS idx_edges_type 
-            ON graph_edges(edge_type)
+            CREATE TRIGGER IF NOT EXISTS graph_nodes_fts_au AFTER UPDATE OF content ON graph_nodes BEGIN
+                INSERT INTO graph_nodes_fts(graph_nodes_fts, rowid, content)
+                VALUES ('delete', old.id, old.content);
+                INSERT INTO graph_nodes_fts(rowid, content) VALUES (new.id, new.content);
+            END
         """)
-        
-        conn.commit()
-        conn.close()
-        logger.info("[GraphStore] Tables initialized")
+        cursor.execute("INSERT INTO graph_nodes_fts(graph_nodes_fts) VALUES ('rebuild')")
+        return True
+
+    @property
+    def node_index(self) -> GraphNodeIndex:
+        """k-NN-Index ueber graph_nodes.embedding (lazy, pro GraphStore)."""
+        if self._node_index is None:
+            self._node_index = GraphNodeIndex()
+        return self._node_index
     
     # ══════════════════════════════════════════════════════════
     # NODE OPERATIONS
@@ -99,62 +217,73 @@ class GraphStore:
         source_id: int = None,
         embedding: List[float] = None,
         conversation_id: str = None,
-        confidence: float = 0.5
+        confidence: float = 0.5,
+        embedding_id: int = None
     ) -> int:
-        """Fügt einen Node hinzu."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        """Fügt einen Node hinzu. `embedding_id` verlinkt die embeddings-Zeile."""
+        conn = db_pool.connect(self.db_path)
+        try:
+            cursor = conn.cursor()
 
-        # Check if confidence column exists (migration may not have run yet)
-        cursor.execute("PRAGMA table_info(graph_nodes)")
-        columns = [row[1] for row in cursor.fetchall()]
-        has_confidence = "confidence" in columns
+            # Check if confidence column exists (migration may not have run yet)
+            cursor.execute("PRAGMA table_info(graph_nodes)")
+            columns = [row[1] for row in cursor.fetchall()]
+            has_confidence = "confidence" in columns
 
-        if has_confidence:
-            cursor.execute("""
-                INSERT INTO graph_nodes
-                (source_type, source_id, content, embedding, conversation_id, confidence)
-                VALUES (?, ?, ?, ?, ?, ?)
-            """, (
-                source_type,
-                source_id,
-                content,
-                json.dumps(embedding) if embedding else None,
-                conversation_id,
-                confidence
-            ))
-        else:
-            cursor.execute("""
-                INSERT INTO graph_nodes
-                (source_type, source_id, content, embedding, conversation_id)
-                VALUES (?, ?, ?, ?, ?)
-            """, (
-                source_type,
-                source_id,
-                content,
-                json.dumps(embedding) if embedding else None,
-                conversation_id
-            ))
-        
-        conn.commit()
-        node_id = cursor.lastrowid
-        conn.close()
+            if has_confidence:
+                cursor.execute("""
+                    INSERT INTO graph_nodes
+                    (source_type, source_id, content, embedding, conversation_id, confidence)
+                    VALUES (?, ?, ?, ?, ?, ?)
+                """, (
+                    source_type,
+                    source_id,
+                    content,
+                    json.dumps(embedding) if embedding else None,
+                    conversation_id,
+                    confidence
+                ))
+            else:
+                cursor.execute("""
+                    INSERT INTO graph_nodes
+                    (source_type, source_id, content, embedding, conversation_id)
+                    VALUES (?, ?, ?, ?, ?)
+                """, (
+                    source_type,
+                    source_id,
+                    content,
+                    json.dumps(embedding) if embedding else None,
+                    conversation_id
+                ))
+            node_id = cursor.lastrowid
+
+            if embedding_id is not None and "embedding_id" in columns:
+                cursor.execute(
+                    "UPDATE graph_nodes SET embedding_id = ? WHERE id = ?",
+                    (embedding_id, node_id),
+                )
+
+            conn.commit()
+        finally:
+            conn.close()
         
         logger.info(f"[GraphStore] Added node {node_id}: {source_type}")
         return node_id
     
     def get_node(self, node_id: int) -> Optional[Dict]:
         """Holt einen Node by ID."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        conn = db_pool.connect(self.db_path, readonly=True)
+        try:
+            cursor = conn.cursor()
 
-        cursor.execute("""
-            SELECT id, source_type, source_id, content, embedding, conversation_id, created_at, confidence
-            FROM graph_nodes WHERE id = ?
-        """, (node_id,))
+            cursor.execute("""
+                SELECT id, source_type, source_id, content, embedding, conversation_id, created_at, confidence
+                FROM graph_nodes WHERE id = ?
+            """, (node_id,))
 
-        row = cursor.fetchone()
-        conn.close()
+            row = cursor.fetchone()
+        finally:
+            conn.close()
 
         if row:
             return {
@@ -171,19 +300,21 @@ class GraphStore:
     
     def get_last_node(self, conversation_id: str) -> Optional[Dict]:
         """Holt den letzten Node einer Conversation."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        conn = db_pool.connect(self.db_path, readonly=True)
+        try:
+            cursor = conn.cursor()
         
-        cursor.execute("""
-            SELECT id, source_type, source_id, content, embedding, conversation_id, created_at
-            FROM graph_nodes 
-            WHERE conversation_id = ?
-            ORDER BY id DESC
-            LIMIT 1
-        """, (conversation_id,))
+            cursor.execute("""
+                SELECT id, source_type, source_id, content, embedding, conversation_id, created_at
+                FROM graph_nodes 
+                WHERE conversation_id = ?
+                ORDER BY id DESC
+                LIMIT 1
+            """, (conversation_id,))
         
-        row = cursor.fetchone()
-        conn.close()
+            row = cursor.fetchone()
+        finally:
+            conn.close()
         
         if row:
             return {
@@ -199,19 +330,21 @@ class GraphStore:
     
     def get_nodes_by_type(self, source_type: str, limit: int = 100) -> List[Dict]:
         """Holt alle Nodes eines Typs."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        conn = db_pool.connect(self.db_path, readonly=True)
+        try:
+            cursor = conn.cursor()
         
-        cursor.execute("""
-            SELECT id, source_type, source_id, content, embedding, conversation_id, created_at
-            FROM graph_nodes 
-            WHERE source_type = ?
-            ORDER BY id DESC
-            LIMIT ?
-        """, (source_type, limit))
+            cursor.execute("""
+                SELECT id, source_type, source_id, content, embedding, conversation_id, created_at
+                FROM graph_nodes 
+                WHERE source_type = ?
+                ORDER BY id DESC
+                LIMIT ?
+            """, (source_type, limit))
         
-        rows = cursor.fetchall()
-        conn.close()
+            rows = cursor.fetchall()
+        finally:
+            conn.close()
         
         return [{
             "id": row[0],
@@ -223,6 +356,195 @@ class GraphStore:
             "created_at": row[6]
         } for row in rows]
     
+    def link_embedding(self, node_id: int, embedding_id: int) -> None:
+        """Verlinkt einen bestehenden Node mit seiner embeddings-Zeile."""
+        conn = db_pool.connect(self.db_path)
+        try:
+            conn.execute(
+                "UPDATE graph_nodes SET embedding_id = ? WHERE id = ?",
+                (embedding_id, node_id),
+            )
+            conn.commit()
+        finally:
+            conn.close()
+
+    def get_node_ids_for_embeddings(self, embedding_ids: List[int]) -> Dict[int, int]:
+        """
+        embedding_id → node_id (jüngster Node) in einer Query über
+        idx_nodes_embedding. Nicht verlinkte IDs fehlen im Ergebnis.
+        """
+        ids = [int(i) for i in dict.fromkeys(embedding_ids or []) if i is not None]
+        if not ids:
+            return {}
+        out: Dict[int, int] = {}
+        conn = db_pool.connect(self.db_path, readonly=True)
+        try:
+            cursor = conn.cursor()
+            for chunk in self._chunks(ids):
+                marks = ",".join("?" * len(chunk))
+                cursor.execute(f"""
+                    SELECT embedding_id, MAX(id) FROM graph_nodes
+                    WHERE embedding_id IN ({marks})
+                    GROUP BY embedding_id
+                """, chunk)
+                out.update({row[0]: row[1] for row in cursor.fetchall()})
+        finally:
+            conn.close()
+        return out
+
+    def get_node_ids_by_content(self, contents: List[str]) -> Dict[str, int]:
+        """
+        Legacy-Fallback für Nodes ohne embedding_id: exakter Content-Match,
+        eine Query für alle Inhalte. content → node_id (jüngster Node).
+        """
+        texts = [c for c in dict.fromkeys(contents or []) if c]
+        if not texts:
+            return {}
+        out: Dict[str, int] = {}
+        conn = db_pool.connect(self.db_path, readonly=True)
+        try:
+            cursor = conn.cursor()
+            for chunk in self._chunks(texts):
+                marks = ",".join("?" * len(chunk))
+                cursor.execute(f"""
+                    SELECT content, MAX(id) FROM graph_nodes
+                    WHERE content IN ({marks})
+                    GROUP BY content
+                """, chunk)
+                out.update({row[0]: row[1] for row in cursor.fetchall()})
+        finally:
+            conn.close()
+        return out
+
+    def get_node_vectors(self, node_ids: List[int]) -> Dict[int, List[float]]:
+        """
+        node_id → Vektor: eigenes graph_nodes.embedding, sonst der verlinkte
+        float32-BLOB aus embeddings. Eine Query pro Chunk.
+        """
+        from vector_index import unpack_embedding
+
+        ids = [int(i) for i in dict.fromkeys(node_ids or [])]
+        out: Dict[int, List[float]] = {}
+        if not ids:
+            return out
+        conn = db_pool.connect(self.db_path, readonly=True)
+        try:
+            cursor = conn.cursor()
+            cursor.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'embeddings'"
+            )
+            has_embeddings = cursor.fetchone() is not None
+            for chunk in self._chunks(ids):
+                marks = ",".join("?" * len(chunk))
+                if has_embeddings:
+                    cursor.execute(f"""
+                        SELECT n.id, n.embedding, e.embedding
+                        FROM graph_nodes n
+                        LEFT JOIN embeddings e ON e.id = n.embedding_id
+                        WHERE n.id IN ({marks})
+                    """, chunk)
+                else:
+                    cursor.execute(f"""
+                        SELECT id, embedding, NULL FROM graph_nodes WHERE id IN ({marks})
+                    """, chunk)
+                for node_id, own, linked in cursor.fetchall():
+                    vec = None
+                    if own:
+                        try:
+                            vec = json.loads(own)
+                        except (TypeError, ValueError):
+                            vec = None
+                    if not vec and linked is not None:
+                        arr = unpack_embedding(linked)
+                        vec = arr.tolist() if arr is not None else None
+                    if vec:
+                        out[node_id] = vec
+        finally:
+            conn.close()
+        return out
+
+    def backfill_embedding_links(self, batch_size: int = 1000) -> int:
+        """
+        Verlinkt Alt-Nodes ohne embedding_id mit der jüngsten embeddings-Zeile
+        gleichen Inhalts. Geprüfte Nodes landen hinter einem Watermark in
+        graph_meta (auch ohne Treffer) — ein Neustart prüft nur neuere Nodes.
+        Resume-fähig; gibt die Zahl verlinkter Nodes zurück.
+        """
+        conn = db_pool.connect(self.db_path)
+        try:
+            cursor = conn.cursor()
+            cursor.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'embeddings'"
+            )
+            if cursor.fetchone() is None:
+                return 0
+            cursor.execute(
+                "SELECT value FROM graph_meta WHERE key = ?", (_EMBEDDING_LINK_WATERMARK,)
+            )
+            row = cursor.fetchone()
+            checked = int(row[0]) if row else 0
+            cursor.execute(
+                "SELECT id, content FROM graph_nodes "
+                "WHERE embedding_id IS NULL AND id > ? ORDER BY id",
+                (checked,),
+            )
+            pending = cursor.fetchall()
+            linked = 0
+            for i in range(0, len(pending), max(1, batch_size)):
+                batch = pending[i:i + batch_size]
+                texts = list({content for _, content in batch if content})
+                if not texts:
+                    self._set_link_watermark(cursor, batch[-1][0])
+                    conn.commit()
+                    continue
+                marks = ",".join("?" * len(texts))
+                cursor.execute(f"""
+                    SELECT content, MAX(id) FROM embeddings
+                    WHERE content IN ({marks})
+                    GROUP BY content
+                """, texts)
+                by_content = {row[0]: row[1] for row in cursor.fetchall()}
+                updates = [
+                    (by_content[content], node_id)
+                    for node_id, content in batch
+                    if content in by_content
+                ]
+                if updates:
+                    cursor.executemany(
+                        "UPDATE graph_nodes SET embedding_id = ? WHERE id = ?", updates
+                    )
+                    linked += len(updates)
+                self._set_link_watermark(cursor, batch[-1][0])
+                conn.commit()
+        finally:
+            conn.close()
+        if linked:
+            logger.info(f"[GraphStore] Linked {linked} legacy nodes to embeddings")
+        return linked
+
+    @staticmethod
+    def _set_link_watermark(cursor, node_id: int) -> None:
+        cursor.execute("""
+            INSERT INTO graph_meta (key, value) VALUES (?, ?)
+            ON CONFLICT(key) DO UPDATE SET value = excluded.value
+        """, (_EMBEDDING_LINK_WATERMARK, str(int(node_id))))
+
+    def start_embedding_link_backfill(self) -> threading.Thread:
+        """Startet backfill_embedding_links() im Hintergrund (Daemon-Thread)."""
+        def _run():
+            try:
+                self.backfill_embedding_links()
+            except Exception as e:
+                logger.warning(f"[GraphStore] Embedding link backfill skipped: {e}")
+
+        thread = threading.Thread(
+            target=_run,
+            daemon=True,
+            name="graph-embedding-link-backfill",
+        )
+        thread.start()
+        return thread
+
     # ══════════════════════════════════════════════════════════
     # EDGE OPERATIONS
     # ══════════════════════════════════════════════════════════
@@ -235,37 +557,38 @@ class GraphStore:
         weight: float = 1.0
     ) -> int:
         """Fügt eine Edge hinzu."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        conn = db_pool.connect(self.db_path)
+        try:
+            cursor = conn.cursor()
         
-        # Check ob Edge schon existiert
-        cursor.execute("""
-            SELECT id, weight FROM graph_edges
-            WHERE src_node_id = ? AND dst_node_id = ? AND edge_type = ?
-        """, (src_node_id, dst_node_id, edge_type))
+            # Check ob Edge schon existiert
+            cursor.execute("""
+                SELECT id, weight FROM graph_edges
+                WHERE src_node_id = ? AND dst_node_id = ? AND edge_type = ?
+            """, (src_node_id, dst_node_id, edge_type))
+        
+            existing = cursor.fetchone()
         
-        existing = cursor.fetchone()
+            if existing:
+                # Update weight (akkumulieren)
+                new_weight = min(existing[1] + weight, 1.0)
+                cursor.execute("""
+                    UPDATE graph_edges SET weight = ? WHERE id = ?
+                """, (new_weight, existing[0]))
+                conn.commit()
+                logger.info(f"[GraphStore] Updated edge {existing[0]}: weight={new_weight}")
+                return existing[0]
         
-        if existing:
-            # Update weight (akkumulieren)
-            new_weight = min(existing[1] + weight, 1.0)
+            # Neue Edge
             cursor.execute("""
-                UPDATE graph_edges SET weight = ? WHERE id = ?
-            """, (new_weight, existing[0]))
+                INSERT INTO graph_edges (src_node_id, dst_node_id, edge_type, weight)
+                VALUES (?, ?, ?, ?)
+            """, (src_node_id, dst_node_id, edge_type, weight))
+        
             conn.commit()
+            edge_id = cursor.lastrowid
+        finally:
             conn.close()
-            logger.info(f"[GraphStore] Updated edge {existing[0]}: weight={new_weight}")
-            return existing[0]
-        
-        # Neue Edge
-        cursor.execute("""
-            INSERT INTO graph_edges (src_node_id, dst_node_id, edge_type, weight)
-            VALUES (?, ?, ?, ?)
-        """, (src_node_id, dst_node_id, edge_type, weight))
-        
-        conn.commit()
-        edge_id = cursor.lastrowid
-        conn.close()
         
         logger.info(f"[GraphStore] Added edge {edge_id}: {src_node_id}--[{edge_type}]-->{dst_node_id}")
         return edge_id
@@ -277,46 +600,48 @@ class GraphStore:
         direction: str = "outgoing"
     ) -> List[Dict]:
         """Holt Nachbarn eines Nodes."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        conn = db_pool.connect(self.db_path, readonly=True)
+        try:
+            cursor = conn.cursor()
         
-        if direction == "outgoing":
-            if edge_type:
-                cursor.execute("""
-                    SELECT e.id, e.dst_node_id, e.edge_type, e.weight, n.content, n.source_type
-                    FROM graph_edges e
-                    JOIN graph_nodes n ON e.dst_node_id = n.id
-                    WHERE e.src_node_id = ? AND e.edge_type = ?
-                    ORDER BY e.weight DESC
-                """, (node_id, edge_type))
-            else:
-                cursor.execute("""
-                    SELECT e.id, e.dst_node_id, e.edge_type, e.weight, n.content, n.source_type
-                    FROM graph_edges e
-                    JOIN graph_nodes n ON e.dst_node_id = n.id
-                    WHERE e.src_node_id = ?
-                    ORDER BY e.weight DESC
-                """, (node_id,))
-        else:  # incoming
-            if edge_type:
-                cursor.execute("""
-                    SELECT e.id, e.src_node_id, e.edge_type, e.weight, n.content, n.source_type
-                    FROM graph_edges e
-                    JOIN graph_nodes n ON e.src_node_id = n.id
-                    WHERE e.dst_node_id = ? AND e.edge_type = ?
-                    ORDER BY e.weight DESC
-                """, (node_id, edge_type))
-            else:
-                cursor.execute("""
-                    SELECT e.id, e.src_node_id, e.edge_type, e.weight, n.content, n.source_type
-                    FROM graph_edges e
-                    JOIN graph_nodes n ON e.src_node_id = n.id
-                    WHERE e.dst_node_id = ?
-                    ORDER BY e.weight DESC
-                """, (node_id,))
+            if direction == "outgoing":
+                if edge_type:
+                    cursor.execute("""
+                        SELECT e.id, e.dst_node_id, e.edge_type, e.weight, n.content, n.source_type
+                        FROM graph_edges e
+                        JOIN graph_nodes n ON e.dst_node_id = n.id
+                        WHERE e.src_node_id = ? AND e.edge_type = ?
+                        ORDER BY e.weight DESC
+                    """, (node_id, edge_type))
+                else:
+                    cursor.execute("""
+                        SELECT e.id, e.dst_node_id, e.edge_type, e.weight, n.content, n.source_type
+                        FROM graph_edges e
+                        JOIN graph_nodes n ON e.dst_node_id = n.id
+                        WHERE e.src_node_id = ?
+                        ORDER BY e.weight DESC
+                    """, (node_id,))
+            else:  # incoming
+                if edge_type:
+                    cursor.execute("""
+                        SELECT e.id, e.src_node_id, e.edge_type, e.weight, n.content, n.source_type
+                        FROM graph_edges e
+                        JOIN graph_nodes n ON e.src_node_id = n.id
+                        WHERE e.dst_node_id = ? AND e.edge_type = ?
+                        ORDER BY e.weight DESC
+                    """, (node_id, edge_type))
+                else:
+                    cursor.execute("""
+                        SELECT e.id, e.src_node_id, e.edge_type, e.weight, n.content, n.source_type
+                        FROM graph_edges e
+                        JOIN graph_nodes n ON e.src_node_id = n.id
+                        WHERE e.dst_node_id = ?
+                        ORDER BY e.weight DESC
+                    """, (node_id,))
         
-        rows = cursor.fetchall()
-        conn.close()
+            rows = cursor.fetchall()
+        finally:
+            conn.close()
         
         return [{
             "edge_id": row[0],
@@ -327,6 +652,134 @@ class GraphStore:
             "source_type": row[5]
         } for row in rows]
     
+    # ══════════════════════════════════════════════════════════
+    # BATCH EDGE BUILDING
+    # ══════════════════════════════════════════════════════════
+
+    _UPSERT_EDGE_SQL = """
+        INSERT INTO graph_edges (src_node_id, dst_node_id, edge_type, weight)
+        VALUES (?, ?, ?, ?)
+        ON CONFLICT(src_node_id, dst_node_id, edge_type) DO UPDATE SET weight = {update}
+    """
+
+    def upsert_edges(self, edges: List[tuple], accumulate: bool = True) -> int:
+        """
+        Bulk-Upsert von (src, dst, edge_type, weight) in einer Transaktion.
+        accumulate=True verhält sich wie add_edge (Gewicht addieren, max 1.0),
+        sonst wird das Gewicht ersetzt.
+        """
+        rows = [(int(s), int(d), str(t), float(w)) for s, d, t, w in edges or []]
+        if not rows:
+            return 0
+        update = "MIN(graph_edges.weight + excluded.weight, 1.0)" if accumulate else "excluded.weight"
+        conn = db_pool.connect(self.db_path)
+        try:
+            conn.executemany(self._UPSERT_EDGE_SQL.format(update=update), rows)
+            conn.commit()
+        finally:
+            conn.close()
+        return len(rows)
+
+    def replace_edges(self, edge_type: str, src_node_ids: List[int], edges: List[tuple]) -> int:
+        """Ersetzt alle `edge_type`-Kanten der src_node_ids atomar durch `edges`."""
+        ids = [int(i) for i in dict.fromkeys(src_node_ids or [])]
+        rows = [(int(s), int(d), str(t), float(w)) for s, d, t, w in edges or []]
+        conn = db_pool.connect(self.db_path)
+        try:
+            cursor = conn.cursor()
+            for chunk in self._chunks(ids):
+                marks = ",".join("?" * len(chunk))
+                cursor.execute(
+                    f"DELETE FROM graph_edges WHERE edge_type = ? AND src_node_id IN ({marks})",
+                    [edge_type, *chunk],
+                )
+            if rows:
+                cursor.executemany(self._UPSERT_EDGE_SQL.format(update="excluded.weight"), rows)
+            conn.commit()
+        finally:
+            conn.close()
+        return len(rows)
+
+    def get_node_embeddings_after(self, after_id: int, limit: int) -> List[tuple]:
+        """Nächste `limit` Nodes nach `after_id` als (id, float32-Vektor oder None)."""
+        from vector_index import unpack_embedding
+
+        conn = db_pool.connect(self.db_path, readonly=True)
+        try:
+            rows = conn.execute(
+                "SELECT id, embedding FROM graph_nodes WHERE id > ? ORDER BY id LIMIT ?",
+                (int(after_id), int(limit)),
+            ).fetchall()
+        finally:
+            conn.close()
+        return [(node_id, unpack_embedding(raw)) for node_id, raw in rows]
+
+    def find_similar_nodes(
+        self,
+        vectors: Dict[int, List[float]],
+        limit: int,
+        min_similarity: float,
+        older_only: bool = False,
+    ) -> Dict[int, List[tuple]]:
+        """
+        Batch-k-NN über alle Nodes: node_id → [(other_id, cosine)].
+        Treffer werden gegen graph_nodes validiert (externe Deletes).
+        """
+        if not vectors:
+            return {}
+        conn = db_pool.connect(self.db_path, readonly=True)
+        try:
+            self.node_index.sync(conn)
+            hits = self.node_index.search_many(vectors, limit, min_similarity, older_only)
+            candidates = sorted({other for found in hits.values() for other, _ in found})
+            existing = set()
+            cursor = conn.cursor()
+            for chunk in self._chunks(candidates):
+                marks = ",".join("?" * len(chunk))
+                cursor.execute(f"SELECT id FROM graph_nodes WHERE id IN ({marks})", chunk)
+                existing.update(row[0] for row in cursor.fetchall())
+        finally:
+            conn.close()
+        stale = [c for c in candidates if c not in existing]
+        if stale:
+            self.node_index.discard(stale)
+            hits = {
+                node_id: [(o, sim) for o, sim in found if o in existing]
+                for node_id, found in hits.items()
+            }
+        return hits
+
+    def find_nodes_containing(
+        self, keys: List[str], exclude_id: int = None, limit: int = 5
+    ) -> Dict[str, List[int]]:
+        """
+        key → bis zu `limit` Node-IDs (aufsteigend), deren Content `key`
+        enthält (Semantik von LIKE '%key%'). Über den Trigram-Index, wenn
+        vorhanden und der Key mindestens 3 Zeichen hat.
+        """
+        out: Dict[str, List[int]] = {}
+        conn = db_pool.connect(self.db_path, readonly=True)
+        try:
+            cursor = conn.cursor()
+            for key in dict.fromkeys(k for k in keys or [] if k):
+                if self._fts and len(key) >= 3:
+                    sql = """
+                        SELECT rowid FROM graph_nodes_fts
+                        WHERE content LIKE ? AND rowid != ?
+                        ORDER BY rowid LIMIT ?
+                    """
+                else:
+                    sql = """
+                        SELECT id FROM graph_nodes
+                        WHERE content LIKE ? AND id != ?
+                        ORDER BY id LIMIT ?
+                    """
+                cursor.execute(sql, (f"%{key}%", -1 if exclude_id is None else exclude_id, limit))
+                out[key] = [row[0] for row in cursor.fetchall()]
+        finally:
+            conn.close()
+        return out
+
     # ══════════════════════════════════════════════════════════
     # GRAPH WALK
     # ══════════════════════════════════════════════════════════
@@ -341,35 +794,45 @@ class GraphStore:
         Graph-Walk von Start-Nodes aus.
         Sammelt Nodes bis zur gegebenen Tiefe.
         Sorts results by confidence (higher = more relevant).
+
+        Expandiert pro Tiefe die ganze Frontier mit einer Query über
+        idx_edges_src (eine Connection pro Walk). Die nächste Frontier behält
+        die Reihenfolge des Per-Node-Walks (Frontier-Node für Frontier-Node,
+        dessen Nachbarn nach Edge-Weight); volle Node-Rows werden pro Ebene
+        nur für die Top-`limit` (confidence, Frontier-Rang) geladen — alle
+        anderen können im Endergebnis ohnehin nicht landen.
         """
         visited = set()
         results = []
+        found = 0
 
-        current_level = start_node_ids
+        frontier = list(dict.fromkeys(start_node_ids or []))
 
-        for d in range(depth):
-            next_level = []
-
-            for node_id in current_level:
-                if node_id in visited:
-                    continue
-                visited.add(node_id)
+        conn = db_pool.connect(self.db_path, readonly=True)
+        try:
+            cursor = conn.cursor()
+            for d in range(depth):
+                frontier = [n for n in frontier if n not in visited]
+                if not frontier:
+                    break
+                visited.update(frontier)
 
-                node = self.get_node(node_id)
-                if node:
+                rank = {node_id: i for i, node_id in enumerate(frontier)}
+                confidences = self._fetch_confidences(cursor, frontier)
+                found += len(confidences)
+                best = sorted(
+                    confidences,
+                    key=lambda nid: (-confidences[nid], rank[nid]),
+                )[:max(0, limit)]
+                for node in self._fetch_nodes(cursor, sorted(best, key=rank.get)):
                     node["depth"] = d
                     results.append(node)
 
-                # Nachbarn holen
-                neighbors = self.get_neighbors(node_id)
-                for neighbor in neighbors:
-                    if neighbor["node_id"] not in visited:
-                        next_level.append(neighbor["node_id"])
-
-            current_level = next_level
-
-            if len(results) >= limit:
-                break
+                if found >= limit or d == depth - 1:
+                    break
+                frontier = self._expand_frontier(cursor, frontier, visited)
+        finally:
+            conn.close()
 
         # Sort by confidence (desc) then depth (asc) so workspace-promoted
         # nodes (confidence=0.9) rank above auto-extracted (confidence=0.5)
@@ -377,11 +840,76 @@ class GraphStore:
 
         return results[:limit]
 
+    @staticmethod
+    def _chunks(ids: List[int], size: int = 500):
+        for i in range(0, len(ids), size):
+            yield ids[i:i + size]
+
+    def _fetch_confidences(self, cursor, node_ids: List[int]) -> Dict[int, float]:
+        """id → confidence für alle existierenden Nodes der Frontier."""
+        out: Dict[int, float] = {}
+        for chunk in self._chunks(node_ids):
+            marks = ",".join("?" * len(chunk))
+            cursor.execute(
+                f"SELECT id, confidence FROM graph_nodes WHERE id IN ({marks})",
+                chunk,
+            )
+            for node_id, confidence in cursor.fetchall():
+                out[node_id] = confidence if confidence is not None else 0.5
+        return out
+
+    def _fetch_nodes(self, cursor, node_ids: List[int]) -> List[Dict]:
+        """Volle Node-Rows (Shape wie get_node) in der Reihenfolge von node_ids."""
+        rows: Dict[int, Dict] = {}
+        for chunk in self._chunks(node_ids):
+            marks = ",".join("?" * len(chunk))
+            cursor.execute(f"""
+                SELECT id, source_type, source_id, content, embedding, conversation_id, created_at, confidence
+                FROM graph_nodes WHERE id IN ({marks})
+            """, chunk)
+            for row in cursor.fetchall():
+                rows[row[0]] = {
+                    "id": row[0],
+                    "source_type": row[1],
+                    "source_id": row[2],
+                    "content": row[3],
+                    "embedding": json.loads(row[4]) if row[4] else None,
+                    "conversation_id": row[5],
+                    "created_at": row[6],
+                    "confidence": row[7],
+                }
+        return [rows[n] for n in node_ids if n in rows]
+
+    def _expand_frontier(self, cursor, frontier: List[int], visited: set) -> List[int]:
+        """
+        Outgoing-Nachbarn der ganzen Frontier in einer Query pro Chunk.
+        Reihenfolge wie get_neighbors() Node für Node: Frontier-Rang, dann
+        Edge-Weight absteigend; Duplikate behalten ihr erstes Vorkommen.
+        """
+        order: Dict[int, None] = {}
+        rank = {node_id: i for i, node_id in enumerate(frontier)}
+        for chunk in self._chunks(frontier):
+            marks = ",".join("?" * len(chunk))
+            cursor.execute(f"""
+                SELECT e.src_node_id, e.dst_node_id, e.weight, e.id
+                FROM graph_edges e
+                JOIN graph_nodes n ON e.dst_node_id = n.id
+                WHERE e.src_node_id IN ({marks})
+            """, chunk)
+            edges = sorted(
+                cursor.fetchall(),
+                key=lambda r: (rank[r[0]], -(r[2] if r[2] is not None else 0.0), r[3]),
+            )
+            for _src, dst, _weight, _edge_id in edges:
+                if dst not in visited:
+                    order.setdefault(dst, None)
+        return list(order)
+
 
 
     def get_edges(self, node_id: int):
         """Get all edges connected to a node."""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_pool.connect(self.db_path, readonly=True)
         cursor = conn.cursor()
         
         try:
@@ -406,13 +934,15 @@ class GraphStore:
     
     def delete_node(self, node_id: int):
         """Delete a node and all its edges."""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_pool.connect(self.db_path)
         cursor = conn.cursor()
         
         try:
             cursor.execute('''DELETE FROM graph_edges WHERE src_node_id = ? OR dst_node_id = ?''', (node_id, node_id))
             cursor.execute('''DELETE FROM graph_nodes WHERE id = ?''', (node_id,))
             conn.commit()
+            if self._node_index is not None:
+                self._node_index.discard([node_id])
         except Exception as e:
             print(f"Error deleting node: {e}")
             conn.rollback()
@@ -421,7 +951,7 @@ class GraphStore:
     
     def delete_edge(self, source: int, target: int, edge_type: str):
         """Delete a specific edge."""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_pool.connect(self.db_path)
         cursor = conn.cursor()
         
         try:
@@ -439,4 +969,5 @@ def get_graph_store(db_path: str = None) -> GraphStore:
     if _graph_store is None:
         from memory_mcp.config import DB_PATH
         _graph_store = GraphStore(db_path or DB_PATH)
+        _graph_store.start_embedding_link_backfill()
     return _graph_store
\ No newline at end of file
@@ -0,0 +1,147 @@
+# sql-memory/graph/node_index.py
+"""
+Graph Node Index - k-NN ueber graph_nodes.embedding fuer Semantic Edges.
+
+Nutzt die Partition aus vector_index (exakter Matrix-Scan, ab
+VECTOR_INDEX_IVF_MIN_ROWS IVF), eine Partition pro Embedding-Dimension.
+Sync inkrementell ueber die Node-ID (graph_nodes ist append-only, IDs sind
+AUTOINCREMENT); geloeschte Nodes werden per discard() bzw. beim Validieren
+der Treffer gegen die DB entfernt.
+"""
+
+import logging
+import threading
+from typing import Dict, Iterable, List, Tuple
+
+import numpy as np
+
+from vector_index import _NPROBE, _Partition, _normalize, unpack_embedding
+
+logger = logging.getLogger(__name__)
+
+_SYNC_CHUNK = 2000
+
+
+class GraphNodeIndex:
+    """In-Process k-NN-Index ueber graph_nodes (thread-safe)."""
+
+    def __init__(self, nprobe: int = _NPROBE):
+        self.nprobe = nprobe
+        self._lock = threading.RLock()
+        self._reset()
+
+    def _reset(self) -> None:
+        self._partitions: Dict[int, _Partition] = {}
+        self._dim_of: Dict[int, int] = {}
+        self._watermark = 0
+
+    # ── sync ────────────────────────────────────────────────────────────────
+
+    def sync(self, conn) -> int:
+        """Nodes mit id > Watermark nachladen. Gibt die Zahl neuer Vektoren zurueck."""
+        with self._lock:
+            max_id = conn.execute("SELECT MAX(id) FROM graph_nodes").fetchone()[0] or 0
+            if max_id < self._watermark:
+                # Tabelle geleert (memory_reset) → neu aufbauen
+                self._reset()
+            added = 0
+            while self._watermark < max_id:
+                rows = conn.execute(
+                    """
+                    SELECT id, embedding FROM graph_nodes
+                    WHERE id > ? AND id <= ? AND embedding IS NOT NULL
+                    ORDER BY id LIMIT ?
+                    """,
+                    (self._watermark, max_id, _SYNC_CHUNK),
+                ).fetchall()
+                if not rows:
+                    break
+                added += self._add_rows(rows)
+                self._watermark = rows[-1][0]
+            self._watermark = max(self._watermark, max_id)
+            return added
+
+    def _add_rows(self, rows: Iterable[Tuple[int, object]]) -> int:
+        by_dim: Dict[int, Tuple[List[int], List[np.ndarray]]] = {}
+        for node_id, raw in rows:
+            vec = unpack_embedding(raw)
+            if vec is None or node_id in self._dim_of:
+                continue
+            ids, vecs = by_dim.setdefault(int(vec.shape[0]), ([], []))
+            ids.append(int(node_id))
+            vecs.append(_normalize(vec))
+        added = 0
+        for dim, (ids, vecs) in by_dim.items():
+            part = self._partitions.get(dim)
+            if part is None:
+                part = self._partitions[dim] = _Partition(dim)
+            part.add_many(np.asarray(ids, dtype=np.int64), np.vstack(vecs))
+            for node_id in ids:
+                self._dim_of[node_id] = dim
+            added += len(ids)
+        return added
+
+    def discard(self, node_ids: Iterable[int]) -> None:
+        with self._lock:
+            for node_id in node_ids:
+                dim = self._dim_of.pop(int(node_id), None)
+                if dim is not None:
+                    self._partitions[dim].remove(int(node_id))
+
+    # ── search ──────────────────────────────────────────────────────────────
+
+    def search_many(
+        self,
+        queries: Dict[int, Iterable[float]],
+        limit: int,
+        min_similarity: float,
+        older_only: bool = False,
+    ) -> Dict[int, List[Tuple[int, float]]]:
+        """
+        node_id → [(other_id, cosine)] absteigend. Der Node selbst ist nie
+        Treffer; older_only beschraenkt auf Nodes mit kleinerer ID.
+        """
+        out: Dict[int, List[Tuple[int, float]]] = {nid: [] for nid in queries}
+        by_dim: Dict[int, Tuple[List[int], List[np.ndarray]]] = {}
+        for node_id, vector in queries.items():
+            vec = np.asarray(vector, dtype=np.float32)
+            if vec.ndim != 1 or not vec.size:
+                continue
+            ids, vecs = by_dim.setdefault(int(vec.shape[0]), ([], []))
+            ids.append(int(node_id))
+            vecs.append(_normalize(vec))
+        limit = max(1, int(limit))
+        with self._lock:
+            for dim, (ids, vecs) in by_dim.items():
+                part = self._partitions.get(dim)
+                if part is None:
+                    continue
+                src = np.asarray(ids, dtype=np.int64)
+                # +1 Platz fuer den Node selbst, falls er schon indexiert ist
+                hits = part.search_batch(
+                    np.vstack(vecs),
+                    limit + 1,
+                    min_similarity,
+                    self.nprobe,
+                    below=src if older_only else None,
+                )
+                for node_id, (hit_ids, scores) in zip(ids, hits):
+                    order = np.argsort(-scores, kind="stable")
+                    out[node_id] = [
+                        (int(hit_ids[i]), float(scores[i]))
+                        for i in order
+                        if int(hit_ids[i]) != node_id
+                    ][:limit]
+        return out
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "vectors": len(self._dim_of),
+                "watermark": self._watermark,
+                "partitions": len(self._partitions),
+                "ivf_partitions": sum(
+                    1 for p in self._partitions.values() if p.centroids is not None
+                ),
+            }
+
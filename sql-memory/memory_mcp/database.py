@@ -3,6 +3,8 @@ import sqlite3
 from datetime import datetime
 from typing import Optional, Dict, List
 
+import db_pool
+
 from .config import DB_PATH
 
 
@@ -105,7 +107,7 @@ def _ensure_memory_fts(conn: sqlite3.Connection, force_repair: bool = False) ->
 
 def init_db():
     os.makedirs(os.path.dirname(DB_PATH), exist_ok=True)
-    conn = sqlite3.connect(DB_PATH)
+    conn = db_pool.connect(DB_PATH)
     try:
         # Basistabelle
         conn.execute(
@@ -318,7 +320,7 @@ def save_secret(name: str, value: str):
     cipher = _get_cipher()
     encrypted = cipher.encrypt(value.encode()).decode()
     now = datetime.utcnow().isoformat()
-    conn = sqlite3.connect(DB_PATH)
+    conn = db_pool.connect(DB_PATH)
     try:
         conn.execute(
             "INSERT INTO secrets (name, encrypted_value, created_at, updated_at) VALUES (?, ?, ?, ?) "
@@ -332,7 +334,7 @@ def save_secret(name: str, value: str):
 
 def get_secret_value(name: str) -> Optional[str]:
     cipher = _get_cipher()
-    conn = sqlite3.connect(DB_PATH)
+    conn = db_pool.connect(DB_PATH, readonly=True)
     try:
         row = conn.execute("SELECT encrypted_value FROM secrets WHERE name=?", (name,)).fetchone()
         if not row:
@@ -343,7 +345,7 @@ def get_secret_value(name: str) -> Optional[str]:
 
 
 def list_secrets() -> List[Dict]:
-    conn = sqlite3.connect(DB_PATH)
+    conn = db_pool.connect(DB_PATH, readonly=True)
     try:
         rows = conn.execute("SELECT name, created_at, updated_at FROM secrets ORDER BY name").fetchall()
         return [{"name": r[0], "created_at": r[1], "updated_at": r[2]} for r in rows]
@@ -352,7 +354,7 @@ def list_secrets() -> List[Dict]:
 
 
 def delete_secret(name: str) -> bool:
-    conn = sqlite3.connect(DB_PATH)
+    conn = db_pool.connect(DB_PATH)
     try:
         cur = conn.execute("DELETE FROM secrets WHERE name=?", (name,))
         conn.commit()
@@ -362,7 +364,14 @@ def delete_secret(name: str) -> bool:
 
 
 def migrate_db():
-    conn = sqlite3.connect(DB_PATH)
+    conn = db_pool.connect(DB_PATH)
+    try:
+        _migrate_schema(conn)
+    finally:
+        conn.close()
+
+
+def _migrate_schema(conn: sqlite3.Connection) -> None:
     cur = conn.cursor()
 
     # Layer-Spalte prüfen
@@ -613,12 +622,11 @@ def migrate_db():
         )
 
     conn.commit()
-    conn.close()
 
 
 def insert_row(conversation_id: str, role: str, content: str,
                tags: Optional[str], layer: str) -> int:
-    conn = sqlite3.connect(DB_PATH)
+    conn = db_pool.connect(DB_PATH)
     try:
         _ensure_memory_fts(conn, force_repair=False)
         cur = conn.cursor()
@@ -665,7 +673,7 @@ def insert_row(conversation_id: str, role: str, content: str,
 
 def insert_fact(conversation_id: str, subject: str, key: str, value: str,
                 layer: str = "ltm") -> int:
-    conn = sqlite3.connect(DB_PATH)
+    conn = db_pool.connect(DB_PATH)
     try:
         cur = conn.cursor()
         cur.execute(
@@ -718,7 +726,7 @@ def row_to_fact_dict(row) -> Dict:
 def upsert_skill_metric(skill_id: str, success: bool, exec_time_ms: float,
                         error: Optional[str] = None, version: str = "1.0") -> int:
     """Record a skill execution result. Creates or updates the metric row."""
-    conn = sqlite3.connect(DB_PATH)
+    conn = db_pool.connect(DB_PATH)
     try:
         cur = conn.cursor()
         now = datetime.utcnow().isoformat(timespec="seconds") + "Z"
@@ -764,7 +772,7 @@ def upsert_skill_metric(skill_id: str, success: bool, exec_time_ms: float,
 
 
 def get_skill_metric(skill_id: str) -> Optional[Dict]:
-    conn = sqlite3.connect(DB_PATH)
+    conn = db_pool.connect(DB_PATH, readonly=True)
     try:
         cur = conn.cursor()
         cur.execute("SELECT * FROM skill_metrics WHERE skill_id = ?", (skill_id,))
@@ -777,7 +785,7 @@ def get_skill_metric(skill_id: str) -> Optional[Dict]:
 
 
 def list_skill_metrics(status: Optional[str] = None, limit: int = 50) -> List[Dict]:
-    conn = sqlite3.connect(DB_PATH)
+    conn = db_pool.connect(DB_PATH, readonly=True)
     try:
         cur = conn.cursor()
         if status:
@@ -790,7 +798,7 @@ def list_skill_metrics(status: Optional[str] = None, limit: int = 50) -> List[Di
 
 
 def update_skill_status(skill_id: str, status: str) -> bool:
-    conn = sqlite3.connect(DB_PATH)
+    conn = db_pool.connect(DB_PATH)
     try:
         cur = conn.cursor()
         now = datetime.utcnow().isoformat(timespec="seconds") + "Z"
@@ -826,7 +834,7 @@ def save_workspace_entry(
     entry_type: str = "observation",
     source_layer: str = "thinking"
 ) -> int:
-    conn = sqlite3.connect(DB_PATH)
+    conn = db_pool.connect(DB_PATH)
     try:
         cur = conn.cursor()
         now = datetime.utcnow().isoformat(timespec="seconds") + "Z"
@@ -849,7 +857,7 @@ def list_workspace_entries(
     limit: int = 50,
     entry_type: Optional[str] = None
 ) -> List[Dict]:
-    conn = sqlite3.connect(DB_PATH)
+    conn = db_pool.connect(DB_PATH, readonly=True)
     try:
         cur = conn.cursor()
         conditions = []
@@ -877,7 +885,7 @@ def list_workspace_entries(
 
 
 def get_workspace_entry(entry_id: int) -> Optional[Dict]:
-    conn = sqlite3.connect(DB_PATH)
+    conn = db_pool.connect(DB_PATH, readonly=True)
     try:
         cur = conn.cursor()
         cur.execute(
@@ -895,7 +903,7 @@ def get_workspace_entry(entry_id: int) -> Optional[Dict]:
 
 
 def update_workspace_entry(entry_id: int, content: str) -> bool:
-    conn = sqlite3.connect(DB_PATH)
+    conn = db_pool.connect(DB_PATH)
     try:
         cur = conn.cursor()
         now = datetime.utcnow().isoformat(timespec="seconds") + "Z"
@@ -910,7 +918,7 @@ def update_workspace_entry(entry_id: int, content: str) -> bool:
 
 
 def delete_workspace_entry(entry_id: int) -> bool:
-    conn = sqlite3.connect(DB_PATH)
+    conn = db_pool.connect(DB_PATH)
     try:
         cur = conn.cursor()
         cur.execute("DELETE FROM workspace_entries WHERE id = ?", (entry_id,))
@@ -921,7 +929,7 @@ def delete_workspace_entry(entry_id: int) -> bool:
 
 
 def get_unpromoted_entries() -> List[Dict]:
-    conn = sqlite3.connect(DB_PATH)
+    conn = db_pool.connect(DB_PATH, readonly=True)
     try:
         cur = conn.cursor()
         cur.execute(
@@ -939,7 +947,7 @@ def get_unpromoted_entries() -> List[Dict]:
 
 
 def mark_promoted(entry_id: int) -> bool:
-    conn = sqlite3.connect(DB_PATH)
+    conn = db_pool.connect(DB_PATH)
     try:
         cur = conn.cursor()
         now = datetime.utcnow().isoformat(timespec="seconds") + "Z"
@@ -987,7 +995,7 @@ def artifact_save(
     """Legt ein Artefakt an oder aktualisiert es (Upsert per id)."""
     aid = artifact_id or _artifact_id(type, name)
     now = datetime.utcnow().isoformat(timespec="seconds") + "Z"
-    conn = sqlite3.connect(DB_PATH)
+    conn = db_pool.connect(DB_PATH)
     try:
         existing = conn.execute(
             "SELECT id FROM trion_artifact_registry WHERE id = ?", (aid,)
@@ -1020,7 +1028,7 @@ def artifact_save(
 
 def artifact_get(name: str) -> Optional[Dict]:
     """Liefert ein Artefakt per Name (neuestes zuerst)."""
-    conn = sqlite3.connect(DB_PATH)
+    conn = db_pool.connect(DB_PATH, readonly=True)
     try:
         row = conn.execute(
             """
@@ -1043,7 +1051,7 @@ def artifact_list(
     limit: int = 100,
 ) -> List[Dict]:
     """Listet Artefakte — standardmäßig nur 'active' und 'deprecated'."""
-    conn = sqlite3.connect(DB_PATH)
+    conn = db_pool.connect(DB_PATH, readonly=True)
     try:
         conditions: List[str] = []
         params: List[str] = []
@@ -1077,7 +1085,7 @@ def artifact_update(
     meta: Optional[str] = None,
 ) -> bool:
     """Aktualisiert Status und/oder Meta eines Artefakts per Name."""
-    conn = sqlite3.connect(DB_PATH)
+    conn = db_pool.connect(DB_PATH)
     try:
         now = datetime.utcnow().isoformat(timespec="seconds") + "Z"
         sets: List[str] = ["updated_at = ?"]
@@ -1115,7 +1123,7 @@ def _row_to_artifact(row) -> Dict:
 
 
 def load_fact(conversation_id: str, key: str) -> Optional[str]:
-    conn = sqlite3.connect(DB_PATH)
+    conn = db_pool.connect(DB_PATH, readonly=True)
     try:
         cur = conn.cursor()
         cur.execute(
@@ -1,8 +1,8 @@
-import sqlite3
 import sys
 sys.path.insert(0, '/app')  # Damit embedding.py gefunden wird
-from graph import get_graph_store, build_node_with_edges
+from graph import get_graph_store, build_node_with_edges, rebuild_semantic_edges
 from vector_store import get_vector_store
+import db_pool
 from typing import Optional, List, Dict
 
 from .config import DB_PATH
@@ -29,6 +29,53 @@ from .database import (
 from .auto_layer import auto_assign_layer
 
 
+def _resolve_seed_node_ids(gs, seed_results: List[Dict]) -> List[int]:
+    """
+    Semantische Treffer → Graph-Seeds in Trefferreihenfolge.
+    Primär über graph_nodes.embedding_id (eine indizierte Query); nur für
+    Alt-Nodes ohne Link ein exakter Content-Match (ebenfalls eine Query).
+    """
+    by_embedding = gs.get_node_ids_for_embeddings([s.get("id") for s in seed_results])
+    unresolved = [s["content"] for s in seed_results if s.get("id") not in by_embedding]
+    by_content = gs.get_node_ids_by_content(unresolved) if unresolved else {}
+
+    seed_node_ids: List[int] = []
+    for seed in seed_results:
+        node_id = by_embedding.get(seed.get("id")) or by_content.get(seed.get("content"))
+        if node_id is not None and node_id not in seed_node_ids:
+            seed_node_ids.append(node_id)
+    return seed_node_ids
+
+
+def _hybrid_rank(
+    nodes: List[Dict],
+    node_vectors: Dict[int, List[float]],
+    query_vec: List[float],
+    alpha: float,
+) -> List[Dict]:
+    """
+    score = alpha * cosine(query, node) + (1 - alpha) * confidence * 0.5**depth.
+    Nodes ohne Vektor bekommen nur den Graph-Anteil.
+    """
+    from embedding import cosine_similarity
+
+    ranked = []
+    for node in nodes:
+        vec = node_vectors.get(node["id"])
+        similarity = cosine_similarity(query_vec, vec) if vec else 0.0
+        graph_score = float(node.get("confidence") or 0.5) * (0.5 ** int(node.get("depth", 0)))
+        ranked.append({
+            "content": node["content"],
+            "type": node["source_type"],
+            "depth": node.get("depth", 0),
+            "node_id": node["id"],
+            "similarity": round(similarity, 4),
+            "score": round(alpha * similarity + (1.0 - alpha) * graph_score, 4),
+        })
+    ranked.sort(key=lambda r: (-r["score"], r["depth"]))
+    return ranked
+
+
 def register_tools(mcp):
 
     # --------------------------------------------------
@@ -87,13 +134,14 @@ def register_tools(mcp):
 
         content = f"{subject} {key}: {value}"
         embedding = None
+        embedding_id = None
 
         # Embedding speichern
         try:
             from embedding import get_embedding
             vs = get_vector_store()
             embedding = get_embedding(content)
-            vs.add(
+            embedding_id = vs.add(
                 conversation_id=conversation_id,
                 content=content,
                 content_type="fact",
@@ -110,7 +158,8 @@ def register_tools(mcp):
                 source_id=new_id,
                 embedding=embedding,
                 conversation_id=conversation_id,
-                related_keys=[key]
+                related_keys=[key],
+                embedding_id=embedding_id
             )
         except Exception as e:
             print (f"[memory_fact_save] Graph failed: {e}")
@@ -145,7 +194,7 @@ def register_tools(mcp):
     # --------------------------------------------------
     @mcp.tool
     def memory_recent(conversation_id: str, limit: int = 20) -> List[Dict]:
-        conn = sqlite3.connect(DB_PATH)
+        conn = db_pool.connect(DB_PATH, readonly=True)
         try:
             cur = conn.cursor()
             cur.execute(
@@ -173,7 +222,7 @@ def register_tools(mcp):
     ) -> List[Dict]:
 
         like = f"%{query}%"
-        conn = sqlite3.connect(DB_PATH)
+        conn = db_pool.connect(DB_PATH, readonly=True)
         try:
             cur = conn.cursor()
 
@@ -219,7 +268,7 @@ def register_tools(mcp):
         layers = ["stm", "mtm", "ltm"]
         results: List[Dict] = []
 
-        conn = sqlite3.connect(DB_PATH)
+        conn = db_pool.connect(DB_PATH, readonly=True)
 
         try:
             cur = conn.cursor()
@@ -259,7 +308,7 @@ def register_tools(mcp):
         limit: int = 20,
     ) -> List[Dict]:
 
-        conn = sqlite3.connect(DB_PATH)
+        conn = db_pool.connect(DB_PATH, readonly=True)
         try:
             cur = conn.cursor()
 
@@ -299,7 +348,7 @@ def register_tools(mcp):
     @mcp.tool
     def memory_delete(id: int) -> str:
 
-        conn = sqlite3.connect(DB_PATH)
+        conn = db_pool.connect(DB_PATH)
         try:
             cur = conn.cursor()
             cur.execute("DELETE FROM memory WHERE id = ?", (id,))
@@ -391,8 +440,14 @@ def register_tools(mcp):
         content_type: Optional[str] = None,
         allow_mixed_versions: bool = False,
         embedding_version: Optional[str] = None,
+        query_embedding: Optional[List[float]] = None,
+        query_embedding_version: Optional[str] = None,
     ) -> Dict:
-        """Semantische Suche - findet ähnliche Einträge nach Bedeutung."""
+        """Semantische Suche - findet ähnliche Einträge nach Bedeutung.
+
+        query_embedding/query_embedding_version: optionaler, vom Core bereits
+        berechneter Query-Vektor (spart den zweiten Embedding-Call pro Turn).
+        """
         vs = get_vector_store()
 
         results = vs.search(
@@ -403,6 +458,8 @@ def register_tools(mcp):
             content_type=content_type,
             allow_mixed_versions=allow_mixed_versions,
             embedding_version=embedding_version,
+            query_embedding=query_embedding,
+            query_embedding_version=query_embedding_version,
         )
 
         return {
@@ -473,22 +530,8 @@ def register_tools(mcp):
         if not seed_results:
             return {"results": [], "count": 0}
         
-        # 2. Finde Graph Nodes die zu den Seeds gehören
-        # Suche über ALLE source_types (nicht nur "fact" - würde z.B. "skill" Nodes verpassen)
-        seed_node_ids = []
-        all_known_types = ["fact", "skill", "event", "note", "observation", "task"]
-        for seed in seed_results:
-            seed_text = seed["content"][:80]
-            found = False
-            for t in all_known_types:
-                candidates = gs.get_nodes_by_type(t, limit=50)
-                for node in candidates:
-                    if seed_text in node["content"] or node["content"][:80] in seed_text:
-                        seed_node_ids.append(node["id"])
-                        found = True
-                        break
-                if found:
-                    break
+        # 2. Finde Graph Nodes die zu den Seeds gehören (embedding_id-Link)
+        seed_node_ids = _resolve_seed_node_ids(gs, seed_results)
 
         if not seed_node_ids:
             # Fallback: direkt semantische Ergebnisse zurückgeben
@@ -545,6 +588,65 @@ def register_tools(mcp):
             "source": "graph_walk"
         }
     
+    # --------------------------------------------------
+    # memory_hybrid_search (Semantik + Graph)
+    # --------------------------------------------------
+    @mcp.tool
+    def memory_hybrid_search(
+        query: str,
+        conversation_id: str = None,
+        depth: int = 2,
+        limit: int = 10,
+        alpha: float = 0.7,
+        min_similarity: float = 0.5,
+    ) -> Dict:
+        """Hybrid-Suche: semantische Seeds + Graph-Walk, Nodes direkt per Vektor-Similarity gerankt.
+
+        alpha gewichtet Similarity (1.0) gegen Graph-Nähe/Confidence (0.0).
+        """
+        from embedding import get_embedding_with_metadata
+
+        vs = get_vector_store()
+        gs = get_graph_store()
+        alpha = max(0.0, min(1.0, float(alpha)))
+
+        emb = get_embedding_with_metadata(query)
+        if not emb:
+            return {"results": [], "count": 0}
+
+        seed_results = vs.search(
+            query=query,
+            conversation_id=conversation_id,
+            limit=5,
+            min_similarity=min_similarity,
+            query_embedding=emb["embedding"],
+            query_embedding_version=emb["embedding_version"],
+        )
+        seed_node_ids = _resolve_seed_node_ids(gs, seed_results)
+        if not seed_node_ids:
+            return {
+                "results": seed_results,
+                "count": len(seed_results),
+                "source": "semantic_only"
+            }
+
+        candidates = [
+            n for n in gs.graph_walk(
+                start_node_ids=seed_node_ids,
+                depth=depth,
+                limit=max(1, int(limit)) * 3
+            )
+            if "tombstone" not in (n.get("content") or "").lower()
+        ]
+        vectors = gs.get_node_vectors([n["id"] for n in candidates])
+        ranked = _hybrid_rank(candidates, vectors, emb["embedding"], alpha)[:limit]
+
+        return {
+            "results": ranked,
+            "count": len(ranked),
+            "source": "hybrid"
+        }
+
     # --------------------------------------------------
     # memory_graph_neighbors (NEU)
     # --------------------------------------------------
@@ -574,29 +676,29 @@ def register_tools(mcp):
     @mcp.tool
     def memory_graph_stats() -> Dict:
         """Gibt Graph-Statistiken zurück."""
-        import sqlite3
         from .config import DB_PATH
 
-        conn = sqlite3.connect(DB_PATH)
-        cursor = conn.cursor()
-
-        cursor.execute("SELECT COUNT(*) FROM graph_nodes")
-        node_count = cursor.fetchone()[0]
+        conn = db_pool.connect(DB_PATH, readonly=True)
+        try:
+            cursor = conn.cursor()
 
-        cursor.execute("SELECT COUNT(*) FROM graph_edges")
-        edge_count = cursor.fetchone()[0]
+            cursor.execute("SELECT COUNT(*) FROM graph_nodes")
+            node_count = cursor.fetchone()[0]
 
-        cursor.execute("""
-            SELECT edge_type, COUNT(*) FROM graph_edges GROUP BY edge_type
-        """)
-        edge_types = {row[0]: row[1] for row in cursor.fetchall()}
+            cursor.execute("SELECT COUNT(*) FROM graph_edges")
+            edge_count = cursor.fetchone()[0]
 
-        cursor.execute("""
-            SELECT source_type, COUNT(*) FROM graph_nodes GROUP BY source_type    
-        """)
-        node_types = {row[0]: row[1] for row in cursor.fetchall()}
+            cursor.execute("""
+                SELECT edge_type, COUNT(*) FROM graph_edges GROUP BY edge_type
+            """)
+            edge_types = {row[0]: row[1] for row in cursor.fetchall()}
 
-        conn.close()
+            cursor.execute("""
+                SELECT source_type, COUNT(*) FROM graph_nodes GROUP BY source_type    
+            """)
+            node_types = {row[0]: row[1] for row in cursor.fetchall()}
+        finally:
+            conn.close()
 
         return {
             "nodes": node_count,
@@ -644,22 +746,24 @@ def register_tools(mcp):
         Get all recent memory entries across ALL conversations.
         Used by maintenance to analyze all memories.
         """
-        import sqlite3
         from .config import DB_PATH
         
         try:
-            conn = sqlite3.connect(DB_PATH)
-            c = conn.cursor()
-            
-            # Get all entries, ordered by created_at DESC
-            c.execute('''
-                SELECT id, conversation_id, content, created_at
-                FROM memory
-                ORDER BY created_at DESC
-                LIMIT ?
-            ''', (limit,))
-            
-            rows = c.fetchall()
+            conn = db_pool.connect(DB_PATH, readonly=True)
+            try:
+                c = conn.cursor()
+                
+                # Get all entries, ordered by created_at DESC
+                c.execute('''
+                    SELECT id, conversation_id, content, created_at
+                    FROM memory
+                    ORDER BY created_at DESC
+                    LIMIT ?
+                ''', (limit,))
+                
+                rows = c.fetchall()
+            finally:
+                conn.close()
             
             entries = []
             for row in rows:
@@ -680,10 +784,9 @@ def register_tools(mcp):
     @mcp.tool
     def memory_list_conversations(limit: int = 100) -> Dict:
         """Lists all conversations with their entry counts."""
-        import sqlite3
         from .config import DB_PATH
         
-        conn = sqlite3.connect(DB_PATH)
+        conn = db_pool.connect(DB_PATH, readonly=True)
         try:
             cursor = conn.cursor()
             
@@ -718,20 +821,22 @@ def register_tools(mcp):
         Delete multiple memory entries at once.
         Used by maintenance to clean up duplicates and unwanted entries.
         """
-        import sqlite3
         from .config import DB_PATH
         
         try:
-            conn = sqlite3.connect(DB_PATH)
-            c = conn.cursor()
-            
-            deleted_count = 0
-            for entry_id in ids:
-                c.execute('DELETE FROM memory WHERE id = ?', (entry_id,))
-                if c.rowcount > 0:
-                    deleted_count += 1
-            
-            conn.commit()
+            conn = db_pool.connect(DB_PATH)
+            try:
+                c = conn.cursor()
+                
+                deleted_count = 0
+                for entry_id in ids:
+                    c.execute('DELETE FROM memory WHERE id = ?', (entry_id,))
+                    if c.rowcount > 0:
+                        deleted_count += 1
+                
+                conn.commit()
+            finally:
+                conn.close()
             
             return {"structuredContent": {"deleted": deleted_count, "total_requested": len(ids)}}
             
@@ -869,6 +974,27 @@ def register_tools(mcp):
         except Exception as e:
             return {"error": str(e), "pruned": 0}
 
+    # graph_rebuild_semantic_edges (OFFLINE, IN CHUNKS)
+    @mcp.tool
+    def graph_rebuild_semantic_edges(
+        chunk_size: int = 256,
+        start_after_id: int = 0,
+        max_nodes: Optional[int] = None,
+    ) -> Dict:
+        """
+        Rebuilds all semantic edges against the full node set (batch k-NN).
+        Resumable: pass the returned last_node_id as start_after_id.
+        """
+        try:
+            stats = rebuild_semantic_edges(
+                chunk_size=chunk_size,
+                start_after_id=start_after_id,
+                max_nodes=max_nodes,
+            )
+            return {"structuredContent": stats}
+        except Exception as e:
+            return {"error": str(e), "processed": 0}
+
     # --------------------------------------------------
     # memory_reset (NEW - FOR FORCE CLEAR)
     # --------------------------------------------------
@@ -878,31 +1004,32 @@ def register_tools(mcp):
         Wipes ALL memory, graph nodes, and edges.
         EXTREMELY DANGEROUS - IRREVERSIBLE.
         """
-        import sqlite3
         from .config import DB_PATH
         
         try:
-            conn = sqlite3.connect(DB_PATH)
-            c = conn.cursor()
-            
-            # Delete content from all tables
-            c.execute("DELETE FROM memory")
-            memory_count = c.rowcount
-            
-            c.execute("DELETE FROM graph_edges")
-            edges_count = c.rowcount
-            
-            c.execute("DELETE FROM graph_nodes")
-            nodes_count = c.rowcount
-            
-            # Try to clear FTS if possible
+            conn = db_pool.connect(DB_PATH)
             try:
-                c.execute("DELETE FROM memory_fts")
-            except:
-                pass
+                c = conn.cursor()
                 
-            conn.commit()
-            conn.close()
+                # Delete content from all tables
+                c.execute("DELETE FROM memory")
+                memory_count = c.rowcount
+                
+                c.execute("DELETE FROM graph_edges")
+                edges_count = c.rowcount
+                
+                c.execute("DELETE FROM graph_nodes")
+                nodes_count = c.rowcount
+                
+                # Try to clear FTS if possible
+                try:
+                    c.execute("DELETE FROM memory_fts")
+                except:
+                    pass
+                    
+                conn.commit()
+            finally:
+                conn.close()
             
             # Reset Vector Store if possible
             try:
@@ -1028,12 +1155,14 @@ def register_tools(mcp):
                     meta_dict = _json.loads(metadata)
                 except Exception:
                     pass
-            vs.add(
+            embedding_id = vs.add(
                 conversation_id=conversation_id,
                 content=content,
                 content_type=source_type,
                 metadata=meta_dict,
             )
+            if embedding_id is not None:
+                get_graph_store().link_embedding(node_id, embedding_id)
         except Exception as e:
             print(f"[graph_add_node] VectorStore add failed (non-critical): {e}")
 
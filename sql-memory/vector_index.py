@@ -0,0 +1,650 @@
+# sql-memory/vector_index.py
+"""
+Vector Index - In-Process ANN-Index (IVF, NumPy) fuer den VectorStore.
+
+- Embeddings werden als gepackte float32-BLOBs gespeichert (pack_embedding);
+  Legacy-Zeilen mit JSON-Text bleiben lesbar (unpack_embedding).
+- Partitioniert nach (embedding_version, conversation_id, content_type).
+  Kleine Partitionen werden exakt (Matrix x Vektor) gescannt, ab
+  VECTOR_INDEX_IVF_MIN_ROWS wird ein IVF (spherical k-means) trainiert.
+- Sync ueber eine Changelog-Tabelle (embedding_changes), die per SQLite-Trigger
+  befuellt wird. Damit bleiben auch Schreiber ausserhalb des VectorStore
+  (z.B. core/lifecycle/archive.py) sichtbar.
+- Persistenz: Snapshot pro Partition (.npz) + Manifest mit Changelog-Seq.
+  Beim Start wird der Snapshot geladen und nur der Changelog-Rest nachgespielt.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+_IVF_MIN_ROWS = int(os.getenv("VECTOR_INDEX_IVF_MIN_ROWS", "4096"))
+_NPROBE = int(os.getenv("VECTOR_INDEX_NPROBE", "16"))
+_SAVE_EVERY = int(os.getenv("VECTOR_INDEX_SAVE_EVERY", "5000"))
+_CHANGELOG_RETAIN = int(os.getenv("VECTOR_INDEX_CHANGELOG_RETAIN", "100000"))
+_PRUNE_EVERY = int(os.getenv("VECTOR_INDEX_PRUNE_EVERY", "1000"))
+_KMEANS_ITERS = 8
+_KMEANS_SAMPLE_PER_LIST = 64
+_FETCH_CHUNK = 900  # < SQLITE_MAX_VARIABLE_NUMBER (999 on old builds)
+
+PartitionKey = Tuple[str, str, str]
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# BLOB codec
+# ─────────────────────────────────────────────────────────────────────────────
+
+def pack_embedding(vector: Iterable[float]) -> bytes:
+    """Packt einen Vektor als little-endian float32-BLOB."""
+    return np.asarray(list(vector), dtype="<f4").tobytes()
+
+
+def unpack_embedding(value: Any) -> Optional[np.ndarray]:
+    """
+    Dekodiert eine gespeicherte Embedding-Spalte.
+
+    bytes -> float32-BLOB, str -> Legacy-JSON-Liste. None bei leer/kaputt.
+    """
+    if value is None:
+        return None
+    try:
+        if isinstance(value, (bytes, bytearray, memoryview)):
+            raw = bytes(value)
+            if not raw or len(raw) % 4:
+                return None
+            return np.frombuffer(raw, dtype="<f4").astype(np.float32)
+        if isinstance(value, str):
+            if not value:
+                return None
+            arr = np.asarray(json.loads(value), dtype=np.float32)
+            return arr if arr.ndim == 1 and arr.size else None
+    except (ValueError, TypeError):
+        return None
+    return None
+
+
+def _normalize(vec: np.ndarray) -> np.ndarray:
+    norm = float(np.linalg.norm(vec))
+    if norm == 0.0:
+        return vec.astype(np.float32, copy=True)
+    return (vec / norm).astype(np.float32, copy=False)
+
+
+def ensure_changelog_schema(cursor: sqlite3.Cursor) -> None:
+    """Changelog-Tabelle + Trigger, die jede Mutation an embeddings protokollieren."""
+    cursor.execute(
+        """
+        CREATE TABLE IF NOT EXISTS embedding_changes (
+            seq INTEGER PRIMARY KEY AUTOINCREMENT,
+            embedding_id INTEGER NOT NULL
+        )
+        """
+    )
+    cursor.execute(
+        """
+        CREATE TRIGGER IF NOT EXISTS trg_embeddings_ai AFTER INSERT ON embeddings
+        BEGIN
+            INSERT INTO embedding_changes (embedding_id) VALUES (NEW.id);
+        END
+        """
+    )
+    cursor.execute(
+        """
+        CREATE TRIGGER IF NOT EXISTS trg_embeddings_au
+        AFTER UPDATE OF embedding, embedding_version, conversation_id, content_type
+        ON embeddings
+        BEGIN
+            INSERT INTO embedding_changes (embedding_id) VALUES (NEW.id);
+        END
+        """
+    )
+    cursor.execute(
+        """
+        CREATE TRIGGER IF NOT EXISTS trg_embeddings_ad AFTER DELETE ON embeddings
+        BEGIN
+            INSERT INTO embedding_changes (embedding_id) VALUES (OLD.id);
+        END
+        """
+    )
+
+
+def _partition_key(version: Any, conversation_id: Any, content_type: Any) -> PartitionKey:
+    return (str(version or ""), str(conversation_id or ""), str(content_type or ""))
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Partition
+# ─────────────────────────────────────────────────────────────────────────────
+
+class _Partition:
+    """Zusammenhaengende float32-Matrix einer Partition + optionales IVF."""
+
+    def __init__(self, dim: int, capacity: int = 64):
+        self.dim = dim
+        self.size = 0
+        self.dead = 0
+        self.ids = np.zeros(capacity, dtype=np.int64)
+        self.vecs = np.zeros((capacity, dim), dtype=np.float32)
+        self.alive = np.zeros(capacity, dtype=bool)
+        self.assign = np.full(capacity, -1, dtype=np.int32)
+        self.centroids: Optional[np.ndarray] = None
+        self.trained_size = 0
+        self.row_of: Dict[int, int] = {}
+
+    @property
+    def count(self) -> int:
+        return self.size - self.dead
+
+    def _grow(self, needed: int) -> None:
+        cap = self.ids.shape[0]
+        if needed <= cap:
+            return
+        new_cap = max(needed, cap * 2)
+        self.ids = np.resize(self.ids, new_cap)
+        vecs = np.zeros((new_cap, self.dim), dtype=np.float32)
+        vecs[: self.size] = self.vecs[: self.size]
+        self.vecs = vecs
+        alive = np.zeros(new_cap, dtype=bool)
+        alive[: self.size] = self.alive[: self.size]
+        self.alive = alive
+        assign = np.full(new_cap, -1, dtype=np.int32)
+        assign[: self.size] = self.assign[: self.size]
+        self.assign = assign
+
+    def add(self, entry_id: int, vec: np.ndarray) -> None:
+        self._grow(self.size + 1)
+        row = self.size
+        self.ids[row] = entry_id
+        self.vecs[row] = vec
+        self.alive[row] = True
+        if self.centroids is not None:
+            self.assign[row] = int(np.argmax(self.centroids @ vec))
+        self.row_of[entry_id] = row
+        self.size += 1
+        self._maybe_train()
+
+    def add_many(self, entry_ids: np.ndarray, vecs: np.ndarray) -> None:
+        n = int(entry_ids.shape[0])
+        if n == 0:
+            return
+        self._grow(self.size + n)
+        start, end = self.size, self.size + n
+        self.ids[start:end] = entry_ids
+        self.vecs[start:end] = vecs
+        self.alive[start:end] = True
+        if self.centroids is not None:
+            self.assign[start:end] = self._nearest_lists(vecs)
+        for offset, entry_id in enumerate(entry_ids.tolist()):
+            self.row_of[int(entry_id)] = start + offset
+        self.size = end
+        self._maybe_train()
+
+    def remove(self, entry_id: int) -> bool:
+        row = self.row_of.pop(entry_id, None)
+        if row is None:
+            return False
+        self.alive[row] = False
+        self.dead += 1
+        if self.dead > max(64, self.size // 4):
+            self._compact()
+        return True
+
+    def _compact(self) -> None:
+        keep = np.nonzero(self.alive[: self.size])[0]
+        n = int(keep.shape[0])
+        self.ids[:n] = self.ids[keep]
+        self.vecs[:n] = self.vecs[keep]
+        self.assign[:n] = self.assign[keep]
+        self.alive[:n] = True
+        self.alive[n:] = False
+        self.size = n
+        self.dead = 0
+        self.row_of = {int(eid): i for i, eid in enumerate(self.ids[:n].tolist())}
+
+    def _nearest_lists(self, vecs: np.ndarray) -> np.ndarray:
+        out = np.empty(vecs.shape[0], dtype=np.int32)
+        for start in range(0, vecs.shape[0], 8192):
+            chunk = vecs[start:start + 8192]
+            out[start:start + chunk.shape[0]] = np.argmax(chunk @ self.centroids.T, axis=1)
+        return out
+
+    def _maybe_train(self) -> None:
+        if self.count < _IVF_MIN_ROWS:
+            return
+        if self.centroids is not None and self.count < 2 * self.trained_size:
+            return
+        self.train()
+
+    def train(self, seed: int = 0) -> None:
+        """Spherical k-means auf einer Stichprobe, danach Zuordnung aller Zeilen."""
+        if self.dead:
+            self._compact()
+        n = self.size
+        if n == 0:
+            return
+        n_lists = int(min(1024, max(8, np.sqrt(n))))
+        rng = np.random.default_rng(seed)
+        sample_n = min(n, n_lists * _KMEANS_SAMPLE_PER_LIST)
+        sample = self.vecs[rng.choice(n, size=sample_n, replace=False)]
+        centroids = sample[rng.choice(sample_n, size=n_lists, replace=False)].copy()
+        for _ in range(_KMEANS_ITERS):
+            labels = np.argmax(sample @ centroids.T, axis=1)
+            sums = np.zeros_like(centroids)
+            np.add.at(sums, labels, sample)
+            counts = np.bincount(labels, minlength=n_lists)
+            empty = counts == 0
+            if empty.any():
+                sums[empty] = sample[rng.choice(sample_n, size=int(empty.sum()))]
+            norms = np.linalg.norm(sums, axis=1, keepdims=True)
+            norms[norms == 0] = 1.0
+            centroids = (sums / norms).astype(np.float32)
+        self.centroids = centroids
+        self.assign[:n] = self._nearest_lists(self.vecs[:n])
+        self.trained_size = n
+
+    def _candidate_rows(self, query: np.ndarray, nprobe: int) -> np.ndarray:
+        n = self.size
+        if self.centroids is None:
+            return np.nonzero(self.alive[:n])[0] if self.dead else np.arange(n)
+        probe = min(nprobe, self.centroids.shape[0])
+        cscores = self.centroids @ query
+        lists = np.argpartition(-cscores, probe - 1)[:probe]
+        mask = self.alive[:n] & np.isin(self.assign[:n], lists)
+        return np.nonzero(mask)[0]
+
+    @staticmethod
+    def _top(scores: np.ndarray, limit: int, min_similarity: float) -> np.ndarray:
+        keep = np.nonzero(scores >= min_similarity)[0]
+        if keep.shape[0] > limit:
+            keep = keep[np.argpartition(-scores[keep], limit - 1)[:limit]]
+        return keep
+
+    def search(
+        self, query: np.ndarray, limit: int, min_similarity: float, nprobe: int
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        n = self.size
+        if n == 0 or self.count == 0:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float32)
+        rows = self._candidate_rows(query, nprobe)
+        if rows.shape[0] == 0:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float32)
+        cand = self.vecs[:n] if rows.shape[0] == n else self.vecs[rows]
+        scores = cand @ query
+        keep = self._top(scores, limit, min_similarity)
+        return self.ids[rows[keep]], scores[keep]
+
+    def search_batch(
+        self,
+        queries: np.ndarray,
+        limit: int,
+        min_similarity: float,
+        nprobe: int,
+        below: Optional[np.ndarray] = None,
+        block: int = 64,
+    ) -> List[Tuple[np.ndarray, np.ndarray]]:
+        """
+        Top-k fuer mehrere Queries. Exakte Partitionen rechnen blockweise
+        (Queries x Matrix), IVF-Partitionen pro Query ueber die Probe-Listen.
+        below[i] beschraenkt Treffer von Query i auf ids < below[i].
+        """
+        m = int(queries.shape[0])
+        empty = (np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float32))
+        n = self.size
+        if m == 0 or n == 0 or self.count == 0:
+            return [empty] * m
+        out: List[Tuple[np.ndarray, np.ndarray]] = []
+        if self.centroids is not None:
+            for i in range(m):
+                rows = self._candidate_rows(queries[i], nprobe)
+                if below is not None:
+                    rows = rows[self.ids[rows] < below[i]]
+                if rows.shape[0] == 0:
+                    out.append(empty)
+                    continue
+                scores = self.vecs[rows] @ queries[i]
+                keep = self._top(scores, limit, min_similarity)
+                out.append((self.ids[rows[keep]], scores[keep]))
+            return out
+        rows = self._candidate_rows(queries[0], nprobe)
+        ids = self.ids[rows]
+        cand = self.vecs[:n] if rows.shape[0] == n else self.vecs[rows]
+        for start in range(0, m, block):
+            scores = queries[start:start + block] @ cand.T
+            if below is not None:
+                scores[ids[None, :] >= below[start:start + block, None]] = -np.inf
+            for row in scores:
+                keep = self._top(row, limit, min_similarity)
+                out.append((ids[keep], row[keep]))
+        return out
+
+    def to_arrays(self) -> Dict[str, np.ndarray]:
+        if self.dead:
+            self._compact()
+        n = self.size
+        arrays = {
+            "ids": self.ids[:n].copy(),
+            "vecs": self.vecs[:n].copy(),
+            "assign": self.assign[:n].copy(),
+            "trained_size": np.asarray([self.trained_size], dtype=np.int64),
+        }
+        if self.centroids is not None:
+            arrays["centroids"] = self.centroids
+        return arrays
+
+    @classmethod
+    def from_arrays(cls, arrays: Dict[str, np.ndarray]) -> "_Partition":
+        ids = np.asarray(arrays["ids"], dtype=np.int64)
+        vecs = np.asarray(arrays["vecs"], dtype=np.float32)
+        part = cls(dim=int(vecs.shape[1]), capacity=max(64, ids.shape[0]))
+        n = ids.shape[0]
+        part.ids[:n] = ids
+        part.vecs[:n] = vecs
+        part.alive[:n] = True
+        part.assign[:n] = np.asarray(arrays["assign"], dtype=np.int32)
+        part.size = n
+        part.row_of = {int(eid): i for i, eid in enumerate(ids.tolist())}
+        if "centroids" in arrays:
+            part.centroids = np.asarray(arrays["centroids"], dtype=np.float32)
+            part.trained_size = int(arrays["trained_size"][0])
+        return part
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Index
+# ─────────────────────────────────────────────────────────────────────────────
+
+class VectorIndex:
+    """
+    Partitionierter ANN-Index ueber die embeddings-Tabelle.
+
+    Thread-safe (RLock). Alle DB-Zugriffe laufen ueber die vom Aufrufer
+    uebergebene Connection.
+    """
+
+    def __init__(self, index_dir: Optional[str] = None, nprobe: int = _NPROBE):
+        self.index_dir = index_dir
+        self.nprobe = max(1, int(nprobe))
+        self._lock = threading.RLock()
+        self._partitions: Dict[PartitionKey, _Partition] = {}
+        self._key_of: Dict[int, PartitionKey] = {}
+        self._seq = 0
+        self._loaded = False
+        self._dirty: set = set()
+        self._mutations_since_save = 0
+        self._saved_seq = 0
+        self._pruned_seq = 0
+
+    # ── sync ────────────────────────────────────────────────────────────────
+
+    def sync(self, conn: sqlite3.Connection) -> None:
+        """Laedt Snapshot/DB beim ersten Aufruf und spielt danach den Changelog nach."""
+        with self._lock:
+            max_seq = self._max_seq(conn)
+            if not self._loaded:
+                if not self._load_snapshot(conn, max_seq):
+                    self.rebuild(conn)
+                    return
+            elif max_seq < self._seq:
+                # DB wurde ersetzt/zurueckgesetzt → Index passt nicht mehr.
+                self.rebuild(conn)
+                return
+            if max_seq > self._seq:
+                self._apply_changes(conn, max_seq)
+
+    def rebuild(self, conn: sqlite3.Connection) -> None:
+        """Vollstaendiger Neuaufbau aus der embeddings-Tabelle."""
+        with self._lock:
+            max_seq = self._max_seq(conn)
+            grouped: Dict[PartitionKey, Tuple[List[int], List[np.ndarray]]] = {}
+            cur = conn.execute(
+                "SELECT id, embedding_version, conversation_id, content_type, embedding "
+                "FROM embeddings"
+            )
+            while True:
+                batch = cur.fetchmany(4096)
+                if not batch:
+                    break
+                for entry_id, version, conv, ctype, blob in batch:
+                    vec = unpack_embedding(blob)
+                    if vec is None:
+                        continue
+                    ids, vecs = grouped.setdefault(_partition_key(version, conv, ctype), ([], []))
+                    ids.append(int(entry_id))
+                    vecs.append(vec)
+
+            self._partitions = {}
+            self._key_of = {}
+            for key, (ids, vecs) in grouped.items():
+                dim = int(vecs[0].shape[0])
+                pairs = [(i, v) for i, v in zip(ids, vecs) if v.shape[0] == dim]
+                mat = np.vstack([v for _, v in pairs]).astype(np.float32)
+                norms = np.linalg.norm(mat, axis=1, keepdims=True)
+                norms[norms == 0] = 1.0
+                part = _Partition(dim=dim, capacity=max(64, len(pairs)))
+                part.add_many(np.asarray([i for i, _ in pairs], dtype=np.int64), mat / norms)
+                self._partitions[key] = part
+                for entry_id, _ in pairs:
+                    self._key_of[entry_id] = key
+
+            self._seq = max_seq
+            self._loaded = True
+            self._dirty = set(self._partitions)
+            logger.info(
+                "[VectorIndex] Rebuilt %d partitions, %d vectors",
+                len(self._partitions),
+                len(self._key_of),
+            )
+            self.save()
+
+    def _apply_changes(self, conn: sqlite3.Connection, max_seq: int) -> None:
+        rows = conn.execute(
+            "SELECT DISTINCT embedding_id FROM embedding_changes WHERE seq > ? AND seq <= ?",
+            (self._seq, max_seq),
+        ).fetchall()
+        changed = [int(r[0]) for r in rows]
+        for entry_id in changed:
+            self._remove(entry_id)
+        for start in range(0, len(changed), _FETCH_CHUNK):
+            chunk = changed[start:start + _FETCH_CHUNK]
+            placeholders = ",".join("?" * len(chunk))
+            for entry_id, version, conv, ctype, blob in conn.execute(
+                "SELECT id, embedding_version, conversation_id, content_type, embedding "
+                f"FROM embeddings WHERE id IN ({placeholders})",
+                chunk,
+            ):
+                vec = unpack_embedding(blob)
+                if vec is not None:
+                    self._add(int(entry_id), _partition_key(version, conv, ctype), vec)
+        self._seq = max_seq
+        self._mutations_since_save += len(changed)
+        if self._mutations_since_save >= _SAVE_EVERY:
+            self.save()
+
+    def _add(self, entry_id: int, key: PartitionKey, vec: np.ndarray) -> None:
+        part = self._partitions.get(key)
+        if part is None:
+            part = _Partition(dim=int(vec.shape[0]))
+            self._partitions[key] = part
+        elif part.dim != vec.shape[0]:
+            logger.warning(
+                "[VectorIndex] dim mismatch for id=%s (%s != %s), skipped",
+                entry_id, vec.shape[0], part.dim,
+            )
+            return
+        part.add(entry_id, _normalize(vec))
+        self._key_of[entry_id] = key
+        self._dirty.add(key)
+
+    def _remove(self, entry_id: int) -> None:
+        key = self._key_of.pop(entry_id, None)
+        if key is None:
+            return
+        part = self._partitions.get(key)
+        if part is not None and part.remove(entry_id):
+            self._dirty.add(key)
+            if part.count == 0:
+                del self._partitions[key]
+
+    @staticmethod
+    def _max_seq(conn: sqlite3.Connection) -> int:
+        row = conn.execute(
+            "SELECT seq FROM sqlite_sequence WHERE name = 'embedding_changes'"
+        ).fetchone()
+        return int(row[0]) if row and row[0] is not None else 0
+
+    def prune_changelog(self, conn: sqlite3.Connection, retain: int = _CHANGELOG_RETAIN) -> int:
+        """Loescht alte Changelog-Eintraege, die dieser Index bereits angewendet hat."""
+        with self._lock:
+            cutoff = self._seq - max(0, int(retain))
+            if self.index_dir:
+                # Nur was der Snapshot schon enthaelt, sonst Rebuild beim Neustart.
+                cutoff = min(cutoff, self._saved_seq)
+        if cutoff <= 0:
+            return 0
+        cur = conn.execute("DELETE FROM embedding_changes WHERE seq <= ?", (cutoff,))
+        return int(cur.rowcount or 0)
+
+    def maybe_prune_changelog(self, conn: sqlite3.Connection) -> int:
+        """Gedrosseltes prune_changelog (alle _PRUNE_EVERY Changelog-Seqs) fuer die Schreibpfade."""
+        with self._lock:
+            if self._seq - self._pruned_seq < _PRUNE_EVERY:
+                return 0
+            self._pruned_seq = self._seq
+        return self.prune_changelog(conn, _CHANGELOG_RETAIN)
+
+    # ── search ──────────────────────────────────────────────────────────────
+
+    def search(
+        self,
+        query: Iterable[float],
+        match: Callable[[PartitionKey], bool],
+        limit: int,
+        min_similarity: float,
+        nprobe: Optional[int] = None,
+    ) -> List[Tuple[int, float]]:
+        """Top-k (id, cosine) ueber alle Partitionen, fuer die match(key) gilt."""
+        q = _normalize(np.asarray(list(query), dtype=np.float32))
+        limit = max(1, int(limit))
+        probe = self.nprobe if nprobe is None else max(1, int(nprobe))
+        all_ids: List[np.ndarray] = []
+        all_scores: List[np.ndarray] = []
+        with self._lock:
+            for key, part in self._partitions.items():
+                if part.dim != q.shape[0] or not match(key):
+                    continue
+                ids, scores = part.search(q, limit, min_similarity, probe)
+                if ids.shape[0]:
+                    all_ids.append(ids)
+                    all_scores.append(scores)
+        if not all_ids:
+            return []
+        ids = np.concatenate(all_ids)
+        scores = np.concatenate(all_scores)
+        order = np.argsort(-scores, kind="stable")[:limit]
+        return [(int(ids[i]), float(scores[i])) for i in order]
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "loaded": self._loaded,
+                "seq": self._seq,
+                "partitions": len(self._partitions),
+                "vectors": len(self._key_of),
+                "ivf_partitions": sum(
+                    1 for p in self._partitions.values() if p.centroids is not None
+                ),
+            }
+
+    # ── persistence ─────────────────────────────────────────────────────────
+
+    @staticmethod
+    def _partition_file(key: PartitionKey) -> str:
+        digest = hashlib.sha256("\x1f".join(key).encode("utf-8")).hexdigest()[:24]
+        return f"part_{digest}.npz"
+
+    def save(self) -> None:
+        """Schreibt geaenderte Partitionen + Manifest (atomar via os.replace)."""
+        if not self.index_dir:
+            return
+        with self._lock:
+            try:
+                os.makedirs(self.index_dir, exist_ok=True)
+                for key in list(self._dirty):
+                    part = self._partitions.get(key)
+                    path = os.path.join(self.index_dir, self._partition_file(key))
+                    if part is None:
+                        if os.path.exists(path):
+                            os.remove(path)
+                        continue
+                    tmp = path + ".tmp.npz"
+                    np.savez(tmp, **part.to_arrays())
+                    os.replace(tmp, path)
+                manifest = {
+                    "seq": self._seq,
+                    "partitions": [
+                        {"key": list(key), "file": self._partition_file(key)}
+                        for key in self._partitions
+                    ],
+                }
+                manifest_path = os.path.join(self.index_dir, "manifest.json")
+                with open(manifest_path + ".tmp", "w", encoding="utf-8") as fh:
+                    json.dump(manifest, fh)
+                os.replace(manifest_path + ".tmp", manifest_path)
+                self._dirty.clear()
+                self._mutations_since_save = 0
+                self._saved_seq = self._seq
+            except Exception as e:
+                logger.warning(f"[VectorIndex] Snapshot save failed: {e}")
+
+    def _load_snapshot(self, conn: sqlite3.Connection, max_seq: int) -> bool:
+        if not self.index_dir:
+            return False
+        manifest_path = os.path.join(self.index_dir, "manifest.json")
+        if not os.path.exists(manifest_path):
+            return False
+        try:
+            with open(manifest_path, "r", encoding="utf-8") as fh:
+                manifest = json.load(fh)
+            snap_seq = int(manifest.get("seq", 0))
+            if snap_seq > max_seq:
+                return False
+            if snap_seq < max_seq:
+                row = conn.execute("SELECT MIN(seq) FROM embedding_changes").fetchone()
+                min_seq = row[0] if row else None
+                if min_seq is None or snap_seq < int(min_seq) - 1:
+                    # Changelog wurde ueber den Snapshot hinaus gekuerzt.
+                    return False
+
+            partitions: Dict[PartitionKey, _Partition] = {}
+            key_of: Dict[int, PartitionKey] = {}
+            for entry in manifest.get("partitions", []):
+                key = tuple(entry["key"])
+                with np.load(os.path.join(self.index_dir, entry["file"])) as data:
+                    part = _Partition.from_arrays({k: data[k] for k in data.files})
+                partitions[key] = part
+                for entry_id in part.row_of:
+                    key_of[entry_id] = key
+        except Exception as e:
+            logger.warning(f"[VectorIndex] Snapshot load failed, rebuilding: {e}")
+            return False
+
+        self._partitions = partitions
+        self._key_of = key_of
+        self._seq = snap_seq
+        self._saved_seq = snap_seq
+        self._loaded = True
+        self._dirty = set()
+        if max_seq > snap_seq:
+            self._apply_changes(conn, max_seq)
+        logger.info(
+            "[VectorIndex] Loaded snapshot seq=%d (%d vectors)", snap_seq, len(key_of)
+        )
+        return True
@@ -7,20 +7,34 @@ Scope 3.2:
   - Suchanfragen filtern standardmaessig auf aktive embedding_version
     (kein stilles Mischen alter/neuer Vektoren).
   - Re-Embedding/Backfill in Batches fuer veraltete Versionen.
+
+Vektoren werden als gepackte float32-BLOBs gespeichert; die Suche laeuft ueber
+den In-Process-ANN-Index aus vector_index.py (Legacy-JSON-Zeilen bleiben
+lesbar und werden per backfill_embeddings in BLOBs umgepackt).
+get_vector_store() laedt bzw. baut den Index im Hintergrund, damit die erste
+Suche nicht den Aufbau (inkl. IVF-Training) bezahlt.
 """
 
 import json
 import logging
+import os
 import sqlite3
+import threading
 from typing import Any, Dict, List, Optional
 
+import db_pool
 from embedding import (
-    cosine_similarity,
     get_active_embedding_version,
     get_embedding,
     get_embedding_with_metadata,
 )
 from memory_mcp.config import DB_PATH
+from vector_index import (
+    VectorIndex,
+    ensure_changelog_schema,
+    pack_embedding,
+    unpack_embedding,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -28,13 +42,42 @@ logger = logging.getLogger(__name__)
 class VectorStore:
     """SQLite-basierter Vector Store."""
 
-    def __init__(self, db_path: str):
+    def __init__(self, db_path: str, index_dir: Optional[str] = None):
         self.db_path = db_path
         self._init_table()
+        if index_dir is None:
+            index_dir = os.getenv("VECTOR_INDEX_DIR") or os.path.join(
+                os.path.dirname(os.path.abspath(db_path)), "vector_index"
+            )
+        self.index = VectorIndex(index_dir=index_dir or None)
+
+    def warm_index(self) -> None:
+        """Laedt Snapshot bzw. baut den Index (inkl. IVF-Training) vor der ersten Suche."""
+        conn = db_pool.connect(self.db_path, readonly=True)
+        try:
+            self.index.sync(conn)
+        finally:
+            conn.close()
+
+    def start_index_warmup(self) -> threading.Thread:
+        """Startet warm_index() im Hintergrund (Daemon-Thread)."""
+        def _run():
+            try:
+                self.warm_index()
+            except Exception as e:
+                logger.warning(f"[VectorStore] Index warmup skipped: {e}")
+
+        thread = threading.Thread(
+            target=_run,
+            daemon=True,
+            name="vector-index-warmup",
+        )
+        thread.start()
+        return thread
 
     def _init_table(self):
         """Erstellt/Migriert die Embedding-Tabelle."""
-        conn = sqlite3.connect(self.db_path)
+        conn = db_pool.connect(self.db_path)
         try:
             cursor = conn.cursor()
             cursor.execute(
@@ -82,6 +125,7 @@ class VectorStore:
             "CREATE INDEX IF NOT EXISTS idx_embeddings_type_version "
             "ON embeddings(content_type, embedding_version)"
         )
+        ensure_changelog_schema(cursor)
 
     def add(
         self,
@@ -98,7 +142,7 @@ class VectorStore:
             logger.error("[VectorStore] Could not generate embedding")
             return None
 
-        conn = sqlite3.connect(self.db_path)
+        conn = db_pool.connect(self.db_path)
         try:
             cursor = conn.cursor()
             cursor.execute(
@@ -113,7 +157,7 @@ class VectorStore:
                     content,
                     content_type,
                     json.dumps(metadata) if metadata else None,
-                    json.dumps(emb["embedding"]),
+                    pack_embedding(emb["embedding"]),
                     emb["embedding_model"],
                     emb["embedding_dim"],
                     emb["embedding_version"],
@@ -121,6 +165,7 @@ class VectorStore:
             )
             conn.commit()
             entry_id = cursor.lastrowid
+            self._prune_changelog(conn)
             logger.info(
                 "[VectorStore] Added entry %s version=%s",
                 entry_id,
@@ -142,83 +187,155 @@ class VectorStore:
         content_type: Optional[str] = None,
         allow_mixed_versions: bool = False,
         embedding_version: Optional[str] = None,
+        query_embedding: Optional[List[float]] = None,
+        query_embedding_version: Optional[str] = None,
     ) -> List[Dict[str, Any]]:
         """
         Semantische Suche nach aehnlichen Eintraegen.
 
         Default: kein Mixing. Es wird nur die aktive embedding_version gelesen.
+        query_embedding: vom Aufrufer bereits berechneter Query-Vektor (z.B. aus
+        dem Turn-Cache im Core). Wird nur genutzt, wenn query_embedding_version
+        zur gesuchten (bzw. aktiven) Version passt, sonst wird neu embedded.
         """
-        query_embedding = get_embedding(query)
-        if not query_embedding:
-            return []
-
         version_filter: Optional[str] = embedding_version
         if version_filter is None and not allow_mixed_versions:
             version_filter = get_active_embedding_version()
 
-        conn = sqlite3.connect(self.db_path)
-        try:
-            cursor = conn.cursor()
+        expected_version = version_filter or get_active_embedding_version()
+        if not (query_embedding and query_embedding_version == expected_version):
+            query_embedding = get_embedding(query)
+        if not query_embedding:
+            return []
 
-            sql = (
-                "SELECT id, content, content_type, metadata, embedding, "
-                "embedding_model, embedding_dim, embedding_version "
-                "FROM embeddings WHERE 1=1"
+        def _match(key) -> bool:
+            version, conv, ctype = key
+            if version_filter and version != version_filter:
+                return False
+            if conversation_id and conv not in (conversation_id, "global"):
+                return False
+            if content_type and ctype != content_type:
+                return False
+            return True
+
+        conn = db_pool.connect(self.db_path, readonly=True)
+        try:
+            self.index.sync(conn)
+            hits = self.index.search(
+                query_embedding,
+                match=_match,
+                limit=limit,
+                min_similarity=min_similarity,
             )
-            params: List[Any] = []
-
-            if conversation_id:
-                sql += " AND (conversation_id = ? OR conversation_id = 'global')"
-                params.append(conversation_id)
-
-            if content_type:
-                sql += " AND content_type = ?"
-                params.append(content_type)
-
-            if version_filter:
-                sql += " AND embedding_version = ?"
-                params.append(version_filter)
-
-            cursor.execute(sql, params)
-            rows = cursor.fetchall()
+            if not hits:
+                return []
+            placeholders = ",".join("?" * len(hits))
+            rows = conn.execute(
+                "SELECT id, content, content_type, metadata, "
+                "embedding_model, embedding_dim, embedding_version "
+                f"FROM embeddings WHERE id IN ({placeholders})",
+                [entry_id for entry_id, _ in hits],
+            ).fetchall()
         finally:
             conn.close()
 
+        by_id = {row[0]: row for row in rows}
         results = []
-        for row in rows:
-            (
-                entry_id,
-                content_val,
-                ctype,
-                metadata_json,
-                embedding_json,
-                emb_model,
-                emb_dim,
-                emb_version,
-            ) = row
-            if not embedding_json:
+        for entry_id, similarity in hits:
+            row = by_id.get(entry_id)
+            if row is None:
                 continue
+            _, content_val, ctype, metadata_json, emb_model, emb_dim, emb_version = row
             try:
-                stored_embedding = json.loads(embedding_json)
-                similarity = cosine_similarity(query_embedding, stored_embedding)
-                if similarity >= min_similarity:
-                    results.append(
-                        {
-                            "id": entry_id,
-                            "content": content_val,
-                            "type": ctype,
-                            "metadata": json.loads(metadata_json) if metadata_json else {},
-                            "similarity": round(similarity, 4),
-                            "embedding_model": emb_model,
-                            "embedding_dim": emb_dim,
-                            "embedding_version": emb_version,
-                        }
-                    )
-            except Exception:
-                continue
+                metadata = json.loads(metadata_json) if metadata_json else {}
+            except (json.JSONDecodeError, TypeError):
+                metadata = {}
+            results.append(
+                {
+                    "id": entry_id,
+                    "content": content_val,
+                    "type": ctype,
+                    "metadata": metadata,
+                    "similarity": round(similarity, 4),
+                    "embedding_model": emb_model,
+                    "embedding_dim": emb_dim,
+                    "embedding_version": emb_version,
+                }
+            )
+        return results
+
+    def delete(self, entry_ids: List[int]) -> int:
+        """Loescht Embedding-Zeilen; der Index folgt ueber den Changelog."""
+        ids = [int(i) for i in entry_ids or []]
+        if not ids:
+            return 0
+        conn = db_pool.connect(self.db_path)
+        try:
+            placeholders = ",".join("?" * len(ids))
+            cur = conn.execute(f"DELETE FROM embeddings WHERE id IN ({placeholders})", ids)
+            conn.commit()
+            deleted = int(cur.rowcount or 0)
+            self.index.sync(conn)
+            self._prune_changelog(conn)
+            return deleted
+        finally:
+            conn.close()
+
+    def _prune_changelog(self, conn: sqlite3.Connection) -> None:
+        """Haelt embedding_changes begrenzt; Fehler blockieren den Schreibpfad nicht."""
+        try:
+            if self.index.maybe_prune_changelog(conn):
+                conn.commit()
+        except Exception as e:
+            logger.warning(f"[VectorStore] Changelog prune failed: {e}")
 
-        results.sort(key=lambda x: x["similarity"], reverse=True)
-        return results[:limit]
+    def pack_legacy_embeddings(self, batch_size: int = 1000) -> int:
+        """
+        Migration: packt Legacy-JSON-Embeddings in float32-BLOBs um
+        (ohne Re-Embedding). Resume-faehig, liefert Anzahl umgepackter Zeilen.
+
+        Nicht lesbare JSON-Werte bleiben unveraendert stehen und werden geloggt
+        (kein stilles Ueberschreiben mit NULL); fuer die Suche sind sie wie
+        bisher unsichtbar.
+        """
+        batch_size = max(1, int(batch_size))
+        conn = db_pool.connect(self.db_path)
+        try:
+            packed = 0
+            skipped: List[int] = []
+            last_id = 0
+            while True:
+                rows = conn.execute(
+                    "SELECT id, embedding FROM embeddings "
+                    "WHERE typeof(embedding) = 'text' AND id > ? ORDER BY id ASC LIMIT ?",
+                    (last_id, batch_size),
+                ).fetchall()
+                if not rows:
+                    break
+                last_id = rows[-1][0]
+                updates = []
+                for entry_id, embedding_json in rows:
+                    vec = unpack_embedding(embedding_json)
+                    if vec is None:
+                        skipped.append(entry_id)
+                        continue
+                    updates.append((vec.tobytes(), entry_id))
+                conn.executemany("UPDATE embeddings SET embedding = ? WHERE id = ?", updates)
+                conn.commit()
+                packed += len(updates)
+            if skipped:
+                logger.warning(
+                    "[VectorStore] %d legacy embeddings not parseable, left unchanged (ids %s%s)",
+                    len(skipped),
+                    ", ".join(str(i) for i in skipped[:20]),
+                    ", ..." if len(skipped) > 20 else "",
+                )
+            self.index.sync(conn)
+            self.index.prune_changelog(conn)
+            conn.commit()
+            return packed
+        finally:
+            conn.close()
 
     def get_version_status(
         self,
@@ -227,7 +344,7 @@ class VectorStore:
     ) -> Dict[str, Any]:
         """Status fuer aktive vs. veraltete embedding-Versionen."""
         active_version = get_active_embedding_version()
-        conn = sqlite3.connect(self.db_path)
+        conn = db_pool.connect(self.db_path, readonly=True)
         try:
             cursor = conn.cursor()
             sql = (
@@ -272,66 +389,79 @@ class VectorStore:
         active_version = get_active_embedding_version()
         status_before = self.get_version_status(conversation_id, content_type)
 
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
+        where = [
+            "(embedding_version IS NULL OR embedding_version != ?)"
+        ]
+        params: List[Any] = [active_version]
+        if conversation_id:
+            where.append("conversation_id = ?")
+            params.append(conversation_id)
+        if content_type:
+            where.append("content_type = ?")
+            params.append(content_type)
+
+        sql = (
+            "SELECT id, content FROM embeddings WHERE "
+            + " AND ".join(where)
+            + " ORDER BY id ASC LIMIT ?"
+        )
+        params.append(batch_size)
+        conn = db_pool.connect(self.db_path, readonly=True)
         try:
-            where = [
-                "(embedding_version IS NULL OR embedding_version != ?)"
-            ]
-            params: List[Any] = [active_version]
-            if conversation_id:
-                where.append("conversation_id = ?")
-                params.append(conversation_id)
-            if content_type:
-                where.append("content_type = ?")
-                params.append(content_type)
-
-            sql = (
-                "SELECT id, content FROM embeddings WHERE "
-                + " AND ".join(where)
-                + " ORDER BY id ASC LIMIT ?"
-            )
-            params.append(batch_size)
+            conn.row_factory = sqlite3.Row
             rows = conn.execute(sql, params).fetchall()
+        finally:
+            conn.close()
 
-            if dry_run:
-                return {
-                    "success": True,
-                    "dry_run": True,
-                    "active_version": active_version,
-                    "selected": len(rows),
-                    "processed": 0,
-                    "failed": 0,
-                    "remaining_stale": status_before["stale_count"],
-                }
-
-            processed = 0
-            failed = 0
-            for row in rows:
-                emb = get_embedding_with_metadata(row["content"])
-                if not emb:
-                    failed += 1
-                    continue
-                conn.execute(
-                    """
-                    UPDATE embeddings
-                    SET embedding = ?, embedding_model = ?, embedding_dim = ?, embedding_version = ?
-                    WHERE id = ?
-                    """,
-                    (
-                        json.dumps(emb["embedding"]),
-                        emb["embedding_model"],
-                        emb["embedding_dim"],
-                        emb["embedding_version"],
-                        row["id"],
-                    ),
+        if dry_run:
+            return {
+                "success": True,
+                "dry_run": True,
+                "active_version": active_version,
+                "selected": len(rows),
+                "processed": 0,
+                "failed": 0,
+                "remaining_stale": status_before["stale_count"],
+            }
+
+        # Embeddings ausserhalb der Writer-Lease holen (Netzwerk-Calls),
+        # danach alle Updates in einer kurzen Schreib-Transaktion.
+        updates = []
+        failed = 0
+        for row in rows:
+            emb = get_embedding_with_metadata(row["content"])
+            if not emb:
+                failed += 1
+                continue
+            updates.append(
+                (
+                    pack_embedding(emb["embedding"]),
+                    emb["embedding_model"],
+                    emb["embedding_dim"],
+                    emb["embedding_version"],
+                    row["id"],
                 )
-                processed += 1
+            )
+        processed = len(updates)
 
+        conn = db_pool.connect(self.db_path)
+        try:
+            conn.executemany(
+                """
+                UPDATE embeddings
+                SET embedding = ?, embedding_model = ?, embedding_dim = ?, embedding_version = ?
+                WHERE id = ?
+                """,
+                updates,
+            )
             conn.commit()
+            self.index.sync(conn)
+            self.index.save()
+            self._prune_changelog(conn)
         finally:
             conn.close()
 
+        packed = self.pack_legacy_embeddings(batch_size=batch_size)
         status_after = self.get_version_status(conversation_id, content_type)
         return {
             "success": True,
@@ -339,6 +469,7 @@ class VectorStore:
             "selected": len(rows),
             "processed": processed,
             "failed": failed,
+            "packed_legacy": packed,
             "remaining_stale": status_after["stale_count"],
         }
 
@@ -351,4 +482,5 @@ def get_vector_store() -> VectorStore:
     global _vector_store
     if _vector_store is None:
         _vector_store = VectorStore(DB_PATH)
+        _vector_store.start_index_warmup()
     return _vector_store
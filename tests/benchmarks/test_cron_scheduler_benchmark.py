@@ -0,0 +1,152 @@
+"""
+Micro-Benchmark fuer core/autonomy/cron_scheduler.py (Tick + list_jobs).
+
+Laedt BENCH_CRON_JOBS Cron-Jobs (taeglich/stuendlich/Werktage, gemischte
+Zeitzonen) aus einer State-Datei und misst ueber BENCH_CRON_TICKS Minuten:
+
+- legacy: Verhalten vor dem Heap — pro Tick jeden Job gegen die aktuelle
+          Minute pruefen, next_run_at per Minuten-Schritt (bis 35 Tage)
+- heap:   AutonomyCronScheduler._tick_once (nur faellige Heap-Eintraege) und
+          list_jobs mit feldweise berechnetem next_run_at
+
+Beide Pfade muessen dieselben Jobs feuern und dieselben next_run_at liefern.
+
+    BENCH_CRON_JOBS=10000 pytest -q -s tests/benchmarks/test_cron_scheduler_benchmark.py
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import random
+import statistics
+import time
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from core.autonomy.cron_scheduler import (
+    AutonomyCronScheduler,
+    _iso,
+    cron_matches,
+    parse_cron_expression,
+)
+
+JOBS = int(os.getenv("BENCH_CRON_JOBS", "10000"))
+TICKS = int(os.getenv("BENCH_CRON_TICKS", "60"))
+LIST_SAMPLE = int(os.getenv("BENCH_CRON_LIST_SAMPLE", "500"))
+
+# Juni: keine Zeitumstellung im Messfenster, damit legacy (Wanduhr-Schritte)
+# und Heap (echte UTC-Minuten) identisch sein muessen
+_BASE = datetime(2026, 6, 10, 7, 0, tzinfo=timezone.utc)
+_ZONES = ["UTC", "Europe/Berlin", "America/New_York", "Asia/Tokyo", "Australia/Sydney"]
+
+
+def _cron(rng: random.Random) -> str:
+    kind = rng.random()
+    if kind < 0.6:
+        return f"{rng.randrange(60)} {rng.randrange(24)} * * *"
+    if kind < 0.9:
+        return f"{rng.randrange(60)} */{rng.choice([2, 3, 6])} * * *"
+    return f"{rng.randrange(60)} {rng.randrange(6, 18)} * * 1-5"
+
+
+def _write_state(path: str, rng: random.Random) -> None:
+    jobs = []
+    for i in range(JOBS):
+        jobs.append({
+            "id": f"cron_{i:05d}",
+            "name": f"job-{i}",
+            "objective": "bench objective",
+            "conversation_id": f"conv-{i % 50}",
+            "cron": _cron(rng),
+            "timezone": rng.choice(_ZONES),
+            "schedule_mode": "recurring",
+            "enabled": True,
+            "max_loops": 4,
+            "created_at": _iso(_BASE),
+        })
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"version": 1, "jobs": jobs, "history": []}, f)
+
+
+def _legacy_due(jobs, parsed, now_utc: datetime) -> list:
+    due = []
+    for job_id, job in jobs.items():
+        local = now_utc.astimezone(ZoneInfo(job["timezone"])).replace(second=0, microsecond=0)
+        if cron_matches(parsed[job["cron"]], local):
+            due.append(job_id)
+    return due
+
+
+def _legacy_next_run(parsed, tz_name: str, now_utc: datetime) -> str:
+    local = now_utc.astimezone(ZoneInfo(tz_name)).replace(second=0, microsecond=0)
+    for i in range(1, 35 * 24 * 60 + 1):
+        candidate = local + timedelta(minutes=i)
+        if cron_matches(parsed, candidate):
+            return _iso(candidate.astimezone(timezone.utc))
+    return ""
+
+
+@pytest.mark.slow
+def test_cron_scheduler_heap_vs_legacy(tmp_path):
+    state_path = str(tmp_path / "autonomy_cron_state.json")
+    _write_state(state_path, random.Random(5))
+    scheduler = AutonomyCronScheduler(
+        state_path=state_path,
+        tick_s=10,
+        max_concurrency=1,
+        submit_cb=None,
+        max_jobs=JOBS,
+        max_jobs_per_conversation=JOBS,
+        max_pending_runs=JOBS * 10,
+    )
+    scheduler._save_state_locked = lambda *a, **k: None  # nur Scheduling messen, keine Store-Writes
+    with patch("core.autonomy.cron_scheduler._utcnow", return_value=_BASE):
+        scheduler._load_state_locked()
+    jobs = dict(scheduler._jobs)
+    parsed = {expr: parse_cron_expression(expr) for expr in {j["cron"] for j in jobs.values()}}
+
+    async def _run():
+        legacy_ms, heap_ms = [], []
+        for minute in range(TICKS):
+            now = _BASE + timedelta(minutes=minute, seconds=5)
+            t0 = time.perf_counter()
+            expected = _legacy_due(jobs, parsed, now)
+            legacy_ms.append((time.perf_counter() - t0) * 1000)
+
+            before = len(scheduler._pending)
+            with patch("core.autonomy.cron_scheduler._utcnow", return_value=now):
+                t0 = time.perf_counter()
+                await scheduler._tick_once()
+                heap_ms.append((time.perf_counter() - t0) * 1000)
+            fired = [x["cron_job_id"] for x in scheduler._pending[before:]]
+            assert sorted(fired) == sorted(expected)
+
+        now = _BASE + timedelta(minutes=TICKS, seconds=5)
+        with patch("core.autonomy.cron_scheduler._utcnow", return_value=now):
+            t0 = time.perf_counter()
+            listed = await scheduler.list_jobs()
+            list_ms = (time.perf_counter() - t0) * 1000
+        return legacy_ms, heap_ms, listed, list_ms, now
+
+    legacy_ms, heap_ms, listed, list_ms, now = asyncio.run(_run())
+
+    sample = listed[:LIST_SAMPLE]
+    t0 = time.perf_counter()
+    legacy_next = [_legacy_next_run(parsed[j["cron"]], j["timezone"], now) for j in sample]
+    legacy_list_ms = (time.perf_counter() - t0) * 1000 * len(listed) / max(1, len(sample))
+    assert [j["next_run_at"] for j in sample] == legacy_next
+
+    fired = len(scheduler._pending)
+    for mode, lat in (("legacy", sorted(legacy_ms)), ("heap", sorted(heap_ms))):
+        print(
+            f"\n{mode} tick: jobs={JOBS} ticks={TICKS} fired={fired} p50={statistics.median(lat):.2f}ms "
+            f"p95={lat[int(len(lat) * 0.95) - 1]:.2f}ms"
+        )
+    print(f"list_jobs: legacy~{legacy_list_ms:.0f}ms (hochgerechnet aus {len(sample)}) heap={list_ms:.0f}ms")
+    assert statistics.median(heap_ms) < statistics.median(legacy_ms)
+    assert list_ms < legacy_list_ms
@@ -0,0 +1,127 @@
+"""
+Micro-Benchmark fuer die Cron-State-Persistenz (core/autonomy/cron_state_store.py).
+
+BENCH_STORE_JOBS Jobs plus 200 Runs Historie, danach BENCH_STORE_UPDATES
+Aenderungen an je einem Job (+ ein Run-Eintrag wie nach einem Dispatch):
+
+- legacy: Verhalten vor dem Store — kompletter State als JSON mit indent=2
+          neu schreiben, synchron im Scheduler-Lock
+- store:  AutonomyCronScheduler._save_state_locked, nur der geaenderte Job
+          und der neue Run; im Lock wird nur serialisiert, die SQLite-Writes
+          laufen im Writer-Thread
+
+Gemessen wird die Zeit im Lock; fuer den Store zusaetzlich bis flush().
+
+    BENCH_STORE_JOBS=2000 pytest -q -s tests/benchmarks/test_cron_state_store_benchmark.py
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import statistics
+import time
+
+import pytest
+
+from core.autonomy.cron_scheduler import AutonomyCronScheduler, _iso
+
+JOBS = int(os.getenv("BENCH_STORE_JOBS", "2000"))
+UPDATES = int(os.getenv("BENCH_STORE_UPDATES", "200"))
+
+
+def _job(i: int) -> dict:
+    return {
+        "id": f"cron_{i:05d}",
+        "name": f"job-{i}",
+        "objective": "summarize the nightly logs and open issues " * 3,
+        "conversation_id": f"conv-{i % 50}",
+        "cron": f"{i % 60} {i % 24} * * *",
+        "timezone": "Europe/Berlin",
+        "schedule_mode": "recurring",
+        "enabled": True,
+        "max_loops": 4,
+        "reference_links": [{"category": "skills", "url": f"skill://s{i}"}],
+        "last_status": "never",
+        "updated_at": _iso(),
+    }
+
+
+def _run(i: int) -> dict:
+    return {
+        "run_id": f"run{i:06d}",
+        "cron_job_id": f"cron_{i % JOBS:05d}",
+        "status": "submitted",
+        "queued_at": _iso(),
+        "started_at": _iso(),
+        "finished_at": _iso(),
+        "autonomy_job_id": f"autonomy_{i}",
+        "reason": "schedule",
+    }
+
+
+def _legacy_save(path: str, jobs: dict, history: list) -> None:
+    data = {"version": 1, "updated_at": _iso(), "jobs": list(jobs.values()), "history": history[-200:]}
+    tmp = f"{path}.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2)
+    os.replace(tmp, path)
+
+
+@pytest.mark.slow
+def test_cron_state_store_vs_full_json_rewrite(tmp_path):
+    jobs = {j["id"]: j for j in (_job(i) for i in range(JOBS))}
+    history = [_run(i) for i in range(200)]
+
+    legacy_path = str(tmp_path / "legacy_state.json")
+    legacy_ms = []
+    for n in range(UPDATES):
+        job = jobs[f"cron_{n % JOBS:05d}"]
+        job["last_status"] = "submitted"
+        history.append(_run(1000 + n))
+        t0 = time.perf_counter()
+        _legacy_save(legacy_path, jobs, history)
+        legacy_ms.append((time.perf_counter() - t0) * 1000)
+
+    scheduler = AutonomyCronScheduler(
+        state_path=str(tmp_path / "autonomy_cron_state.json"),
+        tick_s=10,
+        max_concurrency=1,
+        submit_cb=None,
+    )
+    scheduler._jobs = jobs
+    scheduler._save_state_locked(list(jobs), history)
+    scheduler._store.flush().result()
+
+    store_ms = []
+    t_all = time.perf_counter()
+    for n in range(UPDATES):
+        job_id = f"cron_{n % JOBS:05d}"
+        jobs[job_id]["last_status"] = "failed"
+        run = _run(5000 + n)
+        t0 = time.perf_counter()
+        scheduler._save_state_locked([job_id], [run])
+        store_ms.append((time.perf_counter() - t0) * 1000)
+    scheduler._store.flush().result()
+    store_total_ms = (time.perf_counter() - t_all) * 1000
+
+    scheduler._load_state_locked()
+    assert scheduler._jobs[f"cron_{0:05d}"]["last_status"] == "failed"
+    assert scheduler._history[-1]["run_id"] == _run(5000 + UPDATES - 1)["run_id"]
+    assert scheduler._store.stats["errors"] == 0
+
+    legacy_ms.sort()
+    store_ms.sort()
+    size_kb = os.path.getsize(legacy_path) / 1024
+    print(
+        f"\nlegacy: jobs={JOBS} updates={UPDATES} state={size_kb:.0f}KB "
+        f"lock p50={statistics.median(legacy_ms):.2f}ms p95={legacy_ms[int(len(legacy_ms) * 0.95) - 1]:.2f}ms "
+        f"total={sum(legacy_ms):.0f}ms"
+    )
+    print(
+        f"store:  jobs={JOBS} updates={UPDATES} "
+        f"lock p50={statistics.median(store_ms):.3f}ms p95={store_ms[int(len(store_ms) * 0.95) - 1]:.3f}ms "
+        f"total_incl_flush={store_total_ms:.0f}ms"
+    )
+    assert statistics.median(store_ms) < statistics.median(legacy_ms)
+    assert store_total_ms < sum(legacy_ms)
@@ -0,0 +1,131 @@
+"""
+Benchmark: Semantic-Edge-Aufbau im GraphBuilder.
+
+  - legacy:  pro neuem Node die letzten 100 Nodes (JSON-Embeddings) laden,
+             Python-Cosine, add_edge pro Treffer
+  - indexed: GraphNodeIndex (k-NN ueber alle Nodes) + Batch-Upsert
+  - rebuild: rebuild_semantic_edges() ueber den ganzen Graphen in Chunks
+
+Gemessen wird Latenz pro Insert und die Zahl gefundener Kanten (der alte
+Pfad sieht nur das 100er-Fenster und verpasst aeltere Nachbarn).
+
+    BENCH_GRAPH_SEM_NODES=20000 BENCH_GRAPH_SEM_DIM=384 \\
+        pytest -q -s tests/benchmarks/test_graph_semantic_edges_benchmark.py
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+_SQL_MEMORY = Path(__file__).resolve().parents[2] / "sql-memory"
+if str(_SQL_MEMORY) not in sys.path:
+    sys.path.insert(0, str(_SQL_MEMORY))
+
+import db_pool  # noqa: E402
+import graph.graph_store as gs_module  # noqa: E402
+from graph import graph_builder  # noqa: E402
+from graph.graph_store import GraphStore  # noqa: E402
+
+NODES = int(os.getenv("BENCH_GRAPH_SEM_NODES", "10000"))
+DIM = int(os.getenv("BENCH_GRAPH_SEM_DIM", "384"))
+INSERTS = int(os.getenv("BENCH_GRAPH_SEM_INSERTS", "50"))
+CLUSTERS = 64
+
+
+def _vectors(n: int, seed: int) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    centers = np.random.default_rng(0).normal(size=(CLUSTERS, DIM))
+    return centers[rng.integers(0, CLUSTERS, size=n)] + 0.4 * rng.normal(size=(n, DIM))
+
+
+def _populate(db_path: str) -> GraphStore:
+    store = GraphStore(db_path)
+    conn = sqlite3.connect(db_path)
+    conn.executemany(
+        "INSERT INTO graph_nodes (source_type, content, embedding) VALUES ('fact', ?, ?)",
+        [(f"node {i}", json.dumps(v.tolist())) for i, v in enumerate(_vectors(NODES, 1))],
+    )
+    conn.commit()
+    conn.close()
+    return store
+
+
+def _legacy_semantic_edges(store: GraphStore, node_id: int, embedding) -> int:
+    """1:1 Nachbau des alten Pfads (LIMIT 100, Python-Cosine, add_edge pro Treffer)."""
+    from embedding import cosine_similarity
+
+    conn = sqlite3.connect(store.db_path)
+    rows = conn.execute(
+        "SELECT id, embedding FROM graph_nodes WHERE embedding IS NOT NULL AND id != ? "
+        "ORDER BY id DESC LIMIT 100",
+        (node_id,),
+    ).fetchall()
+    conn.close()
+    found = 0
+    for other_id, raw in rows:
+        sim = cosine_similarity(embedding, json.loads(raw))
+        if sim >= graph_builder.SEMANTIC_THRESHOLD:
+            store.add_edge(node_id, other_id, "semantic", weight=sim)
+            found += 1
+    return found
+
+
+def _run(db_path: str, indexed: bool):
+    store = _populate(db_path)
+    gs_module._graph_store = store
+    latencies, edges = [], 0
+    try:
+        with patch("memory_mcp.config.DB_PATH", db_path):
+            if indexed:
+                store.find_similar_nodes({}, 1, 1.0)  # Index-Aufbau nicht mitmessen
+            for vec in _vectors(INSERTS, 2):
+                emb = vec.tolist()
+                t0 = time.perf_counter()
+                if indexed:
+                    node_id = graph_builder.build_node_with_edges("fact", "new", embedding=emb)
+                else:
+                    node_id = store.add_node("fact", "new", embedding=emb)
+                    _legacy_semantic_edges(store, node_id, emb)
+                latencies.append((time.perf_counter() - t0) * 1000)
+                edges += len([e for e in store.get_edges(node_id) if e["type"] == "semantic"])
+
+            rebuild = None
+            if indexed:
+                t0 = time.perf_counter()
+                stats = graph_builder.rebuild_semantic_edges(chunk_size=256)
+                rebuild = (time.perf_counter() - t0, stats)
+    finally:
+        gs_module._graph_store = None
+        db_pool.close_all()
+    return statistics.median(latencies), edges, rebuild
+
+
+@pytest.mark.slow
+def test_semantic_edges_indexed_vs_recent_window():
+    with tempfile.TemporaryDirectory() as tmp:
+        legacy_ms, legacy_edges, _ = _run(os.path.join(tmp, "legacy.db"), indexed=False)
+        indexed_ms, indexed_edges, (rebuild_s, stats) = _run(
+            os.path.join(tmp, "indexed.db"), indexed=True
+        )
+
+    print(
+        f"\nnodes={NODES} dim={DIM} inserts={INSERTS} "
+        f"legacy p50={legacy_ms:.1f}ms edges={legacy_edges} "
+        f"indexed p50={indexed_ms:.1f}ms edges={indexed_edges}"
+    )
+    print(
+        f"rebuild: processed={stats['processed']} edges={stats['edges']} "
+        f"time={rebuild_s:.1f}s ({stats['processed'] / rebuild_s:.0f} nodes/s)"
+    )
+    assert indexed_edges >= legacy_edges
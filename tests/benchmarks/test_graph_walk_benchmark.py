@@ -0,0 +1,104 @@
+"""
+Latenz-Benchmark: GraphStore.graph_walk (Frontier-Batches, eine Connection)
+gegen den alten Pfad (get_node + get_neighbors pro Node, je eine Connection).
+
+Synthetischer Graph, Default 100k Nodes / 1M Edges:
+
+    BENCH_GRAPH_NODES=100000 BENCH_GRAPH_EDGES=1000000 \\
+        pytest -q -s tests/benchmarks/test_graph_walk_benchmark.py
+"""
+
+from __future__ import annotations
+
+import os
+import random
+import sqlite3
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import pytest
+
+_SQL_MEMORY = Path(__file__).resolve().parents[2] / "sql-memory"
+if str(_SQL_MEMORY) not in sys.path:
+    sys.path.insert(0, str(_SQL_MEMORY))
+
+from graph.graph_store import GraphStore  # noqa: E402
+
+NODES = int(os.getenv("BENCH_GRAPH_NODES", "100000"))
+EDGES = int(os.getenv("BENCH_GRAPH_EDGES", "1000000"))
+WALKS = int(os.getenv("BENCH_GRAPH_WALKS", "20"))
+SEEDS = 5
+
+
+def _legacy_walk(store: GraphStore, start_node_ids, depth: int, limit: int):
+    """1:1 Nachbau des alten Pfads: pro Node get_node + get_neighbors."""
+    visited, results, level = set(), [], list(start_node_ids)
+    for d in range(depth):
+        next_level = []
+        for node_id in level:
+            if node_id in visited:
+                continue
+            visited.add(node_id)
+            node = store.get_node(node_id)
+            if node:
+                node["depth"] = d
+                results.append(node)
+            for nb in store.get_neighbors(node_id):
+                if nb["node_id"] not in visited:
+                    next_level.append(nb["node_id"])
+        level = next_level
+        if len(results) >= limit:
+            break
+    results.sort(key=lambda n: (-n.get("confidence", 0.5), n.get("depth", 0)))
+    return results[:limit]
+
+
+def _populate(db_path: str) -> None:
+    rng = random.Random(42)
+    conn = sqlite3.connect(db_path)
+    conn.executemany(
+        "INSERT INTO graph_nodes (id, source_type, content, confidence) VALUES (?, 'fact', ?, ?)",
+        ((i, f"node {i}", round(rng.random(), 6)) for i in range(1, NODES + 1)),
+    )
+    conn.executemany(
+        "INSERT OR IGNORE INTO graph_edges (src_node_id, dst_node_id, edge_type, weight) "
+        "VALUES (?, ?, 'semantic', ?)",
+        (
+            (rng.randint(1, NODES), rng.randint(1, NODES), round(rng.random(), 4))
+            for _ in range(EDGES)
+        ),
+    )
+    conn.commit()
+    conn.close()
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize("depth,limit", [(2, 10), (3, 50)])
+def test_graph_walk_batched_vs_per_node(depth, limit):
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, "graph.db")
+        store = GraphStore(db_path)
+        t0 = time.perf_counter()
+        _populate(db_path)
+        build_s = time.perf_counter() - t0
+
+        rng = random.Random(depth)
+        seed_sets = [rng.sample(range(1, NODES + 1), SEEDS) for _ in range(WALKS)]
+
+        t0 = time.perf_counter()
+        legacy = [_legacy_walk(store, seeds, depth, limit) for seeds in seed_sets]
+        legacy_ms = (time.perf_counter() - t0) * 1000 / WALKS
+
+        t0 = time.perf_counter()
+        batched = [store.graph_walk(seeds, depth=depth, limit=limit) for seeds in seed_sets]
+        batched_ms = (time.perf_counter() - t0) * 1000 / WALKS
+
+    print(
+        f"\nnodes={NODES} edges={EDGES} depth={depth} limit={limit} build={build_s:.1f}s "
+        f"legacy={legacy_ms:.1f}ms/walk batched={batched_ms:.1f}ms/walk "
+        f"speedup={legacy_ms / max(batched_ms, 1e-6):.1f}x"
+    )
+    assert [[n["id"] for n in r] for r in batched] == [[n["id"] for n in r] for r in legacy]
+    assert batched_ms < legacy_ms
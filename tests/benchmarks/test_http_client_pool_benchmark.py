@@ -0,0 +1,93 @@
+"""
+Micro-Benchmark fuer core/http_client_pool.py.
+
+Vergleicht den alten Pfad (neuer httpx.AsyncClient pro Call, also TCP-Setup
+pro Call) mit dem gepoolten Keep-Alive-Client gegen einen lokalen Stub-Server,
+der /api/chat wie Ollama (non-stream) beantwortet.
+
+    BENCH_HTTP_CALLS=500 pytest -q -s tests/benchmarks/test_http_client_pool_benchmark.py
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import time
+
+import httpx
+import pytest
+
+from core import http_client_pool
+
+CALLS = int(os.getenv("BENCH_HTTP_CALLS", "200"))
+
+_BODY = json.dumps({"message": {"role": "assistant", "content": "ok"}, "done": True}).encode()
+
+
+async def _handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+    try:
+        while True:
+            head = await reader.readuntil(b"\r\n\r\n")
+            length = 0
+            for line in head.split(b"\r\n"):
+                if line.lower().startswith(b"content-length:"):
+                    length = int(line.split(b":", 1)[1])
+            if length:
+                await reader.readexactly(length)
+            writer.write(
+                b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n"
+                b"Content-Length: " + str(len(_BODY)).encode() + b"\r\n\r\n" + _BODY
+            )
+            await writer.drain()
+    except (asyncio.IncompleteReadError, ConnectionError):
+        pass
+    finally:
+        writer.close()
+
+
+async def _bench() -> tuple[float, float, dict]:
+    server = await asyncio.start_server(_handle, "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    endpoint = f"http://127.0.0.1:{port}"
+    payload = {"model": "stub", "messages": [{"role": "user", "content": "hi"}], "stream": False}
+
+    async def _fresh() -> None:
+        async with httpx.AsyncClient(timeout=5.0) as client:
+            r = await client.post(f"{endpoint}/api/chat", json=payload)
+            r.raise_for_status()
+
+    async def _pooled() -> None:
+        async with http_client_pool.pooled_client(endpoint, timeout_s=5.0) as client:
+            r = await client.post(f"{endpoint}/api/chat", json=payload)
+            r.raise_for_status()
+
+    async with server:
+        await _fresh()
+        await _pooled()
+        t0 = time.perf_counter()
+        for _ in range(CALLS):
+            await _fresh()
+        fresh_ms = (time.perf_counter() - t0) * 1000 / CALLS
+
+        t0 = time.perf_counter()
+        for _ in range(CALLS):
+            await _pooled()
+        pooled_ms = (time.perf_counter() - t0) * 1000 / CALLS
+        stats = http_client_pool.get_http_pool_stats()
+        await http_client_pool.aclose_http_clients()
+    return fresh_ms, pooled_ms, stats
+
+
+@pytest.mark.slow
+def test_pooled_client_per_call_overhead():
+    http_client_pool.reset_http_pool()
+    fresh_ms, pooled_ms, stats = asyncio.run(_bench())
+    print(
+        f"\ncalls={CALLS} fresh_client={fresh_ms:.3f}ms/call "
+        f"pooled_client={pooled_ms:.3f}ms/call "
+        f"saved={fresh_ms - pooled_ms:.3f}ms/call "
+        f"(created={stats['created']} reused={stats['reused']})"
+    )
+    assert stats["created"] == 1
+    assert pooled_ms < fresh_ms
@@ -0,0 +1,198 @@
+"""
+Micro-Benchmark fuer mcp/transports/http.py unter paralleler Last.
+
+Vergleicht drei Pfade fuer BENCH_MCP_HTTP_CONCURRENCY gleichzeitige tools/call
+gegen einen lokalen Stub-MCP-Server (Simple JSON-RPC, laeuft in einem eigenen
+Thread mit eigenem Event-Loop):
+
+- legacy:  MCPHub.call_tool_async → asyncio.to_thread → requests.post pro Call
+           (neue TCP-Verbindung pro Call, wie vor dem Pool)
+- pooled:  gleicher Thread-Pfad, aber gepoolte Keep-Alive-Session
+- async:   HTTPTransport.call_tool_async ueber den gepoolten httpx-Client,
+           kein Worker-Thread pro Call
+
+Gemessen: p50/p95 Latenz pro Call, Verbindungen am Server, Peak-Threads im Client.
+
+    BENCH_MCP_HTTP_ROUNDS=20 pytest -q -s tests/benchmarks/test_mcp_http_transport_benchmark.py
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import statistics
+import threading
+import time
+
+import pytest
+import requests
+
+from core import http_client_pool
+from mcp.hub import MCPHub
+from mcp.transports.http import HTTPTransport
+
+CONCURRENCY = int(os.getenv("BENCH_MCP_HTTP_CONCURRENCY", "50"))
+ROUNDS = int(os.getenv("BENCH_MCP_HTTP_ROUNDS", "10"))
+
+
+class _StubServer:
+    def __init__(self) -> None:
+        self.connections = 0
+        self.port = 0
+        self._ready = threading.Event()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self.connections += 1
+        try:
+            while True:
+                head = await reader.readuntil(b"\r\n\r\n")
+                length = 0
+                for line in head.split(b"\r\n"):
+                    if line.lower().startswith(b"content-length:"):
+                        length = int(line.split(b":", 1)[1])
+                payload = json.loads(await reader.readexactly(length)) if length else {}
+                args = (payload.get("params") or {}).get("arguments") or {}
+                result = {"content": [{"type": "text", "text": json.dumps({"echo": args})}]}
+                body = json.dumps({"jsonrpc": "2.0", "id": 1, "result": result}).encode()
+                writer.write(
+                    b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n"
+                    b"Content-Length: " + str(len(body)).encode() + b"\r\n\r\n" + body
+                )
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError, asyncio.CancelledError):
+            pass
+        finally:
+            writer.close()
+
+    def _run(self) -> None:
+        self._loop = asyncio.new_event_loop()
+        server = self._loop.run_until_complete(asyncio.start_server(self._handle, "127.0.0.1", 0))
+        self.port = server.sockets[0].getsockname()[1]
+        self._ready.set()
+        self._loop.run_forever()
+        server.close()
+        pending = asyncio.all_tasks(self._loop)
+        for task in pending:
+            task.cancel()
+        self._loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
+        self._loop.close()
+
+    def start(self) -> str:
+        self._thread.start()
+        self._ready.wait(5)
+        return f"http://127.0.0.1:{self.port}/mcp"
+
+    def stop(self) -> None:
+        if self._loop is not None:
+            self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join(5)
+
+
+def _legacy_transport(url: str) -> HTTPTransport:
+    transport = HTTPTransport(url, timeout=10)
+
+    def _post(payload, headers):
+        return requests.post(url, json=payload, headers=headers, timeout=10, stream=True)
+
+    transport._post = _post  # type: ignore[method-assign]
+    return transport
+
+
+def _hub_for(transport: HTTPTransport) -> MCPHub:
+    hub = MCPHub()
+    hub._initialized = True
+    hub._transports = {"stub-mcp": transport}
+    hub._tools_cache = {"echo": "stub-mcp"}
+    hub._tool_definitions = {"echo": {"name": "echo"}}
+    hub._get_mcp_config = lambda _name: None  # type: ignore[assignment]
+    return hub
+
+
+async def _run_mode(call, server: _StubServer) -> dict:
+    latencies: list[float] = []
+    peak_threads = threading.active_count()
+    sampling = True
+
+    async def _sample() -> None:
+        nonlocal peak_threads
+        while sampling:
+            peak_threads = max(peak_threads, threading.active_count())
+            await asyncio.sleep(0.001)
+
+    async def _one(i: int) -> None:
+        t0 = time.perf_counter()
+        result = await call(i)
+        latencies.append((time.perf_counter() - t0) * 1000)
+        assert result == {"echo": {"i": i}}
+
+    baseline_threads = threading.active_count()
+    connections_before = server.connections
+    sampler = asyncio.create_task(_sample())
+    t0 = time.perf_counter()
+    for _ in range(ROUNDS):
+        await asyncio.gather(*(_one(i) for i in range(CONCURRENCY)))
+    wall_s = time.perf_counter() - t0
+    sampling = False
+    await sampler
+    latencies.sort()
+    return {
+        "p50": statistics.median(latencies),
+        "p95": latencies[int(len(latencies) * 0.95) - 1],
+        "throughput": len(latencies) / wall_s,
+        "connections": server.connections - connections_before,
+        "extra_threads": peak_threads - baseline_threads,
+    }
+
+
+def _bench(url: str, server: _StubServer) -> dict:
+    legacy = _legacy_transport(url)
+    pooled = HTTPTransport(url, timeout=10)
+    for transport in (legacy, pooled):
+        transport.call_tool("echo", {"i": 0})  # Format-Detection vorab
+    legacy_hub, pooled_hub = _hub_for(legacy), _hub_for(pooled)
+
+    async def _async_mode() -> dict:
+        result = await _run_mode(lambda i: pooled_hub.call_tool_async("echo", {"i": i}), server)
+        await http_client_pool.aclose_http_clients()
+        return result
+
+    # Eigener Event-Loop pro Pfad → frischer Default-Executor, Threads vergleichbar
+    results = {
+        "legacy": asyncio.run(_run_mode(
+            lambda i: asyncio.to_thread(legacy_hub.call_tool, "echo", {"i": i}), server
+        )),
+        "pooled": asyncio.run(_run_mode(
+            lambda i: asyncio.to_thread(pooled_hub.call_tool, "echo", {"i": i}), server
+        )),
+        "async": asyncio.run(_async_mode()),
+    }
+    pooled.close()
+    return results
+
+
+@pytest.mark.slow
+def test_http_transport_concurrent_calls():
+    http_client_pool.reset_http_pool()
+    server = _StubServer()
+    url = server.start()
+    try:
+        results = _bench(url, server)
+    finally:
+        server.stop()
+
+    calls = CONCURRENCY * ROUNDS
+    for mode, r in results.items():
+        print(
+            f"\n{mode}: concurrency={CONCURRENCY} calls={calls} p50={r['p50']:.2f}ms p95={r['p95']:.2f}ms "
+            f"throughput={r['throughput']:.0f} calls/s connections={r['connections']} "
+            f"extra_threads={r['extra_threads']}"
+        )
+    assert results["pooled"]["connections"] < results["legacy"]["connections"]
+    # Ueber HTTP_POOL_MAX_KEEPALIVE hinaus werden Verbindungen geschlossen und neu
+    # aufgebaut → keine harte Obergrenze, aber deutlich weniger als eine pro Call
+    assert results["async"]["connections"] * 4 <= results["legacy"]["connections"]
+    assert results["async"]["extra_threads"] == 0
+    assert results["legacy"]["extra_threads"] > 0
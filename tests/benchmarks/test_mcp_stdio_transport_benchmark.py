@@ -0,0 +1,109 @@
+"""
+Micro-Benchmark fuer mcp/transports/stdio.py mit parallelen Aufrufern.
+
+Lokaler Echo-MCP ueber stdio; jeder tools/call wartet BENCH_STDIO_WORK_MS
+(simuliert Arbeit im Server). BENCH_STDIO_CALLERS Threads rufen gleichzeitig auf.
+
+- serial:       ein Request zur Zeit (Verhalten vor dem Multiplexing: eine
+                Response-Queue, feste ID → Calls mussten serialisiert werden)
+- multiplexed:  ein Prozess, Requests mit eigener ID gleichzeitig unterwegs
+                (Server bearbeitet sie nebenlaeufig)
+- pool:         sequentieller Server, BENCH_STDIO_POOL Prozesse
+
+    BENCH_STDIO_CALLS=400 pytest -q -s tests/benchmarks/test_mcp_stdio_transport_benchmark.py
+"""
+
+from __future__ import annotations
+
+import os
+import statistics
+import sys
+import textwrap
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from mcp.transports.stdio import STDIOTransport
+
+CALLERS = int(os.getenv("BENCH_STDIO_CALLERS", "16"))
+CALLS = int(os.getenv("BENCH_STDIO_CALLS", "200"))
+WORK_MS = float(os.getenv("BENCH_STDIO_WORK_MS", "5"))
+POOL = int(os.getenv("BENCH_STDIO_POOL", "4"))
+
+_ECHO_MCP = textwrap.dedent('''
+    import json, sys, threading, time
+
+    SERIAL = "serial" in sys.argv[1:]
+    out_lock = threading.Lock()
+
+    def send(msg):
+        with out_lock:
+            sys.stdout.write(json.dumps(msg) + "\\n")
+            sys.stdout.flush()
+
+    def handle(req):
+        if req.get("method") == "tools/call":
+            args = req["params"]["arguments"]
+            time.sleep(float(args.get("work_ms", 0)) / 1000)
+            result = {"content": [{"type": "text", "text": json.dumps(args)}]}
+        else:
+            result = {"capabilities": {}, "tools": [{"name": "echo"}]}
+        send({"jsonrpc": "2.0", "id": req["id"], "result": result})
+
+    for line in sys.stdin:
+        req = json.loads(line)
+        if "id" not in req:
+            continue
+        if SERIAL:
+            handle(req)
+        else:
+            threading.Thread(target=handle, args=(req,), daemon=True).start()
+''')
+
+
+def _run(transport: STDIOTransport, serialize: bool = False) -> dict:
+    lock = threading.Lock()
+    transport.call_tool("echo", {"warm": True})
+
+    def _one(i: int) -> float:
+        t0 = time.perf_counter()
+        if serialize:
+            with lock:
+                result = transport.call_tool("echo", {"i": i, "work_ms": WORK_MS})
+        else:
+            result = transport.call_tool("echo", {"i": i, "work_ms": WORK_MS})
+        assert f'"i": {i},' in result["content"][0]["text"]
+        return (time.perf_counter() - t0) * 1000
+
+    t0 = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=CALLERS) as pool:
+        latencies = sorted(pool.map(_one, range(CALLS)))
+    wall_s = time.perf_counter() - t0
+    transport.shutdown()
+    return {
+        "p50": statistics.median(latencies),
+        "p95": latencies[int(len(latencies) * 0.95) - 1],
+        "throughput": CALLS / wall_s,
+    }
+
+
+@pytest.mark.slow
+def test_stdio_transport_concurrent_callers(tmp_path):
+    script = tmp_path / "echo_mcp.py"
+    script.write_text(_ECHO_MCP)
+    command = f"{sys.executable} -u {script}"
+
+    results = {
+        "serial": _run(STDIOTransport(command, timeout=30), serialize=True),
+        "multiplexed": _run(STDIOTransport(command, timeout=30)),
+        f"pool={POOL}": _run(STDIOTransport(f"{command} serial", timeout=30, pool_size=POOL)),
+    }
+    for mode, r in results.items():
+        print(
+            f"\n{mode}: callers={CALLERS} calls={CALLS} work={WORK_MS:.0f}ms "
+            f"p50={r['p50']:.2f}ms p95={r['p95']:.2f}ms throughput={r['throughput']:.0f} calls/s"
+        )
+    assert results["multiplexed"]["throughput"] > results["serial"]["throughput"]
+    assert results[f"pool={POOL}"]["throughput"] > results["serial"]["throughput"]
@@ -0,0 +1,124 @@
+"""
+Micro-Benchmark fuer den Streaming-Plan-Parser und die Memory-Spekulation
+(utils/text/json_stream.py, core/orchestrator_plan_speculation_utils.py).
+
+Ein Thinking-Plan wird in BENCH_SPEC_CHUNK Zeichen grossen Chunks mit
+BENCH_SPEC_CHUNK_MS Abstand gestreamt (das lange "reasoning" kommt zuletzt);
+ein Memory-Lookup dauert BENCH_SPEC_LOOKUP_MS. Gemessen wird, wann die
+Memory-Ergebnisse im Request-Cache liegen:
+
+- sequential:  erst nach dem letzten Chunk parsen, dann nachschlagen
+- speculative: PlanSpeculation startet die Lookups, sobald die Memory-Felder
+               gestreamt sind; settle() nach dem letzten Chunk
+
+Zusaetzlich: Parser-Overhead pro Chunk (StreamingJSONParser.feed).
+
+    BENCH_SPEC_LOOKUP_MS=400 pytest -q -s tests/benchmarks/test_plan_speculation_benchmark.py
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import statistics
+import time
+
+import pytest
+
+from core.context_manager import ContextManager
+from core.orchestrator_plan_speculation_utils import PlanSpeculation
+from utils.text.json_stream import StreamingJSONParser
+
+CHUNK = int(os.getenv("BENCH_SPEC_CHUNK", "12"))
+CHUNK_MS = float(os.getenv("BENCH_SPEC_CHUNK_MS", "2"))
+LOOKUP_MS = float(os.getenv("BENCH_SPEC_LOOKUP_MS", "150"))
+RUNS = int(os.getenv("BENCH_SPEC_RUNS", "5"))
+
+_PLAN = {
+    "intent": "User fragt nach dem Geburtstag der Schwester",
+    "needs_memory": True,
+    "memory_keys": ["sister_birthday", "sister_name"],
+    "needs_chat_history": False,
+    "is_fact_query": True,
+    "resolution_strategy": None,
+    "strategy_hints": [],
+    "time_reference": None,
+    "hallucination_risk": "high",
+    "suggested_tools": [],
+    "reasoning": "Der User fragt nach einem gespeicherten Fakt. " * 40,
+}
+
+
+class _SlowContext:
+    memory_lookup_keys = ContextManager.memory_lookup_keys
+
+    @staticmethod
+    def _normalize_memory_keys(keys):
+        return list(dict.fromkeys(keys))
+
+    def search_memory_keys(
+        self, keys, conversation_id, *, include_system, deadline, call_timeout_s, request_cache, cancel_event=None,
+    ):
+        time.sleep(LOOKUP_MS / 1000)
+        for key in keys:
+            request_cache[f"{conversation_id}|fact|{key}"] = f"{key}-value"
+        return {}
+
+
+async def _stream(text: str):
+    for i in range(0, len(text), CHUNK):
+        await asyncio.sleep(CHUNK_MS / 1000)
+        yield text[i:i + CHUNK]
+
+
+async def _sequential(text: str) -> float:
+    t0 = time.perf_counter()
+    full = ""
+    async for chunk in _stream(text):
+        full += chunk
+    plan = json.loads(full)
+    cache: dict = {}
+    await asyncio.to_thread(
+        _SlowContext().search_memory_keys,
+        plan["memory_keys"], "conv",
+        include_system=True, deadline=None, call_timeout_s=None, request_cache=cache,
+    )
+    assert len(cache) == 2
+    return (time.perf_counter() - t0) * 1000
+
+
+async def _speculative(text: str) -> float:
+    t0 = time.perf_counter()
+    parser = StreamingJSONParser()
+    spec = PlanSpeculation(_SlowContext(), "conv", enabled=True)
+    async for chunk in _stream(text):
+        fields = parser.feed(chunk)
+        if fields:
+            spec.observe(dict(fields))
+    cache: dict = {}
+    assert await spec.settle(parser.fields, cache) == "confirmed"
+    assert len(cache) == 2
+    return (time.perf_counter() - t0) * 1000
+
+
+@pytest.mark.slow
+def test_plan_speculation_vs_sequential_retrieval():
+    text = json.dumps(_PLAN, ensure_ascii=False, indent=1)
+    seq_ms = [asyncio.run(_sequential(text)) for _ in range(RUNS)]
+    spec_ms = [asyncio.run(_speculative(text)) for _ in range(RUNS)]
+
+    chunks = [text[i:i + CHUNK] for i in range(0, len(text), CHUNK)]
+    t0 = time.perf_counter()
+    for _ in range(200):
+        parser = StreamingJSONParser()
+        for chunk in chunks:
+            parser.feed(chunk)
+    feed_us = (time.perf_counter() - t0) * 1e6 / (200 * len(chunks))
+
+    stream_ms = len(chunks) * CHUNK_MS
+    print(f"\nplan_chars={len(text)} chunks={len(chunks)} stream~{stream_ms:.0f}ms lookup={LOOKUP_MS:.0f}ms")
+    print(f"sequential: p50={statistics.median(seq_ms):.1f}ms")
+    print(f"speculative: p50={statistics.median(spec_ms):.1f}ms")
+    print(f"parser feed: {feed_us:.1f}us/chunk")
+    assert statistics.median(spec_ms) < statistics.median(seq_ms)
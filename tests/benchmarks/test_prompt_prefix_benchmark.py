@@ -0,0 +1,194 @@
+"""
+Micro-Benchmark fuer prefix-stabile Prompt-Montage (core/prompt_assembly.py).
+
+Lokaler Ollama-Stub fuer /api/generate, der einen KV-Cache pro Modell
+nachbildet:
+
+- Prefill kostet BENCH_PFX_US_PER_CHAR pro Zeichen hinter dem gemeinsamen
+  Prefix mit dem vorherigen Prompt an dasselbe Modell
+- ist keep_alive seit dem letzten Request abgelaufen (virtuelle Uhr, Turns
+  liegen BENCH_PFX_GAP_MIN Minuten auseinander), wird das Modell neu geladen
+  (BENCH_PFX_LOAD_MS) und der Cache ist leer
+
+BENCH_PFX_TURNS Thinking-Turns mit wechselndem Skill-Kontext, Tone-Signal und
+Tool-Auswahl (gleiche Tool-Mengen in wechselnder Selektor-Reihenfolge):
+
+- legacy:    alte Montage (Memory -> Tools json indent=1 -> Tone -> Hints ->
+             User) mit keep_alive="2m" wie im alten stream_prompt
+- assembled: ThinkingLayer.analyze_stream-Prompt (assemble_prompt, gleiche
+             Sektionsfolge, kanonische Tools/Tone) mit dem einheitlichen
+             get_llm_keep_alive()
+
+Gemessen ueber den echten stream_prompt-Client: Prefix-Hit-Ratio (Anteil
+wiederverwendeter Prompt-Zeichen) und Time-to-first-Token.
+
+    BENCH_PFX_TURNS=100 pytest -q -s tests/benchmarks/test_prompt_prefix_benchmark.py
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import random
+import re
+import statistics
+import time
+from unittest.mock import patch
+
+import pytest
+
+from core import http_client_pool
+from core.layers.thinking import THINKING_PROMPT, ThinkingLayer
+from core.llm_provider_client import stream_prompt
+from intelligence_modules.prompt_manager import load_prompt
+
+TURNS = int(os.getenv("BENCH_PFX_TURNS", "40"))
+US_PER_CHAR = float(os.getenv("BENCH_PFX_US_PER_CHAR", "4"))
+LOAD_MS = float(os.getenv("BENCH_PFX_LOAD_MS", "150"))
+GAP_MIN = float(os.getenv("BENCH_PFX_GAP_MIN", "3"))
+
+_TOOL_POOL = [
+    {"name": f"tool_{i}", "mcp": "stub", "description": f"Tool {i} " + "beschreibung " * 6,
+     "inputSchema": {"type": "object", "properties": {"arg": {"type": "string"}}}}
+    for i in range(8)
+]
+_TOOL_SETS = [[0, 1, 2], [0, 3, 4, 5], [2, 6, 7]]
+_HINTS = "=== MCP DETECTION RULES ===\n" + "\n".join(f"TOOL: tool_{i}\nKeywords: a, b, c" for i in range(8))
+
+
+class _OllamaStub:
+    def __init__(self):
+        self.virtual_min = 0.0
+        self.models = {}  # model -> (cached_prompt, expires_at_min)
+        self.stats = {"chars": 0, "reused": 0, "loads": 0}
+
+    @staticmethod
+    def _minutes(keep_alive: str) -> float:
+        m = re.fullmatch(r"(\d+(?:\.\d+)?)([smh]?)", str(keep_alive).strip())
+        if not m:
+            return 5.0
+        value, unit = float(m.group(1)), m.group(2) or "s"
+        return value / 60 if unit == "s" else value * 60 if unit == "h" else value
+
+    def _prefill_ms(self, body: dict) -> float:
+        model, prompt = body["model"], body["prompt"]
+        cached, expires = self.models.get(model, ("", -1.0))
+        load_ms = 0.0
+        if self.virtual_min > expires:
+            cached, load_ms = "", LOAD_MS
+            self.stats["loads"] += 1
+        common = len(os.path.commonprefix([cached, prompt]))
+        self.models[model] = (prompt, self.virtual_min + self._minutes(body.get("keep_alive", "5m")))
+        self.stats["chars"] += len(prompt)
+        self.stats["reused"] += common
+        return load_ms + (len(prompt) - common) * US_PER_CHAR / 1000
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                head = await reader.readuntil(b"\r\n\r\n")
+                length = 0
+                for line in head.split(b"\r\n"):
+                    if line.lower().startswith(b"content-length:"):
+                        length = int(line.split(b":", 1)[1])
+                body = json.loads(await reader.readexactly(length)) if length else {}
+                await asyncio.sleep(self._prefill_ms(body) / 1000)
+                out = (json.dumps({"response": '{"intent": "x"}', "done": False}) + "\n"
+                       + json.dumps({"response": "", "done": True}) + "\n").encode()
+                writer.write(
+                    b"HTTP/1.1 200 OK\r\nContent-Type: application/x-ndjson\r\n"
+                    b"Content-Length: " + str(len(out)).encode() + b"\r\n\r\n" + out
+                )
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+
+def _turns() -> list:
+    rng = random.Random(5)
+    out = []
+    for t in range(TURNS):
+        tools = [_TOOL_POOL[i] for i in rng.choice(_TOOL_SETS)]
+        rng.shuffle(tools)
+        out.append({
+            "user_text": f"Frage {t}: " + rng.choice(["Wie geht es?", "Starte den Container", "Was weisst du ueber mich?"]),
+            "memory_context": rng.choice(["", "SKILL: backup\n" * 5, "SKILL: monitor\n" * 7]),
+            "available_tools": tools,
+            "tone_signal": {"dialogue_act": rng.choice(["request", "smalltalk"]), "confidence": round(rng.random(), 2)},
+            "tool_hints": _HINTS,
+        })
+    return out
+
+
+def _legacy_prompt(turn: dict) -> str:
+    prompt = f"{THINKING_PROMPT}\n\n"
+    if turn["memory_context"]:
+        prompt += load_prompt("layers", "thinking_memory_context", memory_context=turn["memory_context"]) + "\n\n"
+    prompt += load_prompt("layers", "thinking_available_tools",
+                          tools_json=json.dumps(turn["available_tools"], indent=1)) + "\n\n"
+    prompt += load_prompt("layers", "thinking_tone_signal",
+                          tone_json=json.dumps(turn["tone_signal"], ensure_ascii=False, indent=1)) + "\n\n"
+    prompt += f"{turn['tool_hints']}\n\n"
+    return prompt + load_prompt("layers", "thinking_user_request", user_text=turn["user_text"])
+
+
+async def _assembled_prompt(turn: dict) -> str:
+    captured = {}
+
+    async def _capture(**kwargs):
+        captured.update(kwargs)
+        yield '{"intent": "x"}'
+
+    with patch("core.layers.thinking.resolve_role_provider", return_value="openai"), \
+         patch("core.layers.thinking.stream_prompt", _capture):
+        async for _ in ThinkingLayer(model="stub-thinking").analyze_stream(
+            turn["user_text"],
+            memory_context=turn["memory_context"],
+            available_tools=turn["available_tools"],
+            tone_signal=turn["tone_signal"],
+            tool_hints=turn["tool_hints"],
+        ):
+            pass
+    return captured["prompt"]
+
+
+async def _run(mode: str, turns: list) -> tuple:
+    stub = _OllamaStub()
+    server = await asyncio.start_server(stub.handle, "127.0.0.1", 0)
+    endpoint = f"http://127.0.0.1:{server.sockets[0].getsockname()[1]}"
+    rng = random.Random(9)
+    ttft = []
+    async with server:
+        for turn in turns:
+            prompt = _legacy_prompt(turn) if mode == "legacy" else await _assembled_prompt(turn)
+            with patch("core.llm_provider_client.get_llm_keep_alive",
+                       return_value="2m" if mode == "legacy" else "5m"):
+                t0 = time.perf_counter()
+                async for _ in stream_prompt(provider="ollama", model="stub-thinking", prompt=prompt,
+                                             timeout_s=10.0, ollama_endpoint=endpoint):
+                    ttft.append((time.perf_counter() - t0) * 1000)
+                    break
+            stub.virtual_min += rng.uniform(0.5, GAP_MIN)
+        await http_client_pool.aclose_http_clients()
+    return sorted(ttft), stub.stats
+
+
+@pytest.mark.slow
+def test_prompt_prefix_reuse_vs_legacy_assembly():
+    turns = _turns()
+    legacy_ttft, legacy = asyncio.run(_run("legacy", turns))
+    new_ttft, new = asyncio.run(_run("assembled", turns))
+
+    legacy_ratio = legacy["reused"] / legacy["chars"]
+    new_ratio = new["reused"] / new["chars"]
+    print(f"\nturns={TURNS} us/char={US_PER_CHAR} load={LOAD_MS:.0f}ms gap<= {GAP_MIN}min")
+    for mode, lat, stats, ratio in (("legacy", legacy_ttft, legacy, legacy_ratio),
+                                    ("assembled", new_ttft, new, new_ratio)):
+        print(f"{mode}: prefix_hit={ratio:.1%} loads={stats['loads']} "
+              f"ttft p50={statistics.median(lat):.1f}ms p95={lat[int(len(lat) * 0.95) - 1]:.1f}ms")
+    assert new_ratio > legacy_ratio
+    assert new["loads"] <= legacy["loads"]
+    assert statistics.median(new_ttft) < statistics.median(legacy_ttft)
@@ -0,0 +1,70 @@
+"""
+Micro-Benchmark fuer utils/embedding/similarity.py.
+
+Vergleicht den alten Pure-Python-Cosine-Loop mit dem NumPy-Kernel
+(Matrix x Vektor, Top-k, Matrix x Matrix) bei 768/1024 Dimensionen.
+
+    BENCH_SIM_ROWS=10000,100000,1000000 BENCH_SIM_DIMS=768,1024 \\
+        pytest -q -s tests/benchmarks/test_similarity_kernel_benchmark.py
+"""
+
+from __future__ import annotations
+
+import math
+import os
+import time
+
+import numpy as np
+import pytest
+
+from utils.embedding.similarity import normalize_rows, score_matrix, top_k, top_k_batch
+
+ROWS = [int(x) for x in os.getenv("BENCH_SIM_ROWS", "10000,100000").split(",") if x.strip()]
+DIMS = [int(x) for x in os.getenv("BENCH_SIM_DIMS", "768,1024").split(",") if x.strip()]
+PY_ROWS = int(os.getenv("BENCH_SIM_PY_ROWS", "2000"))
+BATCH_QUERIES = int(os.getenv("BENCH_SIM_BATCH_QUERIES", "64"))
+
+
+def _py_cos(a, b):
+    dot = na = nb = 0.0
+    for x, y in zip(a, b):
+        dot += x * y
+        na += x * x
+        nb += y * y
+    return dot / (math.sqrt(na) * math.sqrt(nb))
+
+
+def _ms(fn, repeat=5):
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, (time.perf_counter() - t0) * 1000)
+    return best
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize("dim", DIMS)
+def test_similarity_kernel_throughput(dim):
+    rng = np.random.default_rng(dim)
+    query = rng.normal(size=dim).astype(np.float32)
+
+    py_rows = rng.normal(size=(PY_ROWS, dim)).tolist()
+    py_query = query.tolist()
+    py_ms = _ms(lambda: [_py_cos(py_query, r) for r in py_rows], repeat=1)
+    print(f"\ndim={dim} python_loop rows={PY_ROWS}: {py_ms:.1f}ms "
+          f"({py_ms * 1000 / PY_ROWS:.2f}us/row)")
+
+    for rows in ROWS:
+        mat = normalize_rows(rng.normal(size=(rows, dim)).astype(np.float32))
+        queries = rng.normal(size=(BATCH_QUERIES, dim)).astype(np.float32)
+        mv_ms = _ms(lambda: score_matrix(mat, query))
+        topk_ms = _ms(lambda: top_k(mat, query, 10))
+        batch_ms = _ms(lambda: top_k_batch(mat, queries, 10), repeat=2)
+        print(
+            f"dim={dim} rows={rows}: matvec={mv_ms:.2f}ms "
+            f"({mv_ms * 1000 / rows:.3f}us/row) top10={topk_ms:.2f}ms "
+            f"batch[{BATCH_QUERIES}]x top10={batch_ms:.1f}ms "
+            f"({batch_ms / BATCH_QUERIES:.2f}ms/query)"
+        )
+        assert mv_ms * 1000 / rows < py_ms * 1000 / PY_ROWS
@@ -0,0 +1,128 @@
+"""
+Micro-Benchmark fuer das Skill-Matching in tool_executor/mini_control_core.py.
+
+Legt BENCH_CATALOG_SKILLS Skills an (Haelfte installiert in
+_registry/installed.json, Haelfte als Drafts mit manifest.yaml) und misst
+BENCH_CATALOG_QUERIES Anfragen:
+
+- legacy:  pro Anfrage installed.json + alle Draft-Manifeste neu parsen und
+           jeden Skill mit _calculate_match_score bewerten (Verhalten vor dem
+           Katalog)
+- catalog: SkillMiniControl._find_matching_skill mit SkillCatalog
+           (stat-basierter Refresh, BM25 top-k, erster Kandidat ueber der
+           Score-Schwelle)
+
+Beide Pfade muessen fuer dieselben Anfragen einen Treffer liefern; welcher
+Skill gewinnt, entscheidet im Katalog die BM25-Reihenfolge.
+
+    BENCH_CATALOG_SKILLS=1000 pytest -q -s tests/benchmarks/test_skill_catalog_benchmark.py
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+import yaml
+
+_REPO_ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(_REPO_ROOT / "tool_executor"))
+
+import mini_control_core  # noqa: E402
+
+SKILLS = int(os.getenv("BENCH_CATALOG_SKILLS", "300"))
+QUERIES = int(os.getenv("BENCH_CATALOG_QUERIES", "100"))
+
+_TOPICS = [
+    "weather", "bitcoin", "ethereum", "currency", "calendar", "reminder", "email", "pdf",
+    "image", "resize", "translate", "summary", "stock", "portfolio", "recipe", "timer",
+    "unit", "convert", "distance", "route", "news", "rss", "backup", "disk", "cpu",
+    "docker", "container", "github", "issue", "invoice", "tax", "budget", "sleep", "fitness",
+]
+_VERBS = ["fetch", "check", "compute", "render", "parse", "track", "list", "export"]
+
+
+def _populate(skills_dir: Path, rng: random.Random) -> None:
+    installed = {}
+    for i in range(SKILLS):
+        topic_a, topic_b = rng.sample(_TOPICS, 2)
+        name = f"{rng.choice(_VERBS)}_{topic_a}_{i}"
+        info = {
+            "description": f"{rng.choice(_VERBS)} {topic_a} data and {topic_b} details",
+            "triggers": [topic_a, f"{topic_a} {topic_b}"],
+        }
+        if i % 2:
+            installed[name] = {**info, "version": "1.0"}
+        else:
+            draft = skills_dir / "_drafts" / name
+            draft.mkdir(parents=True)
+            (draft / "manifest.yaml").write_text(yaml.safe_dump({"name": name, **info}), encoding="utf-8")
+    (skills_dir / "_registry").mkdir(parents=True)
+    (skills_dir / "_registry" / "installed.json").write_text(
+        json.dumps({"schema_version": 2, "skills": installed}), encoding="utf-8"
+    )
+
+
+def _legacy_match(control, skills_dir: Path, intent: str, user_text: str):
+    from skill_catalog import load_draft_manifest, load_installed_registry
+
+    installed = load_installed_registry(skills_dir / "_registry" / "installed.json")
+    drafts = {}
+    for skill_dir in (skills_dir / "_drafts").iterdir():
+        info = load_draft_manifest(skill_dir)
+        if info:
+            drafts[skill_dir.name] = info
+    terms = list(set(control._extract_keywords(intent) + control._extract_keywords(user_text)))
+    best, best_score = None, 0
+    for name, info in {**installed, **drafts}.items():
+        score = control._calculate_match_score(name, info, terms)
+        if score > best_score and score >= 0.3:
+            best, best_score = name, score
+    return best, best_score
+
+
+@pytest.mark.slow
+def test_skill_catalog_vs_legacy(tmp_path):
+    rng = random.Random(11)
+    _populate(tmp_path, rng)
+    control = mini_control_core.SkillMiniControl(cim=MagicMock(), skills_dir=str(tmp_path))
+    control._is_skill_discovery_enabled = MagicMock(return_value=False)
+    queries = [
+        (topic, f"bitte {rng.choice(_VERBS)} {topic} fuer {rng.choice(_TOPICS)}")
+        for topic in (rng.choice(_TOPICS) for _ in range(QUERIES))
+    ]
+
+    legacy_ms, legacy = [], []
+    for intent, text in queries:
+        t0 = time.perf_counter()
+        legacy.append(_legacy_match(control, tmp_path, intent, text))
+        legacy_ms.append((time.perf_counter() - t0) * 1000)
+
+    async def _catalog_run():
+        await control._find_matching_skill("warmup", "warmup")  # Erstaufbau des Katalogs
+        out, lat = [], []
+        for intent, text in queries:
+            t0 = time.perf_counter()
+            match = await control._find_matching_skill(intent, text)
+            lat.append((time.perf_counter() - t0) * 1000)
+            out.append((match["name"], match["match_score"]) if match else (None, 0))
+        return out, lat
+
+    catalog, catalog_ms = asyncio.run(_catalog_run())
+
+    assert [name is not None for name, _ in catalog] == [name is not None for name, _ in legacy]
+    assert all(score >= 0.3 for name, score in catalog if name is not None)
+    for mode, lat in (("legacy", sorted(legacy_ms)), ("catalog", sorted(catalog_ms))):
+        print(
+            f"\n{mode}: skills={SKILLS} queries={QUERIES} p50={statistics.median(lat):.2f}ms "
+            f"p95={lat[int(len(lat) * 0.95) - 1]:.2f}ms"
+        )
+    assert statistics.median(catalog_ms) < statistics.median(legacy_ms)
@@ -0,0 +1,176 @@
+"""
+Micro-Benchmark fuer tool_executor/skill_cim_light.py (validate_code).
+
+Generiert BENCH_CIM_SKILLS Skills (~BENCH_CIM_LINES Zeilen, harmloser Code
+plus eingestreute eval/os.system/open/requests-Zeilen) und validiert jeden
+mit den echten CSVs aus tool_executor/data/data:
+
+- legacy:  Verhalten vor dem Scanner — pro CSV-Zeile `in`/`re.search` ueber
+           den kompletten Code, Tags pro Aufruf neu geparst, code.lower()
+           mehrfach
+- scanner: vorkompilierter CodePatternScanner, ein Durchlauf pro Skill
+
+Beide Pfade muessen dieselben Issues und Priors liefern.
+
+    BENCH_CIM_SKILLS=500 pytest -q -s tests/benchmarks/test_skill_cim_scanner_benchmark.py
+"""
+
+from __future__ import annotations
+
+import ast
+import os
+import random
+import re
+import statistics
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+_REPO_ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(_REPO_ROOT / "tool_executor"))
+
+from skill_cim_light import SkillCIMLight  # noqa: E402
+
+SKILLS = int(os.getenv("BENCH_CIM_SKILLS", "200"))
+LINES = int(os.getenv("BENCH_CIM_LINES", "300"))
+DATA_DIR = _REPO_ROOT / "tool_executor" / "data" / "data"
+
+_LEGACY_FUNCTION_PATTERNS = {
+    "eval(": r"\beval\s*\(",
+    "exec(": r"\bexec\s*\(",
+    "os.system(": r"\bos\.system\s*\(",
+    "pickle.load": r"\bpickle\.load\s*\(",
+    "yaml.load(": r"\byaml\.load\s*\([^)]*\)(?!\s*,\s*Loader)",
+    "input(": r"\binput\s*\(",
+    "while True:": r"\bwhile\s+True\s*:",
+    "__import__": r"\b__import__\s*\(",
+    "subprocess.call(shell=True)": r"\bsubprocess\.call\(.*shell\s*=\s*True.*\)",
+    "verify=False": r"verify\s*=\s*False",
+    "0.0.0.0": r"0\.0\.0\.0",
+}
+
+_BENIGN = [
+    "    total = sum(values) / max(len(values), 1)",
+    "    result = {'count': len(items), 'items': sorted(items)}",
+    "    for idx, item in enumerate(items):",
+    "        logger.debug('processing %s', item)",
+    "    if not isinstance(data, dict):",
+    "        return {'error': 'invalid input'}",
+    "    # compute the moving average over the window",
+    "    window = data.get('window', 5)",
+    "    return json.dumps(result)",
+    "    text = str(payload).strip().lower()",
+]
+_RISKY = [
+    "    value = eval(expression)",
+    "    os.system(command)",
+    "    with open(path, 'w') as fh:",
+    "    resp = requests.get(url, verify=False)",
+    "    seed = time.time()",
+    "    name = input('name? ')",
+    "    while True:",
+    "    config = yaml.load(stream)",
+    "    # sandbox isolation is assumed here",
+    "    schema = validate_payload(data)",
+]
+
+
+def _corpus(seed: int = 7) -> list[str]:
+    rng = random.Random(seed)
+    skills = []
+    for n in range(SKILLS):
+        lines = ["import json", "import logging", "", f"def run_{n}(data, items=(), values=()):"]
+        for _ in range(LINES):
+            lines.append(rng.choice(_RISKY) if rng.random() < 0.01 else rng.choice(_BENIGN))
+        skills.append("\n".join(lines) + "\n")
+    return skills
+
+
+def _legacy_validate(cim: SkillCIMLight, code: str) -> tuple[list, list]:
+    """Kompakte, semantisch gleiche Kopie der alten Check-Methoden."""
+    issues, applied = [], []
+    for pattern in cim.anti_patterns:
+        pattern_id = pattern.get("pattern_id", pattern.get("id", "unknown"))
+        bad = pattern.get("negative_example", pattern.get("bad_example", pattern.get("pattern", "")))
+        signature = pattern.get("pattern_signature", "")
+        is_generic = "user_" in bad or "..." in bad
+        if bad and len(bad) > 3 and not is_generic and bad in code:
+            issues.append((pattern_id, bad))
+            continue
+        for func, regex in _LEGACY_FUNCTION_PATTERNS.items():
+            if (func in signature or func in bad) and re.search(regex, code):
+                issues.append((pattern_id, func))
+                break
+
+    for prior in cim.safety_priors:
+        tags = prior.get("embedding_tags", "[]")
+        try:
+            tag_list = ast.literal_eval(tags) if tags.startswith("[") else tags.split(",")
+        except Exception:
+            tag_list = []
+        if not any(str(t).strip().lower() and str(t).strip().lower() in code.lower() for t in tag_list):
+            continue
+        prior_id = prior.get("prior_id", "")
+        applied.append(prior_id)
+        for kw in ["rce", "injection", "crash", "hang", "leak"]:
+            if kw in prior.get("failure_mode", "").lower() and _legacy_violated(code, prior_id):
+                issues.append((prior_id, prior.get("principle_name", "")))
+
+    for pattern in cim.cim_anti_patterns:
+        for kw in pattern.get("keywords", "").split(","):
+            kw = kw.strip().lower()
+            if kw and len(kw) > 3 and kw in code.lower() and any(
+                p + kw in code.lower() for p in ('"', "'", "# ")
+            ):
+                issues.append((f"CIM-{pattern.get('name', '')[:10]}", kw))
+                break
+    return issues, applied
+
+
+def _legacy_violated(code: str, prior_id: str) -> bool:
+    if prior_id == "PRIOR-001":
+        return any(d in code for d in ["os.system", "subprocess.call", "socket.", "__import__"])
+    if prior_id == "PRIOR-002":
+        return any(r in code for r in ["random.", "time.time()", "uuid.uuid4"])
+    if prior_id == "PRIOR-003":
+        return any(s in code for s in ["open(", "write(", "requests.", "urllib."])
+    if prior_id == "PRIOR-004":
+        return ("input(" in code or "request." in code) and not (
+            "validate" in code.lower() or "schema" in code.lower()
+        )
+    return False
+
+
+def _time(fn, corpus: list[str]) -> tuple[list, list[float]]:
+    out, latencies = [], []
+    for code in corpus:
+        t0 = time.perf_counter()
+        out.append(fn(code))
+        latencies.append((time.perf_counter() - t0) * 1000)
+    return out, sorted(latencies)
+
+
+@pytest.mark.slow
+def test_skill_cim_scanner_vs_legacy():
+    cim = SkillCIMLight(DATA_DIR)
+    corpus = _corpus()
+    kb = sum(len(c) for c in corpus) / len(corpus) / 1024
+
+    def _scanner(code: str):
+        result = cim.validate_code(code)
+        return [(i.id, i.matched_text or i.pattern) for i in result.issues], result.applied_priors
+
+    legacy, legacy_ms = _time(lambda code: _legacy_validate(cim, code), corpus)
+    scanned, scanner_ms = _time(_scanner, corpus)
+
+    assert scanned == legacy
+    assert sum(1 for issues, _ in scanned if issues) > 0
+    for mode, lat in (("legacy", legacy_ms), ("scanner", scanner_ms)):
+        print(
+            f"\n{mode}: skills={SKILLS} avg_size={kb:.1f}KB patterns={cim._compiled.scanner.pattern_count} "
+            f"p50={statistics.median(lat):.2f}ms p95={lat[int(len(lat) * 0.95) - 1]:.2f}ms "
+            f"total={sum(lat):.0f}ms"
+        )
+    assert sum(scanner_ms) < sum(legacy_ms)
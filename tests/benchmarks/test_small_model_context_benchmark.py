@@ -0,0 +1,147 @@
+"""
+Micro-Benchmark fuer ContextManager.build_small_model_context.
+
+BENCH_SMC_CONVS Konversationen mit je BENCH_SMC_EVENTS Workspace-Events im
+WorkspaceEventStore; pro Turn kommt in einer Konversation ein neues Event dazu,
+danach wird der Small-Model-Context gebaut:
+
+- legacy:  Verhalten vor dem Umbau — newest-100 per workspace_event_list,
+           mapping_rules.yaml pro Aufruf dreimal geparst, source_event_ids
+           per Listen-Lookup (quadratisch)
+- current: build_small_model_context — Change-Feed ab dem High-Water-Mark,
+           Rules-Cache, Set-Lookup
+
+Beide Pfade sehen dieselben newest-100/48h-Events; der Output muss in jedem
+Turn identisch sein.
+
+    BENCH_SMC_TURNS=60 pytest -q -s tests/benchmarks/test_small_model_context_benchmark.py
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import random
+import sqlite3
+import statistics
+import time
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+import core.context_cleanup as cc
+from core.context_manager import _EVENT_WINDOWS, ContextManager
+from core.tools.fast_lane.definitions import WorkspaceEventListTool
+from core.tools.fast_lane.workspace_event_store import WorkspaceEventStore
+
+EVENTS = int(os.getenv("BENCH_SMC_EVENTS", "10000"))
+CONVS = int(os.getenv("BENCH_SMC_CONVS", "3"))
+TURNS = int(os.getenv("BENCH_SMC_TURNS", "30"))
+
+_TYPES = ["container_started", "container_stopped", "container_exec", "tool_result",
+          "approval_requested", "trust_blocked", "observation", "note"]
+
+
+def _event(rng: random.Random, event_id: int, conv: str, ts: datetime) -> dict:
+    return {
+        "id": event_id,
+        "conversation_id": conv,
+        "event_type": rng.choice(_TYPES),
+        "event_data": {
+            "container_id": f"c{rng.randrange(20)}",
+            "ref_id": f"ref-{event_id}",
+            "tool_name": "exec",
+            "status": rng.choice(["success", "success", "error"]),
+            "exit_code": rng.choice([0, 0, 1]),
+            "content": f"step {event_id % 300}",
+        },
+        "created_at": ts.isoformat(),
+    }
+
+
+def _legacy_build(events: list) -> int:
+    for _ in range(3):  # _load_limits, _load_confidence_config, _load_output_config
+        with open(cc._RULES_PATH, "r", encoding="utf-8") as f:
+            cc.yaml.safe_load(f)
+    ordered = cc._sort_events_asc(cc._dedupe_events(cc._normalize_events(events)))
+    state = cc.TypedState()
+    for ev in ordered:
+        cc._apply_event(state, ev)
+        if ev["id"] not in state.source_event_ids:
+            state.source_event_ids.append(ev["id"])
+    return len(ordered)
+
+
+class _Hub:
+    def initialize(self):
+        pass
+
+    def call_tool(self, name, args):
+        return WorkspaceEventListTool(**args).execute()
+
+
+def _insert(store: WorkspaceEventStore, events: list) -> None:
+    with sqlite3.connect(store.db_path) as conn:
+        conn.executemany(
+            "INSERT INTO workspace_events (id, conversation_id, event_type, event_data, created_at) "
+            "VALUES (?, ?, ?, ?, ?)",
+            [(ev["id"], ev["conversation_id"], ev["event_type"], json.dumps(ev["event_data"]),
+              ev["created_at"]) for ev in events],
+        )
+
+
+@pytest.mark.slow
+def test_small_model_context_vs_legacy(tmp_path):
+    store = WorkspaceEventStore(str(tmp_path / "memory.db"), retention_days=0)
+    store.high_water("warmup")  # Schema + Indizes
+    rng = random.Random(11)
+    start = datetime.utcnow() - timedelta(seconds=7 * (EVENTS + TURNS) + 60)
+    last_ts = {}
+    next_id = 1
+    for c in range(CONVS):
+        conv = f"conv-{c}"
+        events = []
+        for i in range(EVENTS):
+            events.append(_event(rng, next_id, conv, start + timedelta(seconds=7 * i)))
+            next_id += 1
+        _insert(store, events)
+        last_ts[conv] = datetime.fromisoformat(events[-1]["created_at"])
+
+    hub = _Hub()
+    cm = ContextManager()
+    no_task_loop = MagicMock()
+    no_task_loop.get.return_value = None
+    _EVENT_WINDOWS.clear()
+    legacy_ms, current_ms = [], []
+    with patch("core.tools.fast_lane.definitions.get_workspace_event_store", return_value=store), \
+         patch("mcp.hub.get_hub", return_value=hub), \
+         patch("core.typedstate_csv_loader.maybe_load_csv_events", return_value=[]), \
+         patch("config.get_typedstate_mode", return_value="off"), \
+         patch("core.context_manager.get_task_loop_store", return_value=no_task_loop):
+        for c in range(CONVS):
+            cm.build_small_model_context(conversation_id=f"conv-{c}")
+
+        for turn in range(TURNS):
+            conv = f"conv-{turn % CONVS}"
+            last_ts[conv] += timedelta(seconds=7)
+            _insert(store, [_event(rng, next_id, conv, last_ts[conv])])
+            next_id += 1
+
+            t0 = time.perf_counter()
+            newest = cm._extract_workspace_events(
+                hub.call_tool("workspace_event_list", {"limit": 100, "conversation_id": conv})
+            )
+            _legacy_build(newest)
+            legacy_ms.append((time.perf_counter() - t0) * 1000)
+            t0 = time.perf_counter()
+            current = cm.build_small_model_context(conversation_id=conv)
+            current_ms.append((time.perf_counter() - t0) * 1000)
+            assert current == cc.format_compact_context(cc.build_compact_context(newest))
+    _EVENT_WINDOWS.clear()
+
+    print(f"\nevents/conv={EVENTS} convs={CONVS} turns={TURNS}")
+    for mode, lat in (("legacy", legacy_ms), ("current", current_ms)):
+        lat.sort()
+        print(f"{mode}: p50={statistics.median(lat):.2f}ms max={lat[-1]:.2f}ms")
+    assert statistics.median(current_ms) < statistics.median(legacy_ms)
@@ -0,0 +1,154 @@
+"""
+Concurrency-Benchmark fuer sql-memory/db_pool.py.
+
+Treibt die echten MCP-Tools (register_tools mit Fake-mcp) aus vielen Threads
+mit einem gemischten Workload (memory_save + memory_recent/search/
+search_layered/fact_load) gegen dieselbe memory.db:
+
+  - legacy: MEMORY_DB_POOL_ENABLE=false → frische Connection pro Call,
+            Rollback-Journal, Default-Pragmas
+  - pooled: ein Writer (FIFO-Lease) + read-only WAL-Leser, Statement-Cache
+
+Embeddings sind durch einen Stub ersetzt (kein Ollama noetig).
+
+    BENCH_SQLMEM_THREADS=16 BENCH_SQLMEM_OPS=400 \\
+        pytest -q -s tests/benchmarks/test_sql_memory_concurrency_benchmark.py
+"""
+
+from __future__ import annotations
+
+import os
+import random
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+_SQL_MEMORY = Path(__file__).resolve().parents[2] / "sql-memory"
+if str(_SQL_MEMORY) not in sys.path:
+    sys.path.insert(0, str(_SQL_MEMORY))
+
+import db_pool  # noqa: E402
+
+THREADS = int(os.getenv("BENCH_SQLMEM_THREADS", "16"))
+OPS = int(os.getenv("BENCH_SQLMEM_OPS", "200"))
+SEED_ROWS = int(os.getenv("BENCH_SQLMEM_SEED_ROWS", "5000"))
+WRITE_RATIO = float(os.getenv("BENCH_SQLMEM_WRITE_RATIO", "0.2"))
+
+
+class _FakeMCP:
+    def __init__(self):
+        self.tools = {}
+
+    def tool(self, fn=None, **_kwargs):
+        if fn is None:
+            return lambda f: self.tool(f)
+        self.tools[fn.__name__] = fn
+        return fn
+
+
+def _register_tools():
+    from memory_mcp import tools as tools_module
+
+    mcp = _FakeMCP()
+    tools_module.register_tools(mcp)
+    return mcp.tools
+
+
+def _seed(tools):
+    rng = random.Random(7)
+    words = ["docker", "dns", "backup", "nginx", "python", "sqlite", "gpu", "cron"]
+    for i in range(SEED_ROWS):
+        tools["memory_save"](
+            conversation_id=f"conv-{i % 32}",
+            role="user",
+            content=" ".join(rng.choice(words) for _ in range(8)) + f" #{i}",
+            layer="stm",
+        )
+    from memory_mcp.database import insert_fact
+
+    for i in range(32):
+        insert_fact(f"conv-{i}", "user", "pref", f"value-{i}")
+
+
+def _worker(tools, worker_id, latencies, errors, barrier):
+    rng = random.Random(worker_id)
+    conv = f"conv-{worker_id % 32}"
+    barrier.wait()
+    for op in range(OPS):
+        t0 = time.perf_counter()
+        try:
+            if rng.random() < WRITE_RATIO:
+                tools["memory_save"](
+                    conversation_id=conv, role="user",
+                    content=f"worker {worker_id} op {op} docker dns", layer="stm",
+                )
+            else:
+                choice = rng.randrange(4)
+                if choice == 0:
+                    tools["memory_recent"](conversation_id=conv, limit=20)
+                elif choice == 1:
+                    tools["memory_search"](query="backup", conversation_id=conv, limit=20)
+                elif choice == 2:
+                    tools["memory_search_layered"](conversation_id=conv, query="nginx", limit=20)
+                else:
+                    tools["memory_fact_load"](conversation_id=conv, key="pref")
+        except Exception as exc:  # noqa: BLE001 - Fehler zaehlen, nicht abbrechen
+            errors.append(f"{type(exc).__name__}: {exc}")
+        latencies.append((time.perf_counter() - t0) * 1000)
+
+
+def _run(db_path: str, pooled: bool):
+    import memory_mcp.database as database
+    import memory_mcp.tools as tools_module
+
+    with patch.object(db_pool, "_POOL_ENABLE", pooled), \
+         patch.object(database, "DB_PATH", db_path), \
+         patch.object(tools_module, "DB_PATH", db_path), \
+         patch.object(tools_module, "get_vector_store", return_value=MagicMock()):
+        database.init_db()
+        database.migrate_db()
+        tools = _register_tools()
+        _seed(tools)
+
+        latencies, errors = [], []
+        barrier = threading.Barrier(THREADS)
+        threads = [
+            threading.Thread(target=_worker, args=(tools, i, latencies, errors, barrier))
+            for i in range(THREADS)
+        ]
+        t0 = time.perf_counter()
+        for th in threads:
+            th.start()
+        for th in threads:
+            th.join()
+        wall_s = time.perf_counter() - t0
+    db_pool.close_all()
+    latencies.sort()
+    return {
+        "ops_per_s": len(latencies) / wall_s,
+        "p50": statistics.median(latencies),
+        "p95": latencies[int(len(latencies) * 0.95) - 1],
+        "errors": len(errors),
+    }
+
+
+@pytest.mark.slow
+def test_pooled_connections_under_concurrent_tool_load():
+    with tempfile.TemporaryDirectory() as tmp:
+        legacy = _run(os.path.join(tmp, "legacy.db"), pooled=False)
+        pooled = _run(os.path.join(tmp, "pooled.db"), pooled=True)
+
+    for name, r in (("legacy", legacy), ("pooled", pooled)):
+        print(
+            f"\n{name}: threads={THREADS} ops={THREADS * OPS} write_ratio={WRITE_RATIO} "
+            f"throughput={r['ops_per_s']:.0f} ops/s p50={r['p50']:.2f}ms "
+            f"p95={r['p95']:.2f}ms errors={r['errors']}"
+        )
+    assert pooled["errors"] == 0
+    assert pooled["ops_per_s"] > legacy["ops_per_s"]
@@ -0,0 +1,119 @@
+"""
+Recall/Latenz-Benchmark: VectorStore.search (float32-BLOB + IVF-Index)
+gegen den bisherigen Brute-Force-Pfad (JSON-Text + Python-Cosine).
+
+    BENCH_VECTOR_ROWS=100000 BENCH_VECTOR_DIM=1024 \\
+        pytest -q -s tests/benchmarks/test_vector_store_ann_benchmark.py
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+import sys
+import tempfile
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+_SQL_MEMORY = Path(__file__).resolve().parents[2] / "sql-memory"
+if str(_SQL_MEMORY) not in sys.path:
+    sys.path.insert(0, str(_SQL_MEMORY))
+
+import vector_index  # noqa: E402
+import vector_store  # noqa: E402
+from embedding import cosine_similarity  # noqa: E402
+
+ROWS = int(os.getenv("BENCH_VECTOR_ROWS", "10000"))
+DIM = int(os.getenv("BENCH_VECTOR_DIM", "384"))
+QUERIES = int(os.getenv("BENCH_VECTOR_QUERIES", "20"))
+LEGACY_QUERIES = int(os.getenv("BENCH_VECTOR_LEGACY_QUERIES", "3"))
+TOP_K = 10
+
+
+def _legacy_search(db_path: str, query: list, limit: int) -> list:
+    """1:1 Nachbau des alten Pfads: alle Zeilen laden, json.loads, Python-Cosine."""
+    conn = sqlite3.connect(db_path)
+    try:
+        rows = conn.execute(
+            "SELECT id, embedding FROM embeddings WHERE embedding_version = 'v1'"
+        ).fetchall()
+    finally:
+        conn.close()
+    scored = []
+    for entry_id, raw in rows:
+        scored.append((entry_id, cosine_similarity(query, json.loads(raw))))
+    scored.sort(key=lambda x: x[1], reverse=True)
+    return [entry_id for entry_id, _ in scored[:limit]]
+
+
+@pytest.mark.slow
+def test_vector_store_ann_vs_bruteforce():
+    rng = np.random.default_rng(42)
+    centers = rng.normal(size=(max(16, ROWS // 500), DIM))
+    vecs = centers[rng.integers(0, centers.shape[0], size=ROWS)]
+    vecs = (vecs + 0.2 * rng.normal(size=vecs.shape)).astype(np.float32)
+
+    with tempfile.TemporaryDirectory() as td:
+        legacy_db = os.path.join(td, "legacy.db")
+        blob_db = os.path.join(td, "blob.db")
+        vector_store.VectorStore(legacy_db, index_dir="")
+        vs = vector_store.VectorStore(blob_db, index_dir=os.path.join(td, "idx"))
+        for path, encode in (
+            (legacy_db, lambda v: json.dumps(v.tolist())),
+            (blob_db, vector_index.pack_embedding),
+        ):
+            conn = sqlite3.connect(path)
+            try:
+                conn.executemany(
+                    "INSERT INTO embeddings (conversation_id, content, content_type, embedding, "
+                    "embedding_dim, embedding_version) VALUES ('c1', ?, 'fact', ?, ?, 'v1')",
+                    ((f"row-{i}", encode(v), DIM) for i, v in enumerate(vecs)),
+                )
+                conn.commit()
+            finally:
+                conn.close()
+
+        queries = vecs[rng.choice(ROWS, size=QUERIES, replace=False)]
+        queries = queries + 0.05 * rng.normal(size=queries.shape).astype(np.float32)
+
+        t0 = time.perf_counter()
+        legacy_ids = [_legacy_search(legacy_db, q.tolist(), TOP_K) for q in queries[:LEGACY_QUERIES]]
+        legacy_ms = (time.perf_counter() - t0) * 1000 / LEGACY_QUERIES
+
+        with patch.object(vector_store, "get_active_embedding_version", return_value="v1"):
+            with patch.object(vector_store, "get_embedding", return_value=queries[0].tolist()):
+                t0 = time.perf_counter()
+                vs.search("warmup", limit=TOP_K, min_similarity=-1.0)
+                build_ms = (time.perf_counter() - t0) * 1000
+
+            ann_ids, ann_ms = [], []
+            for q in queries:
+                with patch.object(vector_store, "get_embedding", return_value=q.tolist()):
+                    t0 = time.perf_counter()
+                    res = vs.search("q", limit=TOP_K, min_similarity=-1.0)
+                    ann_ms.append((time.perf_counter() - t0) * 1000)
+                ann_ids.append([r["id"] for r in res])
+
+        normed = vecs / np.linalg.norm(vecs, axis=1, keepdims=True)
+        recall_hits = 0
+        for q, got in zip(queries, ann_ids):
+            exact = np.argsort(-(normed @ (q / np.linalg.norm(q))))[:TOP_K] + 1
+            recall_hits += len(set(exact.tolist()) & set(got))
+        recall = recall_hits / (TOP_K * len(queries))
+        legacy_agree = sum(
+            len(set(a) & set(b)) for a, b in zip(legacy_ids, ann_ids)
+        ) / (TOP_K * len(legacy_ids))
+
+        print(
+            f"\nrows={ROWS} dim={DIM} stats={vs.index.stats()}\n"
+            f"legacy_bruteforce_ms_per_query={legacy_ms:.1f}\n"
+            f"index_build_ms={build_ms:.1f}\n"
+            f"ann_ms_per_query p50={np.percentile(ann_ms, 50):.2f} p95={np.percentile(ann_ms, 95):.2f}\n"
+            f"recall@{TOP_K}={recall:.3f} legacy_overlap@{TOP_K}={legacy_agree:.3f}"
+        )
+        assert recall >= 0.9
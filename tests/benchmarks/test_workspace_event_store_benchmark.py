@@ -0,0 +1,153 @@
+"""
+Micro-Benchmark fuer den Workspace-Event-Store (core/tools/fast_lane/workspace_event_store.py).
+
+Fuellt workspace_events mit BENCH_WSE_ROWS Events (BENCH_WSE_CONVS
+Konversationen, verteilt ueber 30 Tage) und misst:
+
+- save:  BENCH_WSE_WRITERS Threads speichern je BENCH_WSE_SAVES Events
+         legacy = pro Save Connection + CREATE TABLE IF NOT EXISTS + INSERT +
+         COMMIT (Verhalten der alten Fast-Lane-Tools)
+         store  = WorkspaceEventStore.save (Group-Commit im Writer-Thread)
+- read:  pro "Turn" die Events einer Konversation
+         legacy = 48h-Filter ohne Index (alte Tabelle)
+         store  = list_recent ueber den Composite-Index, sowie
+         feed   = list_since(high_water) — nur neue Events seit dem letzten Turn
+
+    BENCH_WSE_ROWS=500000 pytest -q -s tests/benchmarks/test_workspace_event_store_benchmark.py
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import random
+import sqlite3
+import statistics
+import threading
+import time
+from datetime import datetime, timedelta
+
+import pytest
+
+from core.tools.fast_lane.workspace_event_store import WorkspaceEventStore
+
+ROWS = int(os.getenv("BENCH_WSE_ROWS", "200000"))
+CONVS = int(os.getenv("BENCH_WSE_CONVS", "50"))
+WRITERS = int(os.getenv("BENCH_WSE_WRITERS", "8"))
+SAVES = int(os.getenv("BENCH_WSE_SAVES", "50"))
+TURNS = int(os.getenv("BENCH_WSE_TURNS", "100"))
+
+_SCHEMA = """
+    CREATE TABLE IF NOT EXISTS workspace_events (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        conversation_id TEXT NOT NULL,
+        event_type TEXT NOT NULL,
+        event_data TEXT NOT NULL,
+        created_at TEXT NOT NULL
+    )
+"""
+
+
+def _fill(path: str) -> None:
+    rng = random.Random(3)
+    now = datetime.utcnow()
+    rows = []
+    for i in range(ROWS):
+        # aufsteigende Zeitstempel wie im Betrieb (id-Reihenfolge == Zeit)
+        ts = now - timedelta(days=30) + timedelta(seconds=i * (30 * 86400 / ROWS))
+        rows.append((f"conv-{rng.randrange(CONVS)}", rng.choice(["observation", "tool_result", "note"]),
+                     json.dumps({"i": i}), ts.isoformat()))
+    with sqlite3.connect(path) as conn:
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute(_SCHEMA)
+        conn.executemany(
+            "INSERT INTO workspace_events (conversation_id, event_type, event_data, created_at) VALUES (?, ?, ?, ?)",
+            rows,
+        )
+
+
+def _legacy_save(path: str, conv: str, i: int) -> int:
+    with sqlite3.connect(path, timeout=5.0, check_same_thread=False) as conn:
+        cur = conn.cursor()
+        cur.execute(_SCHEMA)
+        cur.execute(
+            "INSERT INTO workspace_events (conversation_id, event_type, event_data, created_at) VALUES (?, ?, ?, ?)",
+            (conv, "observation", json.dumps({"i": i}), datetime.utcnow().isoformat()),
+        )
+        conn.commit()
+        return cur.lastrowid
+
+
+def _legacy_list(path: str, conv: str, limit: int = 100) -> list:
+    with sqlite3.connect(path, timeout=5.0) as conn:
+        rows = conn.execute(
+            """
+            SELECT id, conversation_id, event_type, event_data, created_at
+            FROM workspace_events
+            WHERE created_at >= datetime('now', '-2 days') AND conversation_id = ?
+            ORDER BY created_at DESC LIMIT ?
+            """,
+            (conv, limit),
+        ).fetchall()
+    return [json.loads(r[3]) for r in rows]
+
+
+def _parallel_saves(fn) -> float:
+    threads = [
+        threading.Thread(target=lambda w=w: [fn(f"conv-{w}", i) for i in range(SAVES)])
+        for w in range(WRITERS)
+    ]
+    t0 = time.perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return time.perf_counter() - t0
+
+
+def _time_reads(fn) -> list:
+    lat = []
+    for turn in range(TURNS):
+        t0 = time.perf_counter()
+        fn(f"conv-{turn % CONVS}")
+        lat.append((time.perf_counter() - t0) * 1000)
+    return sorted(lat)
+
+
+@pytest.mark.slow
+def test_workspace_event_store_vs_legacy(tmp_path):
+    legacy_path = str(tmp_path / "legacy.db")
+    store_path = str(tmp_path / "store.db")
+    _fill(legacy_path)
+    _fill(store_path)
+    store = WorkspaceEventStore(store_path, retention_days=0)
+    t0 = time.perf_counter()
+    store.high_water("warmup")  # einmalig: Indizes fuer die Bestandsdaten anlegen
+    index_ms = (time.perf_counter() - t0) * 1000
+
+    legacy_s = _parallel_saves(lambda conv, i: _legacy_save(legacy_path, conv, i))
+    store_s = _parallel_saves(lambda conv, i: store.save(conv, "observation", {"i": i}))
+    total = WRITERS * SAVES
+
+    legacy_read = _time_reads(lambda conv: _legacy_list(legacy_path, conv))
+    store_read = _time_reads(lambda conv: store.list_recent(conversation_id=conv, limit=100))
+    marks = {f"conv-{c}": store.high_water(f"conv-{c}") for c in range(CONVS)}
+    feed_read = _time_reads(lambda conv: store.list_since(conv, marks[conv]))
+
+    # beide Pfade liefern dieselben (neuesten) Events
+    for c in range(CONVS):
+        conv = f"conv-{c}"
+        legacy_events = _legacy_list(legacy_path, conv)
+        store_events = [e["event_data"] for e in store.list_recent(conversation_id=conv, limit=100)]
+        assert store_events == legacy_events
+
+    print(
+        f"\nsave: rows={ROWS} writers={WRITERS}x{SAVES} "
+        f"legacy={total / legacy_s:.0f}/s store={total / store_s:.0f}/s batches={store.stats['batches']} "
+        f"index_build={index_ms:.0f}ms"
+    )
+    for mode, lat in (("legacy", legacy_read), ("store", store_read), ("feed", feed_read)):
+        print(f"read {mode}: p50={statistics.median(lat):.2f}ms p95={lat[int(len(lat) * 0.95) - 1]:.2f}ms")
+    assert store_s < legacy_s
+    assert statistics.median(store_read) < statistics.median(legacy_read)
+    assert statistics.median(feed_read) < statistics.median(store_read)
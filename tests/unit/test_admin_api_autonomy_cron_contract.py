@@ -28,6 +28,7 @@ def test_autonomy_cron_endpoints_exist():
     assert '@app.post("/api/autonomy/cron/jobs/{cron_job_id}/resume")' in src
     assert '@app.post("/api/autonomy/cron/jobs/{cron_job_id}/run-now")' in src
     assert '@app.get("/api/autonomy/cron/queue")' in src
+    assert '@app.get("/api/autonomy/cron/runs")' in src
 
 
 def test_autonomy_cron_scheduler_wired_on_startup_and_shutdown():
@@ -8,6 +8,7 @@ from core.autonomy.cron_scheduler import (
     CronPolicyError,
     _TRION_RISKY_CONTEXT_APPROVED,
     cron_matches,
+    next_fire_utc,
     next_matching_utc,
     parse_cron_expression,
     validate_cron_expression,
@@ -54,6 +55,88 @@ def test_cron_matches_and_next_run_utc():
     assert nxt.startswith("2026-03-09T10:30")
 
 
+def test_next_fire_utc_handles_dst_and_sparse_dates():
+    from zoneinfo import ZoneInfo
+
+    berlin = ZoneInfo("Europe/Berlin")
+    # 02:30 does not exist on 2026-03-29 (spring forward) -> next day
+    nxt = next_fire_utc(
+        parse_cron_expression("30 2 * * *"),
+        berlin,
+        datetime(2026, 3, 28, 2, 0, tzinfo=timezone.utc),
+    )
+    assert nxt == datetime(2026, 3, 30, 0, 30, tzinfo=timezone.utc)
+
+    # 02:30 exists twice on 2026-10-25 (fall back) -> both instants match
+    parsed = parse_cron_expression("30 2 * * *")
+    first = next_fire_utc(parsed, berlin, datetime(2026, 10, 24, 23, 0, tzinfo=timezone.utc))
+    second = next_fire_utc(parsed, berlin, first)
+    assert first == datetime(2026, 10, 25, 0, 30, tzinfo=timezone.utc)
+    assert second == datetime(2026, 10, 25, 1, 30, tzinfo=timezone.utc)
+
+    leap = next_fire_utc(
+        parse_cron_expression("0 12 29 2 *"),
+        ZoneInfo("UTC"),
+        datetime(2026, 3, 1, tzinfo=timezone.utc),
+        max_days=366 * 3,
+    )
+    assert leap == datetime(2028, 2, 29, 12, 0, tzinfo=timezone.utc)
+    assert next_matching_utc(parse_cron_expression("0 0 31 2 *"), "UTC") == ""
+
+
+@pytest.mark.asyncio
+async def test_scheduler_tick_fires_due_jobs_once_per_minute(tmp_path):
+    async def _dummy_submit(payload, meta):
+        return {"job_id": "autonomy_dummy_heap", "status": "queued"}
+
+    scheduler = AutonomyCronScheduler(
+        state_path=str(tmp_path / "autonomy_cron_state.json"),
+        tick_s=10,
+        max_concurrency=1,
+        submit_cb=_dummy_submit,
+    )
+    base = datetime(2026, 3, 9, 10, 0, tzinfo=timezone.utc)
+    with patch("core.autonomy.cron_scheduler._utcnow", return_value=base):
+        due = await scheduler.create_job(
+            {
+                "name": "morning",
+                "objective": "morning summary",
+                "conversation_id": "conv-heap",
+                "cron": "30 10 * * *",
+                "timezone": "UTC",
+                "created_by": "user",
+            }
+        )
+        later = await scheduler.create_job(
+            {
+                "name": "evening",
+                "objective": "evening summary",
+                "conversation_id": "conv-heap",
+                "cron": "0 20 * * *",
+                "timezone": "UTC",
+                "created_by": "user",
+            }
+        )
+
+    with patch("core.autonomy.cron_scheduler._utcnow", return_value=base + timedelta(minutes=29)):
+        await scheduler._tick_once()
+    assert (await scheduler.get_queue_snapshot())["pending"] == []
+
+    for seconds in (0, 20, 59):
+        now = base + timedelta(minutes=30, seconds=seconds)
+        with patch("core.autonomy.cron_scheduler._utcnow", return_value=now):
+            await scheduler._tick_once()
+
+    pending = (await scheduler.get_queue_snapshot())["pending"]
+    assert [x["cron_job_id"] for x in pending] == [due["id"]]
+    with patch("core.autonomy.cron_scheduler._utcnow", return_value=base + timedelta(minutes=31)):
+        jobs = {job["id"]: job for job in await scheduler.list_jobs()}
+    assert jobs[due["id"]]["next_run_at"].startswith("2026-03-10T10:30")
+    assert jobs[later["id"]]["next_run_at"].startswith("2026-03-09T20:00")
+    # heap holds one live entry per enabled job
+    assert len(scheduler._next_fire) == 2
+
+
 @pytest.mark.asyncio
 async def test_scheduler_crud_and_manual_queue(tmp_path):
     async def _dummy_submit(payload, meta):
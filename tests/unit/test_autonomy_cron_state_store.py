@@ -0,0 +1,106 @@
+import asyncio
+import json
+
+import pytest
+
+from core.autonomy.cron_scheduler import AutonomyCronScheduler
+from core.autonomy.cron_state_store import CronStateStore, store_path_for
+
+
+def _scheduler(state_path: str) -> AutonomyCronScheduler:
+    async def _dummy_submit(payload, meta):
+        return {"job_id": "autonomy_dummy_store", "status": "queued"}
+
+    return AutonomyCronScheduler(
+        state_path=state_path,
+        tick_s=10,
+        max_concurrency=1,
+        submit_cb=_dummy_submit,
+    )
+
+
+def _payload(name: str) -> dict:
+    return {
+        "name": name,
+        "objective": f"{name} objective",
+        "conversation_id": "conv-store",
+        "cron": "0 4 * * *",
+        "timezone": "UTC",
+        "created_by": "user",
+    }
+
+
+def _run(n: int, job_id: str, status: str = "submitted") -> dict:
+    return {"run_id": f"run-{n}", "cron_job_id": job_id, "status": status, "finished_at": f"2026-01-01T00:{n:02d}:00Z"}
+
+
+def test_store_path_for_maps_json_state_to_sqlite():
+    assert store_path_for("memory_speicher/autonomy_cron_state.json") == "memory_speicher/autonomy_cron_state.sqlite"
+    assert store_path_for("/data/cron.db") == "/data/cron.db"
+    assert store_path_for("/data/cron_state") == "/data/cron_state.sqlite"
+
+
+@pytest.mark.asyncio
+async def test_scheduler_writes_only_changed_jobs_and_reloads(tmp_path):
+    state_path = str(tmp_path / "autonomy_cron_state.json")
+    scheduler = _scheduler(state_path)
+
+    first = await scheduler.create_job(_payload("first"))
+    second = await scheduler.create_job(_payload("second"))
+    await scheduler.update_job(second["id"], {"objective": "changed objective"})
+    await scheduler.delete_job(first["id"])
+    await asyncio.wrap_future(scheduler._store.flush())
+
+    # one row per mutation, never the full job table
+    assert scheduler._store.stats["jobs_written"] == 4
+    assert scheduler._store.stats["writes"] == 4
+
+    reloaded = _scheduler(state_path)
+    reloaded._load_state_locked()
+    assert list(reloaded._jobs) == [second["id"]]
+    assert reloaded._jobs[second["id"]]["objective"] == "changed objective"
+
+
+def test_store_imports_legacy_json_once(tmp_path):
+    legacy = tmp_path / "autonomy_cron_state.json"
+    legacy.write_text(
+        json.dumps({
+            "version": 1,
+            "jobs": [{"id": "cron_legacy", "name": "legacy"}, {"name": "no-id"}],
+            "history": [_run(1, "cron_legacy")],
+        }),
+        encoding="utf-8",
+    )
+    store = CronStateStore(store_path_for(str(legacy)), legacy_json_path=str(legacy))
+    jobs, history = store.load()
+    assert [j["id"] for j in jobs] == ["cron_legacy"]
+    assert [h["run_id"] for h in history] == ["run-1"]
+
+    store.write(deletes=["cron_legacy"]).result()
+    store.close()
+    reopened = CronStateStore(store_path_for(str(legacy)), legacy_json_path=str(legacy))
+    assert reopened.load() == ([], history)
+    reopened.close()
+
+
+def test_store_paginates_run_history_with_filters(tmp_path):
+    store = CronStateStore(str(tmp_path / "cron.sqlite"), history_keep=8)
+    runs = [json.dumps(_run(n, "job-a" if n % 2 else "job-b", "failed" if n % 3 == 0 else "submitted"))
+            for n in range(1, 11)]
+    store.write(runs=runs[:5])
+    store.write(runs=runs[5:])
+
+    page = store.list_runs(limit=3).result()
+    assert [r["run_id"] for r in page["runs"]] == ["run-10", "run-9", "run-8"]
+    page = store.list_runs(limit=3, before=page["next_before"]).result()
+    assert [r["run_id"] for r in page["runs"]] == ["run-7", "run-6", "run-5"]
+    page = store.list_runs(limit=3, before=page["next_before"]).result()
+    # only the newest 8 runs are kept
+    assert [r["run_id"] for r in page["runs"]] == ["run-4", "run-3"]
+    assert page["next_before"] is None
+
+    filtered = store.list_runs(cron_job_id="job-a", status="failed").result()
+    assert [r["run_id"] for r in filtered["runs"]] == ["run-9", "run-3"]
+    _, recent = store.load()
+    assert [r["run_id"] for r in recent][-2:] == ["run-9", "run-10"]
+    store.close()
@@ -0,0 +1,237 @@
+"""
+container_commander/engine_state_cache.py: Docker-events-fed container snapshot
+for list/inspect/quota reads, periodic reconciliation, API-call counter.
+"""
+import logging
+import threading
+import time
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+from container_commander.engine_runtime_state import (
+    RuntimeStateRefs,
+    sync_runtime_state_from_docker,
+)
+from container_commander.engine_state_cache import ContainerStateCache
+from container_commander.models import SessionQuota
+
+LABEL = "trion.managed"
+_log = logging.getLogger("test.state_cache")
+
+
+def _container(cid, name=None, status="running", labels=None, mem_mb=256):
+    return SimpleNamespace(
+        id=cid,
+        name=name or f"trion_{cid}",
+        status=status,
+        labels={LABEL: "true", "trion.blueprint": "bp", **(labels or {})} if labels is not False else {},
+        attrs={
+            "State": {"Status": status},
+            "HostConfig": {"Memory": mem_mb * 1024 * 1024, "NanoCpus": 500_000_000},
+        },
+    )
+
+
+class _FakeDocker:
+    """containers.list/get + events() from a scripted queue."""
+
+    def __init__(self, containers):
+        self.by_id = {c.id: c for c in containers}
+        self.list_calls = 0
+        self.get_calls = 0
+        self.event_batches = []
+        self.events_calls = []
+        self.containers = SimpleNamespace(list=self._list, get=self._get)
+
+    def _list(self, all=False, filters=None):
+        self.list_calls += 1
+        return [c for c in self.by_id.values() if LABEL in c.labels]
+
+    def _get(self, cid):
+        self.get_calls += 1
+        if cid not in self.by_id:
+            raise KeyError(cid)
+        return self.by_id[cid]
+
+    def events(self, **kwargs):
+        self.events_calls.append(kwargs)
+        return iter(self.event_batches.pop(0) if self.event_batches else [])
+
+
+def _live_cache(client):
+    cache = ContainerStateCache(get_client=lambda: client, trion_label=LABEL, logger=_log)
+    cache.reconcile()
+    cache._live = True
+    return cache
+
+
+def test_not_live_cache_defers_to_docker():
+    client = _FakeDocker([_container("a1")])
+    cache = ContainerStateCache(get_client=lambda: client, trion_label=LABEL, logger=_log)
+    assert cache.list() is None
+    assert cache.get("a1") is None
+    cache.refresh("a1")
+    assert client.get_calls == 0
+
+
+def test_reads_are_served_from_snapshot_and_counted():
+    client = _FakeDocker([_container("aaa111", name="web"), _container("bbb222", status="exited")])
+    cache = _live_cache(client)
+
+    assert {c.id for c in cache.list()} == {"aaa111", "bbb222"}
+    assert [c.id for c in cache.list(running_only=True)] == ["aaa111"]
+    assert cache.get("aaa").id == "aaa111"
+    assert cache.get("web").id == "aaa111"
+    assert cache.get("zzz") is None
+    assert client.list_calls == 1 and client.get_calls == 0
+
+    stats = cache.stats()
+    assert stats["api_calls_avoided"] == 2 * (1 + 2) + 2
+    assert stats["reads_served"] == 4
+
+
+def test_events_update_snapshot_and_ignore_exec_noise():
+    client = _FakeDocker([_container("a1")])
+    cache = _live_cache(client)
+
+    client.by_id["b2"] = _container("b2")
+    cache.apply_event({"Type": "container", "Action": "start", "id": "b2"})
+    client.by_id["a1"] = _container("a1", status="exited")
+    cache.apply_event({"Type": "container", "Action": "die", "Actor": {"ID": "a1"}})
+    cache.apply_event({"Type": "container", "Action": "exec_start: sh -c ls", "id": "a1"})
+    cache.apply_event({"Type": "container", "Action": "health_status: healthy", "id": "b2"})
+
+    assert client.get_calls == 3
+    assert {c.id: c.status for c in cache.list()} == {"a1": "exited", "b2": "running"}
+
+    cache.apply_event({"Type": "container", "Action": "destroy", "id": "a1"})
+    assert [c.id for c in cache.list()] == ["b2"]
+    assert cache.stats()["events_ignored"] == 1
+
+
+def test_refresh_drops_vanished_or_unlabelled_containers():
+    client = _FakeDocker([_container("a1"), _container("b2")])
+    cache = _live_cache(client)
+    del client.by_id["a1"]
+    client.by_id["b2"] = _container("b2", labels=False)
+
+    cache.refresh("a1")
+    cache.refresh("b2")
+    assert cache.list() == []
+
+
+def test_subscriber_reconciles_each_window_and_replays_from_until():
+    client = _FakeDocker([_container("a1")])
+    client.event_batches = [[{"Type": "container", "Action": "destroy", "id": "a1"}]]
+    cache = ContainerStateCache(
+        get_client=lambda: client, trion_label=LABEL, logger=_log, reconcile_interval_s=1
+    )
+    assert cache.start()
+    try:
+        deadline = time.time() + 5
+        while len(client.events_calls) < 2 and time.time() < deadline:
+            time.sleep(0.02)
+        assert cache.is_live()
+    finally:
+        cache.stop()
+
+    first, second = client.events_calls[:2]
+    assert first["filters"] == {"type": "container", "label": LABEL}
+    assert second["since"] == first["until"]
+    # destroy from window 1 was corrected by the reconcile at the start of window 2
+    assert cache.stats()["reconciles"] >= 2
+    assert not cache.is_live()
+
+
+def test_broken_stream_marks_cache_not_live():
+    client = _FakeDocker([])
+    client.events = MagicMock(side_effect=ConnectionError("daemon gone"))
+    cache = ContainerStateCache(get_client=lambda: client, trion_label=LABEL, logger=_log)
+    cache._live = True
+    cache.start()
+    try:
+        deadline = time.time() + 2
+        while cache.stats()["stream_errors"] == 0 and time.time() < deadline:
+            time.sleep(0.01)
+    finally:
+        cache.stop()
+    assert cache.stats()["stream_errors"] >= 1
+    assert cache.list() is None
+
+
+def test_quota_sync_uses_snapshot_without_docker_call():
+    client = _FakeDocker([_container("a1", mem_mb=256), _container("b2", status="exited")])
+    cache = _live_cache(client)
+    docker_client = MagicMock()
+    state = RuntimeStateRefs(
+        active={}, ttl_timers={}, quota=SessionQuota(), state_lock=threading.RLock(),
+        pending_starts=0, pending_memory_mb=0.0, pending_cpu=0.0,
+        last_runtime_sync_monotonic=0.0,
+    )
+
+    sync_runtime_state_from_docker(
+        state,
+        force=True,
+        get_client=lambda: docker_client,
+        trion_label=LABEL,
+        logger=_log,
+        list_running_containers=lambda: cache.list(running_only=True),
+    )
+
+    docker_client.containers.list.assert_not_called()
+    assert list(state.active) == ["a1"]
+    assert state.quota.memory_used_mb == 256
+    assert state.quota.cpu_used == 0.5
+
+
+def _import_engine():
+    import sys
+
+    sys.modules.setdefault("docker", MagicMock())
+    sys.modules.setdefault(
+        "docker.errors",
+        SimpleNamespace(
+            DockerException=Exception,
+            NotFound=Exception,
+            APIError=Exception,
+            BuildError=Exception,
+            ImageNotFound=Exception,
+        ),
+    )
+    sys.modules.setdefault(
+        "container_commander.blueprint_store",
+        SimpleNamespace(resolve_blueprint=lambda *args, **kwargs: None, log_action=lambda *args, **kwargs: None),
+    )
+    sys.modules.setdefault(
+        "container_commander.secret_store",
+        SimpleNamespace(
+            get_secrets_for_blueprint=lambda *args, **kwargs: [],
+            get_secret_value=lambda *args, **kwargs: "",
+            log_secret_access=lambda *args, **kwargs: None,
+        ),
+    )
+    import container_commander.engine as engine
+
+    return engine
+
+
+def test_engine_evicts_by_resolved_id_when_addressed_by_short_ref(monkeypatch):
+    engine = _import_engine()
+    full_id = "abcdef1234567890"
+    cache = _live_cache(_FakeDocker([_container(full_id, name="trion_game"), _container("ffff0000")]))
+    stats = MagicMock()
+    docker_client = MagicMock()
+    docker_client.containers.get.side_effect = engine.NotFound("gone")
+    monkeypatch.setattr(engine, "_state_cache", cache)
+    monkeypatch.setattr(engine, "_stats_collector", stats)
+    monkeypatch.setattr(engine, "get_client", lambda: docker_client)
+
+    result = engine.remove_stopped_container(full_id[:8])
+
+    assert result["reason"] == "not_found"
+    assert [c.id for c in cache.list()] == ["ffff0000"]
+    stats.forget.assert_called_once_with(full_id)
+
+    cache.reconcile()
+    assert engine.stop_container("trion_game") is False
+    assert [c.id for c in cache.list()] == ["ffff0000"]
@@ -0,0 +1,229 @@
+"""
+container_commander/engine_stats_collector.py: streaming stats per running
+container, ring buffer, windowed averages, constant-time bulk snapshot,
+reads served without Docker calls, refresh/reconnect of the tracked set.
+"""
+import logging
+import threading
+import time
+from types import SimpleNamespace
+
+from container_commander.engine_stats_collector import (
+    ContainerStatsCollector,
+    _Stream,
+    parse_stats_sample,
+)
+
+_log = logging.getLogger("test.stats_collector")
+_MB = 1024 * 1024
+
+
+def _raw(total, system, pre_total=0, pre_system=0, mem_mb=100, cpus=2, rx=10, tx=20):
+    return {
+        "cpu_stats": {"cpu_usage": {"total_usage": total}, "system_cpu_usage": system, "online_cpus": cpus},
+        "precpu_stats": {"cpu_usage": {"total_usage": pre_total}, "system_cpu_usage": pre_system},
+        "memory_stats": {"usage": mem_mb * _MB, "limit": 1024 * _MB},
+        "networks": {"eth0": {"rx_bytes": rx, "tx_bytes": tx}},
+    }
+
+
+class _FakeClient:
+    """containers.get(cid).stats(stream=True) yields the scripted samples, then blocks until released."""
+
+    def __init__(self, samples_by_id, block=True):
+        self.samples_by_id = samples_by_id
+        self.block = block
+        self.release = threading.Event()
+        self.stats_calls = []
+        self.get_calls = 0
+        self.containers = SimpleNamespace(get=self._get)
+
+    def _get(self, cid):
+        self.get_calls += 1
+
+        def stats(stream=False, decode=False):
+            self.stats_calls.append((cid, stream, decode))
+            for raw in self.samples_by_id.get(cid, []):
+                yield raw
+            if self.block:
+                self.release.wait(5)
+        return SimpleNamespace(id=cid, stats=stats)
+
+
+def _collector(client, running=(), **kw):
+    return ContainerStatsCollector(
+        get_client=lambda: client,
+        list_running=lambda: [SimpleNamespace(id=cid) for cid in running],
+        logger=_log,
+        **kw,
+    )
+
+
+def _wait_for(predicate, timeout=3.0):
+    deadline = time.time() + timeout
+    while not predicate() and time.time() < deadline:
+        time.sleep(0.01)
+    return predicate()
+
+
+def test_parse_matches_blocking_formula_and_handles_first_sample():
+    sample = parse_stats_sample(_raw(total=300, system=2000, pre_total=100, pre_system=1000, cpus=2))
+    assert sample.cpu_percent == (200 / 1000) * 2 * 100.0
+    assert sample.memory_mb == 100 and sample.memory_limit_mb == 1024
+    assert (sample.network_rx_bytes, sample.network_tx_bytes) == (10, 20)
+
+    first = parse_stats_sample({"cpu_stats": {"cpu_usage": {"total_usage": 5}, "system_cpu_usage": 9},
+                                "precpu_stats": {"cpu_usage": {}}, "memory_stats": {}})
+    assert first.cpu_percent == 0.0
+
+
+def test_streams_fill_ring_buffer_and_window_averages():
+    samples = [_raw(total=100 * i, system=1000 * i, pre_total=100 * (i - 1), pre_system=1000 * (i - 1),
+                    cpus=1, mem_mb=100 + i) for i in range(1, 6)]
+    client = _FakeClient({"c1": samples})
+    collector = _collector(client, window_samples=3)
+    try:
+        collector._stop.clear()
+        collector.sync(["c1"])
+        assert _wait_for(lambda: collector.stats()["samples"] == 5)
+
+        assert client.stats_calls == [("c1", True, True)]
+        assert collector.latest("c1").memory_mb == 105
+        window = collector.window("c1")
+        assert window["samples"] == 3
+        assert window["memory_mb_avg"] == (103 + 104 + 105) / 3
+        assert window["cpu_percent_avg"] == 10.0
+        assert set(collector.snapshot_all()) == {"c1"}
+    finally:
+        client.release.set()
+        collector.stop()
+
+
+def test_stale_samples_are_not_served_as_latest():
+    client = _FakeClient({"c1": [_raw(total=1, system=1)]})
+    collector = _collector(client, max_age_s=2.0)
+    try:
+        collector.sync(["c1"])
+        assert _wait_for(lambda: collector.latest("c1") is not None)
+        stream = collector._streams["c1"]
+        old = stream.samples[-1]
+        stream.samples.append(old.__class__(**{**old.to_dict(), "ts": time.time() - 30}))
+        assert collector.latest("c1") is None
+        assert collector.snapshot_all() == {}
+    finally:
+        client.release.set()
+        collector.stop()
+
+
+def test_supervisor_tracks_running_set_and_retires_gone_containers():
+    client = _FakeClient({"c1": [_raw(1, 1)], "c2": [_raw(1, 1)]})
+    running = ["c1", "c2"]
+    collector = ContainerStatsCollector(
+        get_client=lambda: client,
+        list_running=lambda: list(running),
+        logger=_log,
+        refresh_s=0.05,
+    )
+    assert collector.start()
+    try:
+        assert _wait_for(lambda: set(collector.snapshot_all()) == {"c1", "c2"})
+        running.remove("c2")
+        assert _wait_for(lambda: set(collector.snapshot_all()) == {"c1"})
+        assert collector.window("c2") == {}
+    finally:
+        client.release.set()
+        collector.stop()
+    assert not collector.is_running()
+
+
+def test_track_is_noop_until_collector_runs():
+    client = _FakeClient({"c1": [_raw(1, 1)]})
+    collector = _collector(client)
+    collector.track("c1")
+    assert client.stats_calls == []
+
+
+def test_reads_are_served_from_the_ring_buffer_without_docker_calls():
+    client = _FakeClient({"c1": [_raw(total=i, system=10 * i, mem_mb=100 + i) for i in range(1, 4)]})
+    collector = _collector(client)
+    try:
+        collector.sync(["c1"])
+        assert _wait_for(lambda: collector.stats()["samples"] == 3)
+        for _ in range(50):
+            assert collector.latest("c1").memory_mb == 103
+            assert collector.window("c1")["samples"] == 3
+            assert set(collector.snapshot_all()) == {"c1"}
+            collector.sync(["c1"])  # live stream: nothing restarted
+        assert client.get_calls == 1
+        assert client.stats_calls == [("c1", True, True)]
+        assert collector.stats()["streams_started"] == 1
+    finally:
+        client.release.set()
+        collector.stop()
+
+
+def test_window_seconds_only_averages_recent_samples():
+    collector = _collector(_FakeClient({}))
+    stream = collector._streams.setdefault("c1", _Stream("c1", 10))
+    now = time.time()
+    base = parse_stats_sample(_raw(1, 1), ts=now)
+    for age, mem in ((30, 10), (2, 20), (0, 40)):
+        stream.samples.append(base.__class__(**{**base.to_dict(), "ts": now - age, "memory_mb": mem}))
+
+    assert collector.window("c1")["memory_mb_avg"] == (10 + 20 + 40) / 3
+    recent = collector.window("c1", seconds=5)
+    assert recent["samples"] == 2
+    assert recent["memory_mb_avg"] == 30
+    assert recent["memory_mb_max"] == 40
+
+
+def test_refresh_restarts_ended_streams_and_keeps_history():
+    client = _FakeClient({"c1": [_raw(1, 1, mem_mb=101), _raw(2, 2, mem_mb=102)]}, block=False)
+    collector = _collector(client, window_samples=3)
+    collector.sync(["c1"])
+    assert _wait_for(lambda: collector.stats()["streams_ended"] == 1)
+    assert collector.stats()["streams"] == 0
+
+    client.samples_by_id["c1"] = [_raw(3, 3, mem_mb=103), _raw(4, 4, mem_mb=104)]
+    collector.sync(["c1"])  # supervisor refresh: dead stream is reconnected
+    assert _wait_for(lambda: collector.stats()["streams_ended"] == 2)
+
+    assert len(client.stats_calls) == 2
+    assert collector.stats()["streams_started"] == 2
+    # ring buffer survived the reconnect and stays capped at window_samples
+    assert [s.memory_mb for s in collector._streams["c1"].samples] == [102, 103, 104]
+    assert collector.latest("c1").memory_mb == 104
+
+
+def test_forget_and_refresh_drop_cached_samples():
+    client = _FakeClient({"c1": [_raw(1, 1)], "c2": [_raw(1, 1)]})
+    collector = _collector(client)
+    try:
+        collector.sync(["c1", "c2"])
+        assert _wait_for(lambda: set(collector.snapshot_all()) == {"c1", "c2"})
+        collector.forget("c1")
+        assert collector.latest("c1") is None and collector.window("c1") == {}
+        collector.sync([])
+        assert collector.snapshot_all() == {}
+    finally:
+        client.release.set()
+        collector.stop()
+
+
+def test_track_streams_immediately_without_waiting_for_refresh():
+    client = _FakeClient({"c9": [_raw(1, 1, mem_mb=99)]})
+    collector = _collector(client, refresh_s=60)
+    refreshes = []
+    sync = collector.sync
+    collector.sync = lambda ids: (sync(ids), refreshes.append(1))
+    assert collector.start()
+    try:
+        assert _wait_for(lambda: refreshes)  # first refresh done, the next one is 60s away
+        collector.track("c9")  # e.g. right after deploy
+        assert _wait_for(lambda: collector.latest("c9") is not None)
+        assert collector.latest("c9").memory_mb == 99
+        collector.track("c9")
+        assert collector.stats()["streams_started"] == 1
+    finally:
+        client.release.set()
+        collector.stop()
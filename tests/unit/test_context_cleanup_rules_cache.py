@@ -0,0 +1,134 @@
+import json
+import os
+import random
+import shutil
+import sqlite3
+from datetime import datetime, timedelta
+
+import core.context_cleanup as cc
+
+_TYPES = ["container_started", "container_stopped", "container_exec", "tool_result", "trust_blocked", "observation"]
+
+
+def _events(n: int, seed: int = 7) -> list:
+    """Ascending ids/timestamps with many payload repeats inside the dedupe window."""
+    rng = random.Random(seed)
+    ts = datetime(2026, 5, 1, 8, 0, 0)
+    out = []
+    for i in range(1, n + 1):
+        ts += timedelta(seconds=rng.choice([0.5, 1, 2, 5]))
+        out.append({
+            "id": i,
+            "conversation_id": "conv-rules",
+            "event_type": rng.choice(_TYPES),
+            "event_data": {
+                "container_id": f"c{rng.randrange(3)}",
+                "exit_code": rng.choice([0, 1]),
+                "status": rng.choice(["success", "error"]),
+                "reason": "blocked",
+                "content": rng.choice(["ok", "error seen"]),
+            },
+            "created_at": ts.isoformat(),
+        })
+    return out
+
+
+def _output(ctx) -> tuple:
+    meta = dict(ctx.meta)
+    meta.pop("generated_at")
+    return cc.format_compact_context(ctx), cc.format_typedstate_v1(ctx), meta
+
+
+def test_mapping_rules_are_cached_until_mtime_changes(monkeypatch, tmp_path):
+    rules = tmp_path / "mapping_rules.yaml"
+    shutil.copy(cc._RULES_PATH, rules)
+    monkeypatch.setattr(cc, "_RULES_PATH", str(rules))
+    monkeypatch.setattr(cc, "_rules_cache", {"sig": None, "data": None})
+    loads = []
+    real_load = cc.yaml.safe_load
+    monkeypatch.setattr(cc.yaml, "safe_load", lambda f: loads.append(1) or real_load(f))
+
+    events = list(reversed(_events(30)))
+    first = cc.build_compact_context(events)
+    second = cc.build_compact_context(events)
+    assert len(loads) == 1
+    assert _output(first) == _output(second)
+
+    rules.write_text(rules.read_text(encoding="utf-8") + "\nlimits_note: changed\n", encoding="utf-8")
+    stat = os.stat(rules)
+    os.utime(rules, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    cc.build_compact_context(events)
+    assert len(loads) == 2
+
+
+def test_source_event_ids_keep_first_occurrence_order_and_cap():
+    state = cc.TypedState()
+    events = [{"id": i % 150, "event_type": "observation", "event_data": {}} for i in range(1, 400)]
+    cc._apply_events_to_state(state, events, {}, {})
+    expected = list(dict.fromkeys(ev["id"] for ev in events if ev["id"]))[-100:]
+    assert state.source_event_ids == expected
+
+
+def test_small_model_context_caller_reads_newest_100_window(monkeypatch, tmp_path):
+    """Replays build_small_model_context: change-feed read, newest-100 window per turn."""
+    from unittest.mock import MagicMock, patch
+
+    from core.context_manager import _EVENT_WINDOWS, ContextManager
+    from core.tools.fast_lane.definitions import WorkspaceEventListTool
+    from core.tools.fast_lane.workspace_event_store import WorkspaceEventStore
+
+    store = WorkspaceEventStore(str(tmp_path / "memory.db"))
+    store.high_water("conv-live")  # creates the schema
+    payloads = _events(300, seed=11)
+    feed_reads = []
+
+    class _Hub:
+        def initialize(self):
+            pass
+
+        def call_tool(self, name, args):
+            feed_reads.append("since_id" in args)
+            return WorkspaceEventListTool(**args).execute()
+
+    start = datetime.utcnow() - timedelta(hours=4)
+
+    def _insert(ev):
+        # one event per turn, turns ~30s apart (outside the dedupe window)
+        with sqlite3.connect(store.db_path) as conn:
+            conn.execute(
+                "INSERT INTO workspace_events (conversation_id, event_type, event_data, created_at) "
+                "VALUES ('conv-live', ?, ?, ?)",
+                (ev["event_type"], json.dumps(ev["event_data"]),
+                 (start + timedelta(seconds=30 * ev["id"])).isoformat()),
+            )
+
+    real_build = cc.build_compact_context
+    built = []
+
+    def _recording_build(events, **kwargs):
+        built.append([ev["id"] for ev in events])
+        return real_build(events, **kwargs)
+
+    monkeypatch.setattr(cc, "build_compact_context", _recording_build)
+    no_task_loop = MagicMock()
+    no_task_loop.get.return_value = None
+    _EVENT_WINDOWS.clear()
+    cm = ContextManager()
+    with patch("core.tools.fast_lane.definitions.get_workspace_event_store", return_value=store), \
+         patch("mcp.hub.get_hub", return_value=_Hub()), \
+         patch("core.typedstate_csv_loader.maybe_load_csv_events", return_value=[]), \
+         patch("config.get_typedstate_mode", return_value="off"), \
+         patch("core.context_manager.get_task_loop_store", return_value=no_task_loop):
+        for ev in payloads[:150]:
+            _insert(ev)
+        for ev in payloads[150:]:
+            _insert(ev)
+            text = cm.build_small_model_context(conversation_id="conv-live")
+            newest = store.list_recent(conversation_id="conv-live", limit=100)
+            assert built[-1] == [e["id"] for e in newest]
+            assert text == cc.format_compact_context(real_build(newest))
+    _EVENT_WINDOWS.clear()
+
+    assert len(built) == 150
+    # first turn reads the newest 100, every later turn only the change feed
+    assert feed_reads == [False] + [True] * 149
@@ -235,6 +235,16 @@ class TestContextManagerRequestRetrievalPhase:
         out = cm._normalize_memory_keys(["k1", "k2", "k3", "k4"])
         assert out == ["k1", "k2"]
 
+    def test_memory_lookup_keys_follows_get_context_guards(self):
+        cm = ContextManager()
+        plan = {"needs_memory": True, "memory_keys": [" age ", "age", "name"]}
+        assert cm.memory_lookup_keys(plan) == ["age", "name"]
+        assert cm.memory_lookup_keys({**plan, "needs_memory": False, "is_fact_query": True}) == ["age", "name"]
+        assert cm.memory_lookup_keys({**plan, "time_reference": "yesterday"}) == []
+        assert cm.memory_lookup_keys({**plan, "needs_memory": False}) == []
+        assert cm.memory_lookup_keys({"needs_memory": True, "memory_keys": []}) == []
+        assert cm.memory_lookup_keys(None) == []
+
     @patch("core.context_manager.search_memory_fallback")
     @patch("core.context_manager.semantic_search")
     @patch("core.context_manager.graph_search")
@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+import asyncio
+import importlib
+import os
+import sys
+import tempfile
+import unittest
+from unittest.mock import patch
+
+import core.embedding_client as ec
+
+
+_HERE = os.path.dirname(os.path.abspath(__file__))
+_SQL_MEMORY_PATH = os.path.abspath(os.path.join(_HERE, "..", "..", "sql-memory"))
+if _SQL_MEMORY_PATH not in sys.path:
+    sys.path.insert(0, _SQL_MEMORY_PATH)
+
+
+class TestEmbeddingCache(unittest.TestCase):
+    def setUp(self):
+        ec.reset_embedding_cache()
+        self.calls = []
+
+        async def _fake_fetch(text, timeout_s):
+            self.calls.append(text)
+            await asyncio.sleep(0.01)
+            return [1.0, float(len(text))]
+
+        self._patch = patch.object(ec, "_fetch_embedding", side_effect=_fake_fetch)
+        self._patch.start()
+
+    def tearDown(self):
+        self._patch.stop()
+        ec.reset_embedding_cache()
+
+    def test_turn_scope_dedupes_repeated_text(self):
+        async def _turn():
+            ec.begin_embedding_turn()
+            a = await ec.embed_text("hallo")
+            b = await ec.embed_text("hallo")
+            return a, b
+
+        a, b = asyncio.run(_turn())
+        self.assertEqual(a, b)
+        self.assertEqual(self.calls, ["hallo"])
+        stats = ec.get_embedding_cache_stats()
+        self.assertEqual(stats["misses"], 1)
+        self.assertEqual(stats["turn_hits"], 1)
+        self.assertGreater(stats["saved_latency_ms_total"], 0.0)
+
+    def test_lru_serves_next_turn(self):
+        async def _turn():
+            ec.begin_embedding_turn()
+            return await ec.embed_text("wiederholt")
+
+        asyncio.run(_turn())
+        asyncio.run(_turn())
+        self.assertEqual(self.calls, ["wiederholt"])
+        stats = ec.get_embedding_cache_stats()
+        self.assertEqual(stats["lru_hits"], 1)
+        self.assertEqual(stats["hit_ratio"], 0.5)
+
+    def test_concurrent_callers_join_single_flight(self):
+        async def _turn():
+            ec.begin_embedding_turn()
+            return await asyncio.gather(*(ec.embed_text("parallel") for _ in range(4)))
+
+        results = asyncio.run(_turn())
+        self.assertEqual(len({tuple(r) for r in results}), 1)
+        self.assertEqual(self.calls, ["parallel"])
+        self.assertEqual(ec.get_embedding_cache_stats()["inflight_joins"], 3)
+
+    def test_failed_fetch_is_not_cached(self):
+        self._patch.stop()
+        with patch.object(ec, "_fetch_embedding", return_value=None) as fetch:
+            self.assertIsNone(asyncio.run(ec.embed_text("kaputt")))
+            self.assertIsNone(asyncio.run(ec.embed_text("kaputt")))
+        self._patch.start()
+        self.assertEqual(fetch.call_count, 2)
+        self.assertEqual(ec.get_embedding_cache_stats()["errors"], 2)
+
+    def test_cache_key_tracks_embedding_model(self):
+        with patch.object(ec, "get_embedding_model", return_value="model-a"):
+            asyncio.run(ec.embed_text("x"))
+        with patch.object(ec, "get_embedding_model", return_value="model-b"):
+            asyncio.run(ec.embed_text("x"))
+        self.assertEqual(self.calls, ["x", "x"])
+
+
+class TestVectorStorePrecomputedQuery(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.vector_store = importlib.import_module("vector_store")
+        self.vs = self.vector_store.VectorStore(os.path.join(self.tmp.name, "memory.db"), index_dir="")
+        payload = {
+            "embedding": [1.0, 0.0],
+            "embedding_model": "m",
+            "embedding_dim": 2,
+            "embedding_version": "v1",
+            "runtime_policy": "auto",
+        }
+        self._patches = [
+            patch.object(self.vector_store, "get_active_embedding_version", return_value="v1"),
+            patch.object(self.vector_store, "get_embedding_with_metadata", return_value=payload),
+        ]
+        for p in self._patches:
+            p.start()
+        self.vs.add("c1", "row")
+
+    def tearDown(self):
+        for p in self._patches:
+            p.stop()
+        self.tmp.cleanup()
+
+    def test_matching_version_skips_query_embedding(self):
+        with patch.object(self.vector_store, "get_embedding", side_effect=AssertionError("re-embedded")):
+            results = self.vs.search(
+                "q", conversation_id="c1", query_embedding=[1.0, 0.0], query_embedding_version="v1"
+            )
+        self.assertEqual([r["content"] for r in results], ["row"])
+
+    def test_version_mismatch_falls_back_to_embedding(self):
+        with patch.object(self.vector_store, "get_embedding", return_value=[1.0, 0.0]) as emb:
+            self.vs.search("q", conversation_id="c1", query_embedding=[0.0, 1.0], query_embedding_version="old")
+        emb.assert_called_once_with("q")
+
+
+if __name__ == "__main__":
+    unittest.main()
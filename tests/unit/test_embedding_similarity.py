@@ -0,0 +1,63 @@
+import math
+
+import numpy as np
+
+from utils.embedding.similarity import (
+    PrototypeMatrix,
+    cosine_similarity,
+    normalize_rows,
+    score_matrix,
+    top_k,
+    top_k_batch,
+)
+
+
+def _py_cos(a, b):
+    dot = sum(x * y for x, y in zip(a, b))
+    na = math.sqrt(sum(x * x for x in a))
+    nb = math.sqrt(sum(y * y for y in b))
+    return dot / (na * nb)
+
+
+def test_cosine_similarity_matches_python_loop_and_edge_cases():
+    a, b = [0.2, -1.0, 3.0], [1.5, 0.5, 2.0]
+    assert abs(cosine_similarity(a, b) - _py_cos(a, b)) < 1e-12
+    assert cosine_similarity([], [1.0]) == 0.0
+    assert cosine_similarity([1.0, 0.0], [1.0]) == 0.0
+    assert cosine_similarity([0.0, 0.0], [1.0, 1.0]) == 0.0
+
+
+def test_score_matrix_and_top_k_order():
+    mat = normalize_rows([[1.0, 0.0], [0.0, 1.0], [1.0, 1.0], [0.0, 0.0]])
+    scores = score_matrix(mat, [2.0, 0.0])
+    assert np.allclose(scores, [1.0, 0.0, math.sqrt(0.5), 0.0], atol=1e-6)
+
+    idx, top = top_k(mat, [2.0, 0.0], k=2)
+    assert idx.tolist() == [0, 2]
+    idx, _ = top_k(mat, [2.0, 0.0], k=3, min_score=0.5)
+    assert idx.tolist() == [0, 2]
+    assert score_matrix(mat, [1.0, 0.0, 0.0]).tolist() == [0.0, 0.0, 0.0, 0.0]
+
+
+def test_top_k_batch_matches_single_query_top_k():
+    rng = np.random.default_rng(3)
+    mat = normalize_rows(rng.normal(size=(500, 16)))
+    queries = rng.normal(size=(300, 16))
+    idx, scores = top_k_batch(mat, queries, k=5)
+    assert idx.shape == (300, 5)
+    for qi in (0, 123, 299):
+        single_idx, single_scores = top_k(mat, queries[qi], k=5)
+        assert idx[qi].tolist() == single_idx.tolist()
+        assert np.allclose(scores[qi], single_scores, atol=1e-5)
+
+
+def test_prototype_matrix_acts_like_dict_and_scores_in_one_call():
+    protos = PrototypeMatrix({"a": [1.0, 0.0], "b": [0.0, 2.0], "bad": [1.0, 2.0, 3.0], "empty": []})
+    assert list(protos) == ["a", "b"]
+    assert protos.get("b") == [0.0, 2.0]
+    assert protos.matrix.flags["C_CONTIGUOUS"]
+    scores = protos.scores([3.0, 3.0])
+    assert abs(scores["a"] - math.sqrt(0.5)) < 1e-6
+    assert abs(scores["b"] - math.sqrt(0.5)) < 1e-6
+    assert PrototypeMatrix.coerce({"x": [1.0]}).scores([2.0]) == {"x": 1.0}
+    assert not PrototypeMatrix()
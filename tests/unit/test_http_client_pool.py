@@ -0,0 +1,120 @@
+import asyncio
+
+import pytest
+
+from core import http_client_pool as pool
+
+
+@pytest.fixture(autouse=True)
+def _reset_pool():
+    pool.reset_http_pool()
+    yield
+    pool.reset_http_pool()
+
+
+def test_same_origin_and_timeout_reuses_client():
+    async def _run():
+        a = pool.get_http_client("http://ollama:11434/api/chat", timeout_s=90.0)
+        b = pool.get_http_client("http://ollama:11434/api/generate", timeout_s=90.0)
+        c = pool.get_http_client("http://ollama:11434", timeout_s=5.0)
+        d = pool.get_http_client("https://api.openai.com/v1", timeout_s=90.0)
+        await pool.aclose_http_clients()
+        return a, b, c, d
+
+    a, b, c, d = asyncio.run(_run())
+    assert a is b
+    assert a is not c
+    assert a is not d
+    stats = pool.get_http_pool_stats()
+    assert stats["created"] == 3
+    assert stats["reused"] == 1
+    assert stats["closed"] == 3
+
+
+def test_clients_are_not_shared_across_event_loops():
+    async def _get():
+        return pool.get_http_client("http://ollama:11434", timeout_s=90.0)
+
+    first = asyncio.run(_get())
+    second = asyncio.run(_get())
+    assert first is not second
+
+
+def test_pooled_client_stays_open_and_closes_on_shutdown():
+    async def _run():
+        async with pool.pooled_client("http://ollama:11434", timeout_s=1.0) as client:
+            pass
+        open_after_use = not client.is_closed
+        await pool.aclose_http_clients()
+        return client, open_after_use
+
+    client, open_after_use = asyncio.run(_run())
+    assert open_after_use
+    assert client.is_closed
+
+
+async def _serve_slow_and_stream(reader, writer):
+    try:
+        request_line = (await reader.readuntil(b"\r\n\r\n")).split(b" ", 2)[1]
+        if request_line == b"/slow":
+            await asyncio.sleep(2.0)
+            return
+        writer.write(b"HTTP/1.1 200 OK\r\nTransfer-Encoding: chunked\r\n\r\n")
+        for i in range(6):
+            await asyncio.sleep(0.1)
+            writer.write(b"2\r\n%d\n\r\n" % i)
+            await writer.drain()
+        writer.write(b"0\r\n\r\n")
+        await writer.drain()
+    except (asyncio.IncompleteReadError, ConnectionError):
+        pass
+    finally:
+        writer.close()
+
+
+def test_request_timeout_does_not_break_concurrent_stream():
+    async def _run():
+        server = await asyncio.start_server(_serve_slow_and_stream, "127.0.0.1", 0)
+        base = f"http://127.0.0.1:{server.sockets[0].getsockname()[1]}"
+
+        async def _slow():
+            with pytest.raises(pool.httpx.ReadTimeout):
+                async with pool.pooled_client(base, timeout_s=0.3) as client:
+                    await client.get(f"{base}/slow")
+
+        async def _stream():
+            lines = []
+            async with pool.pooled_client(base, timeout_s=0.3) as client:
+                async with client.stream("GET", f"{base}/stream") as resp:
+                    async for line in resp.aiter_lines():
+                        lines.append(line)
+            return client, lines
+
+        async with server:
+            (client, lines), _ = await asyncio.gather(_stream(), _slow())
+            still_pooled = pool.get_http_client(base, timeout_s=0.3) is client
+            await pool.aclose_http_clients()
+        return client, lines, still_pooled
+
+    client, lines, still_pooled = asyncio.run(_run())
+    assert lines == [str(i) for i in range(6)]
+    assert still_pooled
+
+
+def test_connect_error_retires_client_but_closes_after_last_borrower():
+    async def _run():
+        url = "http://ollama:11434"
+        async with pool.pooled_client(url, timeout_s=1.0) as other:
+            with pytest.raises(pool.httpx.ConnectError):
+                async with pool.pooled_client(url, timeout_s=1.0) as client:
+                    raise pool.httpx.ConnectError("down")
+            open_while_borrowed = not other.is_closed
+            fresh = pool.get_http_client(url, timeout_s=1.0)
+        await pool.aclose_http_clients()
+        return client, other, fresh, open_while_borrowed
+
+    client, other, fresh, open_while_borrowed = asyncio.run(_run())
+    assert client is other
+    assert open_while_borrowed
+    assert client.is_closed
+    assert fresh is not client
@@ -0,0 +1,169 @@
+"""
+mcp/transports/http.py: pooled keep-alive session shared across calls/threads,
+one-time format detection + session init, async-native call_tool_async and
+MCPHub.call_tool_async without a worker thread per call.
+"""
+import asyncio
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from core import http_client_pool
+from mcp.hub import MCPHub
+from mcp.transports.http import HTTPTransport
+
+
+class _StubMCP(ThreadingHTTPServer):
+    """Streamable-HTTP stub: needs Mcp-Session-Id, answers tools/call as SSE."""
+
+    daemon_threads = True
+    request_queue_size = 128  # concurrent async callers open many connections at once
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), _Handler)
+        self.connections = 0
+        self.initializes = 0
+        self.calls = []
+        self.lock = threading.Lock()
+
+    @property
+    def url(self):
+        return f"http://127.0.0.1:{self.server_address[1]}/mcp"
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *_args):
+        pass
+
+    def handle(self):
+        with self.server.lock:
+            self.server.connections += 1
+        super().handle()
+
+    def _send(self, status, body, content_type="application/json", headers=None):
+        raw = body.encode()
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(raw)))
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(raw)
+
+    def do_POST(self):
+        payload = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))))
+        method = payload.get("method")
+        if method == "initialize":
+            with self.server.lock:
+                self.server.initializes += 1
+            self._send(200, json.dumps({"jsonrpc": "2.0", "id": 1, "result": {}}),
+                       headers={"Mcp-Session-Id": "sess-1"})
+            return
+        if self.headers.get("Mcp-Session-Id") != "sess-1":
+            self._send(400, json.dumps({"error": {"message": "Missing session ID"}}))
+            return
+        if method == "notifications/initialized":
+            self._send(202, "")
+            return
+        args = payload["params"]["arguments"]
+        with self.server.lock:
+            self.server.calls.append(args)
+        result = {"content": [{"type": "text", "text": json.dumps({"echo": args})}]}
+        body = "data: " + json.dumps({"jsonrpc": "2.0", "id": 1, "result": result}) + "\n\n"
+        self._send(200, body, content_type="text/event-stream")
+
+
+@pytest.fixture
+def stub():
+    server = _StubMCP()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def test_sync_calls_share_keep_alive_connections_across_threads(stub):
+    transport = HTTPTransport(stub.url, timeout=5)
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        results = list(pool.map(lambda i: transport.call_tool("echo", {"i": i}), range(40)))
+
+    assert results == [{"echo": {"i": i}} for i in range(40)]
+    assert stub.initializes == 1
+    # detection + init + 4 worker connections at most, not one per call
+    assert stub.connections <= 6
+    transport.close()
+
+
+def test_call_tool_async_uses_pooled_client(stub):
+    http_client_pool.reset_http_pool()
+    transport = HTTPTransport(stub.url, timeout=5)
+
+    async def _run():
+        results = await asyncio.gather(*(transport.call_tool_async("echo", {"i": i}) for i in range(20)))
+        stats = http_client_pool.get_http_pool_stats()
+        await http_client_pool.aclose_http_clients()
+        return results, stats
+
+    results, stats = asyncio.run(_run())
+    assert results == [{"echo": {"i": i}} for i in range(20)]
+    assert stub.initializes == 1
+    assert stats["created"] == 1
+    transport.close()
+
+
+def test_call_tool_async_reinitializes_expired_session(stub):
+    http_client_pool.reset_http_pool()
+    transport = HTTPTransport(stub.url, timeout=5)
+    assert transport.call_tool("echo", {"i": 0}) == {"echo": {"i": 0}}
+    transport._session_id = "expired"
+
+    async def _run():
+        result = await transport.call_tool_async("echo", {"i": 1})
+        await http_client_pool.aclose_http_clients()
+        return result
+
+    assert asyncio.run(_run()) == {"echo": {"i": 1}}
+    assert transport._session_id == "sess-1"
+    assert stub.initializes == 2
+    transport.close()
+
+
+def test_hub_call_tool_async_skips_worker_thread_for_http(stub, monkeypatch):
+    http_client_pool.reset_http_pool()
+    transport = HTTPTransport(stub.url, timeout=5)
+    transport.call_tool("echo", {"i": 0})  # format + session ready
+    hub = MCPHub()
+    hub._initialized = True
+    hub._transports = {"http-mcp": transport}
+    hub._tools_cache = {"echo": "http-mcp", "blueprint_list": "http-mcp"}
+    hub._tool_definitions = {"echo": {"name": "echo"}, "blueprint_list": {"name": "blueprint_list"}}
+    hub._get_mcp_config = lambda _name: None
+
+    offloaded = []
+    real_to_thread = asyncio.to_thread
+
+    async def _tracking_to_thread(fn, *args, **kwargs):
+        offloaded.append(getattr(fn, "__name__", str(fn)))
+        return await real_to_thread(fn, *args, **kwargs)
+
+    monkeypatch.setattr("mcp.hub.asyncio.to_thread", _tracking_to_thread)
+
+    async def _run():
+        plain = await hub.call_tool_async("echo", {"i": 1})
+        cached = await hub.call_tool_async("blueprint_list", {})
+        await http_client_pool.aclose_http_clients()
+        return plain, cached
+
+    plain, cached = asyncio.run(_run())
+    assert plain == {"echo": {"i": 1}}
+    assert cached == {"echo": {}}
+    # only the cached tool goes through the sync read-through path
+    assert offloaded == ["call_tool"]
+    hub.shutdown()
+    assert transport._http is None
@@ -0,0 +1,148 @@
+"""
+mcp/hub.py: parallel MCP discovery with a cold-start deadline, incremental
+readiness, tool snapshot for warm starts, graph registration off the request path.
+"""
+import time
+from unittest.mock import patch
+
+import pytest
+
+import mcp.hub as hub_module
+from mcp.hub import MCPHub
+
+
+class _SlowTransport:
+    def __init__(self, tools, delay_s=0.0):
+        self.tools = tools
+        self.delay_s = delay_s
+        self.list_calls = 0
+        self.calls = []
+
+    def list_tools(self):
+        self.list_calls += 1
+        time.sleep(self.delay_s)
+        return [{"name": name, "description": name} for name in self.tools]
+
+    def call_tool(self, tool_name, arguments):
+        self.calls.append(tool_name)
+        return {"ok": tool_name}
+
+
+@pytest.fixture
+def hub_env(tmp_path, monkeypatch):
+    monkeypatch.setattr(hub_module, "_DISCOVERY_DEADLINE_S", 0.3)
+    monkeypatch.setattr(hub_module, "_TOOL_SNAPSHOT_PATH", tmp_path / "mcp_tools_snapshot.json")
+    transports = {}
+
+    def _make_hub():
+        hub = MCPHub()
+        hub._init_transport = lambda name, _cfg: hub._transports.__setitem__(name, transports[name])
+        hub._register_fast_lane_tools = lambda register_in_graph=True: None
+        hub._auto_register_tools = lambda: None
+        return hub
+
+    enabled = {"fast-mcp": {"url": "x"}, "slow-mcp": {"url": "y"}}
+    with patch("mcp.hub.get_enabled_mcps", return_value=enabled), \
+         patch.dict("sys.modules", {"container_commander.mcp_bridge": None, "sysinfo.mcp_bridge": None}):
+        yield transports, _make_hub, tmp_path / "mcp_tools_snapshot.json"
+
+
+def test_cold_start_waits_only_for_deadline_and_fills_in_later(hub_env):
+    transports, make_hub, snapshot_path = hub_env
+    transports["fast-mcp"] = _SlowTransport(["fast_tool"], delay_s=0.05)
+    transports["slow-mcp"] = _SlowTransport(["slow_tool"], delay_s=1.0)
+    hub = make_hub()
+
+    started = time.monotonic()
+    hub.initialize()
+    assert time.monotonic() - started < 0.8
+
+    assert hub.get_mcp_for_tool("fast_tool") == "fast-mcp"
+    assert hub.get_mcp_for_tool("slow_tool") is None
+    assert hub.get_discovery_status()["pending"] == ["slow-mcp"]
+
+    assert hub.wait_for_discovery(3)
+    assert hub.call_tool("slow_tool", {}) == {"ok": "slow_tool"}
+    status = hub.get_discovery_status()["mcps"]
+    assert status["slow-mcp"]["state"] == "ok" and status["slow-mcp"]["late"] is True
+    assert snapshot_path.exists()
+
+
+def test_warm_start_routes_from_snapshot_immediately(hub_env):
+    transports, make_hub, _snapshot_path = hub_env
+    transports["fast-mcp"] = _SlowTransport(["fast_tool"])
+    transports["slow-mcp"] = _SlowTransport(["slow_tool"])
+    first = make_hub()
+    first.initialize()
+    assert first.wait_for_discovery(2)
+
+    # Next start: one server is slow, the other is dead (list_tools → [])
+    transports["fast-mcp"] = _SlowTransport(["fast_tool"], delay_s=1.0)
+    transports["slow-mcp"] = _SlowTransport([], delay_s=0.0)
+    hub = make_hub()
+    started = time.monotonic()
+    hub.initialize()
+    assert time.monotonic() - started < 0.25
+
+    assert hub.call_tool("fast_tool", {}) == {"ok": "fast_tool"}
+    assert hub.wait_for_discovery(3)
+    # dead server keeps its snapshot tools instead of becoming unroutable
+    assert hub.get_mcp_for_tool("slow_tool") == "slow-mcp"
+    assert hub.get_discovery_status()["mcps"]["slow-mcp"]["state"] == "failed"
+
+
+def test_late_discovery_does_not_override_locally_registered_tools(hub_env):
+    transports, make_hub, _snapshot_path = hub_env
+    transports["fast-mcp"] = _SlowTransport(["home_read", "fast_tool"], delay_s=0.2)
+    transports["slow-mcp"] = _SlowTransport([])
+    hub = make_hub()
+
+    def _register_local(register_in_graph=True):
+        hub._tool_definitions["home_read"] = {"name": "home_read", "execution": "direct"}
+        hub._tools_cache["home_read"] = "fast-lane"
+
+    hub._register_fast_lane_tools = _register_local
+    hub.initialize()
+    assert hub.wait_for_discovery(2)
+
+    assert hub.get_mcp_for_tool("home_read") == "fast-lane"
+    assert hub.get_mcp_for_tool("fast_tool") == "fast-mcp"
+
+
+def test_graph_registration_runs_in_background(hub_env):
+    transports, make_hub, _snapshot_path = hub_env
+    transports["fast-mcp"] = _SlowTransport(["fast_tool"])
+    transports["slow-mcp"] = _SlowTransport(["slow_tool"])
+    hub = make_hub()
+    registered = []
+
+    def _slow_register():
+        time.sleep(0.5)
+        registered.append(True)
+
+    hub._auto_register_tools = _slow_register
+    started = time.monotonic()
+    hub.initialize()
+    assert time.monotonic() - started < 0.4
+    assert registered == []
+    hub._registration_thread.join(2)
+    assert registered == [True]
+
+
+
+def test_tools_of_a_pending_mcp_fail_fast_until_it_answers(hub_env):
+    transports, make_hub, _snapshot_path = hub_env
+    transports["fast-mcp"] = _SlowTransport(["fast_tool"])
+    transports["slow-mcp"] = _SlowTransport(["slow_tool"], delay_s=1.0)
+    hub = make_hub()
+    hub.initialize()
+    assert hub.get_discovery_status()["pending"] == ["slow-mcp"]
+
+    started = time.monotonic()
+    assert "error" in hub.call_tool("slow_tool", {})
+    assert "error" in hub.call_tool("hallucinated_tool", {})
+    assert time.monotonic() - started < 0.1
+    assert transports["slow-mcp"].calls == []
+
+    assert hub.wait_for_discovery(3)
+    assert hub.call_tool("slow_tool", {}) == {"ok": "slow_tool"}
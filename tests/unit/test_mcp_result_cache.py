@@ -0,0 +1,254 @@
+"""
+mcp/result_cache.py + MCPHub.call_tool: read-through cache for idempotent tools,
+trace-id-free keys, domain invalidation, single-flight, per-tool metrics.
+"""
+import threading
+import time
+from unittest.mock import patch
+
+from mcp.hub import MCPHub
+from mcp.result_cache import CachePolicy, ToolResultCache, canonical_args_key
+
+
+class _Transport:
+    def __init__(self, delay_s=0.0):
+        self.delay_s = delay_s
+        self.calls = []
+        self.fail = False
+
+    def call_tool(self, tool_name, arguments):
+        self.calls.append((tool_name, dict(arguments or {})))
+        if self.delay_s:
+            time.sleep(self.delay_s)
+        if self.fail:
+            return {"error": "backend down"}
+        return {"tool": tool_name, "n": len(self.calls)}
+
+
+def _hub(transport, definitions=None):
+    hub = MCPHub()
+    hub._initialized = True
+    hub._transports = {"demo-mcp": transport}
+    names = ["blueprint_list", "blueprint_create", "container_list", "memory_search", "custom_read"]
+    hub._tools_cache = {name: "demo-mcp" for name in names}
+    hub._tool_definitions = {name: {"name": name} for name in names}
+    hub._tool_definitions.update(definitions or {})
+    hub._get_mcp_config = lambda _name: None  # type: ignore[assignment]
+    return hub
+
+
+def test_identical_calls_hit_cache_ignoring_trace_id():
+    transport = _Transport()
+    hub = _hub(transport)
+
+    first = hub.call_tool("blueprint_list", {"filter": "py", "_trace_id": "t1"})
+    second = hub.call_tool("blueprint_list", {"_trace_id": "t2", "filter": "py"})
+    hub.call_tool("blueprint_list", {"filter": "node"})
+
+    assert first == second
+    assert len(transport.calls) == 2
+    # uncached tool is never served from cache
+    hub.call_tool("memory_search", {"query": "x"})
+    hub.call_tool("memory_search", {"query": "x"})
+    assert len(transport.calls) == 4
+
+    stats = hub.get_result_cache_stats()["tools"]["blueprint_list"]
+    assert (stats["hits"], stats["misses"]) == (1, 2)
+    assert "memory_search" not in hub.get_result_cache_stats()["tools"]
+
+
+def test_mutating_tool_invalidates_its_domain():
+    transport = _Transport()
+    hub = _hub(transport)
+    hub.call_tool("blueprint_list", {})
+    hub.call_tool("container_list", {})
+
+    hub.call_tool("blueprint_create", {"id": "new"})
+    hub.call_tool("blueprint_list", {})
+    hub.call_tool("container_list", {})
+
+    assert [name for name, _ in transport.calls] == [
+        "blueprint_list", "container_list", "blueprint_create", "blueprint_list",
+    ]
+    assert hub.get_result_cache_stats()["tools"]["blueprint_create"]["invalidations"] == 1
+
+
+def test_concurrent_identical_calls_share_one_roundtrip():
+    transport = _Transport(delay_s=0.2)
+    hub = _hub(transport)
+    results = []
+
+    threads = [
+        threading.Thread(target=lambda: results.append(hub.call_tool("container_list", {"all": True})))
+        for _ in range(5)
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert len(transport.calls) == 1
+    assert len(results) == 5 and all(r == results[0] for r in results)
+    stats = hub.get_result_cache_stats()["tools"]["container_list"]
+    assert stats["misses"] == 1 and stats["coalesced"] == 4
+    assert stats["avg_miss_latency_ms"] >= 150
+
+
+def test_declared_policies_and_errors():
+    transport = _Transport()
+    hub = _hub(
+        transport,
+        definitions={
+            "custom_read": {"name": "custom_read", "cache": {"ttl_s": 60, "domain": "custom"}},
+            "blueprint_list": {"name": "blueprint_list", "cache": False},
+        },
+    )
+    hub.call_tool("custom_read", {})
+    hub.call_tool("custom_read", {})
+    hub.call_tool("blueprint_list", {})
+    hub.call_tool("blueprint_list", {})
+    assert [name for name, _ in transport.calls] == ["custom_read", "blueprint_list", "blueprint_list"]
+
+    transport.fail = True
+    hub.call_tool("container_list", {})
+    hub.call_tool("container_list", {})
+    assert [name for name, _ in transport.calls].count("container_list") == 2
+
+
+def test_mcp_config_declares_cache_and_invalidation():
+    transport = _Transport()
+    hub = _hub(transport)
+    config = {
+        "result_cache": {"memory_search": {"ttl_s": 10, "domain": "mem"}},
+        "cache_invalidates": {"custom_read": ["mem"]},
+    }
+    with patch("mcp.hub.get_mcp_config", return_value=config):
+        hub.call_tool("memory_search", {"q": 1})
+        hub.call_tool("memory_search", {"q": 1})
+        hub.call_tool("custom_read", {})
+        hub.call_tool("memory_search", {"q": 1})
+    assert [name for name, _ in transport.calls] == ["memory_search", "custom_read", "memory_search"]
+
+
+def test_invalidation_during_fetch_drops_the_stale_result():
+    cache = ToolResultCache(enabled=True)
+    policy = CachePolicy(ttl_s=60, domain="d")
+    started = threading.Event()
+    release = threading.Event()
+
+    def _slow_fetch():
+        started.set()
+        release.wait(2)
+        return {"v": "old"}
+
+    worker = threading.Thread(target=lambda: cache.call("t", {}, policy, _slow_fetch))
+    worker.start()
+    assert started.wait(2)
+    cache.invalidate_domains(["d"])
+    release.set()
+    worker.join()
+
+    assert canonical_args_key("t", {}) not in cache.keys()
+    assert cache.call("t", {}, policy, lambda: {"v": "new"}) == {"v": "new"}
+
+
+# sql-memory Tools, die den Memory-/Graph-Zustand nicht verändern
+_SQL_MEMORY_READ_ONLY = {
+    "memory_fact_load", "memory_recent", "memory_search", "memory_search_layered",
+    "memory_search_fts", "memory_semantic_search", "memory_embedding_version_status",
+    "memory_graph_search", "memory_hybrid_search", "memory_graph_neighbors",
+    "memory_graph_stats", "memory_all_recent", "memory_list_conversations",
+    "graph_find_duplicate_nodes",
+}
+# eigene Tabellen, nicht Teil der "memory"-Domain
+_SQL_MEMORY_OTHER_PREFIXES = ("skill_metric", "workspace_", "secret_")
+
+
+def _sql_memory_tool_names():
+    import ast
+    from pathlib import Path
+
+    source = Path(__file__).resolve().parents[2] / "sql-memory" / "memory_mcp" / "tools.py"
+    names = set()
+    for node in ast.walk(ast.parse(source.read_text(encoding="utf-8"))):
+        if isinstance(node, ast.FunctionDef) and any(
+            ast.unparse(dec).startswith("mcp.tool") for dec in node.decorator_list
+        ):
+            names.add(node.name)
+    return names
+
+
+def test_every_state_changing_sql_memory_tool_invalidates_memory_domain():
+    from mcp.result_cache import DEFAULT_INVALIDATIONS
+
+    names = _sql_memory_tool_names()
+    assert "memory_graph_search" in names and "graph_merge_nodes" in names
+    writers = {
+        name for name in names
+        if name not in _SQL_MEMORY_READ_ONLY and not name.startswith(_SQL_MEMORY_OTHER_PREFIXES)
+    }
+    missing = sorted(name for name in writers if "memory" not in DEFAULT_INVALIDATIONS.get(name, ()))
+    assert missing == []
+
+
+def test_compressor_fact_push_invalidates_cached_graph_search():
+    import asyncio
+
+    from core import context_compressor
+
+    transport = _Transport()
+    names = ("memory_graph_search", "graph_add_node")
+    hub = _hub(transport, {name: {"name": name} for name in names})
+    hub._tools_cache.update({name: "demo-mcp" for name in names})
+    hub.call_tool("memory_graph_search", {"query": "user"})
+    hub.call_tool("memory_graph_search", {"query": "user"})
+    assert len(transport.calls) == 1
+
+    with patch("mcp.hub.get_hub", return_value=hub):
+        asyncio.run(context_compressor._push_facts_to_graph(["User mag Python."]))
+    hub.call_tool("memory_graph_search", {"query": "user"})
+
+    assert [name for name, _ in transport.calls] == [
+        "memory_graph_search", "graph_add_node", "memory_graph_search",
+    ]
+    assert hub.get_result_cache_stats()["tools"]["graph_add_node"]["invalidations"] == 1
+
+
+def test_writes_that_bypass_the_hub_still_invalidate(monkeypatch, tmp_path):
+    import mcp.client as mcp_client
+    import mcp.hub as hub_module
+    from container_commander import blueprint_store
+    from container_commander.models import Blueprint
+
+    transport = _Transport()
+    hub = _hub(transport, {"memory_graph_search": {"name": "memory_graph_search"}})
+    hub._tools_cache["memory_graph_search"] = "demo-mcp"
+    monkeypatch.setattr(hub_module, "_hub_instance", hub)
+
+    # mcp.client falls back to a direct MCP call when the hub call fails
+    routed = hub.call_tool
+
+    def _failing_writes(name, args):
+        if name == "memory_save":
+            raise RuntimeError("hub busy")
+        return routed(name, args)
+
+    monkeypatch.setattr(hub, "call_tool", _failing_writes)
+    direct = []
+    monkeypatch.setattr(mcp_client, "_call_mcp_raw", lambda payload, timeout=5.0: direct.append(payload) or {})
+    hub.call_tool("memory_graph_search", {"query": "user"})
+    mcp_client.autosave_assistant("conv-1", "remember this")
+    hub.call_tool("memory_graph_search", {"query": "user"})
+    assert len(direct) == 1
+    assert [name for name, _ in transport.calls] == ["memory_graph_search", "memory_graph_search"]
+
+    # admin REST blueprint CRUD writes the store directly
+    monkeypatch.setattr(blueprint_store, "DB_PATH", str(tmp_path / "commander.db"))
+    monkeypatch.setattr(blueprint_store, "_INIT_DONE", False)
+    blueprint_store.ensure_store_initialized(seed_defaults=False)
+    hub.call_tool("blueprint_list", {})
+    blueprint_store.create_blueprint(Blueprint(id="bp-new", name="New", image="python:3.12"))
+    hub.call_tool("blueprint_list", {})
+    blueprint_store.delete_blueprint("bp-new")
+    hub.call_tool("blueprint_list", {})
+    assert [name for name, _ in transport.calls][2:] == ["blueprint_list"] * 3
@@ -0,0 +1,126 @@
+"""
+mcp/transports/stdio.py: responses dispatched by JSON-RPC id, many requests
+in flight, per-request timeouts that keep the process alive, process pool,
+restart after a crash.
+"""
+import json
+import sys
+import textwrap
+import threading
+import time
+
+import pytest
+
+from mcp.transports.stdio import STDIOTransport
+
+_ECHO_MCP = textwrap.dedent('''
+    import json, os, sys, threading, time
+
+    SERIAL = "serial" in sys.argv[1:]
+    out_lock = threading.Lock()
+
+    def send(msg):
+        with out_lock:
+            sys.stdout.write(json.dumps(msg) + "\\n")
+            sys.stdout.flush()
+
+    def handle(req):
+        method = req.get("method")
+        if method == "initialize":
+            send({"jsonrpc": "2.0", "id": req["id"], "result": {"capabilities": {}}})
+        elif method == "tools/list":
+            send({"jsonrpc": "2.0", "id": req["id"], "result": {"tools": [{"name": "echo"}]}})
+        elif method == "tools/call":
+            args = req["params"]["arguments"]
+            if args.get("crash"):
+                os._exit(1)
+            time.sleep(float(args.get("sleep", 0)))
+            text = json.dumps({"echo": args, "pid": os.getpid()})
+            send({"jsonrpc": "2.0", "id": req["id"], "result": {"content": [{"type": "text", "text": text}]}})
+
+    for line in sys.stdin:
+        req = json.loads(line)
+        if "id" not in req:
+            continue
+        if SERIAL:
+            handle(req)
+        else:
+            threading.Thread(target=handle, args=(req,), daemon=True).start()
+''')
+
+
+@pytest.fixture
+def echo_command(tmp_path):
+    script = tmp_path / "echo_mcp.py"
+    script.write_text(_ECHO_MCP)
+    return f"{sys.executable} -u {script}"
+
+
+def _echo(result):
+    return json.loads(result["content"][0]["text"])
+
+
+def _call_concurrently(transport, args_list):
+    results = [None] * len(args_list)
+
+    def _run(i):
+        results[i] = transport.call_tool("echo", args_list[i])
+
+    threads = [threading.Thread(target=_run, args=(i,)) for i in range(len(args_list))]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return results
+
+
+def test_out_of_order_responses_reach_their_callers(echo_command):
+    transport = STDIOTransport(echo_command, timeout=5)
+    try:
+        assert transport.list_tools() == [{"name": "echo"}]
+        args_list = [{"i": i, "sleep": 0.3 - i * 0.05} for i in range(6)]
+        started = time.monotonic()
+        results = _call_concurrently(transport, args_list)
+        assert time.monotonic() - started < 0.9
+        assert [_echo(r)["echo"] for r in results] == args_list
+    finally:
+        transport.shutdown()
+
+
+def test_timeout_affects_only_the_slow_request(echo_command):
+    transport = STDIOTransport(echo_command, timeout=0.3)
+    try:
+        slow, fast = _call_concurrently(transport, [{"sleep": 1.0}, {"i": 1}])
+        assert slow == {"error": "Timeout"}
+        assert _echo(fast)["echo"] == {"i": 1}
+        pid = transport.process.pid
+        time.sleep(0.8)  # late response for the timed-out id is dropped
+        assert _echo(transport.call_tool("echo", {"i": 2}))["echo"] == {"i": 2}
+        assert transport.process.pid == pid
+        assert transport.get_stats()["processes"][0]["timeouts"] == 1
+    finally:
+        transport.shutdown()
+
+
+def test_pool_spreads_calls_over_processes(echo_command):
+    transport = STDIOTransport(f"{echo_command} serial", timeout=5, pool_size=2)
+    try:
+        transport.call_tool("echo", {"warm": True})
+        started = time.monotonic()
+        results = _call_concurrently(transport, [{"sleep": 0.4}, {"sleep": 0.4}])
+        assert time.monotonic() - started < 0.75
+        assert len({_echo(r)["pid"] for r in results}) == 2
+        assert all(p["alive"] for p in transport.get_stats()["processes"])
+    finally:
+        transport.shutdown()
+
+
+def test_crash_fails_in_flight_requests_and_restarts(echo_command):
+    transport = STDIOTransport(echo_command, timeout=5)
+    try:
+        first_pid = _echo(transport.call_tool("echo", {}))["pid"]
+        waiting, crashed = _call_concurrently(transport, [{"sleep": 2.0}, {"crash": True}])
+        assert "error" in waiting and "error" in crashed
+        assert _echo(transport.call_tool("echo", {"i": 3}))["pid"] != first_pid
+    finally:
+        transport.shutdown()
@@ -20,6 +20,20 @@ def test_mini_control_core_kept_in_sync_across_services():
     )
 
 
+def test_skill_catalog_is_a_single_file():
+    repo_root = Path(__file__).resolve().parents[2]
+    source = repo_root / "mcp-servers" / "skill-server" / "skill_catalog.py"
+    link = repo_root / "tool_executor" / "skill_catalog.py"
+
+    assert source.exists(), f"missing source: {source}"
+    assert link.is_symlink(), f"{link} must be a symlink to {source}"
+    assert link.resolve() == source.resolve()
+    assert "skill_catalog.py" in (repo_root / "tool_executor" / ".dockerignore").read_text(encoding="utf-8")
+    assert "COPY --from=skill_server skill_catalog.py" in (
+        repo_root / "tool_executor" / "Dockerfile"
+    ).read_text(encoding="utf-8")
+
+
 def test_wrapper_imports_core_implementation():
     repo_root = Path(__file__).resolve().parents[2]
     ss_wrapper = repo_root / "mcp-servers" / "skill-server" / "mini_control_layer.py"
@@ -0,0 +1,157 @@
+"""
+core/orchestrator_tool_prefetch_utils.py + execute_tools_sync: read-only tools
+of a segment run in parallel, side-effecting tools stay barriers, results and
+evidence keep queue order.
+"""
+import threading
+import time
+
+from core.orchestrator_tool_execution_sync_utils import execute_tools_sync
+from core.orchestrator_tool_prefetch_utils import ToolPrefetcher, plan_read_only_segment
+
+_DELAY_S = 0.2
+
+
+class _Hub:
+    """call_tool sleeps per read tool and records start/end order."""
+
+    def __init__(self, concurrent=True):
+        self.concurrent = concurrent
+        self.calls = []
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+        self._tool_definitions = {}
+
+    def initialize(self):
+        pass
+
+    def supports_concurrent_calls(self, tool_name):
+        return self.concurrent
+
+    def call_tool(self, tool_name, args):
+        with self._lock:
+            self.calls.append(("start", tool_name))
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        time.sleep(_DELAY_S)
+        with self._lock:
+            self.active -= 1
+            self.calls.append(("end", tool_name))
+        if tool_name == "request_container":
+            return {"container_id": "c-new"}
+        return {"tool": tool_name, "args": args}
+
+
+def _run(hub, tools, **overrides):
+    evidence = []
+    kwargs = dict(
+        get_hub_fn=lambda: hub,
+        get_recent_container_state_fn=lambda _sid: {},
+        build_tool_args_fn=lambda name, _text, verified_plan=None: {"query": name},
+        route_blueprint_request_fn=lambda *_a: None,
+        tool_requires_container_id_fn=lambda _name: False,
+        resolve_pending_container_id_sync_fn=lambda *_a, **_k: ("", "none"),
+        validate_tool_args_fn=lambda _hub, _name, args, _text: (True, dict(args), ""),
+        bind_cron_conversation_id_fn=lambda *_a: None,
+        format_tool_result_fn=lambda result, _name: (str(result), True, {}),
+        build_tool_result_card_fn=lambda name, raw, status, _sid: (f"\n[{name}:{status}]", f"ref-{name}"),
+        build_grounding_evidence_entry_fn=lambda **kw: evidence.append(kw["tool_name"]) or kw,
+        sanitize_tool_args_for_state_fn=lambda args: dict(args or {}),
+        verify_container_running_fn=lambda _cid: True,
+        save_workspace_entry_fn=lambda *_a: None,
+        update_container_state_from_tool_result_fn=lambda *_a: None,
+        tool_intelligence_handle_tool_result_fn=lambda **_kw: {"is_error": False},
+        build_direct_cron_create_response_fn=lambda **_kw: "",
+        recover_home_read_directory_with_fast_lane_fn=lambda _path: (False, ""),
+        build_container_event_content_fn=lambda *_a, **_k: None,
+        save_container_event_fn=lambda *_a: None,
+        log_info_fn=lambda _msg: None,
+        log_warn_fn=lambda _msg: None,
+        log_error_fn=lambda _msg: None,
+    )
+    kwargs.update(overrides)
+    started = time.perf_counter()
+    ctx = execute_tools_sync(tools, "zeig mir alles", session_id="s1", **kwargs)
+    return ctx, evidence, time.perf_counter() - started
+
+
+def test_read_only_segment_runs_concurrently_with_stable_order():
+    hub = _Hub()
+    tools = ["memory_search", "container_list", "blueprint_list"]
+    ctx, evidence, elapsed = _run(hub, tools)
+
+    assert hub.max_active == 3
+    assert elapsed < _DELAY_S * 2
+    assert evidence == tools
+    assert ctx.index("[memory_search:ok]") < ctx.index("[container_list:ok]") < ctx.index("[blueprint_list:ok]")
+
+
+def test_side_effecting_tool_is_a_barrier():
+    hub = _Hub()
+    _run(
+        hub,
+        ["memory_search", "container_list", "request_container", "blueprint_list", "container_list"],
+        blueprint_router_id="python-sandbox",
+    )
+
+    rc_start = hub.calls.index(("start", "request_container"))
+    rc_end = hub.calls.index(("end", "request_container"))
+    before = [name for kind, name in hub.calls[:rc_start] if kind == "start"]
+    assert sorted(before) == ["container_list", "memory_search"]
+    # request_container runs alone; reads behind it start only after it returned
+    assert all(kind == "end" for kind, _ in hub.calls[rc_start + 1:rc_end])
+    assert {name for kind, name in hub.calls[rc_end:] if kind == "start"} == {"blueprint_list", "container_list"}
+
+
+def test_tool_args_are_built_once_per_tool():
+    hub = _Hub()
+    built = []
+
+    def _build(name, _text, verified_plan=None):
+        built.append(name)
+        return {"query": name}
+
+    tools = ["memory_search", "container_list", "request_container", "memory_search", "blueprint_list"]
+    _run(hub, tools, build_tool_args_fn=_build)
+
+    # once per queue entry, shared by prefetch planning and execution
+    assert built == tools
+
+
+def test_non_concurrent_transport_stays_serial():
+    hub = _Hub(concurrent=False)
+    _, evidence, _ = _run(hub, ["memory_search", "container_list"])
+    assert hub.max_active == 1
+    assert evidence == ["memory_search", "container_list"]
+
+
+def test_pending_container_id_is_not_prefetched():
+    calls = []
+    prefetcher = ToolPrefetcher(lambda lane, name, args: calls.append(name), enabled=True)
+
+    def _resolve(_index, spec):
+        args = spec.get("args", {})
+        if args.get("container_id") == "PENDING":
+            return None
+        return "mcp", spec["tool"], args
+
+    planned = plan_read_only_segment(
+        [
+            {"tool": "container_list", "args": {}},
+            {"tool": "container_stats", "args": {"container_id": "PENDING"}},
+            {"tool": "blueprint_list", "args": {}},
+            {"tool": "exec_in_container", "args": {"container_id": "c1"}},
+            {"tool": "container_logs", "args": {"container_id": "c1"}},
+        ],
+        0,
+        _resolve,
+    )
+    assert [name for _, name, _ in planned] == ["container_list", "blueprint_list"]
+
+    assert prefetcher.schedule(planned) == 2
+    assert prefetcher.take("mcp", "blueprint_list", {"other": 1}) is None
+    assert prefetcher.take("mcp", "blueprint_list", {}).result(timeout=2) is None
+    prefetcher.barrier()
+    assert prefetcher.take("mcp", "container_list", {}) is None
+    assert prefetcher.stats["hits"] == 1 and prefetcher.stats["discarded"] == 1
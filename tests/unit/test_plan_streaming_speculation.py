@@ -0,0 +1,266 @@
+import asyncio
+import json
+import threading
+from unittest.mock import patch
+
+import pytest
+
+from core.context_manager import ContextManager
+from core.layers.thinking import ThinkingLayer
+from core.orchestrator_plan_speculation_utils import PlanSpeculation
+from utils.text.json_stream import StreamingJSONParser
+
+_PLAN = {
+    "intent": "Alter abfragen",
+    "needs_memory": True,
+    "memory_keys": ["age", "birthday"],
+    "needs_chat_history": False,
+    "is_fact_query": True,
+    "strategy_hints": [{"note": "a } b", "nested": [1, {"x": "\"]"}]}],
+    "time_reference": None,
+    "reasoning": "Zeile 1\nZeile 2 mit {Klammern} und \\ Backslash",
+}
+
+
+def _chunks(text: str, size: int) -> list:
+    return [text[i:i + size] for i in range(0, len(text), size)]
+
+
+@pytest.mark.parametrize("size", [1, 3, 17, 10_000])
+def test_streaming_parser_emits_fields_in_order_for_any_chunking(size):
+    text = "<think>erst {nachdenken}</think>\n```json\n" + json.dumps(_PLAN, ensure_ascii=False, indent=1) + "\n```"
+    parser = StreamingJSONParser()
+    emitted = []
+    for chunk in _chunks(text, size):
+        emitted.extend(parser.feed(chunk))
+    assert emitted == list(_PLAN.items())
+    assert parser.fields == _PLAN
+    assert parser.done
+
+
+def test_streaming_parser_emits_field_before_object_is_closed():
+    parser = StreamingJSONParser()
+    assert parser.feed('Plan: {"needs_memory": tr') == []
+    assert parser.feed('ue, "memory_keys": ["a", "b"') == [("needs_memory", True)]
+    assert parser.feed('], "reasoning": "noch offen') == [("memory_keys", ["a", "b"])]
+    assert not parser.done
+    # ungültige Werte werden ausgelassen, der Rest geht weiter
+    assert parser.feed('", "bad": tru, "ok": 1}') == [("reasoning", "noch offen"), ("ok", 1)]
+    assert parser.done
+    assert parser.feed('{"after": 1}') == []
+
+
+def test_analyze_stream_reports_plan_fields_before_final_plan():
+    text = json.dumps(_PLAN, ensure_ascii=False)
+
+    async def _fake_stream(**kwargs):
+        for chunk in _chunks(text, 9):
+            yield chunk
+
+    async def _collect():
+        out = []
+        async for item in ThinkingLayer(model="m").analyze_stream("Wie alt bin ich?"):
+            out.append(item)
+        return out
+
+    with patch("core.layers.thinking.resolve_role_provider", return_value="openai"), \
+         patch("core.layers.thinking.stream_prompt", _fake_stream):
+        items = asyncio.run(_collect())
+
+    early = {}
+    for chunk, is_done, payload in items[:-1]:
+        assert not is_done and chunk
+        early.update(payload.get("plan_fields", {}))
+    assert early == _PLAN
+    first_keys_at = next(i for i, (_, _, p) in enumerate(items) if "memory_keys" in p.get("plan_fields", {}))
+    assert first_keys_at < len(items) // 2
+    assert items[-1] == ("", True, _PLAN)
+
+
+class _FakeContext:
+    memory_lookup_keys = ContextManager.memory_lookup_keys
+
+    @staticmethod
+    def _normalize_memory_keys(keys):
+        return list(dict.fromkeys(str(k).strip() for k in keys if str(k).strip()))
+
+    def __init__(self):
+        self.calls = []
+        self.release = threading.Event()
+
+    def search_memory_keys(
+        self, keys, conversation_id, *, include_system, deadline, call_timeout_s, request_cache, cancel_event=None,
+    ):
+        self.calls.append((list(keys), include_system))
+        self.release.wait(5)
+        for key in keys:
+            request_cache[f"{conversation_id}|fact|{key}"] = f"{key}-value"
+            request_cache[f"{conversation_id}|graph|{key}"] = []  # Default/Timeout-Wert
+        return {}
+
+
+def _observe_streamed(spec: PlanSpeculation, plan: dict) -> None:
+    for key, value in plan.items():
+        spec.observe({key: value})
+
+
+def test_speculation_confirmed_hands_over_shared_keys_only():
+    ctx = _FakeContext()
+    spec = PlanSpeculation(ctx, "conv-1", small_model_mode=True, enabled=True)
+    _observe_streamed(spec, {"intent": "x", "needs_memory": True, "memory_keys": ["age", "birthday"]})
+    assert spec.status == "idle"
+    spec.observe({"is_fact_query": True, "time_reference": None})
+    assert spec.status == "running"
+    assert ctx.calls == [(["age", "birthday"], False)]
+
+    final_plan = dict(_PLAN, memory_keys=["age", "name"])
+    request_cache = {"conv-1|fact|age": "fresh"}
+    ctx.release.set()
+    assert asyncio.run(spec.settle(final_plan, request_cache)) == "confirmed"
+    # vorhandene Einträge bleiben, Default-Werte und verworfene Keys werden nicht übernommen
+    assert request_cache == {"conv-1|fact|age": "fresh"}
+
+    request_cache = {}
+    spec2 = PlanSpeculation(_FakeContext(), "conv-1", enabled=True)
+    spec2._context.release.set()
+    _observe_streamed(spec2, _PLAN)
+    assert asyncio.run(spec2.settle(final_plan, request_cache)) == "confirmed"
+    assert request_cache == {"conv-1|fact|age": "age-value"}
+
+
+@pytest.mark.parametrize("final_change", [
+    {"time_reference": "yesterday"},
+    {"needs_memory": False, "is_fact_query": False},
+    {"memory_keys": ["name"]},
+])
+def test_speculation_cancelled_when_final_plan_disagrees(final_change):
+    ctx = _FakeContext()
+    spec = PlanSpeculation(ctx, "conv-1", enabled=True)
+    _observe_streamed(spec, _PLAN)
+    assert spec.status == "running"
+    request_cache = {}
+    assert asyncio.run(spec.settle(dict(_PLAN, **final_change), request_cache)) == "cancelled"
+    ctx.release.set()
+    if not spec._future.cancelled():
+        spec._future.result(timeout=5)
+    assert request_cache == {}
+
+
+def test_speculation_skips_plans_without_memory_lookup():
+    ctx = _FakeContext()
+    spec = PlanSpeculation(ctx, "conv-1", enabled=True)
+    _observe_streamed(spec, dict(_PLAN, time_reference="today"))
+    assert spec.status == "skipped"
+    assert asyncio.run(spec.settle(_PLAN, {})) == "skipped"
+    assert ctx.calls == []
+
+    disabled = PlanSpeculation(ctx, "conv-1", enabled=False)
+    _observe_streamed(disabled, _PLAN)
+    assert disabled.status == "idle" and ctx.calls == []
+
+
+def test_cancel_stops_running_key_lookups_without_waiting():
+    import time
+
+    from core.context_manager import ContextManager
+
+    ctx = ContextManager.__new__(ContextManager)
+    started, finished = threading.Event(), []
+
+    def _slow_lookup(key, *args):
+        started.set()
+        time.sleep(0.5)
+        finished.append(key)
+        return ("late", True)
+
+    ctx._search_memory_multi_context = _slow_lookup
+    cancel = threading.Event()
+    threading.Thread(target=lambda: (started.wait(5), cancel.set()), daemon=True).start()
+
+    t0 = time.monotonic()
+    results = ctx.search_memory_keys(
+        keys=["age", "birthday"], conversation_id="conv-1",
+        deadline=time.monotonic() + 5, call_timeout_s=5, cancel_event=cancel,
+    )
+    assert time.monotonic() - t0 < 0.4
+    assert results == {"age": ("", False), "birthday": ("", False)}
+
+
+def _make_orchestrator():
+    from unittest.mock import MagicMock
+
+    from core.orchestrator import PipelineOrchestrator
+
+    with patch("core.orchestrator.ThinkingLayer", return_value=MagicMock()), \
+         patch("core.orchestrator.ControlLayer", return_value=MagicMock()), \
+         patch("core.orchestrator.OutputLayer", return_value=MagicMock()), \
+         patch("core.orchestrator.ToolSelector", return_value=MagicMock()), \
+         patch("core.orchestrator.ContextManager", return_value=MagicMock()), \
+         patch("core.orchestrator.get_hub", return_value=MagicMock()), \
+         patch("core.orchestrator.get_registry", return_value=MagicMock()), \
+         patch("core.orchestrator.get_master_orchestrator", return_value=MagicMock()):
+        orch = PipelineOrchestrator()
+    fake = _FakeContext()
+    orch.context._get_skill_context.return_value = ""
+    orch.context.memory_lookup_keys = fake.memory_lookup_keys
+    orch.context.search_memory_keys = fake.search_memory_keys
+    orch.context.release = fake.release
+    return orch
+
+
+@pytest.mark.parametrize("abort", ["stream_error", "client_disconnect"])
+def test_stream_flow_cancels_speculation_when_aborted_before_settle(abort):
+    from unittest.mock import AsyncMock
+
+    from core.models import CoreChatRequest, Message, MessageRole
+
+    orch = _make_orchestrator()
+    orch.tool_selector.select_tools = AsyncMock(return_value=[])
+
+    async def _analyze_stream(*args, **kwargs):
+        yield "{", False, {"plan_fields": {k: _PLAN[k] for k in ("needs_memory", "memory_keys", "is_fact_query", "time_reference")}}
+        if abort == "stream_error":
+            raise RuntimeError("thinking backend gone")
+        yield "", True, dict(_PLAN)
+
+    orch.thinking.analyze_stream = _analyze_stream
+    created = []
+
+    class _SpySpeculation(PlanSpeculation):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            self.cancel_calls = 0
+            created.append(self)
+
+        def cancel(self):
+            self.cancel_calls += 1
+            super().cancel()
+
+    request = CoreChatRequest(
+        model="test-model",
+        messages=[Message(role=MessageRole.USER, content="Wie alt bin ich eigentlich genau?")],
+        conversation_id="conv-spec-abort",
+        source_adapter="test",
+    )
+
+    async def _run():
+        stream = orch.process_stream_with_events(request)
+        try:
+            async for _, _, meta in stream:
+                if meta.get("type") == "thinking_stream" and abort == "client_disconnect":
+                    break
+        finally:
+            await stream.aclose()
+
+    with patch("core.orchestrator_stream_flow_utils.PlanSpeculation", _SpySpeculation):
+        if abort == "stream_error":
+            with pytest.raises(RuntimeError):
+                asyncio.run(_run())
+        else:
+            asyncio.run(_run())
+
+    assert len(created) == 1
+    spec = created[0]
+    assert spec.keys == ["age", "birthday"]
+    assert spec.cancel_calls == 1 and spec.status == "cancelled"
+    spec._context.release.set()
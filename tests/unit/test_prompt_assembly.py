@@ -0,0 +1,118 @@
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from core import prompt_assembly as pa
+from core.layers.output import OutputLayer
+from core.layers.thinking import THINKING_PROMPT, ThinkingLayer
+from core.persona import get_persona
+
+_TOOLS = [
+    {"name": "memory_graph_search", "mcp": "sql-memory", "description": "Search memory", "inputSchema": {"b": 1, "a": 2}},
+    {"name": "list_skills", "mcp": "skill-server", "description": "List skills"},
+]
+
+
+def test_canonical_tool_snapshot_is_order_independent_and_compact():
+    forward = pa.canonical_tool_snapshot(_TOOLS)
+    assert forward == pa.canonical_tool_snapshot(list(reversed(_TOOLS)) + [dict(_TOOLS[1], description="dup")])
+    lines = forward.splitlines()
+    assert lines[0] == "[" and lines[-1] == "]"
+    assert lines[1].startswith('{"description":"List skills"')
+    assert '"inputSchema":{"a":2,"b":1}' in lines[2]
+    assert pa.canonical_tool_snapshot([]) == "[]"
+    assert pa.canonical_json({"b": "ü", "a": [1, 2]}) == '{"a":[1,2],"b":"ü"}'
+
+
+def test_assemble_prompt_keeps_order_and_tracks_leading_stable_prefix():
+    tracker = pa.PromptPrefixTracker()
+    segments = [
+        pa.PromptSegment("system", "SYS", pa.STABILITY_STATIC),
+        pa.PromptSegment("rules", "RULES", pa.STABILITY_CATALOG),
+        pa.PromptSegment("empty", "", pa.STABILITY_CATALOG),
+        pa.PromptSegment("memory", "MEM-1", pa.STABILITY_TURN),
+        pa.PromptSegment("hints", "HINTS", pa.STABILITY_CATALOG),
+        pa.PromptSegment("user", "USER", pa.STABILITY_REQUEST),
+    ]
+    assert pa.assemble_prompt(segments, role="thinking", model="m", tracker=tracker) == (
+        "SYS\n\nRULES\n\nMEM-1\n\nHINTS\n\nUSER"
+    )
+    segments[3] = pa.PromptSegment("memory", "MEM-2", pa.STABILITY_TURN)
+    pa.assemble_prompt(segments, role="thinking", model="m", tracker=tracker)
+    pa.assemble_prompt(segments[3:], role="thinking", model="other", tracker=tracker)
+
+    stats = tracker.snapshot()
+    assert stats["thinking|m"]["calls"] == 2 and stats["thinking|m"]["hits"] == 1
+    # Segmente hinter dem ersten TURN-Segment zählen nicht zum Prefix
+    assert stats["thinking|m"]["prefix_hash"] == pa.prefix_hash("SYS\n\nRULES")
+    assert stats["thinking|other"]["prefix_hash"] == pa.prefix_hash("")
+
+
+def _thinking_prompt(**kwargs) -> str:
+    captured = {}
+
+    async def _fake_stream(**stream_kwargs):
+        captured.update(stream_kwargs)
+        yield '{"intent": "x"}'
+
+    async def _run():
+        async for _ in ThinkingLayer(model="m").analyze_stream("Hallo", **kwargs):
+            pass
+
+    with patch("core.layers.thinking.resolve_role_provider", return_value="openai"), \
+         patch("core.layers.thinking.stream_prompt", _fake_stream):
+        asyncio.run(_run())
+    return captured["prompt"]
+
+
+def test_thinking_prompt_keeps_section_order_with_canonical_tools():
+    first = _thinking_prompt(
+        memory_context="skill a", available_tools=_TOOLS,
+        tone_signal={"tone": "warm", "confidence": 0.8}, tool_hints="=== MCP DETECTION RULES ===",
+    )
+    second = _thinking_prompt(
+        memory_context="skill a", available_tools=list(reversed(_TOOLS)),
+        tone_signal={"confidence": 0.8, "tone": "warm"}, tool_hints="=== MCP DETECTION RULES ===",
+    )
+    start = len(THINKING_PROMPT)
+    assert first.startswith(THINKING_PROMPT + "\n\n")
+    # Reihenfolge wie vor der Prompt-Montage: Memory, Tools, Tone, Hints, User
+    order = [
+        first.index(marker, start)
+        for marker in (
+            "VERFÜGBARER MEMORY-KONTEXT", "VERFÜGBARE TOOLS", "TONALITÄTS-SIGNAL",
+            "=== MCP DETECTION RULES ===", "USER-ANFRAGE",
+        )
+    ]
+    assert order == sorted(order)
+    # gleiche Tool-Menge / gleiches Tone-Signal ergibt dieselben Bytes
+    assert first == second
+    assert first.rstrip().endswith("Deine Überlegung:")
+
+
+@patch("core.layers.output.prompt.tool_injection.list_live_tools", return_value=_TOOLS)
+@patch("core.layers.output.prompt.tool_injection.get_output_tool_prompt_limit", return_value=10)
+@patch("core.layers.output.prompt.tool_injection.get_output_tool_injection_mode", return_value="selected")
+def test_output_system_prompt_keeps_live_tools_inside_persona(*_mocks):
+    pa._TRACKER.clear()
+    layer = OutputLayer()
+    plan = {"_selected_tools_for_prompt": ["memory_graph_search", "list_skills"]}
+    prompt = layer.build_system_prompt(plan, memory_data="m1")
+
+    persona = get_persona()
+    tools = [t for t in _TOOLS if t["name"] in plan["_selected_tools_for_prompt"]]
+    # Persona inkl. Live-Tools vor den Regeln, wie vor der Prompt-Montage
+    assert prompt.startswith(persona.build_system_prompt(dynamic_context={"tools": tools}) + "\n")
+    # Live-Tools sind Turn-Material: kein stabiler Prefix für diesen Aufruf
+    (stats,) = [v for k, v in pa.get_prompt_prefix_stats().items() if k.startswith("output|")]
+    assert stats["prefix_hash"] == pa.prefix_hash("")
+
+
+@pytest.mark.parametrize("raw,expected", [("30m", "30m"), ("  ", "5m"), ("-1", "-1")])
+def test_llm_keep_alive_is_configurable(monkeypatch, raw, expected):
+    from config.models import llm
+
+    monkeypatch.setattr(llm.settings, "get", lambda key, default=None: default)
+    monkeypatch.setenv("LLM_KEEP_ALIVE", raw)
+    assert llm.get_llm_keep_alive() == expected
@@ -136,7 +136,10 @@ class TestScope32VectorStore(unittest.TestCase):
             self.assertEqual(row[0], "new-model")
             self.assertEqual(row[1], 3)
             self.assertEqual(row[2], "v-new")
-            self.assertEqual(json.loads(row[3]), [0.3, 0.4, 0.5])
+            self.assertEqual(
+                self.vector_store.unpack_embedding(row[3]).tolist(),
+                self.vector_store.unpack_embedding(self.vector_store.pack_embedding([0.3, 0.4, 0.5])).tolist(),
+            )
         finally:
             conn.close()
 
@@ -249,7 +252,8 @@ class TestScope32ArchiveManager(unittest.TestCase):
             self.assertEqual(row["embedding_model"], "new-model")
             self.assertEqual(row["embedding_dim"], 3)
             self.assertEqual(row["embedding_version"], expected_version)
-            self.assertEqual(json.loads(row["embedding"]), [0.9, 0.8, 0.7])
+            for got, want in zip(self.archive_mod._decode_embedding(row["embedding"]), [0.9, 0.8, 0.7]):
+                self.assertAlmostEqual(got, want, places=6)
         finally:
             conn.close()
 
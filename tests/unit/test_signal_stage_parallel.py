@@ -0,0 +1,181 @@
+"""
+Signal-Stage: Tone, Tool-Selector, Query-Budget und Domain-Router laufen
+parallel mit eigenem Timeout je Signal; die kontextabhängige Re-Klassifikation
+läuft nur, wenn selected_tools/Tone die Scores tatsächlich verschieben.
+"""
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from core.domain_router_hybrid import DomainRouterHybridClassifier
+from core.orchestrator_pipeline_stages import run_tool_selection_stage, start_tone_signal
+from core.query_budget_hybrid import QueryBudgetHybridClassifier
+
+
+def _make_orch(*, selected=None, tone=None, select_delay=0.0):
+    orch = MagicMock()
+
+    async def _select(user_text, context_summary=""):
+        if select_delay:
+            await asyncio.sleep(select_delay)
+        return list(selected or [])
+
+    orch.tool_selector.select_tools = _select
+    orch._filter_tool_selector_candidates = lambda tools, *a, **k: tools
+    orch._classify_tone_signal = AsyncMock(return_value=tone)
+    orch._sanitize_tone_signal = lambda value: {"dialogue_act": "request"}
+    orch._classify_query_budget_signal = AsyncMock(return_value={"query_type": "factual"})
+    orch._classify_domain_signal = AsyncMock(return_value={"domain_tag": "GENERIC"})
+    orch.query_budget = QueryBudgetHybridClassifier.__new__(QueryBudgetHybridClassifier)
+    orch.domain_router = DomainRouterHybridClassifier.__new__(DomainRouterHybridClassifier)
+    return orch
+
+
+def _request():
+    return MagicMock(messages=[{"role": "user", "content": "was ist dns"}])
+
+
+def _run(orch, tone_signal, trace=None):
+    with patch("config.get_signal_stage_parallel_enable", return_value=True):
+        return asyncio.run(
+            run_tool_selection_stage(
+                orch, "was ist dns", _request(), None, tone_signal, lambda *_: None,
+                trace_out=trace,
+            )
+        )
+
+
+def test_parallel_stage_skips_followup_without_context_tools():
+    orch = _make_orch(selected=["web_search"])
+    trace = {}
+    tools, budget, domain, _ = _run(orch, {"dialogue_act": "request"}, trace)
+
+    assert tools == ["web_search"]
+    assert budget == {"query_type": "factual"}
+    assert domain == {"domain_tag": "GENERIC"}
+    assert orch._classify_query_budget_signal.await_count == 1
+    assert orch._classify_domain_signal.await_count == 1
+    assert trace["mode"] == "parallel"
+    assert set(trace["signals"]) == {"tool_selection", "query_budget", "domain"}
+
+
+def test_parallel_stage_runs_followup_when_tools_move_scores():
+    orch = _make_orch(selected=["request_container"])
+    orch._classify_domain_signal = AsyncMock(
+        side_effect=[{"domain_tag": "GENERIC"}, {"domain_tag": "CONTAINER"}]
+    )
+    trace = {}
+    _, _, domain, _ = _run(orch, {"dialogue_act": "request"}, trace)
+
+    assert domain == {"domain_tag": "CONTAINER"}
+    last_call = orch._classify_domain_signal.await_args_list[-1]
+    assert last_call.kwargs["selected_tools"] == ["request_container"]
+    assert "domain_followup" in trace["signals"]
+    assert "query_budget_followup" in trace["signals"]
+
+
+def test_signal_timeout_degrades_to_fallback():
+    orch = _make_orch(select_delay=1.0)
+    trace = {}
+    with patch("config.get_signal_stage_timeout_s", return_value=0.05):
+        tools, budget, _, _ = _run(orch, None, trace)
+
+    # selector fallback is empty -> short-input bypass takes over as before
+    assert "request_container" in tools
+    assert budget == {"query_type": "factual"}
+    assert trace["signals"]["tool_selection"]["status"] == "timeout"
+
+
+def test_pending_tone_signal_is_merged_into_trace():
+    orch = _make_orch(tone={"dialogue_act": "smalltalk"})
+    trace = {}
+
+    async def _flow():
+        pending = start_tone_signal(orch, "hi", _request())
+        with patch("config.get_signal_stage_parallel_enable", return_value=True):
+            await run_tool_selection_stage(
+                orch, "hi", _request(), None, pending, lambda *_: None, trace_out=trace
+            )
+        return await pending.result()
+
+    tone = asyncio.run(_flow())
+    assert tone == {"dialogue_act": "smalltalk"}
+    assert trace["signals"]["tone"]["status"] == "ok"
+    # smalltalk shifts the budget scores -> context follow-up
+    assert "query_budget_followup" in trace["signals"]
+
+
+@pytest.mark.parametrize("tools,expected", [
+    ([], False),
+    (["web_search"], False),
+    (["autonomy_cron_create_job"], True),
+    ([{"tool": "run_skill"}], True),
+])
+def test_domain_router_depends_on_selected_tools(tools, expected):
+    assert DomainRouterHybridClassifier.depends_on_selected_tools(tools) is expected
+
+
+def test_tone_timeout_is_off_unless_configured(monkeypatch):
+    from config import get_signal_stage_timeout_s
+
+    monkeypatch.delenv("SIGNAL_STAGE_TIMEOUT_TONE_S", raising=False)
+    assert get_signal_stage_timeout_s("tone") is None
+    assert get_signal_stage_timeout_s("domain") == 3.0
+
+    monkeypatch.setenv("SIGNAL_STAGE_TIMEOUT_TONE_S", "1.5")
+    assert get_signal_stage_timeout_s("tone") == 1.5
+
+
+
+@pytest.mark.asyncio
+async def test_stream_disconnect_before_signal_stage_cancels_tone(monkeypatch):
+    from core.orchestrator_stream_flow_utils import process_stream_with_events
+
+    tone_started = asyncio.Event()
+    tone_cancelled = asyncio.Event()
+
+    async def _slow_tone(*_args, **_kwargs):
+        tone_started.set()
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            tone_cancelled.set()
+            raise
+
+    async def _chunked(*_args, **_kwargs):
+        yield ("", False, {"type": "chunking_progress"})
+        yield ("", False, {"type": "chunking_done"})
+
+    orch = MagicMock()
+    orch._requested_response_mode = MagicMock(return_value=None)
+    orch._classify_tone_signal = _slow_tone
+    orch._process_chunked_stream = _chunked
+    monkeypatch.setattr("utils.chunker.needs_chunking", lambda *_a, **_k: True)
+    request = MagicMock(messages=[], conversation_id="conv-tone-cancel")
+    request.get_last_user_message = lambda: "sehr langer text"
+
+    stream = process_stream_with_events(
+        orch,
+        request,
+        intent_system_available=False,
+        enable_chunking=True,
+        chunking_threshold=1,
+        get_master_settings_fn=lambda: {},
+        thinking_plan_cache=MagicMock(),
+        sequential_result_cache=MagicMock(),
+        soften_control_deny_fn=MagicMock(),
+        skill_creation_intent_cls=None,
+        intent_origin_cls=None,
+        get_intent_store_fn=lambda: None,
+        log_info_fn=lambda *_: None,
+        log_warn_fn=lambda *_: None,
+        log_error_fn=lambda *_: None,
+        log_debug_fn=lambda *_: None,
+        log_warning_fn=lambda *_: None,
+    )
+    assert (await stream.__anext__())[2]["type"] == "chunking_progress"
+    await tone_started.wait()
+    await stream.aclose()
+
+    await asyncio.wait_for(tone_cancelled.wait(), timeout=1.0)
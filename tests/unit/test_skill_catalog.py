@@ -0,0 +1,217 @@
+from __future__ import annotations
+
+import asyncio
+import importlib.util
+import json
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import MagicMock
+
+
+_HERE = os.path.dirname(os.path.abspath(__file__))
+_REPO_ROOT = os.path.abspath(os.path.join(_HERE, "..", ".."))
+_TOOL_EXECUTOR_DIR = os.path.join(_REPO_ROOT, "tool_executor")
+
+if _TOOL_EXECUTOR_DIR not in sys.path:
+    sys.path.insert(0, _TOOL_EXECUTOR_DIR)
+
+
+def _load_module(name: str, filename: str):
+    spec = importlib.util.spec_from_file_location(name, os.path.join(_TOOL_EXECUTOR_DIR, filename))
+    mod = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(mod)
+    return mod
+
+
+def _write_registry(skills_dir: Path, skills: dict):
+    registry = skills_dir / "_registry"
+    registry.mkdir(parents=True, exist_ok=True)
+    tmp = registry / "installed.json.tmp"
+    tmp.write_text(json.dumps({"schema_version": 2, "skills": skills}), encoding="utf-8")
+    os.replace(tmp, registry / "installed.json")
+
+
+def _write_draft(skills_dir: Path, name: str, manifest: dict):
+    skill_dir = skills_dir / "_drafts" / name
+    skill_dir.mkdir(parents=True, exist_ok=True)
+    (skill_dir / "manifest.json").write_text(json.dumps(manifest), encoding="utf-8")
+
+
+class TestSkillCatalog(unittest.TestCase):
+    def setUp(self):
+        self.mod = _load_module("skill_catalog_test_mod", "skill_catalog.py")
+        self._tmp = tempfile.TemporaryDirectory()
+        self.skills_dir = Path(self._tmp.name)
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_refresh_reparses_only_changed_sources(self):
+        _write_registry(self.skills_dir, {"weather_skill": {"description": "weather checks"}})
+        _write_draft(self.skills_dir, "crypto_price", {"description": "bitcoin price"})
+        _write_draft(self.skills_dir, "unit_converter", {"description": "convert units"})
+        catalog = self.mod.SkillCatalog(self.skills_dir)
+
+        skills = list(catalog.skills())
+        self.assertEqual(skills[0], "weather_skill")  # installed first, drafts in directory order
+        self.assertEqual(sorted(skills[1:]), ["crypto_price", "unit_converter"])
+        self.assertEqual(catalog.stats["reparsed"], 3)
+        self.assertFalse(catalog.refresh())
+        self.assertEqual(catalog.stats["reparsed"], 3)
+
+        _write_draft(self.skills_dir, "crypto_price", {"description": "ethereum price in eur"})
+        self.assertTrue(catalog.refresh())
+        self.assertEqual(catalog.stats["reparsed"], 4)
+        self.assertEqual(catalog.drafts()["crypto_price"]["description"], "ethereum price in eur")
+
+        (self.skills_dir / "_drafts" / "unit_converter" / "manifest.json").unlink()
+        (self.skills_dir / "_drafts" / "unit_converter").rmdir()
+        _write_registry(self.skills_dir, {})
+        self.assertEqual(list(catalog.skills()), ["crypto_price"])
+
+    def test_search_ranks_by_bm25_with_substring_terms(self):
+        skills = {
+            "notes_helper": {"description": "take notes, also a calculator for tips", "triggers": []},
+            "taschenrechner": {"description": "rechnet formeln", "triggers": ["rechnen"]},
+            "calculator": {"description": "math calculator", "triggers": ["calculate", "math"]},
+            "weather_skill": {"description": "weather checks", "triggers": ["weather"]},
+        }
+        catalog = self.mod.SkillCatalog(self.skills_dir)
+
+        ranked = [name for name, _ in catalog.search(["calculat"], skills=skills)]
+        self.assertEqual(ranked, ["calculator", "notes_helper"])
+        self.assertEqual([n for n, _ in catalog.search(["rechner"], skills=skills)], ["taschenrechner"])
+        self.assertEqual(len(catalog.search(["weather", "math", "notes"], skills=skills, top_k=2)), 2)
+
+        # only changed entries are re-indexed
+        reindexed = catalog.stats["reindexed"]
+        skills = {**skills, "weather_skill": {"description": "weather forecast", "triggers": []}}
+        self.assertEqual(catalog.search(["forecast"], skills=skills)[0][0], "weather_skill")
+        self.assertEqual(catalog.stats["reindexed"], reindexed + 1)
+
+    def test_stopwords_are_dropped_on_both_sides(self):
+        skills = {
+            "hat_shop": {"description": "buy a hat", "triggers": []},
+            "notes_helper": {"description": "take notes that matter", "triggers": ["this"]},
+        }
+        catalog = self.mod.SkillCatalog(self.skills_dir)
+
+        # "that" is a stopword, so the query "hat" only hits the hat skill
+        self.assertEqual([n for n, _ in catalog.search(["hat"], skills=skills)], ["hat_shop"])
+        self.assertEqual(catalog.search(["this"], skills=skills), [])
+        self.assertNotIn("that", catalog._postings)
+        self.assertEqual(catalog.search(self.mod.extract_keywords("skill for this"), skills=skills), [])
+
+    def test_rank_reranks_with_cached_embeddings(self):
+        skills = {
+            "city_weather": {"description": "weather for a city", "triggers": ["weather"]},
+            "weather_alerts": {"description": "storm warnings", "triggers": ["weather", "storm"]},
+        }
+        batches = []
+
+        async def embed(texts):
+            batches.append(list(texts))
+            return [[1.0, 0.0] if "storm" in text else [0.0, 1.0] for text in texts]
+
+        catalog = self.mod.SkillCatalog(self.skills_dir, embed_fn=embed)
+
+        plain = [name for name, _ in catalog.search(["weather"], skills=skills)]
+        reranked = asyncio.run(catalog.rank(["weather"], skills=skills, query_text="storm coming"))
+        asyncio.run(catalog.rank(["weather"], skills=skills, query_text="storm again"))
+
+        self.assertEqual(plain[0], "city_weather")
+        self.assertEqual(reranked[0], "weather_alerts")
+        # one request per call: query + both skills, then the query alone
+        self.assertEqual([len(batch) for batch in batches], [3, 1])
+        self.assertEqual(batches[1], ["storm again"])
+
+    def test_rank_keeps_bm25_order_when_embeddings_fail(self):
+        skills = {
+            "city_weather": {"description": "weather for a city", "triggers": ["weather"]},
+            "weather_alerts": {"description": "storm warnings", "triggers": ["weather", "storm"]},
+        }
+
+        async def embed(texts):
+            raise RuntimeError("ollama down")
+
+        catalog = self.mod.SkillCatalog(self.skills_dir, embed_fn=embed)
+        plain = [name for name, _ in catalog.search(["weather"], skills=skills)]
+        self.assertEqual(asyncio.run(catalog.rank(["weather"], skills=skills, query_text="storm")), plain)
+        self.assertEqual(catalog._embeddings, {})
+
+
+class TestMiniControlUsesCatalog(unittest.TestCase):
+    def setUp(self):
+        self.mod = _load_module("mini_control_core_catalog_test_mod", "mini_control_core.py")
+        self._tmp = tempfile.TemporaryDirectory()
+        self.skills_dir = Path(self._tmp.name)
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _control(self):
+        control = self.mod.SkillMiniControl(cim=MagicMock(), skills_dir=str(self.skills_dir))
+        control._is_skill_discovery_enabled = MagicMock(return_value=False)
+        return control
+
+    def test_match_picks_up_new_draft_without_reload(self):
+        _write_registry(self.skills_dir, {
+            "weather_skill": {"description": "weather checks", "triggers": ["weather", "forecast"]},
+        })
+        control = self._control()
+
+        match = asyncio.run(control._find_matching_skill("weather", "weather forecast berlin"))
+        self.assertEqual(match["name"], "weather_skill")
+        self.assertEqual(match["match_score"], 1.0)
+        self.assertIsNone(asyncio.run(control._find_matching_skill("bitcoin", "bitcoin kurs")))
+
+        _write_draft(self.skills_dir, "crypto_price", {
+            "description": "bitcoin price", "triggers": ["bitcoin", "kurs"],
+        })
+        match = asyncio.run(control._find_matching_skill("bitcoin", "bitcoin kurs"))
+        self.assertEqual(match["name"], "crypto_price")
+        self.assertTrue(match["is_draft"])
+        self.assertEqual(control._skill_catalog.stats["reparsed"], 2)
+
+    def test_match_follows_bm25_order(self):
+        _write_registry(self.skills_dir, {
+            "weather_report_long": {"description": "long weather report", "triggers": ["weather", "report"]},
+            "weather": {"description": "weather report", "triggers": ["weather", "report"]},
+        })
+        control = self._control()
+
+        ranked = [name for name, _ in control._get_skill_catalog().search(["weather", "report"])]
+        self.assertEqual(ranked[0], "weather")  # shorter document, higher BM25
+        match = asyncio.run(control._find_matching_skill("weather", "weather report"))
+        self.assertEqual(match["name"], "weather")
+        self.assertEqual(match["match_score"], 1.0)
+
+    def test_only_top_k_candidates_are_scored(self):
+        skills = {
+            f"backup_{i}": {"description": "backup disk", "triggers": ["backup"]}
+            for i in range(30)
+        }
+        _write_registry(self.skills_dir, skills)
+        control = self._control()
+        scored = []
+        score = control._calculate_match_score
+
+        def _spy(name, info, terms):
+            scored.append(name)
+            return score(name, info, terms)
+
+        control._calculate_match_score = _spy
+        match = asyncio.run(control._find_matching_skill("backup", "backup disk"))
+        self.assertEqual(match["name"], "backup_0")  # equal BM25 scores keep registry order
+        self.assertEqual(scored, ["backup_0"])
+
+        scored.clear()
+        control._calculate_match_score = lambda name, info, terms: scored.append(name) or 0.0
+        self.assertIsNone(asyncio.run(control._find_matching_skill("backup", "backup disk")))
+        self.assertEqual(len(scored), 20)  # SKILL_MATCH_TOP_K, not all 30 hits
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+import csv
+import importlib.util
+import os
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+
+
+_HERE = os.path.dirname(os.path.abspath(__file__))
+_REPO_ROOT = os.path.abspath(os.path.join(_HERE, "..", ".."))
+_TOOL_EXECUTOR_DIR = os.path.join(_REPO_ROOT, "tool_executor")
+_DATA_DIR = Path(_TOOL_EXECUTOR_DIR) / "data" / "data"
+
+
+def _load_cim_module():
+    # tool_executor and skill-server both ship a skill_cim_light module
+    spec = importlib.util.spec_from_file_location(
+        "skill_cim_light_scanner_test_mod",
+        os.path.join(_TOOL_EXECUTOR_DIR, "skill_cim_light.py"),
+    )
+    mod = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(mod)
+    return mod
+
+
+class TestCodePatternScanner(unittest.TestCase):
+    def setUp(self):
+        self.mod = _load_cim_module()
+
+    def test_reports_all_overlapping_matches_with_lines(self):
+        scanner = self.mod.CodePatternScanner(
+            literals=["os.system(cmd)"],
+            functions=["os.system("],
+            terms=["os.system"],
+            terms_ci=["SANDBOX"],
+        )
+        code = "import os\n# Sandbox only\nos.system(cmd)\nx = 1; os.system ('ls')\n"
+
+        found = [(m.kind, m.key, m.line, m.text) for m in scanner.scan(code)]
+
+        self.assertEqual(found, [
+            ("term_ci", "sandbox", 2, "Sandbox"),
+            ("literal", "os.system(cmd)", 3, "os.system(cmd)"),
+            ("function", "os.system(", 3, "os.system("),
+            ("term", "os.system", 3, "os.system"),
+            ("function", "os.system(", 4, "os.system ("),
+            ("term", "os.system", 4, "os.system"),
+        ])
+        self.assertEqual(scanner.pattern_count, 4)
+
+    def test_function_regex_respects_word_boundary(self):
+        scanner = self.mod.CodePatternScanner(functions=["eval(", "input("])
+        code = "safe_eval(x)\nraw_input(q)\nretrieval(q)\n"
+
+        self.assertEqual(scanner.scan(code), [])
+        self.assertEqual([m.line for m in scanner.scan("\n\n  eval (x)")], [3])
+
+    def test_case_sensitive_terms_ignore_other_casing(self):
+        scanner = self.mod.CodePatternScanner(terms=["open("], terms_ci=["schema"])
+        code = "OPEN(x)\nSCHEMA = {}\n"
+
+        self.assertEqual([(m.kind, m.line) for m in scanner.scan(code)], [("term_ci", 2)])
+
+
+class TestSkillCIMLightValidation(unittest.TestCase):
+    def setUp(self):
+        self.mod = _load_cim_module()
+
+    def test_malicious_code_is_blocked_with_line_numbers(self):
+        cim = self.mod.SkillCIMLight(_DATA_DIR)
+        code = "import os\n\ndef run(expr):\n    # sandbox\n    os.system(expr)\n    return eval(expr)\n"
+
+        result = cim.validate_code(code)
+
+        self.assertFalse(result.passed)
+        lines = {i.matched_text: i.line for i in result.issues if i.matched_text}
+        self.assertEqual(lines.get("eval("), 6)
+        self.assertIn("PRIOR-001", result.applied_priors)
+        payload = result.to_dict()["issues"]
+        self.assertTrue(all("line" in issue for issue in payload))
+
+    def test_benign_code_passes(self):
+        cim = self.mod.SkillCIMLight(_DATA_DIR)
+
+        result = cim.validate_code("def run(values):\n    return sum(values)\n")
+
+        self.assertTrue(result.passed)
+        self.assertEqual(result.issues, [])
+
+    def test_rules_reload_when_csv_changes(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            shutil.copy(_DATA_DIR / "code_safety_priors.csv", tmp)
+            path = Path(tmp) / "code_anti_patterns.csv"
+            fields = ["pattern_id", "risk_severity", "negative_example", "pattern_signature"]
+            with open(path, "w", newline="", encoding="utf-8") as fh:
+                writer = csv.DictWriter(fh, fieldnames=fields)
+                writer.writeheader()
+                writer.writerow({"pattern_id": "AP-1", "risk_severity": "Critical",
+                                 "negative_example": "danger_call()", "pattern_signature": ""})
+            cim = self.mod.SkillCIMLight(Path(tmp))
+            code = "x = 1\nforbidden_call()\n"
+            self.assertTrue(cim.validate_code(code).passed)
+
+            with open(path, "a", newline="", encoding="utf-8") as fh:
+                csv.DictWriter(fh, fieldnames=fields).writerow(
+                    {"pattern_id": "AP-2", "risk_severity": "Critical",
+                     "negative_example": "forbidden_call()", "pattern_signature": ""}
+                )
+            stat = os.stat(path)
+            os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+            result = cim.validate_code(code)
+            self.assertFalse(result.passed)
+            self.assertEqual([(i.id, i.line) for i in result.issues], [("AP-2", 2)])
+            self.assertFalse(cim.reload_if_changed())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,189 @@
+from __future__ import annotations
+
+import asyncio
+import importlib.util
+import os
+import sys
+import tempfile
+import time
+import unittest
+
+
+_HERE = os.path.dirname(os.path.abspath(__file__))
+_REPO_ROOT = os.path.abspath(os.path.join(_HERE, "..", ".."))
+_TOOL_EXECUTOR_DIR = os.path.join(_REPO_ROOT, "tool_executor")
+
+if _REPO_ROOT not in sys.path:
+    sys.path.insert(0, _REPO_ROOT)
+if _TOOL_EXECUTOR_DIR not in sys.path:
+    sys.path.insert(0, _TOOL_EXECUTOR_DIR)
+
+
+def _load_skill_runner_module():
+    spec = importlib.util.spec_from_file_location(
+        "skill_runner_pool_test_mod",
+        os.path.join(_TOOL_EXECUTOR_DIR, "engine", "skill_runner.py"),
+    )
+    mod = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(mod)
+    return mod
+
+
+def _write_skill(skills_dir: str, name: str, code: str, mtime_ns: int | None = None):
+    skill_dir = os.path.join(skills_dir, name)
+    os.makedirs(skill_dir, exist_ok=True)
+    path = os.path.join(skill_dir, "main.py")
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(code)
+    if mtime_ns is not None:
+        os.utime(path, ns=(mtime_ns, mtime_ns))
+    return path
+
+
+_SLEEP_SKILL = (
+    "import time\n"
+    "def run(seconds=0.0):\n"
+    "    time.sleep(seconds)\n"
+    "    return seconds\n"
+)
+
+
+class TestSkillRunnerCodeCache(unittest.TestCase):
+    def setUp(self):
+        self.mod = _load_skill_runner_module()
+        self._tmp = tempfile.TemporaryDirectory()
+        self.skills_dir = self._tmp.name
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_code_object_reused_until_content_changes(self):
+        path = _write_skill(
+            self.skills_dir, "counter",
+            "calls = []\n"
+            "def run():\n"
+            "    calls.append(1)\n"
+            "    return ('v1', len(calls))\n",
+            mtime_ns=1_000_000_000,
+        )
+        runner = self.mod.SkillRunner(skills_dir=self.skills_dir, timeout_seconds=5)
+
+        first = asyncio.run(runner.run("counter"))
+        second = asyncio.run(runner.run("counter"))
+        # module globals are fresh per run even though the code object is cached
+        self.assertEqual(first.result, ("v1", 1))
+        self.assertEqual(second.result, ("v1", 1))
+        self.assertEqual(runner.code_cache.stats(), {"entries": 1, "hits": 1, "misses": 1})
+
+        # touched but identical content → same code object, no recompile
+        os.utime(path, ns=(2_000_000_000, 2_000_000_000))
+        asyncio.run(runner.run("counter"))
+        self.assertEqual(runner.code_cache.stats()["misses"], 1)
+
+        _write_skill(self.skills_dir, "counter", "def run():\n    return 'v2'\n", mtime_ns=3_000_000_000)
+        changed = asyncio.run(runner.run("counter"))
+        self.assertEqual(changed.result, "v2")
+        self.assertEqual(runner.code_cache.stats()["misses"], 2)
+
+    def test_result_reports_load_and_run_times(self):
+        _write_skill(self.skills_dir, "sleepy", _SLEEP_SKILL)
+        runner = self.mod.SkillRunner(skills_dir=self.skills_dir, timeout_seconds=5)
+
+        result = asyncio.run(runner.run("sleepy", args={"seconds": 0.05}))
+
+        payload = result.to_dict()
+        self.assertTrue(result.success)
+        self.assertGreaterEqual(payload["run_ms"], 40)
+        self.assertGreater(payload["load_ms"], 0)
+        self.assertEqual(payload["queue_wait_ms"], 0)
+
+
+class TestSkillWorkerPool(unittest.TestCase):
+    def setUp(self):
+        self.mod = _load_skill_runner_module()
+        self._tmp = tempfile.TemporaryDirectory()
+        self.skills_dir = self._tmp.name
+        _write_skill(self.skills_dir, "sleepy", _SLEEP_SKILL)
+        _write_skill(self.skills_dir, "hung", "def run():\n    while True:\n        pass\n")
+        _write_skill(self.skills_dir, "evil", "import os\ndef run():\n    return os.getcwd()\n")
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _runner(self, pool_size: int, timeout_seconds: int = 5):
+        runner = self.mod.SkillRunner(
+            skills_dir=self.skills_dir,
+            timeout_seconds=timeout_seconds,
+            execution_mode="pool",
+            pool_size=pool_size,
+        )
+        self.addCleanup(runner.shutdown)
+        return runner
+
+    def test_concurrent_runs_execute_in_parallel(self):
+        runner = self._runner(pool_size=2)
+
+        async def _run():
+            await runner.run("sleepy")  # start + warm the pool
+            started = time.perf_counter()
+            results = await asyncio.gather(
+                runner.run("sleepy", args={"seconds": 0.4}),
+                runner.run("sleepy", args={"seconds": 0.4}),
+            )
+            return results, time.perf_counter() - started
+
+        results, elapsed = asyncio.run(_run())
+        self.assertTrue(all(r.success and r.result == 0.4 for r in results))
+        self.assertLess(elapsed, 0.75)
+        self.assertTrue(all(r.run_ms >= 350 for r in results))
+        self.assertEqual(len(set(runner.get_stats()["pool"]["pids"])), 2)
+
+    def test_queue_wait_is_reported_when_pool_is_busy(self):
+        runner = self._runner(pool_size=1)
+
+        async def _run():
+            await runner.run("sleepy")
+            return await asyncio.gather(
+                runner.run("sleepy", args={"seconds": 0.3}),
+                runner.run("sleepy", args={"seconds": 0.0}),
+            )
+
+        first, second = asyncio.run(_run())
+        self.assertLess(first.queue_wait_ms, 100)
+        self.assertGreaterEqual(second.queue_wait_ms, 250)
+
+    def test_hung_skill_is_killed_and_worker_replaced(self):
+        runner = self._runner(pool_size=2, timeout_seconds=1)
+
+        async def _run():
+            await runner.run("sleepy")
+            return await asyncio.gather(
+                runner.run("hung"),
+                runner.run("sleepy", args={"seconds": 0.1}),
+            )
+
+        hung, fast = asyncio.run(_run())
+        self.assertFalse(hung.success)
+        self.assertIn("timed out", hung.error)
+        self.assertTrue(fast.success)
+
+        again = asyncio.run(self._fresh_loop_run(runner))
+        self.assertTrue(again.success)
+
+    async def _fresh_loop_run(self, runner):
+        # pool primitives are bound to one event loop; restart it for a new loop
+        runner.shutdown()
+        return await runner.run("sleepy")
+
+    def test_sandbox_is_enforced_in_workers(self):
+        runner = self._runner(pool_size=1)
+
+        result = asyncio.run(runner.run("evil"))
+
+        self.assertFalse(result.success)
+        self.assertIn("Security violation", result.error)
+        self.assertTrue(result.sandbox_violations)
+
+
+if __name__ == "__main__":
+    unittest.main()
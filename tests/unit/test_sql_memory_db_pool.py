@@ -0,0 +1,171 @@
+"""
+sql-memory/db_pool.py: ein Writer pro DB (FIFO-Lease, reentrant pro Thread),
+read-only WAL-Leser, getunte Pragmas und Rueckgabe statt Schliessen.
+"""
+import sqlite3
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+_SQL_MEMORY = Path(__file__).resolve().parents[2] / "sql-memory"
+if str(_SQL_MEMORY) not in sys.path:
+    sys.path.insert(0, str(_SQL_MEMORY))
+
+import db_pool  # noqa: E402
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    path = str(tmp_path / "memory.db")
+    conn = db_pool.connect(path)
+    try:
+        conn.execute("CREATE TABLE t (id INTEGER PRIMARY KEY, v TEXT)")
+        conn.commit()
+    finally:
+        conn.close()
+    yield path
+    db_pool.close_all()
+
+
+def test_writer_is_reused_and_tuned(db_path):
+    first = db_pool.connect(db_path)
+    first.close()
+    second = db_pool.connect(db_path)
+    try:
+        assert second is first
+        assert second.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        assert second.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+        assert second.execute("PRAGMA busy_timeout").fetchone()[0] > 0
+    finally:
+        second.close()
+
+
+def test_close_rolls_back_and_resets_row_factory(db_path):
+    conn = db_pool.connect(db_path)
+    conn.row_factory = sqlite3.Row
+    conn.execute("INSERT INTO t (v) VALUES ('uncommitted')")
+    conn.close()
+
+    conn = db_pool.connect(db_path)
+    try:
+        assert conn.row_factory is None
+        assert conn.execute("SELECT COUNT(*) FROM t").fetchone()[0] == 0
+    finally:
+        conn.close()
+
+
+def test_reader_is_read_only_and_sees_commits(db_path):
+    writer = db_pool.connect(db_path)
+    writer.execute("INSERT INTO t (v) VALUES ('a')")
+    writer.commit()
+    writer.close()
+
+    reader = db_pool.connect(db_path, readonly=True)
+    try:
+        assert reader.execute("SELECT v FROM t").fetchall() == [("a",)]
+        with pytest.raises(sqlite3.OperationalError):
+            reader.execute("INSERT INTO t (v) VALUES ('b')")
+    finally:
+        reader.close()
+
+
+def test_writer_lease_is_reentrant_per_thread(db_path):
+    outer = db_pool.connect(db_path)
+    inner = db_pool.connect(db_path)
+    assert inner is outer
+    inner.close()
+    # outer lease still held: the inner close must not hand it out
+    assert db_pool._pool_for(db_path)._writer_owner == threading.get_ident()
+    outer.close()
+    assert db_pool._pool_for(db_path)._writer_owner is None
+
+
+def test_reader_under_writer_lease_never_waits_for_the_pool(db_path, monkeypatch):
+    monkeypatch.setattr(db_pool, "_READ_POOL_SIZE", 1)
+    held = db_pool.connect(db_path, readonly=True)  # pool exhausted
+    got = []
+
+    def _write_then_read():
+        writer = db_pool.connect(db_path)
+        try:
+            writer.execute("INSERT INTO t (v) VALUES ('pending')")
+            reader = db_pool.connect(db_path, readonly=True)
+            reader.row_factory = sqlite3.Row
+            got.append((reader is writer, reader.execute("SELECT COUNT(*) FROM t").fetchone()[0]))
+            reader.close()
+            got.append(writer.row_factory)
+            writer.commit()
+        finally:
+            writer.close()
+
+    worker = threading.Thread(target=_write_then_read)
+    worker.start()
+    worker.join(timeout=5)
+    held.close()
+    assert not worker.is_alive()
+    # same connection (sees its own uncommitted insert), outer row_factory restored
+    assert got == [(True, 1), None]
+    assert db_pool._pool_for(db_path)._writer_owner is None
+
+
+def test_writers_are_serialized_across_threads(db_path):
+    active = []
+    overlaps = []
+
+    def _write(i):
+        conn = db_pool.connect(db_path)
+        try:
+            active.append(i)
+            if len(active) > 1:
+                overlaps.append(tuple(active))
+            conn.execute("INSERT INTO t (v) VALUES (?)", (str(i),))
+            time.sleep(0.002)
+            conn.commit()
+            active.remove(i)
+        finally:
+            conn.close()
+
+    threads = [threading.Thread(target=_write, args=(i,)) for i in range(16)]
+    for th in threads:
+        th.start()
+    for th in threads:
+        th.join()
+
+    assert overlaps == []
+    reader = db_pool.connect(db_path, readonly=True)
+    try:
+        assert reader.execute("SELECT COUNT(*) FROM t").fetchone()[0] == 16
+    finally:
+        reader.close()
+    stats = db_pool.get_pool_stats(db_path)
+    assert stats["writer_open"] == 1
+    assert stats["open_readers"] <= db_pool._READ_POOL_SIZE
+
+
+def test_reader_on_missing_file_creates_empty_database(tmp_path):
+    path = str(tmp_path / "fresh.db")
+    conn = db_pool.connect(path, readonly=True)
+    try:
+        assert conn.execute("SELECT COUNT(*) FROM sqlite_master").fetchone()[0] == 0
+    finally:
+        conn.close()
+    db_pool.close_all()
+    assert Path(path).exists()
+
+
+def test_replaced_database_file_gets_fresh_pool(db_path):
+    db_pool.connect(db_path).close()
+    old = db_pool._pool_for(db_path)
+    replacement = db_path + ".new"
+    sqlite3.connect(replacement).close()
+    Path(replacement).replace(db_path)
+
+    conn = db_pool.connect(db_path)
+    try:
+        assert db_pool._pool_for(db_path) is not old
+        assert conn.execute("SELECT name FROM sqlite_master WHERE name='t'").fetchone() is None
+    finally:
+        conn.close()
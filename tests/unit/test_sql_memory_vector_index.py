@@ -0,0 +1,263 @@
+from __future__ import annotations
+
+import importlib
+import json
+import os
+import sqlite3
+import sys
+import tempfile
+import unittest
+from unittest.mock import patch
+
+import numpy as np
+
+
+_HERE = os.path.dirname(os.path.abspath(__file__))
+_REPO_ROOT = os.path.abspath(os.path.join(_HERE, "..", ".."))
+_SQL_MEMORY_PATH = os.path.join(_REPO_ROOT, "sql-memory")
+if _SQL_MEMORY_PATH not in sys.path:
+    sys.path.insert(0, _SQL_MEMORY_PATH)
+
+
+def _insert_raw(db_path, conv, content, embedding_value, version="v1", ctype="fact"):
+    conn = sqlite3.connect(db_path)
+    try:
+        cur = conn.execute(
+            """
+            INSERT INTO embeddings
+            (conversation_id, content, content_type, metadata, embedding,
+             embedding_model, embedding_dim, embedding_version)
+            VALUES (?, ?, ?, '{}', ?, 'm', 2, ?)
+            """,
+            (conv, content, ctype, embedding_value, version),
+        )
+        conn.commit()
+        return cur.lastrowid
+    finally:
+        conn.close()
+
+
+class TestVectorStoreBlobIndex(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.tmp.name, "memory.db")
+        self.vector_store = importlib.import_module("vector_store")
+        self.vs = self.vector_store.VectorStore(self.db_path)
+        self._patches = [
+            patch.object(self.vector_store, "get_embedding", return_value=[1.0, 0.0]),
+            patch.object(self.vector_store, "get_active_embedding_version", return_value="v1"),
+        ]
+        for p in self._patches:
+            p.start()
+
+    def tearDown(self):
+        for p in self._patches:
+            p.stop()
+        self.tmp.cleanup()
+
+    def test_add_stores_packed_float32_blob(self):
+        payload = {
+            "embedding": [0.6, 0.8],
+            "embedding_model": "m",
+            "embedding_dim": 2,
+            "embedding_version": "v1",
+            "runtime_policy": "auto",
+        }
+        with patch.object(self.vector_store, "get_embedding_with_metadata", return_value=payload):
+            row_id = self.vs.add("c1", "blob-row")
+
+        conn = sqlite3.connect(self.db_path)
+        try:
+            kind, raw = conn.execute(
+                "SELECT typeof(embedding), embedding FROM embeddings WHERE id = ?", (row_id,)
+            ).fetchone()
+        finally:
+            conn.close()
+        self.assertEqual(kind, "blob")
+        self.assertEqual(len(raw), 2 * 4)
+
+        results = self.vs.search("q", conversation_id="c1", min_similarity=0.0)
+        self.assertEqual([r["content"] for r in results], ["blob-row"])
+        self.assertAlmostEqual(results[0]["similarity"], 0.6, places=4)
+
+    def test_legacy_json_rows_are_searchable_and_packed(self):
+        _insert_raw(self.db_path, "c1", "legacy", json.dumps([1.0, 0.0]))
+        self.assertEqual(self.vs.search("q", conversation_id="c1")[0]["content"], "legacy")
+
+        packed = self.vs.pack_legacy_embeddings(batch_size=10)
+        self.assertEqual(packed, 1)
+        conn = sqlite3.connect(self.db_path)
+        try:
+            kind = conn.execute("SELECT typeof(embedding) FROM embeddings").fetchone()[0]
+        finally:
+            conn.close()
+        self.assertEqual(kind, "blob")
+        results = self.vs.search("q", conversation_id="c1")
+        self.assertEqual(len(results), 1)
+        self.assertAlmostEqual(results[0]["similarity"], 1.0, places=4)
+
+    def test_unparseable_legacy_rows_are_skipped_and_kept(self):
+        broken = _insert_raw(self.db_path, "c1", "broken", "[1.0, oops")
+        good = _insert_raw(self.db_path, "c1", "legacy", json.dumps([1.0, 0.0]))
+
+        with self.assertLogs(self.vector_store.logger, level="WARNING") as logs:
+            packed = self.vs.pack_legacy_embeddings(batch_size=1)
+        self.assertEqual(packed, 1)
+        self.assertIn(str(broken), logs.output[0])
+        conn = sqlite3.connect(self.db_path)
+        try:
+            rows = dict(conn.execute("SELECT id, embedding FROM embeddings").fetchall())
+        finally:
+            conn.close()
+        self.assertEqual(rows[broken], "[1.0, oops")
+        self.assertIsInstance(rows[good], bytes)
+        self.assertEqual(self.vs.pack_legacy_embeddings(batch_size=1), 0)
+
+    def test_index_is_built_by_warmup_before_first_search(self):
+        _insert_raw(self.db_path, "c1", "warm", self.vector_store.pack_embedding([1.0, 0.0]))
+        self.assertFalse(self.vs.index.stats()["loaded"])
+
+        self.vs.start_index_warmup().join(timeout=10)
+        self.assertTrue(self.vs.index.stats()["loaded"])
+        with patch.object(self.vs.index, "rebuild", side_effect=AssertionError("rebuild in search")):
+            self.assertEqual(self.vs.search("q", conversation_id="c1")[0]["content"], "warm")
+
+    def test_index_follows_external_writes_and_deletes(self):
+        first = _insert_raw(self.db_path, "c1", "first", self.vector_store.pack_embedding([1.0, 0.0]))
+        self.assertEqual(len(self.vs.search("q", conversation_id="c1")), 1)
+
+        # Writer outside the VectorStore (e.g. archive) is picked up via changelog.
+        _insert_raw(self.db_path, "global", "shared", self.vector_store.pack_embedding([0.9, 0.1]))
+        _insert_raw(self.db_path, "c2", "other-conv", self.vector_store.pack_embedding([1.0, 0.0]))
+        contents = [r["content"] for r in self.vs.search("q", conversation_id="c1")]
+        self.assertEqual(contents, ["first", "shared"])
+
+        self.assertEqual(self.vs.delete([first]), 1)
+        contents = [r["content"] for r in self.vs.search("q", conversation_id="c1")]
+        self.assertEqual(contents, ["shared"])
+
+    def test_content_type_and_version_partitions_are_filtered(self):
+        blob = self.vector_store.pack_embedding([1.0, 0.0])
+        _insert_raw(self.db_path, "c1", "fact-row", blob, ctype="fact")
+        _insert_raw(self.db_path, "c1", "skill-row", blob, ctype="skill")
+        _insert_raw(self.db_path, "c1", "old-version", blob, version="v0")
+
+        only_skill = self.vs.search("q", conversation_id="c1", content_type="skill")
+        self.assertEqual([r["content"] for r in only_skill], ["skill-row"])
+        active = self.vs.search("q", conversation_id="c1")
+        self.assertEqual(sorted(r["content"] for r in active), ["fact-row", "skill-row"])
+        mixed = self.vs.search("q", conversation_id="c1", allow_mixed_versions=True)
+        self.assertEqual(len(mixed), 3)
+
+    def test_changelog_stays_bounded_on_routine_writes(self):
+        vector_index = importlib.import_module("vector_index")
+        payload = {
+            "embedding": [1.0, 0.0],
+            "embedding_model": "m",
+            "embedding_dim": 2,
+            "embedding_version": "v1",
+            "runtime_policy": "auto",
+        }
+        with patch.object(self.vector_store, "get_embedding_with_metadata", return_value=payload), \
+                patch.object(vector_index, "_PRUNE_EVERY", 10), \
+                patch.object(vector_index, "_CHANGELOG_RETAIN", 5), \
+                patch.object(vector_index, "_SAVE_EVERY", 10):
+            for i in range(100):
+                self.vs.add("c1", f"row-{i}")
+                self.vs.search("q", conversation_id="c1", limit=200)
+
+        conn = sqlite3.connect(self.db_path)
+        try:
+            changes = conn.execute("SELECT COUNT(*) FROM embedding_changes").fetchone()[0]
+        finally:
+            conn.close()
+        self.assertLessEqual(changes, 30)
+
+        reopened = self.vector_store.VectorStore(self.db_path)
+        with patch.object(reopened.index, "rebuild", side_effect=AssertionError("snapshot not used")):
+            results = reopened.search("q", conversation_id="c1", limit=200)
+        self.assertEqual(len(results), 100)
+
+
+class TestVectorIndexIvf(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.tmp.name, "memory.db")
+        self.vector_index = importlib.import_module("vector_index")
+        importlib.import_module("vector_store").VectorStore(self.db_path, index_dir="")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _fill(self, n=3000, dim=32, clusters=24, seed=7):
+        rng = np.random.default_rng(seed)
+        centers = rng.normal(size=(clusters, dim))
+        vecs = centers[rng.integers(0, clusters, size=n)] + 0.15 * rng.normal(size=(n, dim))
+        conn = sqlite3.connect(self.db_path)
+        try:
+            conn.executemany(
+                "INSERT INTO embeddings (conversation_id, content, content_type, embedding, embedding_version) "
+                "VALUES ('c1', ?, 'fact', ?, 'v1')",
+                [(f"row-{i}", self.vector_index.pack_embedding(v)) for i, v in enumerate(vecs)],
+            )
+            conn.commit()
+        finally:
+            conn.close()
+        return vecs
+
+    def test_ivf_recall_matches_bruteforce_topk(self):
+        vecs = self._fill()
+        with patch.object(self.vector_index, "_IVF_MIN_ROWS", 1000):
+            index = self.vector_index.VectorIndex(index_dir=None, nprobe=8)
+            conn = sqlite3.connect(self.db_path)
+            try:
+                index.sync(conn)
+            finally:
+                conn.close()
+        self.assertEqual(index.stats()["ivf_partitions"], 1)
+
+        normed = vecs / np.linalg.norm(vecs, axis=1, keepdims=True)
+        hits, total = 0, 0
+        for qi in range(0, 3000, 150):
+            q = vecs[qi]
+            exact = set((np.argsort(-(normed @ (q / np.linalg.norm(q))))[:10] + 1).tolist())
+            got = {entry_id for entry_id, _ in index.search(q, lambda k: True, 10, -1.0)}
+            hits += len(exact & got)
+            total += 10
+        self.assertGreaterEqual(hits / total, 0.9)
+
+    def test_search_batch_matches_single_search_with_id_bound(self):
+        vecs = self._fill(n=400)
+        part = self.vector_index._Partition(vecs.shape[1])
+        ids = np.arange(1, len(vecs) + 1, dtype=np.int64)
+        part.add_many(ids, np.vstack([self.vector_index._normalize(v) for v in vecs]))
+
+        queries = np.vstack([self.vector_index._normalize(v) for v in vecs[::40]])
+        below = ids[::40]
+        batched = part.search_batch(queries, 5, 0.0, nprobe=8, below=below, block=3)
+        for q, bound, (hit_ids, scores) in zip(queries, below, batched):
+            all_ids, all_scores = part.search(q, 400, 0.0, 8)
+            order = np.argsort(-all_scores, kind="stable")
+            single = [(int(all_ids[i]), 0) for i in order if all_ids[i] < bound][:5]
+            got = sorted(zip(hit_ids.tolist(), scores.tolist()), key=lambda x: -x[1])
+            self.assertEqual([i for i, _ in got], [i for i, _ in single])
+
+    def test_snapshot_reload_replays_changelog(self):
+        self._fill(n=200)
+        conn = sqlite3.connect(self.db_path)
+        try:
+            first = self.vector_index.VectorIndex(index_dir=os.path.join(self.tmp.name, "idx"))
+            first.sync(conn)
+            conn.execute("DELETE FROM embeddings WHERE id <= 50")
+            conn.commit()
+
+            second = self.vector_index.VectorIndex(index_dir=os.path.join(self.tmp.name, "idx"))
+            with patch.object(second, "rebuild", side_effect=AssertionError("snapshot not used")):
+                second.sync(conn)
+        finally:
+            conn.close()
+        self.assertEqual(second.stats()["vectors"], 150)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,172 @@
+import json
+import sqlite3
+import threading
+import time
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+from core.tools.fast_lane.definitions import WorkspaceEventListTool, WorkspaceEventSaveTool
+from core.tools.fast_lane.workspace_event_store import WorkspaceEventStore
+
+
+def _store(tmp_path, **kwargs) -> WorkspaceEventStore:
+    return WorkspaceEventStore(str(tmp_path / "memory.db"), **kwargs)
+
+
+def test_store_creates_indexes_and_lists_recent(tmp_path):
+    store = _store(tmp_path)
+    first = store.save("conv-a", "observation", {"n": 1})
+    second = store.save("conv-b", "tool_result", {"n": 2})
+    third = store.save("conv-a", "tool_result", {"n": 3})
+
+    assert first < second < third
+    recent = store.list_recent(conversation_id="conv-a")
+    assert [e["id"] for e in recent] == [third, first]
+    assert recent[0]["event_data"] == {"n": 3}
+    assert [e["id"] for e in store.list_recent(event_type="tool_result", limit=1)] == [third]
+
+    with sqlite3.connect(store.db_path) as conn:
+        indexes = {row[1] for row in conn.execute("PRAGMA index_list(workspace_events)")}
+        plan = " ".join(
+            str(row[-1])
+            for row in conn.execute(
+                "EXPLAIN QUERY PLAN SELECT id FROM workspace_events "
+                "WHERE conversation_id = ? AND created_at >= ? ORDER BY created_at DESC",
+                ("conv-a", "2026-01-01"),
+            )
+        )
+    assert {"idx_workspace_events_conv_created", "idx_workspace_events_conv_id"} <= indexes
+    assert "idx_workspace_events_conv_created" in plan
+
+
+def test_concurrent_saves_are_group_committed_and_feed_follows_high_water(tmp_path):
+    store = _store(tmp_path, batch_wait_ms=20)
+    ids = []
+    lock = threading.Lock()
+
+    def _save(i):
+        event_id = store.save("conv-feed", "observation", {"i": i})
+        with lock:
+            ids.append(event_id)
+
+    threads = [threading.Thread(target=_save, args=(i,)) for i in range(40)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert len(set(ids)) == 40
+    assert store.stats["saved"] == 40
+    assert store.stats["batches"] < 40
+
+    mark = store.high_water("conv-feed")
+    assert mark == max(ids)
+    assert store.list_since("conv-feed", mark) == []
+    newer = store.save("conv-feed", "observation", {"i": "new"})
+    store.save("conv-other", "observation", {})
+    feed = store.list_since("conv-feed", mark)
+    assert [e["id"] for e in feed] == [newer]
+    assert [e["id"] for e in store.list_since("conv-feed", 0, limit=3)] == sorted(ids)[:3]
+    assert store.high_water("missing") == 0
+
+
+def test_prune_drops_whole_days_beyond_retention(tmp_path):
+    store = _store(tmp_path, retention_days=3)
+    store.save("conv", "observation", {})
+    now = datetime(2026, 5, 20, 12, 0)
+    with sqlite3.connect(store.db_path) as conn:
+        for day, hour in ((10, 23), (16, 23), (17, 0), (19, 8)):
+            conn.execute(
+                "INSERT INTO workspace_events (conversation_id, event_type, event_data, created_at) "
+                "VALUES ('conv', 'old', '{}', ?)",
+                (datetime(2026, 5, day, hour, 30).isoformat(),),
+            )
+
+    # cutoff is the start of 2026-05-17: the 16th and older go, the 17th stays
+    assert store.prune(now=now) == 2
+    with sqlite3.connect(store.db_path) as conn:
+        days = [row[0][:10] for row in conn.execute(
+            "SELECT created_at FROM workspace_events WHERE event_type = 'old' ORDER BY id"
+        )]
+    assert days == ["2026-05-17", "2026-05-19"]
+    assert WorkspaceEventStore(store.db_path, retention_days=0).prune(now=now + timedelta(days=30)) == 0
+
+
+def test_background_prune_yields_to_queued_saves(tmp_path):
+    from core.tools.fast_lane import workspace_event_store as mod
+
+    assert _store(tmp_path)._retention_days == 0  # opt-in
+    store = _store(tmp_path, retention_days=1)
+    store.save("conv", "observation", {})
+    store._pruned_day = ""  # let the next save arm today's prune
+    with sqlite3.connect(store.db_path) as conn:
+        conn.executemany(
+            "INSERT INTO workspace_events (conversation_id, event_type, event_data, created_at) "
+            "VALUES ('conv', 'old', '{}', '2020-01-01T00:00:00')",
+            [()] * 50,
+        )
+
+    delete_chunk = WorkspaceEventStore._delete_chunk
+
+    def _slow_chunk(conn, cutoff_day):
+        time.sleep(0.05)
+        return delete_chunk(conn, cutoff_day)
+
+    with patch.object(mod, "_PRUNE_CHUNK", 10), patch.object(
+        WorkspaceEventStore, "_delete_chunk", staticmethod(_slow_chunk)
+    ):
+        store.save("conv", "observation", {})  # arms the prune (6 chunks, ~0.3s)
+        started = time.perf_counter()
+        store.save("conv", "observation", {})
+        assert time.perf_counter() - started < 0.2  # waits for at most one chunk
+        deadline = time.monotonic() + 5
+        while store.stats["pruned"] < 50 and time.monotonic() < deadline:
+            time.sleep(0.02)
+
+    assert store.stats["pruned"] == 50
+    assert store.stats["saved"] == 3
+
+
+def test_fast_lane_tools_use_store_and_since_id_feed(tmp_path):
+    store = _store(tmp_path)
+    with patch("core.tools.fast_lane.definitions.get_workspace_event_store", return_value=store):
+        saved = json.loads(WorkspaceEventSaveTool(
+            conversation_id="conv-tool", event_type="observation", event_data={"k": "v"},
+        ).execute())
+        second = json.loads(WorkspaceEventSaveTool(conversation_id="conv-tool").execute())
+
+        listed = WorkspaceEventListTool(conversation_id="conv-tool").execute()
+        feed = WorkspaceEventListTool(conversation_id="conv-tool", since_id=saved["id"]).execute()
+
+    assert saved["status"] == "saved"
+    assert [e["id"] for e in listed] == [second["id"], saved["id"]]
+    assert [e["id"] for e in feed] == [second["id"]]
+
+
+def test_small_model_context_reader_follows_change_feed(tmp_path):
+    from core.context_manager import _EVENT_WINDOWS, ContextManager
+
+    store = _store(tmp_path)
+    calls = []
+
+    class _Hub:
+        def call_tool(self, name, args):
+            calls.append(dict(args))
+            return WorkspaceEventListTool(**args).execute()
+
+    for i in range(120):
+        store.save("conv-r", "observation", {"i": i})
+    store.save("conv-other", "observation", {})
+
+    _EVENT_WINDOWS.clear()
+    cm = ContextManager.__new__(ContextManager)
+    with patch("core.tools.fast_lane.definitions.get_workspace_event_store", return_value=store):
+        for turn in range(5):
+            store.save("conv-r", "tool_result", {"turn": turn})
+            calls.clear()
+            events = cm._fetch_small_model_events(_Hub(), "conv-r")
+            expected = store.list_recent(conversation_id="conv-r", limit=100)
+            assert [e["id"] for e in events] == [e["id"] for e in expected]
+            assert len(calls) == 1
+            assert ("since_id" in calls[0]) == (turn > 0)
+    _EVENT_WINDOWS.clear()
@@ -6,6 +6,7 @@ Tests:
 - GraphStore.add_node() with confidence parameter
 - GraphStore.get_node() returns confidence
 - GraphStore.graph_walk() sorts by confidence DESC
+- GraphStore.graph_walk() batched frontier expansion matches the per-node walk
 - build_node_with_edges() passes confidence + weight_boost
 """
 
@@ -146,6 +147,180 @@ class TestGraphWalkConfidenceSorting:
             assert r.get("confidence", 0.5) >= 0.5
 
 
+class TestGraphWalkBatchedExpansion:
+    """graph_walk expands whole frontiers per depth on one connection."""
+
+    @staticmethod
+    def _legacy_walk(store, start_node_ids, depth, limit):
+        visited, results, level = set(), [], list(start_node_ids)
+        for d in range(depth):
+            next_level = []
+            for node_id in level:
+                if node_id in visited:
+                    continue
+                visited.add(node_id)
+                node = store.get_node(node_id)
+                if node:
+                    node["depth"] = d
+                    results.append(node)
+                for nb in store.get_neighbors(node_id):
+                    if nb["node_id"] not in visited:
+                        next_level.append(nb["node_id"])
+            level = next_level
+            if len(results) >= limit:
+                break
+        results.sort(key=lambda n: (-n.get("confidence", 0.5), n.get("depth", 0)))
+        return results[:limit]
+
+    def test_matches_per_node_walk_on_random_graph(self, graph_store):
+        import random
+
+        rng = random.Random(7)
+        ids = [
+            graph_store.add_node("fact", f"n{i}", confidence=round(0.1 + i * 0.0071, 4))
+            for i in range(120)
+        ]
+        rng.shuffle(ids)
+        for _ in range(360):
+            a, b = rng.sample(ids, 2)
+            graph_store.add_edge(a, b, "semantic", weight=round(rng.random(), 3))
+
+        for seeds, depth, limit in [(ids[:5], 2, 10), (ids[5:7], 3, 25), (ids[:1], 4, 200)]:
+            expected = self._legacy_walk(graph_store, seeds, depth, limit)
+            got = graph_store.graph_walk(seeds, depth=depth, limit=limit)
+            assert [(n["id"], n["depth"]) for n in got] == [(n["id"], n["depth"]) for n in expected]
+            assert got == expected
+
+        # Gleiche Confidence + wenige Weight-Stufen: Ranking haengt allein an
+        # der Frontier-Reihenfolge des Per-Node-Walks.
+        flat = [graph_store.add_node("fact", f"flat{i}", confidence=0.5) for i in range(60)]
+        rng.shuffle(flat)
+        for _ in range(180):
+            a, b = rng.sample(flat, 2)
+            graph_store.add_edge(a, b, "semantic", weight=rng.choice([0.3, 0.6, 0.9]))
+
+        for seeds, depth, limit in [(flat[:3], 2, 8), (flat[3:5], 3, 20), (flat[:1], 4, 100)]:
+            expected = self._legacy_walk(graph_store, seeds, depth, limit)
+            got = graph_store.graph_walk(seeds, depth=depth, limit=limit)
+            assert [(n["id"], n["depth"]) for n in got] == [(n["id"], n["depth"]) for n in expected]
+            assert got == expected
+
+    def test_single_connection_per_walk(self, graph_store):
+        n1 = graph_store.add_node("fact", "a")
+        n2 = graph_store.add_node("fact", "b")
+        n3 = graph_store.add_node("fact", "c")
+        graph_store.add_edge(n1, n2, "temporal")
+        graph_store.add_edge(n2, n3, "temporal")
+
+        import graph.graph_store as gs_module
+        real_connect = gs_module.db_pool.connect
+        with patch.object(gs_module.db_pool, "connect", side_effect=real_connect) as spy:
+            results = graph_store.graph_walk([n1], depth=3, limit=10)
+
+        assert spy.call_count == 1
+        assert [r["id"] for r in results] == [n1, n2, n3]
+
+
+class TestGraphEmbeddingLinks:
+    """graph_nodes.embedding_id links nodes to their embeddings row."""
+
+    @staticmethod
+    def _add_embedding_row(db_path, content, vec):
+        import struct
+        conn = sqlite3.connect(db_path)
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS embeddings (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                conversation_id TEXT, content TEXT, embedding BLOB
+            )
+        """)
+        cur = conn.execute(
+            "INSERT INTO embeddings (conversation_id, content, embedding) VALUES ('c', ?, ?)",
+            (content, struct.pack(f"<{len(vec)}f", *vec)),
+        )
+        conn.commit()
+        eid = cur.lastrowid
+        conn.close()
+        return eid
+
+    def test_seeds_resolve_by_embedding_id(self, graph_store):
+        n1 = graph_store.add_node("fact", "alpha", embedding_id=41)
+        graph_store.add_node("skill", "beta")
+        assert graph_store.get_node_ids_for_embeddings([41, 99]) == {41: n1}
+
+    def test_backfill_links_legacy_nodes_by_content(self, graph_store):
+        node_id = graph_store.add_node("fact", "Danny likes pizza")
+        eid = self._add_embedding_row(graph_store.db_path, "Danny likes pizza", [1.0, 0.0])
+
+        assert graph_store.backfill_embedding_links() == 1
+        assert graph_store.get_node_ids_for_embeddings([eid]) == {eid: node_id}
+        assert graph_store.backfill_embedding_links() == 0
+
+    def test_backfill_watermark_skips_checked_nodes(self, graph_store):
+        old = graph_store.add_node("fact", "no embedding yet")
+        self._add_embedding_row(graph_store.db_path, "unrelated", [1.0, 0.0])
+        assert graph_store.backfill_embedding_links() == 0
+
+        # Bereits geprüfte Nodes werden beim nächsten Lauf nicht erneut gescannt.
+        self._add_embedding_row(graph_store.db_path, "no embedding yet", [1.0, 0.0])
+        newer = graph_store.add_node("fact", "newer node")
+        eid = self._add_embedding_row(graph_store.db_path, "newer node", [0.0, 1.0])
+        assert graph_store.backfill_embedding_links() == 1
+        assert graph_store.get_node_ids_for_embeddings([eid]) == {eid: newer}
+        assert graph_store.get_node(old) is not None
+
+    def test_get_graph_store_backfills_in_background(self, initialized_db):
+        import threading
+        import graph.graph_store as gs_module
+
+        release = threading.Event()
+        done = threading.Event()
+
+        def _slow_backfill(self, batch_size=1000):
+            release.wait(5)
+            done.set()
+            return 0
+
+        gs_module._graph_store = None
+        try:
+            with patch.object(gs_module.GraphStore, "backfill_embedding_links", _slow_backfill):
+                store = gs_module.get_graph_store(initialized_db)
+                assert isinstance(store, gs_module.GraphStore)
+                assert not done.is_set()
+                release.set()
+                assert done.wait(5)
+        finally:
+            gs_module._graph_store = None
+
+    def test_node_vectors_fall_back_to_linked_blob(self, graph_store):
+        eid = self._add_embedding_row(graph_store.db_path, "blob only", [0.0, 1.0])
+        linked = graph_store.add_node("fact", "blob only", embedding_id=eid)
+        own = graph_store.add_node("fact", "own vec", embedding=[1.0, 0.0])
+
+        vectors = graph_store.get_node_vectors([linked, own])
+        assert vectors == {linked: [0.0, 1.0], own: [1.0, 0.0]}
+
+    def test_resolve_seeds_and_hybrid_rank(self, graph_store):
+        from memory_mcp.tools import _hybrid_rank, _resolve_seed_node_ids
+
+        linked = graph_store.add_node("fact", "linked", embedding_id=7)
+        legacy = graph_store.add_node("fact", "legacy text")
+        seeds = [
+            {"id": 7, "content": "linked"},
+            {"id": 8, "content": "legacy text"},
+            {"id": 9, "content": "no node"},
+        ]
+        assert _resolve_seed_node_ids(graph_store, seeds) == [linked, legacy]
+
+        nodes = [
+            {"id": 1, "content": "near", "source_type": "fact", "depth": 1, "confidence": 0.5},
+            {"id": 2, "content": "far", "source_type": "fact", "depth": 0, "confidence": 0.5},
+        ]
+        ranked = _hybrid_rank(nodes, {1: [1.0, 0.0], 2: [0.0, 1.0]}, [1.0, 0.0], alpha=0.7)
+        assert [r["node_id"] for r in ranked] == [1, 2]
+        assert ranked[0]["similarity"] == 1.0
+
+
 class TestGraphBuilderWeightBoost:
     """Test build_node_with_edges with weight_boost and confidence params."""
 
@@ -254,3 +429,135 @@ class TestGraphBuilderWeightBoost:
             # weight should be min(1.0, 1.0 + 0.85) = 1.0 (capped)
             assert temporal[0]["weight"] == 1.0
             gs_module._graph_store = None
+
+
+class TestGraphBatchEdgeBuilding:
+    """Semantic-/Cooccur-Edges über k-NN-Index, Trigram-FTS und Batch-Upserts."""
+
+    @staticmethod
+    def _builder(graph_store):
+        import graph.graph_store as gs_module
+        gs_module._graph_store = graph_store
+        from graph import graph_builder
+        return graph_builder
+
+    @staticmethod
+    def _random_vectors(n, dim=16, seed=3):
+        import numpy as np
+        rng = np.random.default_rng(seed)
+        centers = rng.normal(size=(6, dim))
+        vecs = centers[rng.integers(0, 6, size=n)] + 0.3 * rng.normal(size=(n, dim))
+        return [v.tolist() for v in vecs]
+
+    @staticmethod
+    def _edge_set(db_path, edge_type):
+        conn = sqlite3.connect(db_path)
+        try:
+            rows = conn.execute(
+                "SELECT src_node_id, dst_node_id, weight FROM graph_edges WHERE edge_type = ?",
+                (edge_type,),
+            ).fetchall()
+        finally:
+            conn.close()
+        return {(src, dst): round(w, 4) for src, dst, w in rows}
+
+    def test_semantic_edges_reach_beyond_recent_window(self, graph_store):
+        builder = self._builder(graph_store)
+        target = [1.0, 0.0, 0.0]
+        old = graph_store.add_node("fact", "old match", embedding=target)
+        for i in range(150):
+            graph_store.add_node("fact", f"noise {i}", embedding=[0.0, 1.0, (i % 7) / 10])
+
+        new = builder.build_node_with_edges("fact", "new match", embedding=target)
+
+        semantic = self._edge_set(graph_store.db_path, "semantic")
+        assert (new, old) in semantic
+        assert semantic[(new, old)] == 1.0
+
+    def test_find_nodes_containing_matches_like(self, graph_store):
+        contents = ["Docker setup", "dockerd restart", "nginx proxy", "Nginx TLS", "dns", "a docker b"]
+        ids = [graph_store.add_node("fact", c) for c in contents]
+
+        keys = ["docker", "nginx", "dns", "zz"]
+        found = graph_store.find_nodes_containing(keys, exclude_id=ids[0], limit=5)
+
+        conn = sqlite3.connect(graph_store.db_path)
+        try:
+            for key in keys:
+                expected = [r[0] for r in conn.execute(
+                    "SELECT id FROM graph_nodes WHERE content LIKE ? AND id != ? ORDER BY id LIMIT 5",
+                    (f"%{key}%", ids[0]),
+                )]
+                assert found.get(key, []) == expected, key
+        finally:
+            conn.close()
+
+    def test_cooccur_edges_accumulate_like_add_edge(self, graph_store):
+        builder = self._builder(graph_store)
+        target = graph_store.add_node("fact", "docker nginx")
+
+        node_id = builder.build_node_with_edges(
+            "fact", "new", related_keys=["docker", "nginx"]
+        )
+
+        cooccur = self._edge_set(graph_store.db_path, "cooccur")
+        # beide Keys treffen denselben Node → Gewicht addiert sich wie bei add_edge
+        assert cooccur == {(node_id, target): round(2 * builder.COOCCUR_WEIGHT, 4)}
+
+    def test_upsert_edges_caps_weight_and_replace_edges_overwrites(self, graph_store):
+        a = graph_store.add_node("fact", "a")
+        b = graph_store.add_node("fact", "b")
+        graph_store.upsert_edges([(a, b, "semantic", 0.6), (a, b, "semantic", 0.6)])
+        assert self._edge_set(graph_store.db_path, "semantic") == {(a, b): 1.0}
+
+        graph_store.replace_edges("semantic", [a], [(a, b, "semantic", 0.8)])
+        assert self._edge_set(graph_store.db_path, "semantic") == {(a, b): 0.8}
+
+    def test_rebuild_matches_bruteforce_and_resumes(self, graph_store):
+        import numpy as np
+        builder = self._builder(graph_store)
+        vecs = self._random_vectors(60)
+        ids = [graph_store.add_node("fact", f"n{i}", embedding=v) for i, v in enumerate(vecs)]
+        graph_store.add_node("fact", "no embedding")
+
+        normed = np.asarray(vecs) / np.linalg.norm(vecs, axis=1, keepdims=True)
+        sims = normed @ normed.T
+        expected = {
+            (ids[i], ids[j]): round(float(sims[i, j]), 4)
+            for i in range(len(ids)) for j in range(i)
+            if sims[i, j] >= builder.SEMANTIC_THRESHOLD
+        }
+
+        first = builder.rebuild_semantic_edges(chunk_size=7, max_nodes=20)
+        assert first["processed"] == 20
+        rest = builder.rebuild_semantic_edges(chunk_size=9, start_after_id=first["last_node_id"])
+        assert first["processed"] + rest["processed"] == len(ids) + 1
+
+        got = self._edge_set(graph_store.db_path, "semantic")
+        assert got.keys() == expected.keys()
+        assert all(abs(got[k] - expected[k]) < 1e-3 for k in expected)
+
+        # zweiter Lauf ist idempotent (ersetzt statt zu akkumulieren)
+        builder.rebuild_semantic_edges(chunk_size=50)
+        assert self._edge_set(graph_store.db_path, "semantic").keys() == expected.keys()
+
+    def test_edge_key_migration_dedupes_existing_edges(self, initialized_db):
+        from graph.graph_store import GraphStore
+        store = GraphStore(initialized_db)
+        a = store.add_node("fact", "a")
+        b = store.add_node("fact", "b")
+
+        conn = sqlite3.connect(initialized_db)
+        conn.execute("DROP INDEX IF EXISTS idx_edges_key")
+        conn.executemany(
+            "INSERT INTO graph_edges (src_node_id, dst_node_id, edge_type, weight) VALUES (?, ?, 'cooccur', ?)",
+            [(a, b, 0.2), (a, b, 0.7), (a, b, 0.3), (b, a, 0.5)],
+        )
+        conn.commit()
+        conn.close()
+
+        GraphStore(initialized_db)
+        # duplicates collapse into one row that keeps the strongest weight
+        assert self._edge_set(initialized_db, "cooccur") == {(a, b): 0.7, (b, a): 0.5}
+        store.upsert_edges([(a, b, "cooccur", 0.2)])
+        assert self._edge_set(initialized_db, "cooccur")[(a, b)] == pytest.approx(0.9)
@@ -428,6 +428,12 @@ async def run_skill(request: RunSkillRequest):
 
 
 
+@app.on_event("shutdown")
+def shutdown_skill_runner():
+    """Stop pooled skill workers (SKILL_EXECUTION_MODE=pool)."""
+    get_skill_runner().shutdown()
+
+
 @app.post("/v1/skills/install")
 async def install_skill_from_registry(request: InstallSkillRequest):
     """
@@ -7,18 +7,30 @@ Security Features:
 - Timeout protection
 - Resource monitoring
 - Audit logging
+
+Performance:
+- Compiled code objects are cached per entrypoint (path + mtime + content hash);
+  every run still executes the module in fresh sandbox globals.
+- SKILL_EXECUTION_MODE=pool runs skills in pre-warmed worker processes with
+  per-call timeouts: concurrent runs execute in parallel, a hung skill only
+  costs its worker (killed and replaced), never the event loop.
 """
 
 import importlib.util
 import asyncio
+import hashlib
+import multiprocessing
 import os
 import sys
 import signal
 import json
 import re
+import time
 import urllib.request
+from collections import OrderedDict
 from pathlib import Path
-from typing import Dict, Any, Optional, Callable
+from types import CodeType
+from typing import Dict, Any, Optional, Callable, List, Tuple
 from dataclasses import dataclass
 from contextlib import contextmanager
 import threading
@@ -35,6 +47,9 @@ class ExecutionResult:
     error: Optional[str] = None
     execution_time_ms: float = 0
     sandbox_violations: list = None
+    queue_wait_ms: float = 0
+    load_ms: float = 0
+    run_ms: float = 0
     
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -42,7 +57,10 @@ class ExecutionResult:
             "result": self.result,
             "error": self.error,
             "execution_time_ms": self.execution_time_ms,
-            "sandbox_violations": self.sandbox_violations or []
+            "sandbox_violations": self.sandbox_violations or [],
+            "queue_wait_ms": self.queue_wait_ms,
+            "load_ms": self.load_ms,
+            "run_ms": self.run_ms,
         }
 
 
@@ -97,6 +115,13 @@ BLOCKED_MODULES = {
 
 EXECUTOR_PYTHON_VENV = os.getenv("EXECUTOR_PYTHON_VENV", "/tmp/trion-tool-executor-venv")
 
+# Execution: "inline" (in the API process) or "pool" (pre-warmed worker processes)
+SKILL_EXECUTION_MODE = os.getenv("SKILL_EXECUTION_MODE", "inline").strip().lower()
+_WORKER_POOL_SIZE = max(1, int(os.getenv("SKILL_WORKER_POOL_SIZE", "2")))
+_WORKER_MAX_MEMORY_MB = max(0, int(os.getenv("SKILL_WORKER_MAX_MEMORY_MB", "0")))
+_WORKER_START_METHOD = os.getenv("SKILL_WORKER_START_METHOD", "fork")
+_CODE_CACHE_MAX_ENTRIES = max(1, int(os.getenv("SKILL_CODE_CACHE_MAX_ENTRIES", "256")))
+
 
 def _venv_site_packages_paths(venv_dir: str) -> list[str]:
     """Return candidate site-packages paths for the configured venv."""
@@ -286,15 +311,81 @@ def timeout_context(seconds: int):
         signal.signal(signal.SIGALRM, old_handler)
 
 
+class CompiledSkillCache:
+    """
+    Code-object cache for skill entrypoints.
+
+    An unchanged (mtime, size) is served without touching the file; on a
+    changed stat the source is re-read and only recompiled if its sha256
+    differs. Module execution is NOT cached.
+    """
+
+    def __init__(self, max_entries: int = _CODE_CACHE_MAX_ENTRIES):
+        self.max_entries = max(1, int(max_entries))
+        self._lock = threading.Lock()
+        # path -> (mtime_ns, size, sha256, code)
+        self._entries: "OrderedDict[str, Tuple[int, int, str, CodeType]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, entrypoint: Path) -> CodeType:
+        key = str(entrypoint)
+        stat = os.stat(key)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == stat.st_mtime_ns and entry[1] == stat.st_size:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[3]
+
+        with open(entrypoint, 'r') as f:
+            source_code = f.read()
+        digest = hashlib.sha256(source_code.encode("utf-8")).hexdigest()
+        if entry is not None and entry[2] == digest:
+            code = entry[3]
+        else:
+            code = compile(source_code, key, 'exec')
+
+        with self._lock:
+            if entry is not None and entry[3] is code:
+                self.hits += 1
+            else:
+                self.misses += 1
+            self._entries[key] = (stat.st_mtime_ns, stat.st_size, digest, code)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return code
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {"entries": len(self._entries), "hits": self.hits, "misses": self.misses}
+
+
 class SkillRunner:
     """Secure skill execution engine."""
     
-    def __init__(self, skills_dir: str = "/skills", timeout_seconds: int = 30):
+    def __init__(
+        self,
+        skills_dir: str = "/skills",
+        timeout_seconds: int = 30,
+        execution_mode: str = "inline",
+        pool_size: int = _WORKER_POOL_SIZE,
+    ):
         self.skills_dir = Path(skills_dir)
         self.timeout_seconds = timeout_seconds
+        self.execution_mode = "pool" if str(execution_mode).lower() == "pool" else "inline"
         self._inject_executor_venv_site_packages()
         self.restricted_builtins = create_restricted_builtins()
         self.restricted_import = create_restricted_import()
+        self.code_cache = CompiledSkillCache()
+        self._pool: Optional["SkillWorkerPool"] = None
+        if self.execution_mode == "pool":
+            self._pool = SkillWorkerPool(
+                skills_dir=str(skills_dir),
+                size=pool_size,
+                timeout_seconds=timeout_seconds,
+            )
 
     def _inject_executor_venv_site_packages(self):
         """
@@ -320,9 +411,8 @@ class SkillRunner:
     def _load_module_sandboxed(self, skill_name: str, entrypoint: Path) -> Any:
         """Load a skill module with sandbox restrictions."""
         
-        # Read the source code
-        with open(entrypoint, 'r') as f:
-            source_code = f.read()
+        # Compiled code object (cached by path + mtime + content hash)
+        compiled = self.code_cache.get(entrypoint)
         
         # Inject get_secret() — resolves encrypted API keys at runtime
         _secrets_resolve_url = os.getenv(
@@ -387,12 +477,78 @@ class SkillRunner:
         # Add restricted import to builtins
         self.restricted_builtins['__import__'] = self.restricted_import
         
-        # Compile and execute in sandbox
-        compiled = compile(source_code, str(entrypoint), 'exec')
+        # Execute in sandbox (fresh globals per run)
         exec(compiled, restricted_globals)
         
         return restricted_globals
     
+    def _resolve_action(
+        self, module_globals: Dict[str, Any], skill_name: str, action: str
+    ) -> Tuple[Optional[Callable], Optional[ExecutionResult]]:
+        if action not in module_globals:
+            return None, ExecutionResult(
+                success=False,
+                error=f"Action '{action}' not found in skill '{skill_name}'"
+            )
+        func = module_globals[action]
+        if not callable(func):
+            return None, ExecutionResult(
+                success=False,
+                error=f"'{action}' is not callable"
+            )
+        return func, None
+
+    def _error_result(
+        self,
+        skill_name: str,
+        exc: BaseException,
+        start_time: float,
+        violations: list,
+    ) -> ExecutionResult:
+        """Map an execution exception to an ExecutionResult (+ audit event)."""
+        if isinstance(exc, TimeoutError):
+            EventLogger.emit("skill_run_timeout", {
+                "skill": skill_name,
+                "timeout_seconds": self.timeout_seconds
+            }, status="error")
+            return ExecutionResult(
+                success=False,
+                error=str(exc)
+            )
+        if isinstance(exc, ImportError):
+            # Sandbox violation - blocked import
+            violations.append(f"Blocked import: {exc}")
+            EventLogger.emit("skill_sandbox_violation", {
+                "skill": skill_name,
+                "violation": str(exc)
+            }, status="error")
+            return ExecutionResult(
+                success=False,
+                error=f"Security violation: {exc}",
+                sandbox_violations=violations
+            )
+        execution_time = (time.time() - start_time) * 1000
+        EventLogger.emit("skill_run_error", {
+            "skill": skill_name,
+            "error": str(exc),
+            "error_type": type(exc).__name__
+        }, status="error")
+        return ExecutionResult(
+            success=False,
+            error=f"{type(exc).__name__}: {str(exc)}",
+            execution_time_ms=execution_time
+        )
+
+    def _emit_complete(self, skill_name: str, action: str, result: ExecutionResult):
+        EventLogger.emit("skill_run_complete", {
+            "skill": skill_name,
+            "action": action,
+            "execution_time_ms": result.execution_time_ms,
+            "queue_wait_ms": result.queue_wait_ms,
+            "load_ms": result.load_ms,
+            "run_ms": result.run_ms,
+        })
+
     async def run(
         self, 
         skill_name: str, 
@@ -410,17 +566,33 @@ class SkillRunner:
         Returns:
             ExecutionResult with success status and result/error
         """
-        import time
-        start_time = time.time()
         args = args or {}
-        violations = []
         
         EventLogger.emit("skill_run_start", {
             "skill": skill_name,
             "action": action,
-            "has_args": bool(args)
+            "has_args": bool(args),
+            "mode": self.execution_mode,
         })
         
+        if self._pool is not None:
+            if not self._find_entrypoint(skill_name):
+                return ExecutionResult(
+                    success=False,
+                    error=f"Skill '{skill_name}' not found or has no entrypoint"
+                )
+            # Error/violation events are emitted by the worker itself
+            result = await self._pool.run(skill_name, action, args)
+            if result.success:
+                self._emit_complete(skill_name, action, result)
+            return result
+        
+        return await self._run_inline(skill_name, action, args)
+
+    async def _run_inline(self, skill_name: str, action: str, args: Dict[str, Any]) -> ExecutionResult:
+        start_time = time.time()
+        violations = []
+        
         # 1. Find entrypoint
         entrypoint = self._find_entrypoint(skill_name)
         if not entrypoint:
@@ -432,79 +604,286 @@ class SkillRunner:
         try:
             # 2. Load module in sandbox with timeout
             with timeout_context(self.timeout_seconds):
+                load_started = time.perf_counter()
                 module_globals = self._load_module_sandboxed(skill_name, entrypoint)
+                load_ms = (time.perf_counter() - load_started) * 1000
                 
                 # 3. Find and call the action
-                if action not in module_globals:
-                    return ExecutionResult(
-                        success=False,
-                        error=f"Action '{action}' not found in skill '{skill_name}'"
-                    )
-                
-                func = module_globals[action]
-                
-                if not callable(func):
-                    return ExecutionResult(
-                        success=False,
-                        error=f"'{action}' is not callable"
-                    )
+                func, error_result = self._resolve_action(module_globals, skill_name, action)
+                if error_result is not None:
+                    return error_result
                 
                 # 4. Execute the function
+                run_started = time.perf_counter()
                 if asyncio.iscoroutinefunction(func):
                     result = await func(**args)
                 else:
                     result = func(**args)
+                run_ms = (time.perf_counter() - run_started) * 1000
                 
-                execution_time = (time.time() - start_time) * 1000
-                
-                EventLogger.emit("skill_run_complete", {
-                    "skill": skill_name,
-                    "action": action,
-                    "execution_time_ms": execution_time
-                })
-                
-                return ExecutionResult(
+                execution_result = ExecutionResult(
                     success=True,
                     result=result,
-                    execution_time_ms=execution_time,
-                    sandbox_violations=violations
+                    execution_time_ms=(time.time() - start_time) * 1000,
+                    sandbox_violations=violations,
+                    load_ms=load_ms,
+                    run_ms=run_ms,
                 )
+                self._emit_complete(skill_name, action, execution_result)
+                return execution_result
                 
-        except TimeoutError as e:
-            EventLogger.emit("skill_run_timeout", {
-                "skill": skill_name,
-                "timeout_seconds": self.timeout_seconds
-            }, status="error")
-            return ExecutionResult(
-                success=False,
-                error=str(e)
-            )
-            
-        except ImportError as e:
-            # Sandbox violation - blocked import
-            violations.append(f"Blocked import: {e}")
-            EventLogger.emit("skill_sandbox_violation", {
-                "skill": skill_name,
-                "violation": str(e)
-            }, status="error")
+        except Exception as e:
+            return self._error_result(skill_name, e, start_time, violations)
+
+    def run_sync(self, skill_name: str, action: str = "run", args: Optional[Dict[str, Any]] = None) -> ExecutionResult:
+        """Blocking variant used inside pool workers (own process, main thread)."""
+        start_time = time.time()
+        args = args or {}
+        violations = []
+        entrypoint = self._find_entrypoint(skill_name)
+        if not entrypoint:
             return ExecutionResult(
                 success=False,
-                error=f"Security violation: {e}",
-                sandbox_violations=violations
+                error=f"Skill '{skill_name}' not found or has no entrypoint"
             )
-            
+        try:
+            with timeout_context(self.timeout_seconds):
+                load_started = time.perf_counter()
+                module_globals = self._load_module_sandboxed(skill_name, entrypoint)
+                load_ms = (time.perf_counter() - load_started) * 1000
+
+                func, error_result = self._resolve_action(module_globals, skill_name, action)
+                if error_result is not None:
+                    return error_result
+
+                run_started = time.perf_counter()
+                if asyncio.iscoroutinefunction(func):
+                    result = asyncio.run(func(**args))
+                else:
+                    result = func(**args)
+                run_ms = (time.perf_counter() - run_started) * 1000
+
+                return ExecutionResult(
+                    success=True,
+                    result=result,
+                    execution_time_ms=(time.time() - start_time) * 1000,
+                    sandbox_violations=violations,
+                    load_ms=load_ms,
+                    run_ms=run_ms,
+                )
         except Exception as e:
-            execution_time = (time.time() - start_time) * 1000
-            EventLogger.emit("skill_run_error", {
-                "skill": skill_name,
-                "error": str(e),
-                "error_type": type(e).__name__
-            }, status="error")
-            return ExecutionResult(
+            return self._error_result(skill_name, e, start_time, violations)
+
+    def get_stats(self) -> Dict[str, Any]:
+        stats: Dict[str, Any] = {
+            "execution_mode": self.execution_mode,
+            "code_cache": self.code_cache.stats(),
+        }
+        if self._pool is not None:
+            stats["pool"] = self._pool.stats()
+        return stats
+
+    def shutdown(self):
+        if self._pool is not None:
+            self._pool.close()
+
+
+# === WORKER POOL ===
+
+def _skill_worker_main(conn, skills_dir: str, timeout_seconds: int, max_memory_mb: int):
+    """Worker process: pre-warmed SkillRunner, serves (skill, action, args) requests."""
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    if max_memory_mb:
+        try:
+            import resource
+            limit = max_memory_mb * 1024 * 1024
+            resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+        except Exception:
+            pass
+    runner = SkillRunner(skills_dir=skills_dir, timeout_seconds=timeout_seconds)
+    conn.send({"ready": True, "pid": os.getpid()})
+    while True:
+        try:
+            message = conn.recv()
+        except (EOFError, OSError):
+            break
+        if message is None:
+            break
+        skill_name, action, args = message
+        result = runner.run_sync(skill_name, action, args)
+        try:
+            conn.send(result.to_dict())
+        except Exception as e:
+            conn.send(ExecutionResult(
                 success=False,
-                error=f"{type(e).__name__}: {str(e)}",
-                execution_time_ms=execution_time
-            )
+                error=f"Skill result is not serializable: {type(e).__name__}: {e}",
+                load_ms=result.load_ms,
+                run_ms=result.run_ms,
+            ).to_dict())
+    conn.close()
+
+
+class _SkillWorker:
+    def __init__(self, ctx, skills_dir: str, timeout_seconds: int):
+        parent_conn, child_conn = ctx.Pipe()
+        self.conn = parent_conn
+        self.process = ctx.Process(
+            target=_skill_worker_main,
+            args=(child_conn, skills_dir, timeout_seconds, _WORKER_MAX_MEMORY_MB),
+            daemon=True,
+        )
+        self.process.start()
+        child_conn.close()
+        if not self.conn.poll(60):
+            self.kill()
+            raise RuntimeError("Skill worker did not become ready")
+        self.conn.recv()
+        self.runs = 0
+
+    def is_alive(self) -> bool:
+        return self.process.is_alive()
+
+    async def request(self, skill_name: str, action: str, args: Dict[str, Any]) -> Dict[str, Any]:
+        """Send a request and await the response without blocking a thread."""
+        loop = asyncio.get_running_loop()
+        self.conn.send((skill_name, action, args))
+        ready = loop.create_future()
+        fd = self.conn.fileno()
+        loop.add_reader(fd, lambda: ready.done() or ready.set_result(None))
+        try:
+            await ready
+        finally:
+            loop.remove_reader(fd)
+        self.runs += 1
+        return self.conn.recv()
+
+    def close(self):
+        try:
+            self.conn.send(None)
+        except Exception:
+            pass
+        self.process.join(2)
+        if self.process.is_alive():
+            self.kill()
+        self.conn.close()
+
+    def kill(self):
+        self.process.kill()
+        self.process.join(5)
+
+
+class SkillWorkerPool:
+    """Pre-warmed worker processes; one request per worker at a time."""
+
+    def __init__(self, skills_dir: str, size: int, timeout_seconds: int, start_method: str = _WORKER_START_METHOD):
+        self.skills_dir = skills_dir
+        self.size = max(1, int(size))
+        self.timeout_seconds = timeout_seconds
+        self._ctx = multiprocessing.get_context(start_method)
+        self._idle: Optional[asyncio.Queue] = None
+        self._workers: List[_SkillWorker] = []
+        self._start_lock: Optional[asyncio.Lock] = None
+        self._stats = {"runs": 0, "timeouts": 0, "replaced": 0, "queue_wait_ms_total": 0.0}
+
+    def _spawn(self) -> _SkillWorker:
+        return _SkillWorker(self._ctx, self.skills_dir, self.timeout_seconds)
+
+    async def _ensure_started(self):
+        if self._idle is not None:
+            return
+        if self._start_lock is None:
+            self._start_lock = asyncio.Lock()
+        async with self._start_lock:
+            if self._idle is not None:
+                return
+            idle: asyncio.Queue = asyncio.Queue()
+            workers = await asyncio.gather(*(asyncio.to_thread(self._spawn) for _ in range(self.size)))
+            for worker in workers:
+                self._workers.append(worker)
+                idle.put_nowait(worker)
+            self._idle = idle
+            EventLogger.emit("skill_pool_started", {"size": self.size})
+
+    async def _replace(self, worker: _SkillWorker) -> _SkillWorker:
+        await asyncio.to_thread(worker.kill)
+        fresh = await asyncio.to_thread(self._spawn)
+        self._workers = [fresh if w is worker else w for w in self._workers]
+        self._stats["replaced"] += 1
+        return fresh
+
+    async def run(self, skill_name: str, action: str, args: Dict[str, Any]) -> ExecutionResult:
+        start_time = time.time()
+        await self._ensure_started()
+        queued = time.perf_counter()
+        worker = await self._idle.get()
+        queue_wait_ms = (time.perf_counter() - queued) * 1000
+        self._stats["queue_wait_ms_total"] += queue_wait_ms
+        self._stats["runs"] += 1
+        completed = False
+        try:
+            if not worker.is_alive():
+                worker = await self._replace(worker)
+            try:
+                payload = await asyncio.wait_for(
+                    worker.request(skill_name, action, args),
+                    timeout=self.timeout_seconds,
+                )
+                completed = True
+            except asyncio.TimeoutError:
+                self._stats["timeouts"] += 1
+                EventLogger.emit("skill_run_timeout", {
+                    "skill": skill_name,
+                    "timeout_seconds": self.timeout_seconds,
+                    "mode": "pool",
+                }, status="error")
+                worker = await self._replace(worker)
+                completed = True
+                return ExecutionResult(
+                    success=False,
+                    error=f"Skill execution timed out after {self.timeout_seconds} seconds",
+                    execution_time_ms=(time.time() - start_time) * 1000,
+                    queue_wait_ms=queue_wait_ms,
+                )
+            except (EOFError, OSError) as e:
+                worker = await self._replace(worker)
+                completed = True
+                return ExecutionResult(
+                    success=False,
+                    error=f"Skill worker crashed: {type(e).__name__}: {e}",
+                    execution_time_ms=(time.time() - start_time) * 1000,
+                    queue_wait_ms=queue_wait_ms,
+                )
+        finally:
+            if not completed:
+                # Cancelled mid-request: a stale response may still arrive →
+                # kill now, the next run() replaces the dead worker.
+                worker.kill()
+            self._idle.put_nowait(worker)
+
+        result = ExecutionResult(**payload)
+        result.queue_wait_ms = queue_wait_ms
+        result.execution_time_ms = (time.time() - start_time) * 1000
+        return result
+
+    def stats(self) -> Dict[str, Any]:
+        runs = self._stats["runs"]
+        return {
+            "size": self.size,
+            "started": self._idle is not None,
+            "idle": self._idle.qsize() if self._idle is not None else 0,
+            "runs": runs,
+            "timeouts": self._stats["timeouts"],
+            "replaced": self._stats["replaced"],
+            "avg_queue_wait_ms": round(self._stats["queue_wait_ms_total"] / runs, 2) if runs else 0.0,
+            "pids": [w.process.pid for w in self._workers],
+        }
+
+    def close(self):
+        workers, self._workers = self._workers, []
+        for worker in workers:
+            worker.close()
+        self._idle = None
+        self._start_lock = None
 
 
 # Singleton instance
@@ -516,6 +895,7 @@ def get_skill_runner() -> SkillRunner:
     if _runner_instance is None:
         _runner_instance = SkillRunner(
             skills_dir=os.getenv("SKILLS_DIR", "/skills"),
-            timeout_seconds=int(os.getenv("SKILL_TIMEOUT", "30"))
+            timeout_seconds=int(os.getenv("SKILL_TIMEOUT", "30")),
+            execution_mode=SKILL_EXECUTION_MODE,
         )
     return _runner_instance
@@ -0,0 +1 @@
+../mcp-servers/skill-server/skill_catalog.py
\ No newline at end of file
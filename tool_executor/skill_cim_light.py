@@ -16,16 +16,217 @@ CSV Sources:
 - code_safety_priors.csv: Security principles to enforce
 - code_review_procedures.csv: Review pipeline steps
 - cognitive_priors.csv: Cognitive biases/priors from CIM
+
+Matching:
+- All anti-pattern, safety-prior and CIM patterns are compiled once into a
+  CodePatternScanner (one prefilter pass over the code, all matches with line
+  numbers). The scanner is rebuilt when a CSV's mtime changes.
 """
 
+import bisect
 import csv
 import ast
+import os
 import re
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Iterable, Tuple
 from dataclasses import dataclass, field
 
 
+# func -> (literal anchor, confirming regex). Order matters: the first function
+# mentioned by a CSV row that matches the code is reported.
+FUNCTION_PATTERNS: Dict[str, Tuple[str, str]] = {
+    "eval(": ("eval", r"\beval\s*\("),
+    "exec(": ("exec", r"\bexec\s*\("),
+    "os.system(": ("os.system", r"\bos\.system\s*\("),
+    "pickle.load": ("pickle.load", r"\bpickle\.load\s*\("),
+    "yaml.load(": ("yaml.load", r"\byaml\.load\s*\([^)]*\)(?!\s*,\s*Loader)"),
+    "input(": ("input", r"\binput\s*\("),
+    "while True:": ("while", r"\bwhile\s+True\s*:"),
+    "__import__": ("__import__", r"\b__import__\s*\("),
+    "subprocess.call(shell=True)": ("subprocess.call", r"\bsubprocess\.call\(.*shell\s*=\s*True.*\)"),
+    "verify=False": ("verify", r"verify\s*=\s*False"),
+    "0.0.0.0": ("0.0.0.0", r"0\.0\.0\.0"),
+}
+
+# Heuristic violation terms per safety prior (case-sensitive substrings)
+PRIOR_VIOLATION_TERMS: Dict[str, Tuple[str, ...]] = {
+    "PRIOR-001": ("os.system", "subprocess.call", "socket.", "__import__"),
+    "PRIOR-002": ("random.", "time.time()", "uuid.uuid4"),
+    "PRIOR-003": ("open(", "write(", "requests.", "urllib."),
+    "PRIOR-004": ("input(", "request."),
+}
+PRIOR_004_GUARDS = ("validate", "schema")  # case-insensitive
+FAILURE_KEYWORDS = ("rce", "injection", "crash", "hang", "leak")
+
+_CSV_FILES = (
+    "code_anti_patterns.csv",
+    "code_safety_priors.csv",
+    "code_review_procedures.csv",
+    "cognitive_priors.csv",
+    "cim_anti_patterns.csv",
+)
+
+
+@dataclass(frozen=True)
+class ScanMatch:
+    """One pattern occurrence found by CodePatternScanner."""
+    kind: str  # literal | function | term | term_ci
+    key: str
+    line: int
+    text: str
+
+
+class CodePatternScanner:
+    """
+    Multi-pattern scanner over skill code.
+
+    Every pattern has a literal anchor. One lookahead over a prefix trie of
+    all anchors (run on the lower-cased code) finds candidate positions in a
+    single pass;
+    at each candidate, anchors sharing the first character are confirmed
+    (case-sensitive or not) and function patterns are verified with their
+    precompiled regex anchored at that position. Overlapping patterns are
+    all reported.
+    """
+
+    def __init__(
+        self,
+        literals: Iterable[str] = (),
+        functions: Iterable[str] = (),
+        terms: Iterable[str] = (),
+        terms_ci: Iterable[str] = (),
+    ):
+        # (anchor, case_sensitive) -> [(kind, key, regex)]
+        anchors: Dict[Tuple[str, bool], List[Tuple[str, str, Optional[re.Pattern]]]] = {}
+
+        def _add(anchor: str, case_sensitive: bool, kind: str, key: str, regex=None):
+            if not anchor:
+                return
+            entries = anchors.setdefault((anchor, case_sensitive), [])
+            if not any(e[0] == kind and e[1] == key for e in entries):
+                entries.append((kind, key, regex))
+
+        for literal in literals:
+            _add(literal, True, "literal", literal)
+        for func in functions:
+            anchor, regex = FUNCTION_PATTERNS[func]
+            _add(anchor, True, "function", func, re.compile(regex))
+        for term in terms:
+            _add(term, True, "term", term)
+        for term in terms_ci:
+            _add(term.lower(), False, "term_ci", term.lower())
+
+        self._by_first: Dict[str, List[Tuple[str, bool, list]]] = {}
+        for (anchor, case_sensitive), entries in anchors.items():
+            self._by_first.setdefault(anchor[0].lower(), []).append((anchor, case_sensitive, entries))
+
+        # Anchors folded into a prefix trie: the alternation then costs one
+        # branch per character instead of one per pattern.
+        trie = _anchor_trie_regex({a.lower() for a, _cs in anchors})
+        self._prefilter = re.compile(f"(?={trie})") if trie else None
+        self._prefilter_ci = re.compile(f"(?={trie})", re.IGNORECASE) if trie else None
+        self.pattern_count = sum(len(e) for e in anchors.values())
+
+    def scan(self, code: str) -> List[ScanMatch]:
+        """All matches in code order, with 1-based line numbers."""
+        if self._prefilter is None or not code:
+            return []
+        matches: List[ScanMatch] = []
+        newlines: Optional[List[int]] = None
+        folded = code.lower()
+        if len(folded) == len(code):
+            candidates = self._prefilter.finditer(folded)
+        else:  # lower() changed offsets (e.g. "İ"), fall back to IGNORECASE
+            candidates = self._prefilter_ci.finditer(code)
+        for m in candidates:
+            pos = m.start()
+            for anchor, case_sensitive, entries in self._by_first.get(code[pos].lower(), ()):
+                segment = code[pos:pos + len(anchor)]
+                if (segment != anchor) if case_sensitive else (segment.lower() != anchor):
+                    continue
+                for kind, key, regex in entries:
+                    text = segment
+                    if regex is not None:
+                        hit = regex.match(code, pos)
+                        if hit is None:
+                            continue
+                        text = hit.group(0)
+                    if newlines is None:
+                        newlines = [i for i, ch in enumerate(code) if ch == "\n"]
+                    matches.append(ScanMatch(kind, key, bisect.bisect_left(newlines, pos) + 1, text))
+        return matches
+
+    def first_hits(self, code: str) -> Dict[Tuple[str, str], ScanMatch]:
+        """First occurrence per (kind, key)."""
+        hits: Dict[Tuple[str, str], ScanMatch] = {}
+        for match in self.scan(code):
+            hits.setdefault((match.kind, match.key), match)
+        return hits
+
+
+def _anchor_trie_regex(words: Iterable[str]) -> str:
+    """Regex matching any of words, with shared prefixes factored out."""
+    root: Dict[str, Any] = {}
+    for word in words:
+        node = root
+        for ch in word:
+            node = node.setdefault(ch, {})
+        node[""] = None
+
+    def _render(node: Dict[str, Any]) -> str:
+        branches = [re.escape(ch) + _render(child) for ch, child in sorted(node.items()) if ch]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        return f"(?:{body})?" if "" in node else body
+
+    return _render(root)
+
+
+@dataclass
+class _AntiPatternRule:
+    pattern_id: str
+    severity: str
+    description: str
+    remediation: str
+    literal: str  # meaningful negative example ("" if generic/short)
+    functions: List[str]
+
+
+@dataclass
+class _SafetyPriorRule:
+    prior_id: str
+    principle: str
+    enforcement: str
+    tags: List[str]
+    failure_hits: int  # how many FAILURE_KEYWORDS the failure mode mentions
+
+
+@dataclass
+class _CimRule:
+    name: str
+    description: str
+    mitigation: str
+    keywords: List[str]
+
+
+@dataclass
+class _CompiledRules:
+    scanner: CodePatternScanner
+    anti_patterns: List[_AntiPatternRule]
+    safety_priors: List[_SafetyPriorRule]
+    cim_patterns: List[_CimRule]
+
+
+def _parse_tags(tags: str) -> List[str]:
+    try:
+        tag_list = ast.literal_eval(tags) if tags.startswith("[") else tags.split(",")
+    except:
+        tag_list = []
+    return [t for t in (str(tag).strip().lower() for tag in tag_list) if t]
+
+
 @dataclass
 class ValidationIssue:
     """Represents a validation issue found in code."""
@@ -35,6 +236,7 @@ class ValidationIssue:
     description: str
     remediation: str
     matched_text: Optional[str] = None
+    line: Optional[int] = None
 
 
 @dataclass
@@ -58,7 +260,8 @@ class ValidationResult:
                     "pattern": i.pattern,
                     "description": i.description,
                     "remediation": i.remediation,
-                    "matched": i.matched_text
+                    "matched": i.matched_text,
+                    "line": i.line
                 }
                 for i in self.issues
             ],
@@ -81,6 +284,19 @@ class SkillCIMLight:
             data_dir = Path(__file__).parent / "data"
         
         self.data_dir = Path(data_dir)
+        self._load_all()
+
+    def _csv_mtimes(self) -> Tuple[Optional[int], ...]:
+        mtimes = []
+        for filename in _CSV_FILES:
+            try:
+                mtimes.append(os.stat(self.data_dir / filename).st_mtime_ns)
+            except OSError:
+                mtimes.append(None)
+        return tuple(mtimes)
+
+    def _load_all(self):
+        self._loaded_mtimes = self._csv_mtimes()
         
         # Load all CSVs
         self.anti_patterns = self._load_csv("code_anti_patterns.csv")
@@ -91,6 +307,14 @@ class SkillCIMLight:
         
         # Build lookup indices
         self._build_indices()
+        self._compiled = self._compile_rules()
+
+    def reload_if_changed(self) -> bool:
+        """Reload CSVs and rebuild the scanner when a CSV mtime changed."""
+        if self._csv_mtimes() == self._loaded_mtimes:
+            return False
+        self._load_all()
+        return True
     
     def _load_csv(self, filename: str) -> List[Dict]:
         """Load CSV file into list of dicts."""
@@ -121,6 +345,65 @@ class SkillCIMLight:
             prior_id = sp.get("prior_id", "")
             if prior_id:
                 self.prior_index[prior_id] = sp
+
+    def _compile_rules(self) -> _CompiledRules:
+        """Precompute rule metadata and compile all patterns into one scanner."""
+        anti_rules = []
+        for pattern in self.anti_patterns:
+            # Map CSV columns to internal names
+            bad_pattern = pattern.get("negative_example", pattern.get("bad_example", pattern.get("pattern", "")))
+            signature = pattern.get("pattern_signature", "")
+            # Filter out generic examples like "user_expression" or placeholder text
+            is_generic = "user_" in bad_pattern or "..." in bad_pattern
+            anti_rules.append(_AntiPatternRule(
+                pattern_id=pattern.get("pattern_id", pattern.get("id", "unknown")),
+                severity=pattern.get("risk_severity", pattern.get("severity", "medium")),
+                description=pattern.get("trigger_condition", pattern.get("description", "")),
+                remediation=pattern.get("refactoring_steps", pattern.get("remediation", "")),
+                literal=bad_pattern if bad_pattern and len(bad_pattern) > 3 and not is_generic else "",
+                functions=[f for f in FUNCTION_PATTERNS if f in signature or f in bad_pattern],
+            ))
+
+        prior_rules = []
+        for prior in self.safety_priors:
+            failure_mode = prior.get("failure_mode", "").lower()
+            prior_rules.append(_SafetyPriorRule(
+                prior_id=prior.get("prior_id", ""),
+                principle=prior.get("principle_name", ""),
+                enforcement=prior.get("enforcement_mechanism", ""),
+                tags=_parse_tags(prior.get("embedding_tags", "[]")),
+                failure_hits=sum(1 for kw in FAILURE_KEYWORDS if kw in failure_mode),
+            ))
+
+        cim_rules = []
+        for pattern in self.cim_anti_patterns:
+            keywords = [kw.strip().lower() for kw in pattern.get("keywords", "").split(",")]
+            cim_rules.append(_CimRule(
+                name=pattern.get("name", ""),
+                description=pattern.get("description", ""),
+                mitigation=pattern.get("mitigation", ""),
+                # Skip very short keywords
+                keywords=[kw for kw in keywords if kw and len(kw) > 3],
+            ))
+
+        terms_ci = {tag for rule in prior_rules for tag in rule.tags}
+        terms_ci.update(PRIOR_004_GUARDS)
+        for rule in cim_rules:
+            for kw in rule.keywords:
+                terms_ci.update((f'"{kw}', f"'{kw}", f"# {kw}"))
+
+        scanner = CodePatternScanner(
+            literals=[r.literal for r in anti_rules if r.literal],
+            functions=[f for r in anti_rules for f in r.functions],
+            terms=[t for terms in PRIOR_VIOLATION_TERMS.values() for t in terms],
+            terms_ci=sorted(terms_ci),
+        )
+        return _CompiledRules(scanner, anti_rules, prior_rules, cim_rules)
+
+    def scan_code(self, code: str) -> List[ScanMatch]:
+        """All pattern matches (anti-pattern, prior and CIM terms) with line numbers."""
+        self.reload_if_changed()
+        return self._compiled.scanner.scan(code)
     
     # ================================================================
     # VALIDATION METHODS
@@ -136,20 +419,24 @@ class SkillCIMLight:
         Returns:
             ValidationResult with pass/fail and issues
         """
+        self.reload_if_changed()
         issues = []
         applied_priors = []
         
+        # Single scanner pass shared by all checks
+        hits = self._compiled.scanner.first_hits(code)
+        
         # 1. Anti-Pattern Check
-        ap_issues = self._check_anti_patterns(code)
+        ap_issues = self._check_anti_patterns(code, hits)
         issues.extend(ap_issues)
         
         # 2. Safety Prior Check
-        prior_issues, priors_applied = self._check_safety_priors(code)
+        prior_issues, priors_applied = self._check_safety_priors(code, hits)
         issues.extend(prior_issues)
         applied_priors.extend(priors_applied)
         
         # 3. CIM Anti-Pattern Check (broader patterns)
-        cim_issues = self._check_cim_anti_patterns(code)
+        cim_issues = self._check_cim_anti_patterns(code, hits)
         issues.extend(cim_issues)
         
         # Calculate score
@@ -172,177 +459,123 @@ class SkillCIMLight:
             applied_priors=applied_priors,
             score=score
         )
+
+    def _hits(self, code: str, hits: Optional[Dict[Tuple[str, str], ScanMatch]]) -> Dict[Tuple[str, str], ScanMatch]:
+        return hits if hits is not None else self._compiled.scanner.first_hits(code)
     
-    def _check_anti_patterns(self, code: str) -> List[ValidationIssue]:
+    def _check_anti_patterns(
+        self, code: str, hits: Optional[Dict[Tuple[str, str], ScanMatch]] = None
+    ) -> List[ValidationIssue]:
         """Check code against anti-patterns CSV."""
+        hits = self._hits(code, hits)
         issues = []
         
-        for pattern in self.anti_patterns:
-            # Map CSV columns to internal names
-            pattern_id = pattern.get("pattern_id", pattern.get("id", "unknown"))
-            # negative_example contains the bad code snippet
-            bad_pattern = pattern.get("negative_example", pattern.get("bad_example", pattern.get("pattern", "")))
-            # pattern_signature is often just the function name like "eval()"
-            signature = pattern.get("pattern_signature", "")
-            
-            severity = pattern.get("risk_severity", pattern.get("severity", "medium"))
-            description = pattern.get("trigger_condition", pattern.get("description", ""))
-            remediation = pattern.get("refactoring_steps", pattern.get("remediation", ""))
-            
-            # 1. Simple string match (if bad_pattern is a meaningful string)
-            # Filter out generic examples like "user_expression" or placeholder text
-            is_generic = "user_" in bad_pattern or "..." in bad_pattern
-            if bad_pattern and len(bad_pattern) > 3 and not is_generic and bad_pattern in code:
+        for rule in self._compiled.anti_patterns:
+            # 1. Simple string match (meaningful negative example)
+            hit = hits.get(("literal", rule.literal)) if rule.literal else None
+            if hit is not None:
                 issues.append(ValidationIssue(
-                    id=pattern_id,
-                    severity=severity,
-                    pattern=bad_pattern,
-                    description=description,
-                    remediation=remediation,
-                    matched_text=bad_pattern
+                    id=rule.pattern_id,
+                    severity=rule.severity,
+                    pattern=rule.literal,
+                    description=rule.description,
+                    remediation=rule.remediation,
+                    matched_text=rule.literal,
+                    line=hit.line
                 ))
                 continue
             
-            # 2. Regex patterns (e.g., for eval(), exec(), etc.)
-            function_patterns = {
-                "eval(": r"\beval\s*\(",
-                "exec(": r"\bexec\s*\(",
-                "os.system(": r"\bos\.system\s*\(",
-                "pickle.load": r"\bpickle\.load\s*\(",
-                "yaml.load(": r"\byaml\.load\s*\([^)]*\)(?!\s*,\s*Loader)",
-                "input(": r"\binput\s*\(",
-                "while True:": r"\bwhile\s+True\s*:",
-                "__import__": r"\b__import__\s*\(",
-                "subprocess.call(shell=True)": r"\bsubprocess\.call\(.*shell\s*=\s*True.*\)",
-                "verify=False": r"verify\s*=\s*False",
-                "0.0.0.0": r"0\.0\.0\.0"
-            }
-            
-            # Match if the pattern signature or negative example mentions the function
-            term_found = False
-            for func, regex in function_patterns.items():
-                # Check if this CSV row is about this function
-                # We check pattern_signature (e.g., "eval()") or negative_example
-                if (func in signature) or (func in bad_pattern):
-                    if re.search(regex, code):
-                        issues.append(ValidationIssue(
-                            id=pattern_id,
-                            severity=severity,
-                            pattern=func,
-                            description=description,
-                            remediation=remediation,
-                            matched_text=func
-                        ))
-                        term_found = True
-                        break
-            
-            if term_found:
-                continue
+            # 2. Regex patterns (first function mentioned by the row that matches)
+            for func in rule.functions:
+                hit = hits.get(("function", func))
+                if hit is not None:
+                    issues.append(ValidationIssue(
+                        id=rule.pattern_id,
+                        severity=rule.severity,
+                        pattern=func,
+                        description=rule.description,
+                        remediation=rule.remediation,
+                        matched_text=func,
+                        line=hit.line
+                    ))
+                    break
                 
         return issues
     
-    def _check_safety_priors(self, code: str) -> tuple[List[ValidationIssue], List[str]]:
+    def _check_safety_priors(
+        self, code: str, hits: Optional[Dict[Tuple[str, str], ScanMatch]] = None
+    ) -> tuple[List[ValidationIssue], List[str]]:
         """Check code against safety priors."""
+        hits = self._hits(code, hits)
         issues = []
         applied = []
         
-        for prior in self.safety_priors:
-            prior_id = prior.get("prior_id", "")
-            principle = prior.get("principle_name", "")
-            enforcement = prior.get("enforcement_mechanism", "")
-            failure_mode = prior.get("failure_mode", "")
-            tags = prior.get("embedding_tags", "[]")
-            
+        for rule in self._compiled.safety_priors:
             # Check if this prior is relevant based on code content
-            try:
-                tag_list = ast.literal_eval(tags) if tags.startswith("[") else tags.split(",")
-            except:
-                tag_list = []
-            
-            prior_relevant = False
-            for tag in tag_list:
-                tag = str(tag).strip().lower()
-                if tag and tag in code.lower():
-                    prior_relevant = True
-                    break
+            if not any(("term_ci", tag) in hits for tag in rule.tags):
+                continue
+            applied.append(rule.prior_id)
             
-            if prior_relevant:
-                applied.append(prior_id)
-                
-                # Check for violations based on failure mode keywords
-                if failure_mode:
-                    failure_keywords = ["rce", "injection", "crash", "hang", "leak"]
-                    for kw in failure_keywords:
-                        if kw in failure_mode.lower():
-                            # This is an important prior - check more carefully
-                            if self._prior_might_be_violated(code, prior_id):
-                                issues.append(ValidationIssue(
-                                    id=prior_id,
-                                    severity="high",
-                                    pattern=principle,
-                                    description=f"Potential violation of: {principle}",
-                                    remediation=enforcement
-                                ))
+            # Important priors (failure mode mentions rce/injection/...) are
+            # checked more carefully — one issue per matching failure keyword
+            if rule.failure_hits and self._prior_might_be_violated(code, rule.prior_id, hits):
+                for _ in range(rule.failure_hits):
+                    issues.append(ValidationIssue(
+                        id=rule.prior_id,
+                        severity="high",
+                        pattern=rule.principle,
+                        description=f"Potential violation of: {rule.principle}",
+                        remediation=rule.enforcement
+                    ))
         
         return issues, applied
     
-    def _prior_might_be_violated(self, code: str, prior_id: str) -> bool:
+    def _prior_might_be_violated(
+        self, code: str, prior_id: str, hits: Optional[Dict[Tuple[str, str], ScanMatch]] = None
+    ) -> bool:
         """Heuristic check if a prior might be violated."""
-        # PRIOR-001: Sandbox Isolation
-        if prior_id == "PRIOR-001":
-            dangerous = ["os.system", "subprocess.call", "socket.", "__import__"]
-            return any(d in code for d in dangerous)
+        hits = self._hits(code, hits)
+        terms = PRIOR_VIOLATION_TERMS.get(prior_id)
+        if not terms:
+            return False
+        found = any(("term", t) in hits for t in terms)
         
-        # PRIOR-002: Deterministic Execution
-        if prior_id == "PRIOR-002":
-            random_calls = ["random.", "time.time()", "uuid.uuid4"]
-            return any(r in code for r in random_calls)
-        
-        # PRIOR-003: No Implicit Side-Effects
-        if prior_id == "PRIOR-003":
-            side_effects = ["open(", "write(", "requests.", "urllib."]
-            return any(s in code for s in side_effects)
-        
-        # PRIOR-004: Input Sanitization
+        # PRIOR-004: Input Sanitization — only without validation nearby
         if prior_id == "PRIOR-004":
-            if "input(" in code or "request." in code:
-                # Check if there's validation nearby
-                if "validate" not in code.lower() and "schema" not in code.lower():
-                    return True
+            return found and not any(("term_ci", g) in hits for g in PRIOR_004_GUARDS)
         
-        return False
+        return found
     
-    def _check_cim_anti_patterns(self, code: str) -> List[ValidationIssue]:
+    def _check_cim_anti_patterns(
+        self, code: str, hits: Optional[Dict[Tuple[str, str], ScanMatch]] = None
+    ) -> List[ValidationIssue]:
         """Check against broader CIM anti-patterns (reasoning fallacies)."""
+        hits = self._hits(code, hits)
         issues = []
         
         # These are more about reasoning than code, but some apply
-        for pattern in self.cim_anti_patterns:
-            name = pattern.get("name", "")
-            keywords = pattern.get("keywords", "").split(",")
-            severity = pattern.get("severity", "medium")
-            description = pattern.get("description", "")
-            mitigation = pattern.get("mitigation", "")
-            
-            # Check if any keyword appears in comments/docstrings
-            for kw in keywords:
-                kw = kw.strip().lower()
-                if kw and len(kw) > 3:  # Skip very short keywords
-                    if kw in code.lower():
-                        # Only flag if it's in a comment or string
-                        if f'"{kw}' in code.lower() or f"'{kw}" in code.lower() or f"# {kw}" in code.lower():
-                            issues.append(ValidationIssue(
-                                id=f"CIM-{name[:10]}",
-                                severity="low",  # Downgrade - these are hints
-                                pattern=name,
-                                description=description,
-                                remediation=mitigation,
-                                matched_text=kw
-                            ))
-                            break
+        for rule in self._compiled.cim_patterns:
+            for kw in rule.keywords:
+                # Only flag if it's in a comment or string
+                hit = (
+                    hits.get(("term_ci", f'"{kw}'))
+                    or hits.get(("term_ci", f"'{kw}"))
+                    or hits.get(("term_ci", f"# {kw}"))
+                )
+                if hit is not None:
+                    issues.append(ValidationIssue(
+                        id=f"CIM-{rule.name[:10]}",
+                        severity="low",  # Downgrade - these are hints
+                        pattern=rule.name,
+                        description=rule.description,
+                        remediation=rule.mitigation,
+                        matched_text=kw,
+                        line=hit.line
+                    ))
+                    break
         
         return issues
-    
+
     # ================================================================
     # UTILITY METHODS
     # ================================================================
@@ -360,18 +593,9 @@ class SkillCIMLight:
         relevant = []
         context_lower = context.lower()
         
-        for prior in self.safety_priors:
-            tags = prior.get("embedding_tags", "[]")
-            try:
-                tag_list = ast.literal_eval(tags) if tags.startswith("[") else tags.split(",")
-            except:
-                tag_list = []
-            
-            for tag in tag_list:
-                tag = str(tag).strip().lower()
-                if tag and tag in context_lower:
-                    relevant.append(prior)
-                    break
+        for prior, rule in zip(self.safety_priors, self._compiled.safety_priors):
+            if any(tag in context_lower for tag in rule.tags):
+                relevant.append(prior)
         
         return relevant
     
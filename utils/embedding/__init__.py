@@ -9,6 +9,15 @@ from utils.embedding.resolver import (  # noqa: F401
     VALID_ENDPOINT_MODES,
 )
 from utils.embedding.health import check_embedding_availability, clear_health_cache  # noqa: F401
+from utils.embedding.similarity import (  # noqa: F401
+    PrototypeMatrix,
+    as_unit_vector,
+    cosine_similarity,
+    normalize_rows,
+    score_matrix,
+    top_k,
+    top_k_batch,
+)
 from utils.embedding.metrics import (  # noqa: F401
     increment_fallback,
     increment_error,
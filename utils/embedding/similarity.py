@@ -0,0 +1,179 @@
+"""
+utils/embedding/similarity.py — Shared vectorized cosine kernel
+
+All cosine callers (embedding client, tone / query-budget / domain classifiers)
+score against pre-normalized, contiguous float32 matrices:
+
+- cosine_similarity(a, b)           scalar compat helper
+- normalize_rows(matrix)            L2-normalize rows (zero rows stay zero)
+- score_matrix(matrix, query)       matrix-vs-vector, one BLAS call
+- top_k(matrix, query, k)           best k rows for one query
+- top_k_batch(matrix, queries, k)   matrix-vs-matrix, chunked over queries
+- PrototypeMatrix                   labelled prototype set scored in one call
+
+Inputs of mismatching dimension score 0.0 (same contract as the old
+pure-Python loops).
+"""
+from __future__ import annotations
+
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+
+_BATCH_QUERY_CHUNK = 256
+
+
+def as_unit_vector(vec: Iterable[float]) -> np.ndarray:
+    """Return `vec` as L2-normalized float32 array (zero vector stays zero)."""
+    arr = np.asarray(vec if isinstance(vec, np.ndarray) else list(vec), dtype=np.float32)
+    norm = float(np.linalg.norm(arr))
+    if norm <= 0.0:
+        return arr
+    return arr / norm
+
+
+def normalize_rows(matrix: Any) -> np.ndarray:
+    """L2-normalize rows into a C-contiguous float32 matrix."""
+    mat = np.ascontiguousarray(np.asarray(matrix, dtype=np.float32))
+    if mat.ndim == 1:
+        mat = mat.reshape(1, -1)
+    norms = np.linalg.norm(mat, axis=1, keepdims=True)
+    norms[norms == 0.0] = 1.0
+    return np.ascontiguousarray(mat / norms, dtype=np.float32)
+
+
+def cosine_similarity(a: Sequence[float], b: Sequence[float]) -> float:
+    """Cosine similarity of two vectors; 0.0 for empty / mismatched / zero input."""
+    if a is None or b is None or len(a) == 0 or len(b) == 0 or len(a) != len(b):
+        return 0.0
+    va = np.asarray(a, dtype=np.float64)
+    vb = np.asarray(b, dtype=np.float64)
+    na = float(np.linalg.norm(va))
+    nb = float(np.linalg.norm(vb))
+    if na <= 0.0 or nb <= 0.0:
+        return 0.0
+    return float(np.dot(va, vb) / (na * nb))
+
+
+def score_matrix(matrix: np.ndarray, query: Iterable[float], *, normalized: bool = True) -> np.ndarray:
+    """
+    Cosine scores of every row of `matrix` against `query`.
+
+    `matrix` must already be row-normalized (see normalize_rows). The query is
+    normalized here unless `normalized=False` is passed for a pre-normalized one.
+    """
+    q = as_unit_vector(query) if normalized else np.asarray(query, dtype=np.float32)
+    if matrix.ndim != 2 or matrix.shape[0] == 0 or q.shape[0] != matrix.shape[1]:
+        return np.zeros(matrix.shape[0] if matrix.ndim == 2 else 0, dtype=np.float32)
+    return matrix @ q
+
+
+def _top_indices(scores: np.ndarray, k: int) -> np.ndarray:
+    if k >= scores.shape[0]:
+        return np.argsort(-scores, kind="stable")
+    part = np.argpartition(-scores, k - 1)[:k]
+    return part[np.argsort(-scores[part], kind="stable")]
+
+
+def top_k(
+    matrix: np.ndarray,
+    query: Iterable[float],
+    k: int,
+    min_score: Optional[float] = None,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Indices and scores of the best `k` rows (descending)."""
+    scores = score_matrix(matrix, query)
+    if scores.shape[0] == 0 or k <= 0:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float32)
+    idx = _top_indices(scores, k)
+    top = scores[idx]
+    if min_score is not None:
+        keep = top >= min_score
+        idx, top = idx[keep], top[keep]
+    return idx.astype(np.int64), top
+
+
+def top_k_batch(
+    matrix: np.ndarray,
+    queries: Any,
+    k: int,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Matrix-vs-matrix top-k: for each query row, the best `k` rows of `matrix`.
+
+    Returns (indices[m, k'], scores[m, k']) with k' = min(k, rows). Queries are
+    processed in chunks so the score block stays bounded in memory.
+    """
+    qmat = normalize_rows(queries)
+    n = matrix.shape[0]
+    kk = max(0, min(int(k), n))
+    out_idx = np.zeros((qmat.shape[0], kk), dtype=np.int64)
+    out_scores = np.zeros((qmat.shape[0], kk), dtype=np.float32)
+    if kk == 0 or qmat.shape[1] != matrix.shape[1]:
+        return out_idx, out_scores
+    for start in range(0, qmat.shape[0], _BATCH_QUERY_CHUNK):
+        block = qmat[start:start + _BATCH_QUERY_CHUNK] @ matrix.T
+        if kk < n:
+            part = np.argpartition(-block, kk - 1, axis=1)[:, :kk]
+        else:
+            part = np.tile(np.arange(n), (block.shape[0], 1))
+        part_scores = np.take_along_axis(block, part, axis=1)
+        order = np.argsort(-part_scores, axis=1, kind="stable")
+        out_idx[start:start + block.shape[0]] = np.take_along_axis(part, order, axis=1)
+        out_scores[start:start + block.shape[0]] = np.take_along_axis(part_scores, order, axis=1)
+    return out_idx, out_scores
+
+
+class PrototypeMatrix(Mapping[str, List[float]]):
+    """
+    Labelled prototype vectors held as one contiguous normalized matrix.
+
+    Behaves like the old ``Dict[label, List[float]]`` caches (``get``, ``items``,
+    truthiness), but ``scores(query)`` scores the whole set in a single call.
+    Prototypes with a dimension different from the first one are dropped.
+    """
+
+    def __init__(self, vectors: Optional[Mapping[str, Sequence[float]]] = None):
+        labels: List[str] = []
+        rows: List[Sequence[float]] = []
+        dim: Optional[int] = None
+        for label, vec in (vectors or {}).items():
+            if vec is None or len(vec) == 0:
+                continue
+            if dim is None:
+                dim = len(vec)
+            if len(vec) != dim:
+                continue
+            labels.append(str(label))
+            rows.append(vec)
+        self._labels: Tuple[str, ...] = tuple(labels)
+        self._raw: Dict[str, List[float]] = {
+            label: [float(v) for v in vec] for label, vec in zip(labels, rows)
+        }
+        self.matrix = normalize_rows(rows) if rows else np.zeros((0, 0), dtype=np.float32)
+
+    @classmethod
+    def coerce(cls, value: Any) -> "PrototypeMatrix":
+        if isinstance(value, PrototypeMatrix):
+            return value
+        return cls(value or {})
+
+    @property
+    def labels(self) -> Tuple[str, ...]:
+        return self._labels
+
+    def __getitem__(self, label: str) -> List[float]:
+        return self._raw[label]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._labels)
+
+    def __len__(self) -> int:
+        return len(self._labels)
+
+    def scores(self, query: Iterable[float]) -> Dict[str, float]:
+        """Cosine score per label (0.0 for everything on dimension mismatch)."""
+        if not self._labels:
+            return {}
+        raw = score_matrix(self.matrix, query)
+        return {label: float(raw[i]) for i, label in enumerate(self._labels)}
@@ -1,4 +1,5 @@
 from utils.text.json_parser import safe_parse_json, extract_json_array  # noqa: F401
+from utils.text.json_stream import StreamingJSONParser  # noqa: F401
 from utils.text.prompt import build_prompt  # noqa: F401
 from utils.text.chunker import (  # noqa: F401
     Chunker,
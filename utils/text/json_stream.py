@@ -0,0 +1,133 @@
+# utils/text/json_stream.py
+"""
+Inkrementeller JSON-Parser für gestreamte LLM-Outputs.
+
+safe_parse_json() braucht die komplette Antwort. Für Pläne, deren Felder
+nacheinander gestreamt werden, liefert StreamingJSONParser jedes Top-Level-
+Feld, sobald sein Wert vollständig ist — z.B. needs_memory/memory_keys lange
+bevor "reasoning" fertig ist.
+
+- Text vor dem Objekt (Markdown-Fence, <think>-Block) wird übersprungen
+- nur das erste Top-Level-Objekt wird gelesen, danach ist der Parser fertig
+- Werte, die kein gültiges JSON sind, werden ausgelassen
+
+Die Felder sind vorläufig: maßgeblich bleibt safe_parse_json() auf der
+vollständigen Antwort.
+"""
+
+import json
+from typing import Any, Dict, List, Tuple
+
+_THINK_OPEN = "<think>"
+_THINK_CLOSE = "</think>"
+
+
+class StreamingJSONParser:
+    """
+    Usage:
+        parser = StreamingJSONParser()
+        for chunk in stream:
+            for key, value in parser.feed(chunk):
+                ...
+    """
+
+    def __init__(self):
+        self.fields: Dict[str, Any] = {}
+        self.done = False
+        self._buf = ""
+        self._pos = 0
+        self._started = False
+        self._depth = 0
+        self._in_str = False
+        self._esc = False
+        self._expect = "key"      # key | colon | value
+        self._token_start = -1    # Start des Keys bzw. Werts auf Tiefe 1
+        self._key = ""
+
+    def feed(self, chunk: str) -> List[Tuple[str, Any]]:
+        """Chunk anhängen; gibt die dadurch vollständig gewordenen Felder zurück."""
+        if self.done or not chunk:
+            return []
+        self._buf += chunk
+        completed: List[Tuple[str, Any]] = []
+        if not self._started and not self._seek_object():
+            return completed
+
+        buf = self._buf
+        i = self._pos
+        n = len(buf)
+        while i < n:
+            ch = buf[i]
+            if self._in_str:
+                if self._esc:
+                    self._esc = False
+                elif ch == "\\":
+                    self._esc = True
+                elif ch == '"':
+                    self._in_str = False
+                    if self._depth == 1 and self._expect == "key":
+                        try:
+                            self._key = str(json.loads(buf[self._token_start:i + 1]))
+                        except ValueError:
+                            self._key = buf[self._token_start + 1:i]
+                        self._expect = "colon"
+            elif ch == '"':
+                self._in_str = True
+                if self._depth == 1 and (self._expect == "key" or self._token_start < 0):
+                    self._token_start = i
+            elif ch == "{" or ch == "[":
+                if self._depth == 1 and self._expect == "value" and self._token_start < 0:
+                    self._token_start = i
+                self._depth += 1
+            elif ch == "}" or ch == "]":
+                if self._depth > 1:
+                    self._depth -= 1
+                elif ch == "}":
+                    self._complete_value(buf, i, completed)
+                    self.done = True
+                    i += 1
+                    break
+            elif self._depth == 1:
+                if ch == ",":
+                    self._complete_value(buf, i, completed)
+                elif ch == ":" and self._expect == "colon":
+                    self._expect = "value"
+                    self._token_start = -1
+                elif not ch.isspace() and self._expect == "value" and self._token_start < 0:
+                    self._token_start = i
+            i += 1
+        self._pos = i
+        return completed
+
+    def _seek_object(self) -> bool:
+        """Springt zur ersten '{' außerhalb eines <think>-Blocks; False = mehr Daten nötig."""
+        while True:
+            brace = self._buf.find("{", self._pos)
+            think = self._buf.find(_THINK_OPEN, self._pos)
+            if think >= 0 and (brace < 0 or think < brace):
+                end = self._buf.find(_THINK_CLOSE, think)
+                if end < 0:
+                    self._pos = think
+                    return False
+                self._pos = end + len(_THINK_CLOSE)
+                continue
+            if brace < 0:
+                # ein angefangenes "<think" am Ende behalten
+                self._pos = max(self._pos, len(self._buf) - len(_THINK_OPEN))
+                return False
+            self._started = True
+            self._depth = 1
+            self._pos = brace + 1
+            return True
+
+    def _complete_value(self, buf: str, end: int, completed: List[Tuple[str, Any]]) -> None:
+        if self._expect == "value" and self._token_start >= 0:
+            try:
+                value = json.loads(buf[self._token_start:end])
+            except ValueError:
+                pass
+            else:
+                self.fields[self._key] = value
+                completed.append((self._key, value))
+        self._expect = "key"
+        self._token_start = -1